@@ -0,0 +1,6 @@
+"""
+Benchmarks and performance harnesses for Claude Notification WSL2
+
+These tools measure the hook pipeline (processes spawned, wall time, memory)
+so performance changes can be compared across commits.
+"""
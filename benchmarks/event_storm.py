@@ -0,0 +1,303 @@
+# event_storm.py
+# Load generator: hook event storms from many concurrent sessions
+#
+# Usage: python3 -m benchmarks.event_storm [--sessions 10] [--rate 100] [--duration 60]
+#            [--mix PostToolUse=90,Stop=4,Notification=3,PermissionRequest=3]
+#            [--startup-ms 250] [--timeout 10] [--seed 1] [--json]
+#
+# Each simulated session sends --rate events per minute, in the --mix
+# proportions, by running the real hooks/*.sh scripts against the
+# stand-in powershell.exe (benchmarks/fake_powershell.py). As in Claude
+# Code, a session waits for each hook before its next event. A session
+# that falls behind schedule sends its next event at once, and the lag is
+# reported. The report covers:
+# - achieved throughput
+# - hook latency percentiles
+# - dropped events (hooks that timed out or failed)
+# - Windows-side processes spawned (stand-in powershell.exe invocations)
+#
+# Author: Claude Code TDD Implementation
+# Version: 1.0.0
+
+import argparse
+import json
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from benchmarks import fake_powershell
+from benchmarks.hook_latency import PROJECT_ROOT, settle, write_transcript
+from src.stats import PERCENTILES, LatencyHistogram
+
+DEFAULT_MIX = {"PostToolUse": 90, "Stop": 4, "Notification": 3, "PermissionRequest": 3}
+DEFAULT_SESSIONS = 10
+DEFAULT_RATE = 100
+DEFAULT_DURATION = 60.0
+DEFAULT_STARTUP_MS = 250
+DEFAULT_TIMEOUT = 10.0
+
+# PostToolUse tools and how often each fails
+TOOLS = [("Bash", 0.15), ("Edit", 0.02), ("Read", 0.0), ("Write", 0.02), ("Grep", 0.0)]
+
+
+def parse_mix(text: str) -> Dict[str, float]:
+    """
+    Parse a --mix value
+
+    Args:
+        text: Comma-separated Event=weight pairs
+
+    Returns:
+        Dictionary mapping event name to weight
+
+    Raises:
+        ValueError: If a pair is malformed or no weight is positive
+    """
+    mix = {}
+    for pair in text.split(","):
+        event, _, weight = pair.partition("=")
+        mix[event.strip()] = float(weight)
+    if not mix or any(w < 0 for w in mix.values()) or not any(mix.values()):
+        raise ValueError(f"invalid mix: {text}")
+    return mix
+
+
+def make_payload(event: str, session_id: str, transcript: Path, rng: random.Random) -> bytes:
+    """
+    Build a payload for one event
+
+    Args:
+        event: Hook event name
+        session_id: Simulated session id
+        transcript: Transcript the Stop payload points to
+        rng: Random source for the tool and outcome
+
+    Returns:
+        Encoded payload
+    """
+    payload: Dict[str, Any] = {"session_id": session_id, "transcript_path": str(transcript),
+                               "hook_event_name": event}
+    if event == "PostToolUse":
+        tool, failure_rate = rng.choice(TOOLS)
+        failed = rng.random() < failure_rate
+        payload.update(tool_name=tool, tool_input={"command": "make test"},
+                       tool_response={"stdout": "ok\n" * 50, "stderr": "error\n" if failed else "",
+                                      "interrupted": False, "exit_code": 1 if failed else 0})
+    elif event == "Notification":
+        payload["message"] = "Claude needs your permission to use Bash"
+    elif event == "PermissionRequest":
+        payload.update(tool_name="Bash", tool_input={"command": "git push", "description": "Push the branch"})
+    return json.dumps(payload).encode("utf-8")
+
+
+class Storm:
+    """Runs simulated sessions and collects per-event results"""
+
+    def __init__(self, hooks_dir: Path, env: Dict[str, str], transcript: Path, mix: Dict[str, float],
+                 rate: float, duration: float, timeout: float = DEFAULT_TIMEOUT, seed: int = 1):
+        """
+        Prepare a storm
+
+        Args:
+            hooks_dir: Directory holding the <Event>.sh scripts
+            env: Environment for the hooks (see fake_powershell.environment)
+            transcript: Transcript for Stop payloads
+            mix: Event weights
+            rate: Events per minute per session
+            duration: Seconds each session keeps sending
+            timeout: Seconds after which a hook counts as dropped
+            seed: Random seed (sessions get seed + index)
+        """
+        self.hooks_dir = hooks_dir
+        self.env = env
+        self.transcript = transcript
+        self.events = list(mix)
+        self.weights = [mix[e] for e in self.events]
+        self.interval = 60.0 / rate
+        self.duration = duration
+        self.timeout = timeout
+        self.seed = seed
+        self.sessions = 1
+        self.lock = threading.Lock()
+        self.latency: Dict[str, LatencyHistogram] = defaultdict(LatencyHistogram)
+        self.sent: Counter = Counter()
+        self.dropped: Counter = Counter()
+        self.max_lag_ms = 0.0
+
+    def fire(self, event: str, payload: bytes) -> None:
+        """Run one hook and record its outcome"""
+        started = time.perf_counter()
+        try:
+            completed = subprocess.run(
+                ["bash", str(self.hooks_dir / f"{event}.sh")], input=payload, env=self.env,
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=self.timeout, check=False,
+            )
+            ok = completed.returncode == 0
+        except subprocess.TimeoutExpired:
+            ok = False
+        ms = (time.perf_counter() - started) * 1000
+        with self.lock:
+            self.sent[event] += 1
+            if not ok:
+                self.dropped[event] += 1
+            self.latency[event].add(ms)
+            self.latency["*"].add(ms)
+
+    def session(self, index: int, start: float) -> None:
+        """Send one session's events on schedule"""
+        rng = random.Random(self.seed + index)
+        session_id = f"storm-{index:03d}"
+        # Stagger sessions across the first interval
+        due = start + self.interval * index / max(1, self.sessions)
+        end = start + self.duration
+        while due < end:
+            now = time.perf_counter()
+            if now < due:
+                time.sleep(due - now)
+            else:
+                with self.lock:
+                    self.max_lag_ms = max(self.max_lag_ms, (now - due) * 1000)
+            event = rng.choices(self.events, self.weights)[0]
+            self.fire(event, make_payload(event, session_id, self.transcript, rng))
+            due += self.interval
+
+    def run(self, sessions: int) -> float:
+        """
+        Run all sessions to completion
+
+        Args:
+            sessions: Number of concurrent sessions
+
+        Returns:
+            Elapsed seconds
+        """
+        self.sessions = sessions
+        start = time.perf_counter()
+        threads = [threading.Thread(target=self.session, args=(i, start), daemon=True) for i in range(sessions)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return time.perf_counter() - start
+
+
+def run(sessions: int = DEFAULT_SESSIONS, rate: float = DEFAULT_RATE, duration: float = DEFAULT_DURATION,
+        mix: Optional[Dict[str, float]] = None, startup_ms: int = DEFAULT_STARTUP_MS,
+        timeout: float = DEFAULT_TIMEOUT, seed: int = 1, hooks_dir: Optional[Path] = None) -> Dict[str, Any]:
+    """
+    Generate an event storm and report how the pipeline coped
+
+    Args:
+        sessions: Concurrent simulated sessions
+        rate: Events per minute per session
+        duration: Seconds of load
+        mix: Event weights (default: DEFAULT_MIX)
+        startup_ms: Simulated PowerShell startup cost
+        timeout: Seconds after which a hook counts as dropped
+        seed: Random seed
+        hooks_dir: Directory holding the hook scripts (default: hooks/)
+
+    Returns:
+        Report dictionary
+    """
+    hooks_dir = Path(hooks_dir) if hooks_dir else PROJECT_ROOT / "hooks"
+    with tempfile.TemporaryDirectory(prefix="wsl-toast-storm-") as tmp:
+        tmp_path = Path(tmp)
+        home = tmp_path / "home"
+        (home / ".wsl-toast" / "logs").mkdir(parents=True)
+        calls_log = tmp_path / "powershell-calls.log"
+        env = fake_powershell.environment(fake_powershell.install(tmp_path / "bin"), home, calls_log, startup_ms)
+        storm = Storm(hooks_dir, env, write_transcript(tmp_path / "transcript.jsonl", turns=20),
+                      mix or DEFAULT_MIX, rate, duration, timeout, seed)
+        elapsed = storm.run(sessions)
+        settle(calls_log, startup_ms)
+        spawns = fake_powershell.call_count(calls_log)
+
+    total = sum(storm.sent.values())
+    return {
+        "sessions": sessions,
+        "target_per_second": round(sessions * rate / 60, 2),
+        "achieved_per_second": round(total / elapsed, 2) if elapsed else 0.0,
+        "elapsed_s": round(elapsed, 2),
+        "events": dict(storm.sent),
+        "dropped": dict(storm.dropped),
+        "max_lag_ms": round(storm.max_lag_ms, 1),
+        "windows_processes": spawns,
+        "latency_ms": {
+            event: {f"p{p}": hist.percentile(p) for p in PERCENTILES}
+            for event, hist in sorted(storm.latency.items())
+        },
+    }
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """
+    Format a storm report as plain text
+
+    Args:
+        report: Output of run()
+
+    Returns:
+        Multi-line text
+    """
+    lines = [
+        f"{report['sessions']} sessions, {report['elapsed_s']} s: "
+        f"{report['achieved_per_second']} events/s (target {report['target_per_second']})",
+        f"Max schedule lag: {report['max_lag_ms']} ms",
+        f"Windows processes spawned: {report['windows_processes']}",
+        "",
+        f"{'event':<20}{'sent':>8}{'dropped':>9}" + "".join(f"{f'p{p} ms':>10}" for p in PERCENTILES),
+    ]
+    for event, latency in report["latency_ms"].items():
+        sent = sum(report["events"].values()) if event == "*" else report["events"].get(event, 0)
+        dropped = sum(report["dropped"].values()) if event == "*" else report["dropped"].get(event, 0)
+        name = "all" if event == "*" else event
+        lines.append(f"{name:<20}{sent:>8}{dropped:>9}"
+                     + "".join(f"{latency.get(f'p{p}') or '-':>10}" for p in PERCENTILES))
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(prog="python3 -m benchmarks.event_storm",
+                                     description="Drive the hooks with event storms from concurrent sessions")
+    parser.add_argument("--sessions", type=int, default=DEFAULT_SESSIONS,
+                        help=f"concurrent sessions (default: {DEFAULT_SESSIONS})")
+    parser.add_argument("--rate", type=float, default=DEFAULT_RATE,
+                        help=f"events per minute per session (default: {DEFAULT_RATE})")
+    parser.add_argument("--duration", type=float, default=DEFAULT_DURATION,
+                        help=f"seconds of load (default: {DEFAULT_DURATION:g})")
+    parser.add_argument("--mix", default=",".join(f"{k}={v}" for k, v in DEFAULT_MIX.items()),
+                        help="event weights as Event=weight pairs")
+    parser.add_argument("--startup-ms", type=int, default=DEFAULT_STARTUP_MS,
+                        help=f"simulated PowerShell startup (default: {DEFAULT_STARTUP_MS})")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT,
+                        help=f"seconds before a hook counts as dropped (default: {DEFAULT_TIMEOUT:g})")
+    parser.add_argument("--seed", type=int, default=1, help="random seed (default: 1)")
+    parser.add_argument("--hooks-dir", help="directory holding the hook scripts (default: hooks/)")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+    try:
+        mix = parse_mix(args.mix)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.sessions < 1 or args.rate <= 0 or args.duration <= 0:
+        parser.error("--sessions, --rate and --duration must be positive")
+    hooks_dir = Path(args.hooks_dir) if args.hooks_dir else PROJECT_ROOT / "hooks"
+    missing = [event for event in mix if not (hooks_dir / f"{event}.sh").exists()]
+    if missing:
+        parser.error(f"no hook script for: {', '.join(missing)}")
+
+    report = run(args.sessions, args.rate, args.duration, mix, args.startup_ms, args.timeout, args.seed, hooks_dir)
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+    return 0 if not report["dropped"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
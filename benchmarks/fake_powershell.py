@@ -0,0 +1,134 @@
+# fake_powershell.py
+# Stand-in powershell.exe and wslpath for driving hooks off Windows
+#
+# install() writes both into a bin directory to put first on PATH.
+# notify.sh then finds the stand-in (its PATH fallback), which:
+# - appends one line per invocation to $WSL_TOAST_FAKE_PS_LOG: the
+#   start time in microseconds, then the arguments separated by \x1f;
+# - sleeps $WSL_TOAST_FAKE_PS_STARTUP_MS to simulate PowerShell startup;
+# - prints the success result wsl-toast.ps1 would print.
+#
+# Author: Claude Code TDD Implementation
+# Version: 1.0.0
+
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+FAKE_POWERSHELL = r"""#!/usr/bin/env bash
+# Stand-in for powershell.exe (benchmarks/fake_powershell.py)
+if [[ -n "${WSL_TOAST_FAKE_PS_LOG:-}" ]]; then
+    line="${EPOCHREALTIME/./}"
+    for arg in "$@"; do line+=$'\x1f'"$arg"; done
+    printf '%s\n' "$line" >> "$WSL_TOAST_FAKE_PS_LOG"
+fi
+ms="${WSL_TOAST_FAKE_PS_STARTUP_MS:-0}"
+if (( ms > 0 )); then
+    sleep "$((ms / 1000)).$(printf '%03d' $((ms % 1000)))"
+fi
+echo '{"Success":true,"DisplayMethod":"BurntToast"}'
+"""
+
+FAKE_WSLPATH = r"""#!/usr/bin/env bash
+# Stand-in for wslpath (benchmarks/fake_powershell.py)
+echo 'C:\fake\windows'
+"""
+
+
+def install(bin_dir: Path) -> Path:
+    """
+    Write the stand-in powershell.exe and wslpath
+
+    Args:
+        bin_dir: Directory to create them in (put it first on PATH)
+
+    Returns:
+        bin_dir
+    """
+    bin_dir = Path(bin_dir)
+    bin_dir.mkdir(parents=True, exist_ok=True)
+    for name, body in (("powershell.exe", FAKE_POWERSHELL), ("wslpath", FAKE_WSLPATH)):
+        path = bin_dir / name
+        path.write_text(body, encoding="utf-8")
+        path.chmod(0o755)
+    return bin_dir
+
+
+def environment(bin_dir: Path, home: Path, calls_log: Path, startup_ms: int = 0,
+                base: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    """
+    Environment for running hooks against the stand-in
+
+    Args:
+        bin_dir: Directory passed to install()
+        home: HOME for the hooks (state goes to home/.wsl-toast)
+        calls_log: File the stand-in appends its invocations to
+        startup_ms: Simulated PowerShell startup cost
+        base: Environment to extend (default: os.environ)
+
+    Returns:
+        Environment dictionary (MOCK_MODE removed, so notify.sh calls PowerShell)
+    """
+    env = dict(os.environ if base is None else base)
+    env.pop("MOCK_MODE", None)
+    env.update(
+        HOME=str(home),
+        USER=env.get("USER") or "bench",
+        PATH=f"{bin_dir}{os.pathsep}{env.get('PATH', '')}",
+        WSL_TOAST_FAKE_PS_LOG=str(calls_log),
+        WSL_TOAST_FAKE_PS_STARTUP_MS=str(int(startup_ms)),
+    )
+    return env
+
+
+def read_calls(calls_log: Path) -> List[Dict[str, object]]:
+    """
+    Read the stand-in's invocations
+
+    Args:
+        calls_log: File passed as WSL_TOAST_FAKE_PS_LOG
+
+    Returns:
+        List of {'ts': Unix time, 'args': [...]} in invocation order
+    """
+    try:
+        text = Path(calls_log).read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        return []
+    calls = []
+    for line in text.splitlines():
+        fields = line.split("\x1f")
+        try:
+            ts = int(fields[0]) / 1e6
+        except ValueError:
+            continue
+        calls.append({"ts": ts, "args": fields[1:]})
+    return calls
+
+
+def call_count(calls_log: Path) -> int:
+    """Number of stand-in invocations recorded so far"""
+    try:
+        with open(calls_log, "rb") as f:
+            return sum(1 for _ in f)
+    except OSError:
+        return 0
+
+
+def toast(args: List[str]) -> Dict[str, str]:
+    """
+    The notification a wsl-toast.ps1 invocation asked for
+
+    Args:
+        args: Arguments recorded by the stand-in
+
+    Returns:
+        Dictionary with title, message and type, or {'clear_session': id}
+    """
+    named: Dict[str, str] = {}
+    for i, arg in enumerate(args):
+        if arg.startswith("-") and i + 1 < len(args) and not args[i + 1].startswith("-"):
+            named.setdefault(arg[1:], args[i + 1])
+    if "-ClearSession" in args:
+        return {"clear_session": named.get("SessionId", "")}
+    return {key.lower(): named[key] for key in ("Title", "Message", "Type") if key in named}
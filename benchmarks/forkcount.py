@@ -0,0 +1,148 @@
+# forkcount.py
+# strace-free process counting for hook and notify.sh invocations
+#
+# Usage: python3 -m benchmarks.forkcount [--runs N] -- <command> [args...]
+#
+# Linux allocates PIDs sequentially. The last allocated PID is published in
+# /proc/loadavg, so the difference before and after a command is the number
+# of processes (and threads) it created, the command itself included. Other
+# activity on the machine can only inflate a sample, so the minimum over a
+# few runs is reported.
+#
+# Author: Claude Code TDD Implementation
+# Version: 1.0.0
+
+import argparse
+import subprocess
+import sys
+from typing import Dict, List, Optional
+
+LOADAVG_PATH = "/proc/loadavg"
+
+
+def last_pid() -> int:
+    """
+    Read the most recently allocated PID
+
+    Returns:
+        Last allocated PID in this PID namespace
+
+    Raises:
+        OSError: If /proc/loadavg is unavailable (non-Linux systems)
+    """
+    with open(LOADAVG_PATH, "r", encoding="ascii") as f:
+        return int(f.read().split()[-1])
+
+
+def is_supported() -> bool:
+    """Check whether PID-based counting works on this system"""
+    try:
+        last_pid()
+    except (OSError, ValueError, IndexError):
+        return False
+    return True
+
+
+def count_forks_once(
+    command: List[str],
+    env: Optional[Dict[str, str]] = None,
+    stdin: bytes = b"",
+    cwd: Optional[str] = None,
+    timeout: float = 60.0,
+) -> Optional[int]:
+    """
+    Count the processes created by one run of a command
+
+    Args:
+        command: Command and arguments
+        env: Environment (default: inherit)
+        stdin: Bytes fed to the command's stdin
+        cwd: Working directory
+        timeout: Seconds before the command is killed
+
+    Returns:
+        Number of PIDs allocated, or None if the PID counter wrapped
+    """
+    before = last_pid()
+    subprocess.run(
+        command,
+        input=stdin,
+        env=env,
+        cwd=cwd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        timeout=timeout,
+        check=False,
+    )
+    after = last_pid()
+    if after < before:
+        return None
+    return after - before
+
+
+def count_forks(
+    command: List[str],
+    env: Optional[Dict[str, str]] = None,
+    stdin: bytes = b"",
+    cwd: Optional[str] = None,
+    runs: int = 3,
+    timeout: float = 60.0,
+) -> int:
+    """
+    Count the processes a command creates, taking the minimum over several runs
+
+    Background commands (e.g. notify.sh --background) are counted only if
+    they are spawned before the command exits.
+
+    Args:
+        command: Command and arguments
+        env: Environment (default: inherit)
+        stdin: Bytes fed to the command's stdin
+        cwd: Working directory
+        runs: Number of samples
+        timeout: Seconds before each run is killed
+
+    Returns:
+        Minimum number of PIDs allocated in one run
+
+    Raises:
+        RuntimeError: If every sample hit a PID wrap-around
+    """
+    samples = []
+    for _ in range(max(1, runs)):
+        sample = count_forks_once(command, env, stdin, cwd, timeout)
+        if sample is not None:
+            samples.append(sample)
+    if not samples:
+        raise RuntimeError("PID counter wrapped during every run")
+    return min(samples)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point; prints the process count"""
+    parser = argparse.ArgumentParser(
+        prog="python3 -m benchmarks.forkcount",
+        description="Count processes created by a command (strace-free)",
+    )
+    parser.add_argument("--runs", type=int, default=3, help="samples to take (default: 3)")
+    parser.add_argument("--stdin", metavar="FILE", help="file fed to the command's stdin")
+    parser.add_argument("command", nargs=argparse.REMAINDER, help="-- command [args...]")
+    args = parser.parse_args(argv)
+
+    command = args.command[1:] if args.command[:1] == ["--"] else args.command
+    if not command:
+        parser.error("a command is required")
+    if not is_supported():
+        sys.stderr.write("PID counting needs /proc/loadavg (Linux)\n")
+        return 1
+
+    stdin = b""
+    if args.stdin:
+        with open(args.stdin, "rb") as f:
+            stdin = f.read()
+    print(count_forks(command, stdin=stdin, runs=args.runs))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,300 @@
+# hook_latency.py
+# End-to-end hook benchmark against a stand-in powershell.exe
+#
+# Usage: python3 -m benchmarks.hook_latency [--runs 5] [--startup-ms 250] [--hooks-dir DIR]
+#                                           [--only Stop,PostToolUse] [--json] [--output FILE]
+#                                           [--compare FILE]
+#
+# Drives every hooks/*.sh script with a realistic payload under a scratch
+# HOME. The stand-in powershell.exe (benchmarks/fake_powershell.py)
+# records its arguments and sleeps --startup-ms. For each hook it reports:
+# - median wall time
+# - processes created (benchmarks/forkcount.py)
+# - peak RSS of the hook process tree (wait4 rusage)
+# - bytes added to ~/.wsl-toast/logs
+# - PowerShell invocations per run
+# Save a run with --output and pass it to --compare after a change to see
+# the difference per hook.
+#
+# Author: Claude Code TDD Implementation
+# Version: 1.0.0
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from benchmarks import fake_powershell, forkcount
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+DEFAULT_RUNS = 5
+DEFAULT_STARTUP_MS = 250
+
+
+def write_transcript(path: Path, turns: int = 200) -> Path:
+    """
+    Write a session transcript ending with an assistant message
+
+    Args:
+        path: Transcript file
+        turns: Tool call round trips before the final message
+
+    Returns:
+        path
+    """
+    filler = "출력 output line\n" * 200
+    with open(path, "w", encoding="utf-8") as f:
+        for turn in range(turns):
+            f.write(json.dumps({"type": "assistant", "message": {"role": "assistant", "content": [
+                {"type": "tool_use", "id": f"toolu_{turn}", "name": "Bash", "input": {"command": "make"}},
+            ]}}, ensure_ascii=False) + "\n")
+            f.write(json.dumps({"type": "user", "message": {"role": "user", "content": [
+                {"type": "tool_result", "tool_use_id": f"toolu_{turn}", "content": filler},
+            ]}}, ensure_ascii=False) + "\n")
+        f.write(json.dumps({"type": "assistant", "message": {"role": "assistant", "content": [
+            {"type": "text", "text": "All tests pass. The parser now streams its input."},
+        ]}}) + "\n")
+    return path
+
+
+def sample_payloads(workdir: Path, session_id: str = "bench-session") -> Dict[str, bytes]:
+    """
+    Build a realistic stdin payload for every hook event
+
+    Args:
+        workdir: Directory for the transcript the Stop payload points to
+        session_id: Session id set in every payload
+
+    Returns:
+        Dictionary mapping event name to encoded payload
+    """
+    transcript = write_transcript(Path(workdir) / "transcript.jsonl")
+    common = {"session_id": session_id, "transcript_path": str(transcript), "cwd": str(workdir)}
+    payloads = {
+        "Stop": {"hook_event_name": "Stop", "stop_hook_active": False},
+        "Notification": {"hook_event_name": "Notification",
+                         "message": "Claude needs your permission to use Bash"},
+        "PermissionRequest": {"hook_event_name": "PermissionRequest", "tool_name": "Bash",
+                              "tool_input": {"command": "rm -rf build/", "description": "Clean build output"}},
+        "PostToolUse": {"hook_event_name": "PostToolUse", "tool_name": "Bash",
+                        "tool_input": {"command": "pytest -q"},
+                        "tool_response": {"stdout": "E   AssertionError\n" * 2000, "stderr": "",
+                                          "interrupted": False, "exit_code": 1}},
+        "SessionStart": {"hook_event_name": "SessionStart", "source": "startup"},
+        "SessionEnd": {"hook_event_name": "SessionEnd", "reason": "prompt_input_exit"},
+        "UserPromptSubmit": {"hook_event_name": "UserPromptSubmit", "prompt": "Make the parser stream"},
+    }
+    return {
+        event: json.dumps(dict(common, **payload), ensure_ascii=False).encode("utf-8")
+        for event, payload in payloads.items()
+    }
+
+
+def _tree_bytes(directory: Path) -> int:
+    """Total size of the files under a directory"""
+    total = 0
+    for root, _, files in os.walk(directory):
+        for name in files:
+            try:
+                total += os.stat(os.path.join(root, name)).st_size
+            except OSError:
+                pass
+    return total
+
+
+def run_once(script: Path, payload: bytes, env: Dict[str, str], log_dir: Path) -> Dict[str, Any]:
+    """
+    Run one hook and measure it
+
+    Args:
+        script: Hook script
+        payload: Bytes fed to its stdin
+        env: Environment (see fake_powershell.environment)
+        log_dir: ~/.wsl-toast/logs of the scratch HOME
+
+    Returns:
+        Dictionary with wall_ms, forks (None if the PID counter wrapped),
+        maxrss_kib and logged_bytes
+    """
+    logged = _tree_bytes(log_dir)
+    before = forkcount.last_pid()
+    started = time.perf_counter()
+    proc = subprocess.Popen(["bash", str(script)], stdin=subprocess.PIPE, stdout=subprocess.DEVNULL,
+                            stderr=subprocess.DEVNULL, env=env)
+    try:
+        proc.stdin.write(payload)
+    except BrokenPipeError:
+        pass
+    proc.stdin.close()
+    # wait4 reports the peak RSS of the hook and the children it waited for
+    _, status, usage = os.wait4(proc.pid, 0)
+    wall_ms = (time.perf_counter() - started) * 1000
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    after = forkcount.last_pid()
+    return {
+        "wall_ms": wall_ms,
+        "forks": after - before if after >= before else None,
+        "maxrss_kib": usage.ru_maxrss,
+        "logged_bytes": _tree_bytes(log_dir) - logged,
+    }
+
+
+def settle(calls_log: Path, startup_ms: int, timeout: float = 10.0) -> None:
+    """Wait for background PowerShell stand-ins of the last run to exit"""
+    # Give a stand-in started with nohup ... & time to exec
+    time.sleep(0.02)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        result = subprocess.run(["pgrep", "-f", str(calls_log.parent / "bin" / "powershell.exe")],
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        if result.returncode != 0:
+            return
+        time.sleep(min(0.05, startup_ms / 1000 or 0.01))
+
+
+def bench_hook(script: Path, payload: bytes, env: Dict[str, str], log_dir: Path,
+               calls_log: Path, runs: int, startup_ms: int) -> Dict[str, Any]:
+    """
+    Measure one hook over several runs
+
+    Args:
+        script: Hook script
+        payload: Bytes fed to its stdin
+        env: Environment (see fake_powershell.environment)
+        log_dir: ~/.wsl-toast/logs of the scratch HOME
+        calls_log: Stand-in invocation log
+        runs: Number of runs
+        startup_ms: Simulated PowerShell startup, waited out between runs
+
+    Returns:
+        Dictionary with wall_ms (median), wall_min_ms, forks (min),
+        maxrss_kib (max), logged_bytes (median) and powershell_calls (max)
+    """
+    samples = []
+    for _ in range(runs):
+        calls = fake_powershell.call_count(calls_log)
+        sample = run_once(script, payload, env, log_dir)
+        # Background stand-ins may log their call after the hook exits
+        settle(calls_log, startup_ms)
+        sample["powershell_calls"] = fake_powershell.call_count(calls_log) - calls
+        samples.append(sample)
+    forks = [s["forks"] for s in samples if s["forks"] is not None]
+    return {
+        "wall_ms": round(statistics.median(s["wall_ms"] for s in samples), 2),
+        "wall_min_ms": round(min(s["wall_ms"] for s in samples), 2),
+        # Other activity can only inflate a sample
+        "forks": min(forks) if forks else None,
+        "maxrss_kib": max(s["maxrss_kib"] for s in samples),
+        "logged_bytes": int(statistics.median(s["logged_bytes"] for s in samples)),
+        "powershell_calls": max(s["powershell_calls"] for s in samples),
+        "runs": runs,
+    }
+
+
+def run(runs: int = DEFAULT_RUNS, startup_ms: int = DEFAULT_STARTUP_MS,
+        hooks_dir: Optional[Path] = None, only: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Benchmark every hook script
+
+    Args:
+        runs: Runs per hook
+        startup_ms: Simulated PowerShell startup cost
+        hooks_dir: Directory holding the <Event>.sh scripts (default: hooks/)
+        only: Hook event names to run (default: all)
+
+    Returns:
+        Dictionary mapping event name to its measurements
+    """
+    hooks_dir = Path(hooks_dir) if hooks_dir else PROJECT_ROOT / "hooks"
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="wsl-toast-hookbench-") as tmp:
+        tmp_path = Path(tmp)
+        home = tmp_path / "home"
+        log_dir = home / ".wsl-toast" / "logs"
+        log_dir.mkdir(parents=True)
+        calls_log = tmp_path / "powershell-calls.log"
+        env = fake_powershell.environment(fake_powershell.install(tmp_path / "bin"), home, calls_log, startup_ms)
+        payloads = sample_payloads(tmp_path)
+        for script in sorted(hooks_dir.glob("*.sh")):
+            event = script.stem
+            if script.name.startswith("_") or (only and event not in only):
+                continue
+            payload = payloads.get(event, json.dumps({"hook_event_name": event}).encode("utf-8"))
+            results[event] = bench_hook(script, payload, env, log_dir, calls_log, runs, startup_ms)
+    return results
+
+
+def format_table(results: Dict[str, Dict[str, Any]], baseline: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Format results as a table, with the change from a baseline if given
+
+    Args:
+        results: Output of run()
+        baseline: Earlier output of run() (saved with --output)
+
+    Returns:
+        Multi-line text
+    """
+    def cell(event: str, key: str, width: int, fmt: str = "") -> str:
+        value = results[event].get(key)
+        text = "-" if value is None else format(value, fmt)
+        old = (baseline or {}).get(event, {}).get(key)
+        if baseline is not None and value is not None and old is not None:
+            delta = value - old
+            text += f" ({delta:+{fmt or 'g'}})"
+        return f"{text:>{width}}"
+
+    wide = baseline is not None
+    columns = [("wall_ms", "wall ms", ".1f"), ("forks", "forks", ""), ("maxrss_kib", "peak RSS KiB", ""),
+               ("logged_bytes", "logged B", ""), ("powershell_calls", "PowerShell", "")]
+    widths = [22 if wide else 12, 14 if wide else 7, 22 if wide else 14, 18 if wide else 10, 14 if wide else 11]
+    lines = [f"{'hook':<20}" + "".join(f"{title:>{w}}" for (_, title, _), w in zip(columns, widths))]
+    for event in results:
+        lines.append(f"{event:<20}" + "".join(cell(event, key, w, fmt) for (key, _, fmt), w in zip(columns, widths)))
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(prog="python3 -m benchmarks.hook_latency",
+                                     description="Measure every hook end to end against a stand-in powershell.exe")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS, help=f"runs per hook (default: {DEFAULT_RUNS})")
+    parser.add_argument("--startup-ms", type=int, default=DEFAULT_STARTUP_MS,
+                        help=f"simulated PowerShell startup (default: {DEFAULT_STARTUP_MS})")
+    parser.add_argument("--hooks-dir", help="directory holding the hook scripts (default: hooks/)")
+    parser.add_argument("--only", help="comma-separated hook events to run")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    parser.add_argument("--output", metavar="FILE", help="also write results as JSON to FILE")
+    parser.add_argument("--compare", metavar="FILE", help="show the change from results saved with --output")
+    args = parser.parse_args(argv)
+    if args.runs < 1 or args.startup_ms < 0:
+        parser.error("--runs must be at least 1 and --startup-ms not negative")
+    if not forkcount.is_supported():
+        sys.stderr.write("process counting needs /proc/loadavg (Linux)\n")
+        return 1
+
+    baseline = None
+    if args.compare:
+        try:
+            baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))["results"]
+        except (OSError, ValueError, KeyError) as e:
+            parser.error(f"cannot read {args.compare}: {e}")
+
+    only = args.only.split(",") if args.only else None
+    results = run(args.runs, args.startup_ms, Path(args.hooks_dir) if args.hooks_dir else None, only)
+    document = {"startup_ms": args.startup_ms, "runs": args.runs, "results": results}
+    if args.output:
+        Path(args.output).write_text(json.dumps(document, indent=2) + "\n", encoding="utf-8")
+    print(json.dumps(document, indent=2) if args.json else format_table(results, baseline))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
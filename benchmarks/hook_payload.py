@@ -0,0 +1,90 @@
+# hook_payload.py
+# Benchmark: PostToolUse payload parsing against tool output size
+#
+# Usage: python3 -m benchmarks.hook_payload [--sizes-mb 1,16,64]
+#
+# Builds PostToolUse payloads whose tool output is the given size and
+# compares the streaming field reader used by the hook with json.loads
+# of the whole payload (the previous behaviour).
+#
+# Author: Claude Code TDD Implementation
+# Version: 1.0.0
+
+import argparse
+import io
+import json
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict
+
+from src.config_loader import get_default_config
+from src.outcome import payload_fields
+from src.payload import read_fields
+
+
+def build_payload(size_mb: int) -> bytes:
+    """
+    Build a PostToolUse payload with about size_mb MiB of tool output
+
+    Args:
+        size_mb: Tool output size in MiB
+
+    Returns:
+        Encoded payload
+    """
+    line = 'src/app.py:12: print("로그 line") \\ done\n'
+    stdout = line * (size_mb * 1024 * 1024 // len(line.encode("utf-8")))
+    return json.dumps({
+        "session_id": "bench",
+        "hook_event_name": "PostToolUse",
+        "tool_name": "Bash",
+        "tool_input": {"command": "cat build.log"},
+        "tool_response": {"stdout": stdout, "stderr": "", "interrupted": False, "is_error": False},
+    }, ensure_ascii=False).encode("utf-8")
+
+
+def measure(func: Callable[[bytes], Any], data: bytes) -> Dict[str, float]:
+    """
+    Time one parse and record peak Python memory
+
+    Args:
+        func: Parser to measure
+        data: Payload bytes
+
+    Returns:
+        Dictionary with 'seconds' and 'peak_mib'
+    """
+    tracemalloc.start()
+    started = time.perf_counter()
+    func(data)
+    seconds = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"seconds": seconds, "peak_mib": peak / (1024 * 1024)}
+
+
+def main(argv=None) -> int:
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(prog="python3 -m benchmarks.hook_payload")
+    parser.add_argument("--sizes-mb", default="1,16,64", help="tool output sizes (default: 1,16,64)")
+    args = parser.parse_args(argv)
+
+    print(f"{'size':>8}  {'json.loads':>22}  {'read_fields':>22}")
+    fields = payload_fields(get_default_config())
+    for size_mb in (int(s) for s in args.sizes_mb.split(",")):
+        data = build_payload(size_mb)
+        full = measure(lambda d: json.loads(d), data)
+        streamed = measure(
+            lambda d: read_fields(io.BytesIO(d), fields, max_bytes=len(d)), data
+        )
+        print(
+            f"{size_mb:>5} MiB"
+            f"  {full['seconds'] * 1000:8.1f} ms {full['peak_mib']:7.1f} MiB"
+            f"  {streamed['seconds'] * 1000:8.1f} ms {streamed['peak_mib']:7.1f} MiB"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,315 @@
+# loaders.py
+# Micro-benchmarks for config_loader and template_loader
+#
+# Usage: python3 -m benchmarks.loaders [--keys 2000] [--languages 36] [--filter NAME]
+#                                      [--save [FILE]] [--compare [FILE]] [--threshold 0.25]
+#                                      [--stat min_us] [--json]
+#
+# Runs offline against a synthetic template set: thousands of keys in
+# dozens of languages. en.json holds every key and the other languages
+# hold half of them, so lookups of the rest recurse to the English
+# fallback. Each case is timed pytest-benchmark style: the calls per
+# round are calibrated to fill MIN_ROUND_SECONDS, and min/median/mean
+# per call are reported over the rounds.
+#
+# --save writes the results to benchmarks/baselines/loaders.json (kept in
+# the repository). --compare reruns the cases and exits 1 if any case is
+# more than --threshold slower than the baseline. Cases are compared on
+# their fastest round by default: on a busy machine noise only ever adds
+# time, so the minimum moves least between runs.
+#
+# Author: Claude Code TDD Implementation
+# Version: 1.0.0
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.config_loader import clear_config_cache, get_default_config, load_config, validate_config
+from src.template_loader import TemplateLoader
+
+DEFAULT_BASELINE = Path(__file__).parent / "baselines" / "loaders.json"
+
+# Synthetic template set size
+DEFAULT_KEYS = 2000
+DEFAULT_LANGUAGES = 36
+
+# Timing: rounds per case and the minimum duration of one round
+DEFAULT_ROUNDS = 15
+MIN_ROUND_SECONDS = 0.005
+
+# Relative slowdown that counts as a regression, and the statistic compared
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_STAT = "min_us"
+STATS = ("min_us", "median_us", "mean_us")
+
+
+def language_codes(count: int) -> List[str]:
+    """
+    Synthetic language codes, English first
+
+    Args:
+        count: Number of languages
+
+    Returns:
+        List of codes ('en', 'l01', 'l02', ...)
+    """
+    return ["en"] + [f"l{i:02d}" for i in range(1, count)]
+
+
+def generate_templates(directory: Path, keys: int = DEFAULT_KEYS,
+                       languages: int = DEFAULT_LANGUAGES) -> List[str]:
+    """
+    Write a synthetic template set
+
+    Args:
+        directory: Templates directory to fill
+        keys: Template keys in en.json
+        languages: Number of <lang>.json files
+
+    Returns:
+        Language codes written, English first
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    codes = language_codes(languages)
+    for code in codes:
+        # Other languages translate the even keys only
+        step = 1 if code == "en" else 2
+        templates = {
+            f"key_{i:05d}": {
+                "title": f"[{code}] Title {i}",
+                "message": f"[{code}] {{tool}} finished step {i} in {{seconds}}s — 完了",
+            }
+            for i in range(0, keys, step)
+        }
+        (directory / f"{code}.json").write_text(
+            json.dumps(templates, ensure_ascii=False), encoding="utf-8"
+        )
+    return codes
+
+
+def make_loader(directory: Path, codes: List[str]) -> TemplateLoader:
+    """Template loader that accepts the synthetic languages"""
+    loader = TemplateLoader(directory)
+    loader.SUPPORTED_LANGUAGES = codes
+    return loader
+
+
+def time_case(func: Callable[[], Any], rounds: int = DEFAULT_ROUNDS) -> Dict[str, float]:
+    """
+    Time a call, calibrating the calls per round
+
+    Args:
+        func: Call to measure
+        rounds: Number of timed rounds
+
+    Returns:
+        Dictionary with per-call min_us, median_us and mean_us, and the
+        calls per round
+    """
+    calls = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(calls):
+            func()
+        elapsed = time.perf_counter() - started
+        if elapsed >= MIN_ROUND_SECONDS or calls >= 1 << 20:
+            break
+        calls *= 2
+
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for _ in range(calls):
+            func()
+        samples.append((time.perf_counter() - started) / calls * 1e6)
+    return {
+        "min_us": round(min(samples), 3),
+        "median_us": round(statistics.median(samples), 3),
+        "mean_us": round(statistics.fmean(samples), 3),
+        "calls": calls,
+    }
+
+
+def build_cases(workdir: Path, keys: int, languages: int) -> Dict[str, Callable[[], Any]]:
+    """
+    Set up the benchmark cases
+
+    Args:
+        workdir: Scratch directory for the config and template files
+        keys: Template keys in en.json
+        languages: Number of languages
+
+    Returns:
+        Dictionary mapping case name to the call to time
+    """
+    templates_dir = workdir / "templates"
+    codes = generate_templates(templates_dir, keys, languages)
+    config_dir = workdir / "config"
+    config_dir.mkdir(exist_ok=True)
+    config = get_default_config()
+    config.update(language="ko", hook_tool_denylist=["Read", "Glob", "Grep"])
+    (config_dir / "config.json").write_text(json.dumps(config), encoding="utf-8")
+
+    last = codes[-1]
+    translated = "key_00000"
+    untranslated = f"key_{(keys - 1) | 1:05d}" if keys > 1 else translated
+    warm = make_loader(templates_dir, codes)
+    for code in (last, "en"):
+        warm.get_template(translated, code)
+
+    def config_cold() -> None:
+        clear_config_cache()
+        load_config(str(config_dir))
+
+    def template_cold() -> None:
+        make_loader(templates_dir, codes).get_template(translated, last)
+
+    load_config(str(config_dir))
+    return {
+        "load_config_cold": config_cold,
+        "load_config_cached": lambda: load_config(str(config_dir)),
+        "validate_config": lambda: validate_config(config),
+        "get_template_cold": template_cold,
+        "get_template": lambda: warm.get_template(translated, last),
+        "get_template_fallback": lambda: warm.get_template(untranslated, last),
+        "get_template_unsupported_language": lambda: warm.get_template(translated, "xx"),
+        "get_notification_data": lambda: warm.get_notification_data(
+            translated, last, tool="Bash", seconds=12
+        ),
+        "get_available_languages": warm.get_available_languages,
+    }
+
+
+def run(keys: int = DEFAULT_KEYS, languages: int = DEFAULT_LANGUAGES, rounds: int = DEFAULT_ROUNDS,
+        only: Optional[str] = None) -> Dict[str, Dict[str, float]]:
+    """
+    Run the benchmark cases
+
+    Args:
+        keys: Template keys in en.json
+        languages: Number of languages
+        rounds: Timed rounds per case
+        only: Run only cases whose name contains this
+
+    Returns:
+        Dictionary mapping case name to its timings
+    """
+    with tempfile.TemporaryDirectory(prefix="wsl-toast-bench-") as tmp:
+        cases = build_cases(Path(tmp), keys, languages)
+        results = {
+            name: time_case(func, rounds)
+            for name, func in cases.items()
+            if only is None or only in name
+        }
+    clear_config_cache()
+    return results
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Any],
+            threshold: float = DEFAULT_THRESHOLD,
+            stat: str = DEFAULT_STAT) -> List[Tuple[str, float, float, float, bool]]:
+    """
+    Compare results with a baseline
+
+    Args:
+        results: Output of run()
+        baseline: Saved baseline ({'results': {name: {'min_us': ...}}})
+        threshold: Relative slowdown counted as a regression (0.25 = 25%)
+        stat: Statistic compared (min_us, median_us or mean_us)
+
+    Returns:
+        List of (name, baseline_us, current_us, ratio, regressed) for the
+        cases present in both
+    """
+    rows = []
+    for name, result in results.items():
+        base = baseline.get("results", {}).get(name, {}).get(stat)
+        if not base:
+            continue
+        ratio = result[stat] / base
+        rows.append((name, base, result[stat], ratio, ratio > 1 + threshold))
+    return rows
+
+
+def baseline_document(results: Dict[str, Dict[str, float]], keys: int, languages: int) -> Dict[str, Any]:
+    """Baseline file contents for a run"""
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "keys": keys,
+        "languages": languages,
+        "results": results,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(prog="python3 -m benchmarks.loaders",
+                                     description="Micro-benchmarks for config and template loading")
+    parser.add_argument("--keys", type=int, default=DEFAULT_KEYS, help=f"template keys (default: {DEFAULT_KEYS})")
+    parser.add_argument("--languages", type=int, default=DEFAULT_LANGUAGES,
+                        help=f"template languages (default: {DEFAULT_LANGUAGES})")
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS, help=f"rounds per case (default: {DEFAULT_ROUNDS})")
+    parser.add_argument("--filter", help="only run cases whose name contains this")
+    parser.add_argument("--save", nargs="?", const=str(DEFAULT_BASELINE), metavar="FILE",
+                        help="write the results as the baseline")
+    parser.add_argument("--compare", nargs="?", const=str(DEFAULT_BASELINE), metavar="FILE",
+                        help="compare with a baseline; exit 1 on regressions")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"slowdown counted as a regression (default: {DEFAULT_THRESHOLD})")
+    parser.add_argument("--stat", choices=STATS, default=DEFAULT_STAT,
+                        help=f"statistic compared with the baseline (default: {DEFAULT_STAT})")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args(argv)
+    if args.keys < 1 or args.languages < 1 or args.rounds < 1:
+        parser.error("--keys, --languages and --rounds must be at least 1")
+
+    baseline = None
+    if args.compare:
+        try:
+            baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            parser.error(f"cannot read baseline {args.compare}: {e}")
+        if (baseline.get("keys"), baseline.get("languages")) != (args.keys, args.languages):
+            sys.stderr.write("warning: baseline was recorded with a different template set size\n")
+
+    results = run(args.keys, args.languages, args.rounds, args.filter)
+
+    if args.save:
+        path = Path(args.save)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(baseline_document(results, args.keys, args.languages), indent=2) + "\n",
+                        encoding="utf-8")
+
+    if baseline is None:
+        if args.json:
+            print(json.dumps(results, indent=2))
+        else:
+            print(f"{'case':<36}{'min us':>12}{'median us':>12}{'mean us':>12}{'calls':>9}")
+            for name, r in results.items():
+                print(f"{name:<36}{r['min_us']:>12.2f}{r['median_us']:>12.2f}{r['mean_us']:>12.2f}{r['calls']:>9}")
+        return 0
+
+    rows = compare(results, baseline, args.threshold, args.stat)
+    if args.json:
+        print(json.dumps([
+            {"case": name, "baseline_us": base, "current_us": current, "ratio": round(ratio, 3), "regressed": bad}
+            for name, base, current, ratio, bad in rows
+        ], indent=2))
+    else:
+        print(f"{'case':<36}{'baseline us':>13}{'current us':>12}{'ratio':>8}")
+        for name, base, current, ratio, bad in rows:
+            flag = "  REGRESSION" if bad else ""
+            print(f"{name:<36}{base:>13.2f}{current:>12.2f}{ratio:>8.2f}{flag}")
+    return 1 if any(row[4] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
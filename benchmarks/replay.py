@@ -0,0 +1,360 @@
+# replay.py
+# Replay captured hook payloads through the pipeline
+#
+# Usage: python3 -m benchmarks.replay [--log-dir ~/.wsl-toast/logs] [--source both]
+#            [--speed 1] [--limit N] [--output FILE] [--compare FILE] [--threshold 0.25] [--json]
+#
+# Builds a payload corpus from real traffic. Two sources feed it:
+# - the '=== <Hook> Hook <date> ===' blocks in hooks.log and its rotated
+#   files (written at hook_log_level debug)
+# - the per-invocation files under logs/payloads/ (hook_capture_payloads)
+# Each payload is run through its hooks/<Event>.sh script in recorded
+# order, against the stand-in powershell.exe (benchmarks/fake_powershell.py)
+# with no startup delay. --speed 1 keeps the recorded gaps between hooks,
+# --speed 10 replays ten times faster and --speed 0 back to back.
+#
+# --output saves the notifications each hook produced and its latency.
+# --compare replays again and reports payloads whose notifications
+# changed, plus events whose median latency grew past --threshold. It
+# exits 1 if either is found.
+#
+# Author: Claude Code TDD Implementation
+# Version: 1.0.0
+
+import argparse
+import gzip
+import json
+import re
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from benchmarks import fake_powershell
+from benchmarks.hook_latency import PROJECT_ROOT, run_once, settle
+
+_MARKER = re.compile(r"^=== (\w+) Hook (.*) ===$")
+
+DEFAULT_THRESHOLD = 0.25
+
+# Payload sources
+SOURCES = ("log", "captures", "both")
+
+
+def log_files(log_dir: Path, name: str = "hooks.log") -> List[Path]:
+    """
+    List a log and its rotated files, oldest first
+
+    Args:
+        log_dir: Directory holding the log
+        name: Log file name
+
+    Returns:
+        Existing paths (name.N[.gz] ... name)
+    """
+    base = Path(log_dir) / name
+    rotated = []
+    for path in base.parent.glob(base.name + ".*"):
+        index = path.name[len(base.name) + 1:].partition(".")[0]
+        if index.isdigit():
+            rotated.append((int(index), path))
+    files = [path for _, path in sorted(rotated, reverse=True)]
+    if base.exists():
+        files.append(base)
+    return files
+
+
+def parse_stamp(text: str) -> Optional[float]:
+    """
+    Parse a marker date as written by date(1) or HookLog
+
+    Args:
+        text: e.g. 'Mon Oct 19 05:12:01 UTC 2026' (the zone is ignored)
+
+    Returns:
+        Unix time in local time, or None if not understood
+    """
+    parts = text.split()
+    if len(parts) == 6:
+        del parts[4]
+    try:
+        return datetime.strptime(" ".join(parts), "%a %b %d %H:%M:%S %Y").timestamp()
+    except ValueError:
+        return None
+
+
+def _payload_json(body: str) -> Optional[Dict[str, Any]]:
+    """The JSON object at the start of a marker block, ignoring trailing log lines"""
+    try:
+        value, _ = json.JSONDecoder().raw_decode(body.lstrip())
+    except ValueError:
+        return None
+    return value if isinstance(value, dict) else None
+
+
+def parse_hooks_log(lines: Iterable[str], source: str = "hooks.log") -> List[Dict[str, Any]]:
+    """
+    Extract payloads from hooks.log text
+
+    Blocks whose body is not a JSON object (e.g. UserPromptSubmit byte
+    counts) are skipped.
+
+    Args:
+        lines: Log lines
+        source: Name recorded with each payload
+
+    Returns:
+        List of {'event', 'ts', 'payload', 'source'} in log order
+    """
+    corpus = []
+    current: Optional[Dict[str, Any]] = None
+    body: List[str] = []
+
+    def finish() -> None:
+        if current is not None:
+            payload = _payload_json("".join(body))
+            if payload is not None:
+                current["payload"] = payload
+                corpus.append(current)
+
+    for line in lines:
+        match = _MARKER.match(line.rstrip("\n"))
+        if match:
+            finish()
+            current = {"event": match.group(1), "ts": parse_stamp(match.group(2)), "source": source}
+            body = []
+        elif current is not None:
+            body.append(line)
+    finish()
+    return corpus
+
+
+def load_captures(capture_dir: Path) -> List[Dict[str, Any]]:
+    """
+    Load payload capture files (<Event>-<YYYYmmdd-HHMMSS>-<pid>-<hex>.json)
+
+    Args:
+        capture_dir: logs/payloads directory
+
+    Returns:
+        List of {'event', 'ts', 'payload', 'source'}
+    """
+    corpus = []
+    for path in sorted(Path(capture_dir).glob("*.json")):
+        parts = path.stem.split("-")
+        if len(parts) < 3:
+            continue
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        if not isinstance(payload, dict):
+            continue
+        try:
+            ts = datetime.strptime(f"{parts[1]}-{parts[2]}", "%Y%m%d-%H%M%S").timestamp()
+        except ValueError:
+            ts = path.stat().st_mtime
+        corpus.append({"event": parts[0], "ts": ts, "payload": payload, "source": path.name})
+    return corpus
+
+
+def load_corpus(log_dir: Path, source: str = "both") -> List[Dict[str, Any]]:
+    """
+    Build the replay corpus from a log directory
+
+    Args:
+        log_dir: ~/.wsl-toast/logs
+        source: 'log' (hooks.log), 'captures' (payloads/) or 'both'
+
+    Returns:
+        Payloads in recorded order; with 'both', a payload found in both
+        sources within two seconds is kept once
+    """
+    corpus: List[Dict[str, Any]] = []
+    if source in ("log", "both"):
+        for path in log_files(log_dir):
+            opener = gzip.open if path.suffix == ".gz" else open
+            try:
+                with opener(path, "rt", encoding="utf-8", errors="replace") as f:
+                    corpus += parse_hooks_log(f, path.name)
+            except (OSError, EOFError):
+                continue
+    if source in ("captures", "both"):
+        seen = {(item["event"], json.dumps(item["payload"], sort_keys=True)): item["ts"] for item in corpus}
+        for item in load_captures(Path(log_dir) / "payloads"):
+            ts = seen.get((item["event"], json.dumps(item["payload"], sort_keys=True)))
+            if ts is None or item["ts"] is None or abs(ts - item["ts"]) > 2:
+                corpus.append(item)
+    # Stable sort keeps file order for entries without a time
+    order = {id(item): i for i, item in enumerate(corpus)}
+    corpus.sort(key=lambda item: (item["ts"] if item["ts"] is not None else float("inf"), order[id(item)]))
+    return corpus
+
+
+def replay(corpus: List[Dict[str, Any]], speed: float = 1.0,
+           hooks_dir: Optional[Path] = None) -> List[Dict[str, Any]]:
+    """
+    Run each payload through its hook against the stand-in powershell.exe
+
+    Args:
+        corpus: Output of load_corpus()
+        speed: Timing factor (1 = recorded gaps, 10 = ten times faster, 0 = no waits)
+        hooks_dir: Directory holding the hook scripts (default: hooks/)
+
+    Returns:
+        One result per payload: event, source, latency_ms and the
+        notifications it produced (list of toast() dicts)
+    """
+    hooks_dir = Path(hooks_dir) if hooks_dir else PROJECT_ROOT / "hooks"
+    results = []
+    with tempfile.TemporaryDirectory(prefix="wsl-toast-replay-") as tmp:
+        tmp_path = Path(tmp)
+        home = tmp_path / "home"
+        log_dir = home / ".wsl-toast" / "logs"
+        log_dir.mkdir(parents=True)
+        calls_log = tmp_path / "powershell-calls.log"
+        env = fake_powershell.environment(fake_powershell.install(tmp_path / "bin"), home, calls_log, 0)
+        # Live config must not change what is replayed
+        env.pop("WSL_TOAST_CONFIG", None)
+
+        started = time.perf_counter()
+        first_ts = next((item["ts"] for item in corpus if item["ts"] is not None), None)
+        for item in corpus:
+            script = hooks_dir / f"{item['event']}.sh"
+            if not script.exists():
+                continue
+            if speed > 0 and first_ts is not None and item["ts"] is not None:
+                delay = started + (item["ts"] - first_ts) / speed - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            calls = fake_powershell.call_count(calls_log)
+            payload = json.dumps(item["payload"], ensure_ascii=False).encode("utf-8")
+            sample = run_once(script, payload, env, log_dir)
+            settle(calls_log, 0)
+            new_calls = fake_powershell.read_calls(calls_log)[calls:]
+            results.append({
+                "event": item["event"],
+                "source": item["source"],
+                "latency_ms": round(sample["wall_ms"], 2),
+                "notifications": [fake_powershell.toast(call["args"]) for call in new_calls],
+            })
+    return results
+
+
+def compare(results: List[Dict[str, Any]], baseline: List[Dict[str, Any]],
+            threshold: float = DEFAULT_THRESHOLD) -> Dict[str, Any]:
+    """
+    Diff a replay against a baseline replay of the same corpus
+
+    Args:
+        results: Output of replay()
+        baseline: Earlier output of replay()
+        threshold: Relative median latency growth counted as a regression
+
+    Returns:
+        Dictionary with 'changed' (index, event, before, after), 'latency'
+        (per event: baseline and current median ms, ratio, regressed) and
+        'count_mismatch' when the runs replayed a different number of payloads
+    """
+    changed = []
+    for index, (old, new) in enumerate(zip(baseline, results)):
+        if old["event"] != new["event"] or old["notifications"] != new["notifications"]:
+            changed.append({"index": index, "event": new["event"],
+                            "before": old["notifications"], "after": new["notifications"]})
+
+    def medians(rows: List[Dict[str, Any]]) -> Dict[str, float]:
+        by_event: Dict[str, List[float]] = {}
+        for row in rows:
+            by_event.setdefault(row["event"], []).append(row["latency_ms"])
+        return {event: statistics.median(values) for event, values in by_event.items()}
+
+    before, after = medians(baseline), medians(results)
+    latency = {}
+    for event in sorted(set(before) & set(after)):
+        ratio = after[event] / before[event] if before[event] else 1.0
+        latency[event] = {"baseline_ms": round(before[event], 2), "median_ms": round(after[event], 2),
+                          "ratio": round(ratio, 3), "regressed": ratio > 1 + threshold}
+    return {"changed": changed, "latency": latency, "count_mismatch": len(results) != len(baseline)}
+
+
+def format_diff(diff: Dict[str, Any]) -> str:
+    """
+    Format a comparison as plain text
+
+    Args:
+        diff: Output of compare()
+
+    Returns:
+        Multi-line text
+    """
+    lines = [f"{'event':<20}{'baseline ms':>13}{'median ms':>12}{'ratio':>8}"]
+    for event, row in diff["latency"].items():
+        flag = "  REGRESSION" if row["regressed"] else ""
+        lines.append(f"{event:<20}{row['baseline_ms']:>13.1f}{row['median_ms']:>12.1f}{row['ratio']:>8.2f}{flag}")
+    lines.append("")
+    if diff["count_mismatch"]:
+        lines.append("Warning: the baseline replayed a different number of payloads")
+    lines.append(f"{len(diff['changed'])} payload(s) produced different notifications")
+    for change in diff["changed"]:
+        lines.append(f"  #{change['index']} {change['event']}: {change['before']} -> {change['after']}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(prog="python3 -m benchmarks.replay",
+                                     description="Replay captured hook payloads against a stand-in backend")
+    parser.add_argument("--log-dir", default=str(Path.home() / ".wsl-toast" / "logs"),
+                        help="directory holding hooks.log and payloads/ (default: ~/.wsl-toast/logs)")
+    parser.add_argument("--source", choices=SOURCES, default="both", help="payload source (default: both)")
+    parser.add_argument("--speed", type=float, default=1.0,
+                        help="timing factor: 1 recorded gaps, 10 ten times faster, 0 no waits (default: 1)")
+    parser.add_argument("--limit", type=int, help="replay only the first N payloads")
+    parser.add_argument("--hooks-dir", help="directory holding the hook scripts (default: hooks/)")
+    parser.add_argument("--output", metavar="FILE", help="write the replay results to FILE")
+    parser.add_argument("--compare", metavar="FILE", help="diff against results saved with --output")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"median latency growth counted as a regression (default: {DEFAULT_THRESHOLD})")
+    parser.add_argument("--json", action="store_true", help="print JSON")
+    args = parser.parse_args(argv)
+    if args.speed < 0:
+        parser.error("--speed must not be negative")
+
+    baseline = None
+    if args.compare:
+        try:
+            baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))["results"]
+        except (OSError, ValueError, KeyError) as e:
+            parser.error(f"cannot read {args.compare}: {e}")
+
+    corpus = load_corpus(Path(args.log_dir), args.source)[:args.limit]
+    if not corpus:
+        sys.stderr.write(f"no payloads found in {args.log_dir} "
+                         "(set hook_log_level to debug or enable hook_capture_payloads)\n")
+        return 1
+    results = replay(corpus, args.speed, Path(args.hooks_dir) if args.hooks_dir else None)
+    if args.output:
+        Path(args.output).write_text(json.dumps({"results": results}, indent=2, ensure_ascii=False) + "\n",
+                                     encoding="utf-8")
+
+    if baseline is None:
+        if args.json:
+            print(json.dumps(results, indent=2, ensure_ascii=False))
+        else:
+            toasts = sum(len(r["notifications"]) for r in results)
+            print(f"replayed {len(results)} payloads, {toasts} notifications")
+            for event, ms in sorted(compare(results, results)["latency"].items()):
+                print(f"  {event:<20} median {ms['median_ms']:.1f} ms")
+        return 0
+
+    diff = compare(results, baseline, args.threshold)
+    print(json.dumps(diff, indent=2, ensure_ascii=False) if args.json else format_diff(diff))
+    regressed = any(row["regressed"] for row in diff["latency"].values())
+    return 1 if diff["changed"] or regressed or diff["count_mismatch"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+# transcript_tail.py
+# Benchmark: last assistant message from a large transcript
+#
+# Usage: python3 -m benchmarks.transcript_tail [--size-mb 1024] [--path FILE] [--skip-forward]
+#
+# Generates a transcript of the requested size (large tool results, as in
+# real sessions, with multi-byte text) and times the backward reader used
+# by the Stop hook against the previous front-to-back scan.
+#
+# Author: Claude Code TDD Implementation
+# Version: 1.0.0
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict
+
+from src.transcript import extract_text_from_content, get_last_assistant_message
+
+# Size of one generated tool result; real Read/Bash results are often this large
+TOOL_RESULT_BYTES = 48 * 1024
+
+
+def generate_transcript(path: str, size_mb: int) -> str:
+    """
+    Write a transcript of roughly size_mb megabytes
+
+    Args:
+        path: Output file
+        size_mb: Target size in MiB
+
+    Returns:
+        Text of the final assistant message
+    """
+    target = size_mb * 1024 * 1024
+    filler = ("로그 출력 line — ログ 数据 " * (TOOL_RESULT_BYTES // 40))[: TOOL_RESULT_BYTES // 3]
+    tool_result = json.dumps({
+        "type": "user",
+        "message": {"role": "user", "content": [
+            {"type": "tool_result", "tool_use_id": "toolu_01", "content": filler},
+        ]},
+    }, ensure_ascii=False).encode("utf-8") + b"\n"
+
+    written = 0
+    turn = 0
+    with open(path, "wb") as f:
+        while written < target:
+            turn += 1
+            assistant = json.dumps({
+                "type": "assistant",
+                "message": {"role": "assistant", "content": [
+                    {"type": "text", "text": f"Step {turn} finished. Moving on."},
+                ]},
+            }, ensure_ascii=False).encode("utf-8") + b"\n"
+            f.write(assistant)
+            f.write(tool_result)
+            written += len(assistant) + len(tool_result)
+    return f"Step {turn} finished. Moving on."
+
+
+def forward_scan(transcript_path: str) -> str:
+    """Previous implementation: parse every line front to back"""
+    last_text = ""
+    with open(transcript_path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            msg = entry.get("message", {}) if isinstance(entry, dict) else {}
+            if isinstance(msg, dict) and msg.get("role") == "assistant":
+                text = extract_text_from_content(msg.get("content", []))
+                if text:
+                    last_text = text
+    return last_text
+
+
+def measure(func: Callable[[str], str], path: str) -> Dict[str, float]:
+    """
+    Time one call and record peak Python memory
+
+    Args:
+        func: Reader to measure
+        path: Transcript path
+
+    Returns:
+        Dictionary with 'seconds', 'peak_mib' and 'result'
+    """
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = func(path)
+    seconds = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"seconds": seconds, "peak_mib": peak / (1024 * 1024), "result": result}
+
+
+def main(argv=None) -> int:
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(prog="python3 -m benchmarks.transcript_tail")
+    parser.add_argument("--size-mb", type=int, default=1024, help="transcript size (default: 1024)")
+    parser.add_argument("--path", help="reuse or keep the transcript at this path")
+    parser.add_argument("--skip-forward", action="store_true", help="only time the backward reader")
+    args = parser.parse_args(argv)
+
+    path = args.path or os.path.join(tempfile.gettempdir(), f"wsl-toast-bench-{args.size_mb}mb.jsonl")
+    try:
+        if not os.path.exists(path) or os.path.getsize(path) < args.size_mb * 1024 * 1024:
+            print(f"Generating {args.size_mb} MiB transcript at {path} ...")
+            generate_transcript(path, args.size_mb)
+
+        print(f"Transcript: {os.path.getsize(path) / (1024 * 1024):.0f} MiB")
+        backward = measure(get_last_assistant_message, path)
+        print(f"backward  {backward['seconds'] * 1000:10.2f} ms  peak {backward['peak_mib']:8.2f} MiB")
+        if not args.skip_forward:
+            forward = measure(forward_scan, path)
+            print(f"forward   {forward['seconds'] * 1000:10.2f} ms  peak {forward['peak_mib']:8.2f} MiB")
+            if forward["result"] != backward["result"]:
+                print("MISMATCH between forward and backward results", file=sys.stderr)
+                return 1
+            print(f"speedup   {forward['seconds'] / max(backward['seconds'], 1e-9):10.0f}x")
+    finally:
+        if not args.path and os.path.exists(path):
+            os.unlink(path)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,15 +4,132 @@ Fix Claude Code hooks configuration to use the correct format.
 
 Run this script in any directory containing a .claude/settings.json file
 to fix the hooks configuration format.
+
+With --scan ROOT, every .claude/settings.json and settings.local.json below
+ROOT is checked in parallel for legacy-format entries and for hooks that
+are registered more than once (including hooks already registered in the
+user-level ~/.claude/settings.json). Add --fix to rewrite them.
 """
 
+import argparse
+import copy
 import json
+import os
 import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from src.config_loader import load_config
+    from src.matchers import MATCH_ALL, estimate_invocations, format_savings, get_tool_matcher
+except ImportError:  # copied out of the project: matcher narrowing unavailable
+    load_config = None
+    estimate_invocations = None
+
+# Matchers that make Claude Code launch a hook for every tool
+CATCH_ALL_MATCHERS = (None, "", "*", ".*")
+
+# Events whose matcher is applied to the tool name
+TOOL_EVENTS = ('PreToolUse', 'PostToolUse', 'PermissionRequest')
+
+# Settings files Claude Code merges for a project, in precedence order
+PROJECT_SETTINGS_FILES = ('settings.json', 'settings.local.json')
+
+# Our hook scripts: the same script registered under two of our hook
+# directories (see wsl_toast_hook_dirs) is a duplicate
+WSL_TOAST_HOOK_SCRIPTS = {
+    'Notification.sh', 'Stop.sh', 'PermissionRequest.sh', 'PostToolUse.sh',
+    'SessionStart.sh', 'SessionEnd.sh', 'UserPromptSubmit.sh', 'SubagentStop.sh',
+}
+
+# Where setup.sh installs the hook scripts
+WSL_TOAST_INSTALL_DIR = os.path.join('$HOME', '.claude', 'hooks', 'wsl-toast')
+
+# This repository's hook scripts
+PACKAGE_HOOKS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'hooks')
+
+# Directories never descended into while scanning
+SCAN_SKIP_DIRS = {
+    'node_modules', '__pycache__', 'venv', 'dist', 'build', 'target', 'vendor',
+}
+
+
+def narrow_post_tool_use_matchers(hooks: dict, matcher: str) -> List[str]:
+    """Replace catch-all matchers on our PostToolUse hooks with a narrow one.
+
+    Only entries whose commands run PostToolUse.sh are touched; other
+    PostToolUse hooks in the same settings file keep their matchers.
+    Returns a description of each change.
+    """
+    fixes = []
+    for hook_entry in hooks.get('PostToolUse', []):
+        if not isinstance(hook_entry, dict):
+            continue
+        commands = [h.get('command', '') for h in hook_entry.get('hooks', []) if isinstance(h, dict)]
+        if not any(hook_identity(command) == 'wsl-toast:PostToolUse.sh' for command in commands):
+            continue
+        if hook_entry.get('matcher') in CATCH_ALL_MATCHERS and matcher not in CATCH_ALL_MATCHERS:
+            hook_entry['matcher'] = matcher
+            fixes.append(f"Narrowed PostToolUse matcher to: {matcher}")
+    return fixes
 
 
-def fix_hooks_config(settings_path: Path) -> bool:
-    """Fix hooks configuration in settings.json file."""
+def fix_hooks(hooks: dict, tool_matcher: Optional[str] = None) -> List[str]:
+    """Fix legacy-format entries in a 'hooks' object in place.
+
+    Returns a description of each change (empty if nothing was wrong).
+    """
+    fixes = []
+
+    # Fix SessionStart/SessionEnd - wrap with hooks structure (no matcher for these)
+    for event in ('SessionStart', 'SessionEnd'):
+        entries = hooks.get(event)
+        if not entries:
+            continue
+        # Check if it's using old format (direct array of hooks)
+        if 'hooks' not in entries[0]:
+            # Old format: wrap with hooks
+            hooks[event] = [{'hooks': entries}]
+            fixes.append(f"Wrapped {event} hooks (no matcher needed)")
+        elif 'matcher' in entries[0] and entries[0]['matcher'] == {}:
+            # Has empty matcher that should be removed
+            del entries[0]['matcher']
+            fixes.append(f"Removed empty matcher from {event}")
+
+    # Fix PostToolUse - ensure matcher is a string
+    for hook_entry in hooks.get('PostToolUse', []):
+        if 'matcher' in hook_entry:
+            current_matcher = hook_entry['matcher']
+            if isinstance(current_matcher, dict):
+                # Convert object matcher to string pattern
+                if 'tools' in current_matcher:
+                    tools = current_matcher['tools']
+                    if isinstance(tools, list):
+                        hook_entry['matcher'] = '|'.join(tools)
+                    else:
+                        hook_entry['matcher'] = str(tools)
+                    fixes.append(f"Converted PostToolUse matcher to string: {hook_entry['matcher']}")
+                # Empty dict: keep it as is for SessionStart/SessionEnd style
+            elif not isinstance(current_matcher, str):
+                # Convert non-string matcher to string
+                hook_entry['matcher'] = str(current_matcher)
+                fixes.append(f"Converted PostToolUse matcher to string: {hook_entry['matcher']}")
+
+    if tool_matcher is not None:
+        fixes.extend(narrow_post_tool_use_matchers(hooks, tool_matcher))
+
+    return fixes
+
+
+def fix_hooks_config(settings_path: Path, tool_matcher: Optional[str] = None) -> bool:
+    """Fix hooks configuration in settings.json file.
+
+    When tool_matcher is given, catch-all PostToolUse matchers on our hook
+    are replaced with it (see src/matchers.py).
+    """
     try:
         # Read the current settings
         with open(settings_path, 'r', encoding='utf-8') as f:
@@ -22,81 +139,16 @@ def fix_hooks_config(settings_path: Path) -> bool:
             print("No 'hooks' key found in settings.json")
             return False
 
-        modified = False
-        hooks = settings['hooks']
-
-        # Fix SessionStart - wrap with hooks structure (no matcher for SessionStart/SessionEnd)
-        if 'SessionStart' in hooks:
-            session_start = hooks['SessionStart']
-            # Check if it's using old format (direct array of hooks)
-            if session_start:
-                if 'hooks' not in session_start[0]:
-                    # Old format: wrap with hooks
-                    hooks['SessionStart'] = [
-                        {
-                            'hooks': session_start
-                        }
-                    ]
-                    modified = True
-                    print("Fixed: Wrapped SessionStart hooks (no matcher needed)")
-                elif 'matcher' in session_start[0] and session_start[0]['matcher'] == {}:
-                    # Has empty matcher that should be removed
-                    del session_start[0]['matcher']
-                    modified = True
-                    print("Fixed: Removed empty matcher from SessionStart")
-
-        # Fix SessionEnd - wrap with hooks structure (no matcher for SessionStart/SessionEnd)
-        if 'SessionEnd' in hooks:
-            session_end = hooks['SessionEnd']
-            # Check if it's using old format (direct array of hooks)
-            if session_end:
-                if 'hooks' not in session_end[0]:
-                    # Old format: wrap with hooks
-                    hooks['SessionEnd'] = [
-                        {
-                            'hooks': session_end
-                        }
-                    ]
-                    modified = True
-                    print("Fixed: Wrapped SessionEnd hooks (no matcher needed)")
-                elif 'matcher' in session_end[0] and session_end[0]['matcher'] == {}:
-                    # Has empty matcher that should be removed
-                    del session_end[0]['matcher']
-                    modified = True
-                    print("Fixed: Removed empty matcher from SessionEnd")
-
-        # Fix PostToolUse - ensure matcher is a string
-        if 'PostToolUse' in hooks:
-            for hook_entry in hooks['PostToolUse']:
-                if 'matcher' in hook_entry:
-                    current_matcher = hook_entry['matcher']
-                    if isinstance(current_matcher, dict):
-                        # Convert object matcher to string pattern
-                        if 'tools' in current_matcher:
-                            tools = current_matcher['tools']
-                            if isinstance(tools, list):
-                                hook_entry['matcher'] = '|'.join(tools)
-                            else:
-                                hook_entry['matcher'] = str(tools)
-                            modified = True
-                            print(f"Fixed: Converted PostToolUse matcher to string: {hook_entry['matcher']}")
-                        else:
-                            # Empty dict, keep it as is for SessionStart/SessionEnd style
-                            pass
-                    elif not isinstance(current_matcher, str):
-                        # Convert non-string matcher to string
-                        hook_entry['matcher'] = str(current_matcher)
-                        modified = True
-                        print(f"Fixed: Converted PostToolUse matcher to string: {hook_entry['matcher']}")
-
-        if not modified:
+        fixes = fix_hooks(settings['hooks'], tool_matcher)
+        for fix in fixes:
+            print(f"Fixed: {fix}")
+
+        if not fixes:
             print("No changes needed - hooks configuration is already correct")
             return True
 
         # Write back the fixed settings
-        with open(settings_path, 'w', encoding='utf-8') as f:
-            json.dump(settings, f, indent=2)
-            f.write('\n')  # Add trailing newline
+        write_settings(settings_path, settings)
 
         print(f"Successfully fixed {settings_path}")
         return True
@@ -109,8 +161,403 @@ def fix_hooks_config(settings_path: Path) -> bool:
         return False
 
 
-def main():
+def write_settings(settings_path: Path, settings: dict) -> None:
+    """Write settings back in the format Claude Code uses.
+
+    The file is written to a temporary file next to it and moved into
+    place, so an interrupted run never leaves a truncated settings file.
+    The original file's permissions are kept.
+    """
+    settings_path = Path(settings_path)
+    try:
+        mode = settings_path.stat().st_mode & 0o7777
+    except OSError:
+        mode = None
+    fd, tmp_path = tempfile.mkstemp(dir=str(settings_path.parent),
+                                    prefix=f".{settings_path.name}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(settings, f, indent=2)
+            f.write('\n')  # Add trailing newline
+            f.flush()
+            os.fsync(f.fileno())
+        if mode is not None:
+            os.chmod(tmp_path, mode)
+        os.replace(tmp_path, settings_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+#############################################################################
+# Fleet scan (--scan ROOT)
+#############################################################################
+
+
+def normalize_path(word: str, project_dir: Optional[Path] = None) -> str:
+    """Normalize a path as spelled in a hook command.
+
+    Quotes are dropped, ~ and ${VAR} are spelled $VAR, and
+    $CLAUDE_PROJECT_DIR is replaced with project_dir when it is known.
+    """
+    path = word.replace('"', '').replace("'", '').replace('\\', '/')
+    path = path.replace('${HOME}', '$HOME').replace('${CLAUDE_PROJECT_DIR}', '$CLAUDE_PROJECT_DIR')
+    if path == '~' or path.startswith('~/'):
+        path = '$HOME' + path[1:]
+    if project_dir is not None:
+        path = path.replace('$CLAUDE_PROJECT_DIR', str(project_dir))
+    return os.path.normpath(path) if '/' in path else path
+
+
+def wsl_toast_hook_dirs(project_dir: Optional[Path] = None) -> set:
+    """Directories our hook scripts are run from.
+
+    These are the setup.sh install directory, this repository's hooks/ and
+    the hooks/ directory of a project that keeps a copy of them, as in
+    settings.example.json.
+    """
+    home = str(Path.home())
+    dirs = {WSL_TOAST_INSTALL_DIR, WSL_TOAST_INSTALL_DIR.replace('$HOME', home, 1),
+            PACKAGE_HOOKS_DIR, normalize_path('$CLAUDE_PROJECT_DIR/hooks')}
+    if project_dir is not None:
+        dirs.add(normalize_path('$CLAUDE_PROJECT_DIR/hooks', project_dir))
+    return dirs
+
+
+def hook_identity(command: str, project_dir: Optional[Path] = None) -> str:
+    """Identify what a hook command runs, independent of how it is spelled.
+
+    Our hook scripts are identified by name when they are run from one of
+    our hook directories, so $HOME/.claude/hooks/wsl-toast/Stop.sh and
+    $CLAUDE_PROJECT_DIR/hooks/Stop.sh count as the same hook. Any other
+    command, including a third-party script that happens to be called
+    Stop.sh, is identified by its full normalized command line.
+    """
+    words = [normalize_path(word, project_dir) for word in str(command).split()]
+    our_dirs = wsl_toast_hook_dirs(project_dir)
+    for word in words:
+        directory, _, script = word.rpartition('/')
+        if script in WSL_TOAST_HOOK_SCRIPTS and directory in our_dirs:
+            return f"wsl-toast:{script}"
+    return ' '.join(words)
+
+
+def iter_hook_commands(hooks: dict):
+    """Yield (event, entry, hook) for every command hook in a 'hooks' object.
+
+    Legacy entries (a hook object directly in the event list) are yielded
+    with the hook as its own entry.
+    """
+    if not isinstance(hooks, dict):
+        return
+    for event, entries in hooks.items():
+        if not isinstance(entries, list):
+            continue
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            inner = entry.get('hooks')
+            if isinstance(inner, list):
+                for hook in inner:
+                    if isinstance(hook, dict) and 'command' in hook:
+                        yield event, entry, hook
+            elif 'command' in entry:
+                yield event, entry, entry
+
+
+def matcher_key(entry: dict) -> str:
+    """Normalize an entry's matcher for comparison; every catch-all becomes '*'."""
+    matcher = entry.get('matcher')
+    if matcher in CATCH_ALL_MATCHERS:
+        return '*'
+    if isinstance(matcher, str):
+        return matcher
+    return json.dumps(matcher, sort_keys=True)
+
+
+def remove_duplicate_hooks(hooks: dict, seen: Dict[Tuple[str, str, str], str], source: str,
+                           project_dir: Optional[Path] = None) -> List[str]:
+    """Remove hooks already registered elsewhere, in place.
+
+    seen maps (event, identity, matcher) to the file that registered it
+    first and is updated with this file's hooks. A hook is a duplicate when
+    it was registered before with the same matcher or with a catch-all one,
+    which launches it for every tool the later matcher could. The same
+    script under different matchers (e.g. "Bash" and "Edit") is kept.
+    project_dir resolves $CLAUDE_PROJECT_DIR in commands (see hook_identity).
+    Returns a description of each duplicate.
+    """
+    duplicates = []
+    for event, entry, hook in list(iter_hook_commands(hooks)):
+        identity = hook_identity(hook['command'], project_dir)
+        key = (event, identity, matcher_key(entry))
+        earlier = seen.get(key) or seen.get((event, identity, '*'))
+        if earlier is None:
+            seen[key] = source
+            continue
+        where = 'earlier in this file' if earlier == source else f"also in {earlier}"
+        duplicates.append(f"Duplicate {event} hook {hook['command']} ({where})")
+        if hook is entry:
+            hooks[event].remove(entry)
+        else:
+            entry['hooks'].remove(hook)
+            if not entry['hooks']:
+                hooks[event].remove(entry)
+        if not hooks[event]:
+            del hooks[event]
+    return duplicates
+
+
+def entry_weight(event: str, entry: dict) -> float:
+    """Hook processes one entry starts per event, on average.
+
+    For tool events this is the share of tool calls the matcher lets
+    through, estimated from src.matchers.REFERENCE_TOOL_MIX; other events
+    start the hook every time.
+    """
+    matcher = entry.get('matcher')
+    if event not in TOOL_EVENTS or estimate_invocations is None or matcher in CATCH_ALL_MATCHERS:
+        return 1.0
+    if not isinstance(matcher, str):
+        return 1.0
+    estimate = estimate_invocations(matcher)
+    return estimate['invoked'] / estimate['total'] if estimate['total'] else 1.0
+
+
+def count_invocations(hooks_list: List[dict]) -> Dict[str, float]:
+    """Estimate the hook processes Claude Code starts per event.
+
+    hooks_list holds the 'hooks' objects of every settings file Claude Code
+    merges for a project (user, project, local). Each hook is weighted by
+    its entry's matcher (see entry_weight), so narrowing a catch-all
+    PostToolUse matcher shows up as fewer invocations.
+    """
+    counts: Dict[str, float] = {}
+    for hooks in hooks_list:
+        for event, entry, _hook in iter_hook_commands(hooks):
+            counts[event] = counts.get(event, 0.0) + entry_weight(event, entry)
+    return {event: round(count, 2) for event, count in counts.items()}
+
+
+def find_settings_dirs(root: Path, workers: int = 8) -> List[Path]:
+    """Find every .claude directory below root holding a settings file.
+
+    The top-level subdirectories are walked in parallel. Hidden
+    directories (other than .claude), node_modules, virtualenvs and build
+    output are skipped.
+    """
+    def has_settings(claude_dir: str) -> bool:
+        return any(os.path.isfile(os.path.join(claude_dir, name)) for name in PROJECT_SETTINGS_FILES)
+
+    def walk(top: str) -> List[str]:
+        found = []
+        stack = [top]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        if not entry.is_dir(follow_symlinks=False):
+                            continue
+                        if entry.name == '.claude':
+                            if has_settings(entry.path):
+                                found.append(entry.path)
+                        elif not entry.name.startswith('.') and entry.name not in SCAN_SKIP_DIRS:
+                            stack.append(entry.path)
+            except OSError:
+                continue
+        return found
+
+    root = str(root)
+    found = []
+    subdirs = []
+    try:
+        with os.scandir(root) as it:
+            for entry in it:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                if entry.name == '.claude':
+                    if has_settings(entry.path):
+                        found.append(entry.path)
+                elif not entry.name.startswith('.') and entry.name not in SCAN_SKIP_DIRS:
+                    subdirs.append(entry.path)
+    except OSError:
+        return []
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for result in pool.map(walk, subdirs):
+            found.extend(result)
+    return sorted(Path(p) for p in found)
+
+
+def load_hooks(settings_path: Path) -> Tuple[Optional[dict], Optional[str]]:
+    """Load a settings file, returning (settings, error)."""
+    try:
+        with open(settings_path, 'r', encoding='utf-8') as f:
+            settings = json.load(f)
+    except json.JSONDecodeError as e:
+        return None, f"Invalid JSON: {e}"
+    except OSError as e:
+        return None, str(e)
+    if not isinstance(settings, dict):
+        return None, "Settings file is not a JSON object"
+    return settings, None
+
+
+def scan_project(claude_dir: Path, user_hooks: dict, user_source: str,
+                 tool_matcher: Optional[str] = None, fix: bool = False) -> dict:
+    """Check one project's settings files against each other and the user settings.
+
+    Returns a report with 'project', 'files' (path -> list of findings),
+    'errors', the numbers of 'duplicates', 'legacy' entries and 'narrowed'
+    catch-all matchers, 'before' and 'after' per-event invocation estimates
+    and whether anything was 'fixed'.
+    """
+    project_dir = claude_dir.parent
+    seen: Dict[Tuple[str, str, str], str] = {}
+    remove_duplicate_hooks(copy.deepcopy(user_hooks), seen, user_source, project_dir)
+
+    report = {'project': str(project_dir), 'files': {}, 'errors': {},
+              'duplicates': 0, 'legacy': 0, 'narrowed': 0, 'fixed': False}
+    before = [user_hooks]
+    after = [user_hooks]
+
+    for name in PROJECT_SETTINGS_FILES:
+        settings_path = claude_dir / name
+        if not settings_path.is_file():
+            continue
+        settings, error = load_hooks(settings_path)
+        if error:
+            report['errors'][str(settings_path)] = error
+            continue
+        hooks = settings.get('hooks')
+        if not isinstance(hooks, dict):
+            continue
+
+        before.append(copy.deepcopy(hooks))
+        legacy = fix_hooks(hooks)
+        narrowed = narrow_post_tool_use_matchers(hooks, tool_matcher) if tool_matcher is not None else []
+        duplicates = remove_duplicate_hooks(hooks, seen, str(settings_path), project_dir)
+        after.append(hooks)
+
+        findings = legacy + narrowed + duplicates
+        if findings:
+            report['files'][str(settings_path)] = findings
+            report['legacy'] += len(legacy)
+            report['narrowed'] += len(narrowed)
+            report['duplicates'] += len(duplicates)
+            if fix:
+                write_settings(settings_path, settings)
+                report['fixed'] = True
+
+    report['before'] = count_invocations(before)
+    report['after'] = count_invocations(after)
+    return report
+
+
+def format_counts(counts: Dict[str, float]) -> str:
+    """Format per-event invocation estimates as 'Event=N ...'."""
+    return ' '.join(f"{event}={counts[event]:g}" for event in sorted(counts)) or '(no hooks)'
+
+
+def scan(root: Path, user_settings: Optional[Path] = None, fix: bool = False,
+         workers: int = 8, tool_matcher: Optional[str] = None, out=None) -> int:
+    """Scan a tree of projects and print a report.
+
+    Returns the number of projects with duplicate or legacy hook entries.
+    """
+    out = out or sys.stdout
+    started = time.monotonic()
+
+    user_hooks: dict = {}
+    user_source = str(user_settings) if user_settings else '(no user settings)'
+    if user_settings and user_settings.is_file():
+        settings, error = load_hooks(user_settings)
+        if error:
+            print(f"Warning: {user_settings}: {error}", file=out)
+        elif isinstance(settings.get('hooks'), dict):
+            user_hooks = settings['hooks']
+
+    claude_dirs = find_settings_dirs(root, workers)
+    # The user-level settings are not a project
+    if user_settings:
+        claude_dirs = [d for d in claude_dirs if d != user_settings.parent]
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        reports = list(pool.map(
+            lambda d: scan_project(d, user_hooks, user_source, tool_matcher, fix), claude_dirs))
+
+    affected = 0
+    totals = {'duplicates': 0, 'legacy': 0, 'narrowed': 0, 'errors': 0}
+    for report in reports:
+        totals['duplicates'] += report['duplicates']
+        totals['legacy'] += report['legacy']
+        totals['narrowed'] += report['narrowed']
+        totals['errors'] += len(report['errors'])
+        if not report['files'] and not report['errors']:
+            continue
+        affected += 1 if report['files'] else 0
+        print(report['project'], file=out)
+        for path, error in report['errors'].items():
+            print(f"  Error: {path}: {error}", file=out)
+        for path, findings in report['files'].items():
+            print(f"  {path}", file=out)
+            for finding in findings:
+                print(f"    {'Fixed' if fix else 'Found'}: {finding}", file=out)
+        print(f"  Invocations per event: {format_counts(report['before'])}", file=out)
+        print(f"  After fixing:          {format_counts(report['after'])}", file=out)
+
+    elapsed = time.monotonic() - started
+    print('-' * 50, file=out)
+    print(f"Scanned {len(claude_dirs)} projects in {elapsed:.2f}s: "
+          f"{totals['duplicates']} duplicate and {totals['legacy']} legacy hook entries, "
+          f"{totals['narrowed']} catch-all matchers to narrow "
+          f"in {affected} projects, {totals['errors']} unreadable files", file=out)
+    if affected and not fix:
+        print("Re-run with --fix to rewrite them", file=out)
+    return affected
+
+
+def parse_args(argv=None):
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Fix Claude Code hooks configuration format.")
+    parser.add_argument('--scan', metavar='ROOT', type=Path,
+                        help="check every project below ROOT instead of this directory")
+    parser.add_argument('--fix', action='store_true',
+                        help="with --scan: rewrite duplicate and legacy entries")
+    parser.add_argument('--user-settings', metavar='PATH', type=Path,
+                        default=Path.home() / '.claude' / 'settings.json',
+                        help="user-level settings checked for duplicates (default: ~/.claude/settings.json)")
+    parser.add_argument('--workers', type=int, default=min(32, (os.cpu_count() or 1) * 4),
+                        help="threads used by --scan")
+    return parser.parse_args(argv)
+
+
+def get_default_tool_matcher(verbose: bool = True) -> Optional[str]:
+    """PostToolUse matcher from hook_tool_allowlist / hook_tool_denylist."""
+    if load_config is None:
+        return None
+    tool_matcher = get_tool_matcher(load_config())
+    if verbose and tool_matcher != MATCH_ALL:
+        print(format_savings(tool_matcher))
+    return tool_matcher
+
+
+def main(argv=None):
     """Main entry point."""
+    args = parse_args(argv)
+
+    if args.scan is not None:
+        if not args.scan.is_dir():
+            print(f"Error: {args.scan} is not a directory")
+            sys.exit(1)
+        affected = scan(args.scan, args.user_settings, args.fix, max(1, args.workers),
+                        get_default_tool_matcher(verbose=False))
+        sys.exit(1 if affected and not args.fix else 0)
+
     # Get the script's directory
     script_dir = Path(__file__).parent
     settings_path = script_dir / '.claude' / 'settings.json'
@@ -124,7 +571,7 @@ def main():
     print(f"Fixing hooks configuration in: {settings_path}")
     print("-" * 50)
 
-    success = fix_hooks_config(settings_path)
+    success = fix_hooks_config(settings_path, get_default_tool_matcher())
 
     if success:
         print("-" * 50)
@@ -6,46 +6,12 @@
 #
 # Author: Claude Code TDD Implementation
 # Version: 1.0.0
+#
+# All work happens in one python3 process (src/hooks.py); this is only a shim.
+# src/ lives next to the hooks when installed and one level up in a checkout.
+# Running from there also keeps python3 -m from importing the project's own src/.
 
-# Script directory and paths
-SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
-PROJECT_ROOT="$(cd "${SCRIPT_DIR}/.." && pwd)"
-NOTIFY_SCRIPT="${PROJECT_ROOT}/scripts/notify.sh"
-CONFIG_DIR="${HOME}/.wsl-toast"
-CONFIG_FILE="${CONFIG_DIR}/config.json"
-
-# Exit if notify script doesn't exist
-if [ ! -f "$NOTIFY_SCRIPT" ]; then
-    exit 0
-fi
-
-# Load language from config (default: English)
-LANGUAGE="en"
-if [ -f "$CONFIG_FILE" ]; then
-    LANGUAGE="$(python3 -c "import json; print(json.load(open('$CONFIG_FILE')).get('language', 'en'))" 2>/dev/null || echo "en")"
-fi
-
-# Get template based on language
-TITLE="Session Started"
-MESSAGE="Welcome back! Your Claude Code session has started"
-
-if command -v python3 &>/dev/null; then
-    TEMPLATE_JSON="${PROJECT_ROOT}/templates/notifications/${LANGUAGE}.json"
-    if [ -f "$TEMPLATE_JSON" ]; then
-        TEMPLATE_DATA=$(python3 -c "import json; data=json.load(open('$TEMPLATE_JSON')); print(data.get('session_start', {}).get('title', '$TITLE')); print(data.get('session_start', {}).get('message', '$MESSAGE'))" 2>/dev/null)
-        if [ -n "$TEMPLATE_DATA" ]; then
-            TITLE=$(echo "$TEMPLATE_DATA" | sed -n '1p')
-            MESSAGE=$(echo "$TEMPLATE_DATA" | sed -n '2p')
-        fi
-    fi
-fi
-
-# Send notification in background (non-blocking)
-"$NOTIFY_SCRIPT" \
-    --title "$TITLE" \
-    --message "$MESSAGE" \
-    --type "Success" \
-    --background \
-    2>/dev/null || true
-
-exit 0
+[[ "${BASH_SOURCE[0]}" == */* ]] && cd "${BASH_SOURCE[0]%/*}"
+[ -d src ] || cd ..
+command -v python3 &>/dev/null || exit 0
+exec python3 -m src.hooks SessionStart
@@ -10,12 +10,69 @@
 
 set -euo pipefail
 
+# WSL_TOAST_PROFILE=1: time every stage and print one breakdown record.
+# Bash has no monotonic clock builtin; EPOCHREALTIME (bash 5+) is read
+# without forking. When disabled, profile_mark returns at once.
+PROFILE_ENABLED=false
+PROFILE_START_US=0
+PROFILE_LAST_US=0
+PROFILE_STAGES=""
+PROFILE_RESULT=""
+if [[ "${WSL_TOAST_PROFILE:-}" == "1" && -n "${EPOCHREALTIME:-}" ]]; then
+    PROFILE_ENABLED=true
+    PROFILE_START_US="${EPOCHREALTIME//[.,]/}"
+    PROFILE_LAST_US="$PROFILE_START_US"
+    # Correlation id shared with the hook and wsl-toast.ps1
+    PROFILE_TRACE_ID="${WSL_TOAST_TRACE_ID:-${PROFILE_START_US}-$$}"
+    PROFILE_TRACE_ID="${PROFILE_TRACE_ID//[^A-Za-z0-9_-]/}"
+fi
+
+# Format microseconds as milliseconds into the variable named by $1
+profile_ms() {
+    printf -v "$1" '%d.%03d' $(( $2 / 1000 )) $(( $2 % 1000 ))
+}
+
+# Record the time since the previous mark as stage $1
+profile_mark() {
+    [[ "$PROFILE_ENABLED" == "true" ]] || return 0
+    local now="${EPOCHREALTIME//[.,]/}" ms
+    profile_ms ms $(( now - PROFILE_LAST_US ))
+    PROFILE_STAGES+="${PROFILE_STAGES:+,}\"$1\":$ms"
+    PROFILE_LAST_US="$now"
+}
+
+# Print the breakdown record (EXIT trap): stages, the spawn gap since the
+# caller's WSL_TOAST_PROFILE_T0 (µs since the epoch) and wsl-toast.ps1's
+# JSON result, whose Timing holds the PowerShell stages
+profile_emit() {
+    local now="${EPOCHREALTIME//[.,]/}" total spawn="null" result="null"
+    profile_ms total $(( now - PROFILE_START_US ))
+    if [[ "${WSL_TOAST_PROFILE_T0:-}" =~ ^[0-9]+$ ]] && (( PROFILE_START_US >= WSL_TOAST_PROFILE_T0 )); then
+        profile_ms spawn $(( PROFILE_START_US - WSL_TOAST_PROFILE_T0 ))
+    fi
+    if [[ "$PROFILE_RESULT" == "{"*"}" ]]; then
+        result="$PROFILE_RESULT"
+    fi
+    printf 'WSL_TOAST_PROFILE {"trace_id":"%s","spawn_ms":%s,"stages_ms":{%s},"total_ms":%s,"powershell":%s}\n' \
+        "$PROFILE_TRACE_ID" "$spawn" "$PROFILE_STAGES" "$total" "$result"
+}
+
+if [[ "$PROFILE_ENABLED" == "true" ]]; then
+    trap profile_emit EXIT
+fi
+
 # Script directory and paths
+# Only symlinks (e.g. ~/.local/bin/wsl-toast) need readlink; absolute paths,
+# as used by the hooks, are split without forking.
 SCRIPT_PATH="${BASH_SOURCE[0]}"
-if command -v readlink &>/dev/null; then
+if [[ -L "$SCRIPT_PATH" ]] && command -v readlink &>/dev/null; then
     SCRIPT_PATH="$(readlink -f "$SCRIPT_PATH" 2>/dev/null || echo "$SCRIPT_PATH")"
 fi
-SCRIPT_DIR="$(cd "$(dirname "$SCRIPT_PATH")" && pwd)"
+if [[ "$SCRIPT_PATH" == /*/* ]]; then
+    SCRIPT_DIR="${SCRIPT_PATH%/*}"
+else
+    SCRIPT_DIR="$(cd "$(dirname "$SCRIPT_PATH")" && pwd)"
+fi
 CONFIG_DIR="${HOME}/.wsl-toast"
 CONFIG_FILE="${CONFIG_DIR}/config.json"
 
@@ -43,16 +100,23 @@ find_windows_dir() {
     echo ""
 }
 
-WINDOWS_DIR=$(find_windows_dir)
+# Hooks rendered by setup.sh export both directories, skipping the lookups
+WINDOWS_DIR="${WSL_TOAST_WINDOWS_DIR:-}"
+if [[ -z "$WINDOWS_DIR" ]]; then
+    WINDOWS_DIR=$(find_windows_dir)
+fi
 PROJECT_ROOT="${WINDOWS_DIR:-${SCRIPT_DIR}/..}"
 
 # PowerShell script path (Windows side)
-if [ -n "$WINDOWS_DIR" ]; then
+if [[ -n "${WSL_TOAST_PS_SCRIPT_DIR:-}" ]]; then
+    PS_SCRIPT_DIR="$WSL_TOAST_PS_SCRIPT_DIR"
+elif [ -n "$WINDOWS_DIR" ]; then
     PS_SCRIPT_DIR="$(wslpath -w "$WINDOWS_DIR" 2>/dev/null || echo "C:\\Users\\$USER\\.wsl-toast")"
 else
     PS_SCRIPT_DIR="$(wslpath -w "${PROJECT_ROOT}/windows" 2>/dev/null || echo "C:\\Users\\$USER\\.wsl-toast")"
 fi
 PS_SCRIPT_PATH="${PS_SCRIPT_DIR}\\wsl-toast.ps1"
+profile_mark paths
 
 # Default values
 DEFAULT_TYPE="Information"
@@ -61,6 +125,11 @@ MOCK_MODE="${MOCK_MODE:-false}"
 BACKGROUND_MODE=false
 # Silent by default in v1.3.0+; --sound re-enables the Windows notification ding.
 SILENT_MODE="${WSL_TOAST_SILENT:-true}"
+# Action Center history: keep the last HISTORY_CAP toasts, prune at most every N seconds
+HISTORY_CAP=20
+HISTORY_PRUNE_INTERVAL=60
+SESSION_ID="${WSL_TOAST_SESSION_ID:-}"
+CLEAR_SESSION=false
 
 # Exit codes
 EXIT_SUCCESS=0
@@ -99,9 +168,17 @@ log_debug() {
 show_usage() {
     cat <<EOF
 Usage: $(basename "$0") [OPTIONS]
+       $(basename "$0") stats [--since <when>] [--session <id>] [--json]
+       $(basename "$0") doctor [--bench] [--runs <n>] [--sessions <n>] [--no-toast] [--json]
 
 Display Windows toast notifications from WSL2 using PowerShell.
 
+COMMANDS:
+    stats                        Hook counts and latency percentiles from the event log
+                                (see $(basename "$0") stats --help)
+    doctor                       Check this host; --bench measures PowerShell, BurntToast,
+                                wslpath and round-trip costs and recommends a configuration
+
 OPTIONS:
     -t, --title <title>          Notification title (required)
     -m, --message <message>      Notification message (required)
@@ -110,6 +187,9 @@ OPTIONS:
     -d, --duration <duration>    Display duration: Short, Normal, Long
                                 (default: Normal)
     -l, --logo <path>            Path to custom icon/image
+    --session <id>               Claude Code session id used to tag the toast
+    --clear-session              Remove the session's remaining toasts from Action Center
+                                (requires --session; title and message are not needed)
     -b, --background             Run in background (non-blocking, for hooks)
     -s, --silent                 Suppress the Windows notification ding (default)
     --sound                      Play the Windows notification ding
@@ -123,12 +203,19 @@ ENVIRONMENT VARIABLES:
     WSL_TOAST_TYPE               Default notification type
     WSL_TOAST_DURATION           Default notification duration
     WSL_TOAST_CONFIG             Path to config file (default: ~/.wsl-toast/config.json)
+    WSL_TOAST_SESSION_ID         Default value for --session
+    WSL_TOAST_PROFILE            Set to 1 to print a per-stage timing record (WSL_TOAST_PROFILE ...)
+    WSL_TOAST_WINDOWS_DIR        Directory containing wsl-toast.ps1 (set by rendered hooks)
+    WSL_TOAST_PS_SCRIPT_DIR      Windows path of that directory (set by rendered hooks)
 
 EXAMPLES:
     $(basename "$0") --title "Build Complete" --message "Your project built successfully"
     $(basename "$0") -t "Warning" -m "Low disk space" -T Warning -d Long
     $(basename "$0") --title "테스트" --message "한글 알림" --type Success
     $(basename "$0") --mock --title "Test" --message "Testing notification system"
+    $(basename "$0") --clear-session --session "\$SESSION_ID"
+    $(basename "$0") stats --since 24h
+    $(basename "$0") doctor --bench --no-toast
 
 EXIT CODES:
     0    Success
@@ -171,8 +258,88 @@ except Exception as e:
     fi
 }
 
+# Compile config.json into the shell-sourceable config.sh snapshot.
+# src/ sits next to notify.sh when installed and one level up in a checkout.
+compile_config_snapshot() {
+    local config_file="$1"
+    local package_root="$SCRIPT_DIR"
+
+    if [[ ! -d "${package_root}/src" ]]; then
+        package_root="${SCRIPT_DIR}/.."
+    fi
+    if [[ ! -f "${package_root}/src/config_loader.py" ]] || ! command -v python3 &>/dev/null; then
+        return 1
+    fi
+
+    log_debug "Compiling config snapshot for: $config_file"
+    # Warnings about values replaced by defaults go to stderr (once per edit)
+    (cd "$package_root" && python3 -m src.config_loader compile "$config_file") >/dev/null
+}
+
+# Source the config.sh snapshot, rebuilding it first if config.json is newer.
+# The common path is a single `source` with no fork at all.
+load_config_snapshot() {
+    local config_file="${WSL_TOAST_CONFIG:-$CONFIG_FILE}"
+    local snapshot="${config_file%.json}.sh"
+
+    if [[ ! -f "$config_file" ]] || [[ "$config_file" != *.json ]]; then
+        return 1
+    fi
+    if [[ ! -f "$snapshot" || "$config_file" -nt "$snapshot" ]]; then
+        compile_config_snapshot "$config_file" || return 1
+    fi
+
+    log_debug "Loading config snapshot from: $snapshot"
+    # shellcheck disable=SC1090
+    source "$snapshot" && [[ "${WSL_TOAST_CFG_LOADED:-}" == "1" ]]
+}
+
+# Apply values from the config.sh snapshot
+apply_config_snapshot() {
+    local value_lower
+
+    value_lower="${WSL_TOAST_CFG_ENABLED:-true}"
+    value_lower="${value_lower,,}"
+    if [[ "$value_lower" == "false" || "$value_lower" == "0" || "$value_lower" == "no" ]]; then
+        log_info "Notifications are disabled in config"
+        exit $EXIT_SUCCESS
+    fi
+
+    DEFAULT_TYPE="${WSL_TOAST_CFG_DEFAULT_TYPE:-$DEFAULT_TYPE}"
+    DEFAULT_DURATION="${WSL_TOAST_CFG_DEFAULT_DURATION:-$DEFAULT_DURATION}"
+
+    if [[ -n "${WSL_TOAST_CFG_SILENT:-}" ]]; then
+        value_lower="${WSL_TOAST_CFG_SILENT,,}"
+        if [[ "$value_lower" == "false" || "$value_lower" == "0" || "$value_lower" == "no" ]]; then
+            SILENT_MODE="false"
+        else
+            SILENT_MODE="true"
+        fi
+    fi
+    # Legacy key (v1.2 and earlier): only sound_enabled=false has an effect, so
+    # v1.3's silent-by-default holds unless the user sets silent=false.
+    value_lower="${WSL_TOAST_CFG_SOUND_ENABLED:-true}"
+    value_lower="${value_lower,,}"
+    if [[ "$value_lower" == "false" || "$value_lower" == "0" || "$value_lower" == "no" ]]; then
+        SILENT_MODE="true"
+    fi
+
+    if [[ "${WSL_TOAST_CFG_HISTORY_CAP:-}" =~ ^[0-9]+$ ]]; then
+        HISTORY_CAP="$WSL_TOAST_CFG_HISTORY_CAP"
+    fi
+    if [[ "${WSL_TOAST_CFG_HISTORY_PRUNE_INTERVAL:-}" =~ ^[0-9]+$ ]]; then
+        HISTORY_PRUNE_INTERVAL="$WSL_TOAST_CFG_HISTORY_PRUNE_INTERVAL"
+    fi
+}
+
 # Apply configuration to variables
 apply_config() {
+    if load_config_snapshot; then
+        apply_config_snapshot
+        return
+    fi
+
+    # Fallback when the snapshot cannot be built (e.g. notify.sh copied without src/)
     local config_output
     config_output="$(load_config)"
 
@@ -211,6 +378,16 @@ apply_config() {
                     # If sound_enabled=true we deliberately do NOT override, so v1.3's
                     # silent-by-default holds unless the user explicitly sets silent=false.
                     ;;
+                history_cap)
+                    if [[ "$value" =~ ^[0-9]+$ ]]; then
+                        HISTORY_CAP="$value"
+                    fi
+                    ;;
+                history_prune_interval)
+                    if [[ "$value" =~ ^[0-9]+$ ]]; then
+                        HISTORY_PRUNE_INTERVAL="$value"
+                    fi
+                    ;;
             esac
         done <<< "$config_output"
     fi
@@ -310,6 +487,44 @@ build_powershell_args() {
     if [[ "$SILENT_MODE" != "true" ]]; then
         POWERSHELL_ARGS+=("-Sound")
     fi
+
+    if [[ -n "$SESSION_ID" ]]; then
+        POWERSHELL_ARGS+=("-SessionId" "$SESSION_ID")
+    fi
+    # Clamp to the [ValidateRange] of wsl-toast.ps1, which would otherwise
+    # refuse to bind the parameters and show nothing (both are digits only)
+    local history_cap="$HISTORY_CAP" prune_interval="$HISTORY_PRUNE_INTERVAL"
+    if (( ${#history_cap} > 4 || 10#$history_cap > 1000 )); then
+        history_cap=1000
+    fi
+    if (( ${#prune_interval} > 5 || 10#$prune_interval > 86400 )); then
+        prune_interval=86400
+    fi
+    POWERSHELL_ARGS+=("-HistoryCap" "$history_cap")
+    POWERSHELL_ARGS+=("-PruneIntervalSec" "$prune_interval")
+
+    if [[ "$PROFILE_ENABLED" == "true" ]]; then
+        POWERSHELL_ARGS+=("-Timing" "-TraceId" "$PROFILE_TRACE_ID")
+    fi
+}
+
+# Build PowerShell command that clears a session's toasts from Action Center
+build_clear_session_args() {
+    POWERSHELL_ARGS=()
+    POWERSHELL_ARGS+=("-NoProfile")
+    POWERSHELL_ARGS+=("-NonInteractive")
+    POWERSHELL_ARGS+=("-ExecutionPolicy" "Bypass")
+    POWERSHELL_ARGS+=("-File" "$PS_SCRIPT_PATH")
+    POWERSHELL_ARGS+=("-ClearSession")
+    POWERSHELL_ARGS+=("-SessionId" "$SESSION_ID")
+
+    if [[ "$MOCK_MODE" == "true" ]]; then
+        POWERSHELL_ARGS+=("-MockMode")
+    fi
+
+    if [[ "$PROFILE_ENABLED" == "true" ]]; then
+        POWERSHELL_ARGS+=("-Timing" "-TraceId" "$PROFILE_TRACE_ID")
+    fi
 }
 
 # Execute PowerShell command in background (non-blocking)
@@ -347,6 +562,7 @@ execute_powershell() {
         return $EXIT_POWERSHELL_NOT_FOUND
     fi
 
+    profile_mark find_powershell
     log_debug "Using PowerShell: $powershell_exe"
     log_debug "Executing: $powershell_exe ${POWERSHELL_ARGS[*]}"
 
@@ -360,6 +576,11 @@ execute_powershell() {
     )"
     exit_code=$?
     set -e
+    profile_mark powershell
+    if [[ "$PROFILE_ENABLED" == "true" ]]; then
+        # wsl-toast.ps1 prints its JSON result (with Timing) last
+        PROFILE_RESULT="${output##*$'\n'}"
+    fi
 
     if [[ $exit_code -eq 0 ]]; then
         log_info "Notification sent successfully"
@@ -389,6 +610,7 @@ send_notification() {
     # Validate parameters
     type="$(validate_type "$type")"
     duration="$(validate_duration "$duration")"
+    profile_mark validate
 
     log_info "Sending notification: [$type] $title"
 
@@ -407,20 +629,80 @@ send_notification() {
 
     # Build PowerShell arguments
     build_powershell_args "$title" "$message" "$type" "$duration" "$logo"
+    profile_mark build
 
-    # Execute in background or foreground
-    if [[ "$BACKGROUND_MODE" == "true" ]]; then
+    # Execute in background or foreground (profiling waits for PowerShell
+    # so its stages are part of the breakdown)
+    if [[ "$BACKGROUND_MODE" == "true" && "$PROFILE_ENABLED" != "true" ]]; then
         execute_powershell_background
     else
         execute_powershell
     fi
 }
 
+# Remove the remaining toasts of a session (SessionEnd)
+clear_session() {
+    log_info "Clearing Action Center history for session: $SESSION_ID"
+
+    # Mock mode still runs wsl-toast.ps1 -MockMode where it is available,
+    # so the toasts that would be cleared are reported
+    if [[ "$MOCK_MODE" == "true" ]]; then
+        if [[ ! -f "${WINDOWS_DIR}/wsl-toast.ps1" ]] || ! find_powershell >/dev/null; then
+            log_info "Mock mode enabled; PowerShell not available, skipping PowerShell execution"
+            return $EXIT_SUCCESS
+        fi
+    fi
+
+    if [[ -z "$WINDOWS_DIR" ]] || [[ ! -f "${WINDOWS_DIR}/wsl-toast.ps1" ]]; then
+        log_error "PowerShell script not found. Searched in:"
+        log_error "  - ${SCRIPT_DIR}/windows/"
+        log_error "  - ${SCRIPT_DIR}/../windows/"
+        return $EXIT_SCRIPT_NOT_FOUND
+    fi
+
+    build_clear_session_args
+    profile_mark build
+
+    # Mock mode waits for the result so the candidates are logged
+    if [[ "$BACKGROUND_MODE" == "true" && "$PROFILE_ENABLED" != "true" && "$MOCK_MODE" != "true" ]]; then
+        execute_powershell_background
+    else
+        execute_powershell
+    fi
+}
+
+#############################################################################
+# Subcommands
+#############################################################################
+
+# Run a Python subcommand (python3 -m src.<module>)
+# src/ lives next to notify.sh when installed and one level up in a checkout.
+run_python_command() {
+    local module="$1"
+    shift
+    local src_parent="$SCRIPT_DIR"
+    [ -d "${src_parent}/src" ] || src_parent="${SCRIPT_DIR}/.."
+    if ! command -v python3 &>/dev/null; then
+        log_error "python3 is required for this command"
+        exit $EXIT_ERROR
+    fi
+    cd "$src_parent" && exec python3 -m "src.${module}" "$@"
+}
+
 #############################################################################
 # Main Script
 #############################################################################
 
 main() {
+    if [[ "${1:-}" == "stats" ]]; then
+        shift
+        run_python_command stats "$@"
+    fi
+    if [[ "${1:-}" == "doctor" ]]; then
+        shift
+        run_python_command doctor "$@"
+    fi
+
     local title=""
     local message=""
     local type=""
@@ -478,6 +760,18 @@ main() {
                 logo="${1#*=}"
                 shift
                 ;;
+            --session)
+                SESSION_ID="$2"
+                shift 2
+                ;;
+            --session=*)
+                SESSION_ID="${1#*=}"
+                shift
+                ;;
+            --clear-session)
+                CLEAR_SESSION=true
+                shift
+                ;;
             --mock)
                 MOCK_MODE=true
                 shift
@@ -516,9 +810,11 @@ main() {
     if [[ "$verbose" == "true" ]]; then
         set -x
     fi
+    profile_mark args
 
     # Load configuration
     apply_config
+    profile_mark config
 
     if [[ -n "${WSL_TOAST_TYPE:-}" ]]; then
         DEFAULT_TYPE="${WSL_TOAST_TYPE}"
@@ -534,6 +830,15 @@ main() {
         duration="$DEFAULT_DURATION"
     fi
 
+    if [[ "$CLEAR_SESSION" == "true" ]]; then
+        if [[ -z "$SESSION_ID" ]]; then
+            log_error "Missing required parameter: --clear-session needs --session"
+            exit $EXIT_MISSING_PARAMS
+        fi
+        clear_session
+        exit $?
+    fi
+
     # Validate required parameters
     if [[ -z "$title" ]] || [[ -z "$message" ]]; then
         log_error "Missing required parameters: title and message are required"
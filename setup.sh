@@ -323,7 +323,25 @@ create_default_config() {
   "language": "en",
   "silent": true,
   "sound_enabled": false,
-  "position": "top_right"
+  "position": "top_right",
+  "history_cap": 20,
+  "history_prune_interval": 60,
+  "hook_tool_allowlist": [],
+  "hook_tool_denylist": ["Read", "Glob", "Grep", "LS", "TodoWrite", "WebFetch", "WebSearch"],
+  "hook_payload_max_bytes": 8388608,
+  "hook_outcome_rules": {},
+  "hook_capture_payloads": false,
+  "hook_log_level": "info",
+  "hook_log_max_bytes": 1048576,
+  "hook_log_backups": 3,
+  "hook_log_max_age_days": 7,
+  "hook_log_compress": true,
+  "hook_log_field_max": 256,
+  "event_log_enabled": true,
+  "event_log_sample_rates": {"*": 1.0, "PostToolUse": 0.01},
+  "event_store_enabled": false,
+  "event_store_retention_days": 90,
+  "trace_enabled": false
 }
 EOF
 
@@ -395,6 +413,100 @@ create_symlink() {
     return 0
 }
 
+# Hooks that are shims around the Python dispatcher; setup.sh renders these
+DISPATCHED_HOOKS=("Notification" "Stop" "PermissionRequest" "PostToolUse" "SessionEnd")
+
+# Language baked into rendered hooks: config.json's "language" if a
+# template file exists for it, otherwise English
+get_install_language() {
+    local templates_dir="$1"
+    local language=""
+
+    if command -v python3 &>/dev/null && [ -f "$CONFIG_FILE" ]; then
+        language="$(python3 -c '
+import json, sys
+try:
+    with open(sys.argv[1], encoding="utf-8") as f:
+        value = json.load(f).get("language", "")
+    print(value if isinstance(value, str) else "")
+except Exception:
+    pass
+' "$CONFIG_FILE" 2>/dev/null || true)"
+    fi
+
+    if [[ -z "$language" || "$language" == */* || ! -f "${templates_dir}/${language}.json" ]]; then
+        language="en"
+    fi
+    echo "$language"
+}
+
+# Render a hook script specialized for this install: absolute paths, the
+# python3 binary, the language and the templates/Windows directories are
+# baked in, so the hook never probes its surroundings at runtime.
+render_hook_script() {
+    local event="$1"
+    local target_dir="$2"
+    local language="$3"
+    local python_bin="$4"
+    local ps_script_dir="$5"
+
+    printf '#!/usr/bin/env bash\n'
+    printf '# %s.sh - rendered by setup.sh for this install; do not edit.\n' "$event"
+    printf '# Re-run setup.sh after moving the install or changing "language".\n'
+    printf '\n'
+    printf 'cd %q || exit 0\n' "$target_dir"
+    printf 'export WSL_TOAST_NOTIFY_SCRIPT=%q\n' "${target_dir}/notify.sh"
+    printf 'export WSL_TOAST_TEMPLATES_DIR=%q\n' "${target_dir}/templates"
+    printf 'export WSL_TOAST_LANGUAGE=%q\n' "$language"
+    printf 'export WSL_TOAST_WINDOWS_DIR=%q\n' "${target_dir}/windows"
+    if [[ -n "$ps_script_dir" ]]; then
+        printf 'export WSL_TOAST_PS_SCRIPT_DIR=%q\n' "$ps_script_dir"
+    fi
+    printf 'exec %q -m src.hooks %s\n' "$python_bin" "$event"
+}
+
+# Report files edited since the last install; returns 1 if the user
+# declines to overwrite them
+check_hook_drift() {
+    local target_dir="$1"
+
+    if [ ! -f "${target_dir}/manifest.json" ] || ! command -v python3 &>/dev/null; then
+        return 0
+    fi
+
+    local drift
+    drift="$(cd "$PROJECT_ROOT" && python3 -m src.manifest check "$target_dir" --config "$CONFIG_FILE" 2>/dev/null || true)"
+    if [[ -z "$drift" ]]; then
+        log_info "Installed hooks match manifest.json"
+        return 0
+    fi
+
+    local kind name modified=false
+    while read -r kind name; do
+        case "$kind" in
+            modified)
+                log_warning "Locally modified since install: ${name}"
+                modified=true
+                ;;
+            missing)
+                log_info "Missing since install (will be restored): ${name}"
+                ;;
+            language)
+                log_info "Language changed to '${name}'; hooks will be re-rendered"
+                ;;
+        esac
+    done <<< "$drift"
+
+    if [[ "$modified" == "true" && "$FORCE_OVERWRITE" != "true" ]]; then
+        if ! prompt_yes_no "Overwrite locally modified hook files? [y/N]: " "N"; then
+            log_info "Hook scripts unchanged. Re-run with --force to overwrite."
+            return 1
+        fi
+    fi
+
+    return 0
+}
+
 install_hook_scripts() {
     if [[ "$DRY_RUN" == "true" ]]; then
         log_info "Dry run: would install hook scripts to ${HOME}/.claude/hooks/wsl-toast/"
@@ -406,22 +518,15 @@ install_hook_scripts() {
     local target_dir="${HOME}/.claude/hooks/wsl-toast"
     local source_dir="${PROJECT_ROOT}/hooks"
 
+    if ! check_hook_drift "$target_dir"; then
+        return 0
+    fi
+
     # Create target directories
     mkdir -p "$target_dir"
     mkdir -p "${target_dir}/templates"
     mkdir -p "${target_dir}/windows"
-
-    # Copy hook scripts (including v1.3.0 spinner helpers)
-    local hooks=("Notification.sh" "Stop.sh" "PermissionRequest.sh" "UserPromptSubmit.sh" "_spinner.sh")
-    for hook in "${hooks[@]}"; do
-        if [ -f "${source_dir}/${hook}" ]; then
-            cp "${source_dir}/${hook}" "${target_dir}/${hook}"
-            chmod +x "${target_dir}/${hook}"
-            log_info "Installed: ${hook}"
-        else
-            log_warning "Hook script not found: ${hook}"
-        fi
-    done
+    mkdir -p "${target_dir}/src"
 
     # Copy the notify.sh script (dependency for hooks)
     local notify_script="${PROJECT_ROOT}/scripts/notify.sh"
@@ -431,6 +536,13 @@ install_hook_scripts() {
         log_info "Installed: notify.sh (hook dependency)"
     fi
 
+    # Copy the Python hook dispatcher (hooks are shims around python3 -m src.hooks)
+    local src_source="${PROJECT_ROOT}/src"
+    if [ -d "$src_source" ]; then
+        cp "$src_source"/*.py "${target_dir}/src/"
+        log_info "Installed: hook dispatcher (src/)"
+    fi
+
     # Copy notification templates
     local templates_source="${PROJECT_ROOT}/templates/notifications"
     if [ -d "$templates_source" ]; then
@@ -445,6 +557,47 @@ install_hook_scripts() {
         log_info "Installed: PowerShell scripts"
     fi
 
+    # Resolve everything the hooks would otherwise look up on every run
+    local python_bin language ps_script_dir=""
+    # The interpreter itself, not a wrapper such as a pyenv shim
+    python_bin="$(python3 -c 'import sys; print(sys.executable)' 2>/dev/null || true)"
+    language="$(get_install_language "${target_dir}/templates")"
+    if command -v wslpath &>/dev/null; then
+        ps_script_dir="$(wslpath -w "${target_dir}/windows" 2>/dev/null || true)"
+    fi
+
+    # Render dispatcher hooks; copy the others (including v1.3.0 spinner helpers)
+    local hooks=("Notification.sh" "Stop.sh" "PermissionRequest.sh" "PostToolUse.sh" "SessionEnd.sh" "UserPromptSubmit.sh" "_spinner.sh")
+    local hook event
+    for hook in "${hooks[@]}"; do
+        event="${hook%.sh}"
+        if [ ! -f "${source_dir}/${hook}" ]; then
+            log_warning "Hook script not found: ${hook}"
+            continue
+        fi
+        if [[ -n "$python_bin" && " ${DISPATCHED_HOOKS[*]} " == *" ${event} "* ]]; then
+            render_hook_script "$event" "$target_dir" "$language" "$python_bin" "$ps_script_dir" \
+                > "${target_dir}/${hook}"
+            log_info "Rendered: ${hook} (language: ${language})"
+        else
+            cp "${source_dir}/${hook}" "${target_dir}/${hook}"
+            log_info "Installed: ${hook}"
+        fi
+        chmod +x "${target_dir}/${hook}"
+    done
+
+    # Record what was installed so re-runs and uninstall.sh can detect drift
+    if [[ -n "$python_bin" ]]; then
+        if (cd "$PROJECT_ROOT" && "$python_bin" -m src.manifest write "$target_dir" \
+                --meta "language=${language}" \
+                --meta "python=${python_bin}" \
+                --meta "project_root=${PROJECT_ROOT}" >/dev/null); then
+            log_info "Installed: manifest.json"
+        else
+            log_warning "Failed to write manifest.json; drift detection unavailable"
+        fi
+    fi
+
     log_success "Hook scripts installed to ${target_dir}"
 
     return 0
@@ -467,12 +620,14 @@ configure_claude_hooks() {
         fi
     fi
 
-    local enable_notification enable_permissionrequest enable_stop enable_subagentstop enable_userpromptsubmit
+    local enable_notification enable_permissionrequest enable_stop enable_subagentstop enable_userpromptsubmit enable_posttooluse enable_sessionend
     enable_notification=false
     enable_permissionrequest=false
     enable_stop=false
     enable_subagentstop=false
     enable_userpromptsubmit=false
+    enable_posttooluse=false
+    enable_sessionend=false
 
     if prompt_yes_no "Enable Notification hook? [Y/n]: " "Y"; then
         enable_notification=true
@@ -489,13 +644,19 @@ configure_claude_hooks() {
     if prompt_yes_no "Enable SubagentStop hook? [y/N]: " "N"; then
         enable_subagentstop=true
     fi
+    if prompt_yes_no "Enable PostToolUse hook (toast when tools finish; see hook_tool_denylist)? [y/N]: " "N"; then
+        enable_posttooluse=true
+    fi
+    if prompt_yes_no "Enable SessionEnd hook (clears the session's toasts, records event history)? [Y/n]: " "Y"; then
+        enable_sessionend=true
+    fi
 
-    if [[ "$enable_notification" != "true" && "$enable_permissionrequest" != "true" && "$enable_stop" != "true" && "$enable_subagentstop" != "true" && "$enable_userpromptsubmit" != "true" ]]; then
+    if [[ "$enable_notification" != "true" && "$enable_permissionrequest" != "true" && "$enable_stop" != "true" && "$enable_subagentstop" != "true" && "$enable_userpromptsubmit" != "true" && "$enable_posttooluse" != "true" && "$enable_sessionend" != "true" ]]; then
         log_info "No hooks selected. Skipping Claude Code hook configuration."
         return 0
     fi
 
-    local notification_timeout permission_timeout stop_timeout subagent_timeout userpromptsubmit_timeout
+    local notification_timeout permission_timeout stop_timeout subagent_timeout userpromptsubmit_timeout posttooluse_timeout sessionend_timeout
     if [[ "$enable_notification" == "true" ]]; then
         notification_timeout="$(prompt_value "Notification timeout in ms (default: 1000): " "1000")"
     fi
@@ -511,6 +672,12 @@ configure_claude_hooks() {
     if [[ "$enable_subagentstop" == "true" ]]; then
         subagent_timeout="$(prompt_value "SubagentStop timeout in ms (default: 1000): " "1000")"
     fi
+    if [[ "$enable_posttooluse" == "true" ]]; then
+        posttooluse_timeout="$(prompt_value "PostToolUse timeout in ms (default: 1000): " "1000")"
+    fi
+    if [[ "$enable_sessionend" == "true" ]]; then
+        sessionend_timeout="$(prompt_value "SessionEnd timeout in ms (default: 1000): " "1000")"
+    fi
 
     export CLAUDE_SETTINGS_FILE
     export CLAUDE_PROJECT_ROOT="${PROJECT_ROOT}"
@@ -519,11 +686,15 @@ configure_claude_hooks() {
     export HOOK_STOP_TIMEOUT="${stop_timeout:-1000}"
     export HOOK_SUBAGENTSTOP_TIMEOUT="${subagent_timeout:-1000}"
     export HOOK_USERPROMPTSUBMIT_TIMEOUT="${userpromptsubmit_timeout:-1000}"
+    export HOOK_POSTTOOLUSE_TIMEOUT="${posttooluse_timeout:-1000}"
+    export HOOK_SESSIONEND_TIMEOUT="${sessionend_timeout:-1000}"
     export HOOK_ENABLE_NOTIFICATION="$enable_notification"
     export HOOK_ENABLE_PERMISSIONREQUEST="$enable_permissionrequest"
     export HOOK_ENABLE_STOP="$enable_stop"
     export HOOK_ENABLE_SUBAGENTSTOP="$enable_subagentstop"
     export HOOK_ENABLE_USERPROMPTSUBMIT="$enable_userpromptsubmit"
+    export HOOK_ENABLE_POSTTOOLUSE="$enable_posttooluse"
+    export HOOK_ENABLE_SESSIONEND="$enable_sessionend"
     export DRY_RUN
 
     local hook_status
@@ -550,6 +721,8 @@ permission_timeout = parse_timeout(os.environ.get("HOOK_PERMISSION_TIMEOUT"), 10
 stop_timeout = parse_timeout(os.environ.get("HOOK_STOP_TIMEOUT"), 1000)
 subagent_timeout = parse_timeout(os.environ.get("HOOK_SUBAGENTSTOP_TIMEOUT"), 1000)
 userpromptsubmit_timeout = parse_timeout(os.environ.get("HOOK_USERPROMPTSUBMIT_TIMEOUT"), 1000)
+posttooluse_timeout = parse_timeout(os.environ.get("HOOK_POSTTOOLUSE_TIMEOUT"), 1000)
+sessionend_timeout = parse_timeout(os.environ.get("HOOK_SESSIONEND_TIMEOUT"), 1000)
 
 def load_settings():
     if not os.path.exists(settings_file):
@@ -601,7 +774,12 @@ def set_hook(name, hook_value):
 file_exists = os.path.exists(settings_file)
 changed = False
 
-for legacy_hook in ("PostToolUse", "SessionStart", "SessionEnd"):
+legacy_hooks = ["SessionStart"]
+if os.environ.get("HOOK_ENABLE_POSTTOOLUSE") != "true":
+    legacy_hooks.append("PostToolUse")
+if os.environ.get("HOOK_ENABLE_SESSIONEND") != "true":
+    legacy_hooks.append("SessionEnd")
+for legacy_hook in legacy_hooks:
     if legacy_hook in hooks:
         hooks.pop(legacy_hook, None)
         changed = True
@@ -634,6 +812,25 @@ if os.environ.get("HOOK_ENABLE_SUBAGENTSTOP") == "true":
         build_hook(f"{hooks_dir}/SubagentStop.sh", subagent_timeout),
     ):
         changed = True
+if os.environ.get("HOOK_ENABLE_POSTTOOLUSE") == "true":
+    # Narrow matcher from hook_tool_allowlist / hook_tool_denylist, so Claude
+    # Code never launches the hook for Read, Grep, Glob, ...
+    sys.path.insert(0, project_root)
+    from src.config_loader import load_config
+    from src.matchers import get_tool_matcher
+
+    if set_hook(
+        "PostToolUse",
+        build_hook(f"{hooks_dir}/PostToolUse.sh", posttooluse_timeout, get_tool_matcher(load_config())),
+    ):
+        changed = True
+if os.environ.get("HOOK_ENABLE_SESSIONEND") == "true":
+    # Clears the session's toasts and copies events.jsonl into the event store
+    if set_hook(
+        "SessionEnd",
+        build_hook(f"{hooks_dir}/SessionEnd.sh", sessionend_timeout),
+    ):
+        changed = True
 if os.environ.get("HOOK_ENABLE_USERPROMPTSUBMIT") == "true":
     if set_hook(
         "UserPromptSubmit",
@@ -693,6 +890,14 @@ PY
             ;;
     esac
 
+    # Report how many hook launches per turn the PostToolUse matcher avoids
+    if [[ "$enable_posttooluse" == "true" ]]; then
+        local savings
+        if savings="$(cd "$PROJECT_ROOT" && python3 -m src.matchers --config "$CONFIG_FILE" 2>/dev/null)"; then
+            log_info "$savings"
+        fi
+    fi
+
     return 0
 }
 
@@ -829,5 +1034,7 @@ main() {
     exit $EXIT_SUCCESS
 }
 
-# Execute main function
-main "$@"
+# Execute main function (skipped when sourced, e.g. by tests)
+if [[ "${BASH_SOURCE[0]}" == "$0" ]]; then
+    main "$@"
+fi
@@ -4,9 +4,48 @@
 # Author: Claude Code TDD Implementation
 # Version: 1.0.0
 
+import importlib
 import json
+import os
+import re
+import shlex
+import sys
+import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple, List
+from types import MappingProxyType
+from typing import Dict, Any, Callable, Iterator, Mapping, Optional, Tuple, List
+
+try:
+    import fcntl
+except ImportError:  # non-POSIX: write without locking
+    fcntl = None
+
+# Prefix of the shell variables written to the config.sh snapshot
+SNAPSHOT_PREFIX = "WSL_TOAST_CFG_"
+
+# Upper bounds of the Action Center history settings, matching the
+# [ValidateRange] of -HistoryCap and -PruneIntervalSec in wsl-toast.ps1
+HISTORY_CAP_MAX = 1000
+HISTORY_PRUNE_INTERVAL_MAX = 86400
+
+# Keys notify.sh has always read as shell words: "false", "0" and "no"
+# (any case) turn them off, anything else leaves them on
+_SHELL_BOOLEAN_KEYS = ("enabled", "sound_enabled")
+_SHELL_FALSE_WORDS = ("false", "0", "no")
+
+# Config keys that can be turned into shell variable names
+_SHELL_KEY_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+# Validators for the keys of feature modules (hook log, event log,
+# tracing, ...), registered by those modules so this one imports none of
+# them. Each takes the config and returns a list of error messages.
+ConfigValidator = Callable[[Mapping[str, Any]], List[str]]
+_VALIDATORS: List[ConfigValidator] = []
+
+# Modules that register validators, imported by main() so the snapshot it
+# compiles validates every key
+_VALIDATOR_MODULES = ("events", "hooklog", "outcome", "tracing")
 
 
 def get_default_config() -> Dict[str, Any]:
@@ -23,11 +62,34 @@ def get_default_config() -> Dict[str, Any]:
         "language": "en",
         "sound_enabled": True,
         "position": "top_right",
+        "history_cap": 20,
+        "history_prune_interval": 60,
+        "hook_tool_allowlist": [],
+        "hook_tool_denylist": ["Read", "Glob", "Grep", "LS", "TodoWrite", "WebFetch", "WebSearch"],
+        "hook_payload_max_bytes": 8388608,
+        "hook_outcome_rules": {},
+        "hook_capture_payloads": False,
+        "hook_log_level": "info",
+        "hook_log_max_bytes": 1048576,
+        "hook_log_backups": 3,
+        "hook_log_max_age_days": 7,
+        "hook_log_compress": True,
+        "hook_log_field_max": 256,
+        "event_log_enabled": True,
+        "event_log_sample_rates": {"*": 1.0, "PostToolUse": 0.01},
+        "event_store_enabled": False,
+        "event_store_retention_days": 90,
+        "trace_enabled": False,
     }
 
 
-# Configuration cache
-_config_cache: Dict[str, Dict[str, Any]] = {}
+# Seconds between stat() checks of a cached config file
+# (overridden by WSL_TOAST_CONFIG_CHECK_INTERVAL)
+CONFIG_CHECK_INTERVAL = 1.0
+
+# Configuration cache: config path -> (read-only view, file signature,
+# monotonic time of the last check)
+_config_cache: Dict[str, Tuple[Mapping[str, Any], Optional[Tuple[int, int, int]], float]] = {}
 
 
 def clear_config_cache() -> None:
@@ -36,15 +98,92 @@ def clear_config_cache() -> None:
     _config_cache.clear()
 
 
-def load_config(config_dir: Optional[str] = None) -> Dict[str, Any]:
+def get_config_check_interval() -> float:
+    """
+    Get the interval between checks of a cached config file for changes
+
+    Returns:
+        Seconds from WSL_TOAST_CONFIG_CHECK_INTERVAL, else CONFIG_CHECK_INTERVAL
+    """
+    env = os.environ.get("WSL_TOAST_CONFIG_CHECK_INTERVAL")
+    if env:
+        try:
+            return max(0.0, float(env))
+        except ValueError:
+            pass
+    return CONFIG_CHECK_INTERVAL
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Make a configuration value read-only, all the way down
+
+    Args:
+        value: Value parsed from JSON
+
+    Returns:
+        The value with dicts turned into read-only views and lists into tuples
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def thaw_config(value: Any) -> Any:
+    """
+    Copy a configuration returned by load_config() into plain, mutable objects
+
+    Args:
+        value: Configuration (or a value in it)
+
+    Returns:
+        Deep copy with read-only views turned into dicts and tuples into lists
+    """
+    if isinstance(value, Mapping):
+        return {k: thaw_config(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw_config(v) for v in value]
+    return value
+
+
+def _file_signature(config_path: Path) -> Optional[Tuple[int, int, int]]:
+    """
+    Identify the current version of a configuration file
+
+    Args:
+        config_path: Path to the JSON configuration file
+
+    Returns:
+        (mtime_ns, size, inode), or None if the file does not exist
+    """
+    try:
+        st = os.stat(config_path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def load_config(config_dir: Optional[str] = None) -> Mapping[str, Any]:
     """
     Load configuration from file, falling back to defaults
 
+    Results are cached per file. A cached result is revalidated against
+    the file's (mtime_ns, size, inode) at most once per
+    get_config_check_interval() seconds, so edits made by hand or by
+    another process are picked up without a restart, and repeated calls
+    cost no more than a clock read.
+
+    The result is a read-only view shared by all callers: nested objects
+    are read-only views too and lists are tuples. thaw_config() returns a
+    plain, mutable copy.
+
     Args:
         config_dir: Configuration directory path (default: ~/.wsl-toast)
 
     Returns:
-        Dictionary with configuration values
+        Read-only mapping with configuration values
     """
     # Determine config directory
     if config_dir is None:
@@ -52,54 +191,162 @@ def load_config(config_dir: Optional[str] = None) -> Dict[str, Any]:
 
     config_path = Path(config_dir) / "config.json"
 
-    # Check cache first
+    # Check cache first, statting the file only once per interval
     cache_key = str(config_path)
-    if cache_key in _config_cache:
-        return _config_cache[cache_key]
-
-    # Start with defaults
+    now = time.monotonic()
+    cached = _config_cache.get(cache_key)
+    if cached is not None:
+        view, signature, checked = cached
+        if now - checked < get_config_check_interval():
+            return view
+        if _file_signature(config_path) == signature:
+            _config_cache[cache_key] = (view, signature, now)
+            return view
+
+    # Stat before reading, so a write racing the read is seen next check
+    signature = _file_signature(config_path)
+
+    # Start with defaults, file values take precedence
     config = get_default_config()
+    config.update(read_config_file(config_path))
+
+    # Cache the result
+    view = _freeze(config)
+    _config_cache[cache_key] = (view, signature, now)
+
+    return view
+
+
+def read_config_file(config_path: Path) -> Dict[str, Any]:
+    """
+    Read a configuration file without merging defaults
+
+    Args:
+        config_path: Path to the JSON configuration file
+
+    Returns:
+        File contents, or an empty dict if the file is missing or invalid
+    """
+    if not config_path.exists():
+        return {}
+    try:
+        with open(config_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (json.JSONDecodeError, IOError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+@contextmanager
+def _config_lock(config_file: Path) -> Iterator[None]:
+    """
+    Hold an exclusive flock on config.json.lock next to a configuration file
+
+    Every writer takes it, so a read-modify-write never loses another
+    process's update. Readers need no lock: the file is replaced by rename.
 
-    # Try to load from file
-    if config_path.exists():
+    Args:
+        config_file: Path to config.json (its directory must exist)
+    """
+    lock_fd = os.open(config_file.with_name(config_file.name + ".lock"), os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        if fcntl is not None:
+            fcntl.flock(lock_fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(lock_fd)
+
+
+def _write_config_file(config: Mapping[str, Any], config_file: Path) -> None:
+    """
+    Atomically replace a configuration file and its config.sh snapshot
+
+    The JSON is written to a temporary file, fsynced and renamed into place,
+    so readers see either the old or the new file, never a partial one, even
+    across a crash. The caller holds _config_lock().
+
+    Args:
+        config: Configuration mapping to write
+        config_file: Path to config.json
+    """
+    tmp = config_file.with_name(f".{config_file.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(thaw_config(config), f, indent=2, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        # Keep the permissions of the file being replaced
+        try:
+            os.chmod(tmp, os.stat(config_file).st_mode & 0o7777)
+        except OSError:
+            pass
+        os.replace(tmp, config_file)
+    except BaseException:
         try:
-            with open(config_path, "r", encoding="utf-8") as f:
-                file_config = json.load(f)
-                # Merge with defaults (file takes precedence)
-                config.update(file_config)
-        except (json.JSONDecodeError, IOError):
-            # If file is invalid, use defaults
+            os.unlink(tmp)
+        except OSError:
             pass
+        raise
 
-    # Cache the result
-    _config_cache[cache_key] = config
+    # Make the rename itself durable
+    try:
+        dir_fd = os.open(config_file.parent, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+    except OSError:
+        pass
+
+    write_config_snapshot(config, config_file)
 
-    return config
+    # Clear cache to force reload
+    _config_cache.pop(str(config_file), None)
 
 
-def save_config(config: Dict[str, Any], config_dir: Optional[str] = None) -> None:
+def save_config(config: Mapping[str, Any], config_dir: Optional[str] = None) -> None:
     """
     Save configuration to file
 
+    The file is replaced atomically (see _write_config_file) under the
+    config lock, so concurrent readers never see a partial file.
+
     Args:
-        config: Configuration dictionary to save
+        config: Configuration mapping to save (load_config() views are accepted)
         config_dir: Configuration directory path
     """
-    if config_dir is None:
-        config_dir = str(Path.home() / ".wsl-toast")
+    config_file = get_config_path(config_dir)
+    config_file.parent.mkdir(parents=True, exist_ok=True)
 
-    config_path = Path(config_dir)
-    config_path.mkdir(parents=True, exist_ok=True)
+    with _config_lock(config_file):
+        _write_config_file(config, config_file)
 
-    config_file = config_path / "config.json"
 
-    with open(config_file, "w", encoding="utf-8") as f:
-        json.dump(config, f, indent=2, ensure_ascii=False)
+def update_config(changes: Mapping[str, Any], *, config_dir: Optional[str] = None) -> Mapping[str, Any]:
+    """
+    Set several configuration values in one locked read-modify-write
 
-    # Clear cache to force reload
-    cache_key = str(config_file)
-    if cache_key in _config_cache:
-        del _config_cache[cache_key]
+    The current file is re-read under the config lock (not taken from the
+    cache, which may be up to a check interval old), so concurrent updates
+    from other processes are never lost.
+
+    Args:
+        changes: Keys and values to set (any key, including "config_dir")
+        config_dir: Configuration directory path (keyword only)
+
+    Returns:
+        Read-only view of the saved configuration
+    """
+    config_file = get_config_path(config_dir)
+    config_file.parent.mkdir(parents=True, exist_ok=True)
+
+    with _config_lock(config_file):
+        config = get_default_config()
+        config.update(read_config_file(config_file))
+        config.update(changes)
+        _write_config_file(config, config_file)
+
+    return _freeze(config)
 
 
 def get_config_value(
@@ -133,15 +380,34 @@ def set_config_value(key: str, value: Any, config_dir: Optional[str] = None) ->
         value: Value to set
         config_dir: Configuration directory path
     """
-    config = load_config(config_dir)
-    config[key] = value
-    save_config(config, config_dir)
+    update_config({key: value}, config_dir=config_dir)
+
+
+def register_validator(validator: ConfigValidator) -> ConfigValidator:
+    """
+    Register a validator for a feature module's configuration keys
+
+    validate_config() runs every registered validator after its own
+    checks. Usable as a decorator.
+
+    Args:
+        validator: Function of the config returning a list of error messages
+
+    Returns:
+        The validator, unchanged
+    """
+    if validator not in _VALIDATORS:
+        _VALIDATORS.append(validator)
+    return validator
 
 
 def validate_config(config: Dict[str, Any]) -> Tuple[bool, List[str]]:
     """
     Validate configuration values
 
+    Keys owned by feature modules are checked by the validators those
+    modules register (see register_validator), once they are imported.
+
     Args:
         config: Configuration dictionary to validate
 
@@ -193,6 +459,11 @@ def validate_config(config: Dict[str, Any]) -> Tuple[bool, List[str]]:
         if not isinstance(config["sound_enabled"], bool):
             errors.append("sound_enabled must be a boolean")
 
+    # Validate hook_capture_payloads
+    if "hook_capture_payloads" in config:
+        if not isinstance(config["hook_capture_payloads"], bool):
+            errors.append("hook_capture_payloads must be a boolean")
+
     # Validate position
     if "position" in config:
         if config["position"] not in valid_positions:
@@ -200,6 +471,34 @@ def validate_config(config: Dict[str, Any]) -> Tuple[bool, List[str]]:
                 f"position must be one of {valid_positions}, got '{config['position']}'"
             )
 
+    # Validate Action Center history settings (integers within the ranges
+    # wsl-toast.ps1 accepts, not bools)
+    for key, maximum in (("history_cap", HISTORY_CAP_MAX),
+                         ("history_prune_interval", HISTORY_PRUNE_INTERVAL_MAX)):
+        if key in config:
+            value = config[key]
+            if isinstance(value, bool) or not isinstance(value, int) or not 0 <= value <= maximum:
+                errors.append(f"{key} must be an integer from 0 to {maximum}")
+
+    # Validate PostToolUse tool lists (lists of tool names)
+    for key in ("hook_tool_allowlist", "hook_tool_denylist"):
+        if key in config:
+            value = config[key]
+            if not isinstance(value, (list, tuple)) or not all(
+                isinstance(tool, str) and tool for tool in value
+            ):
+                errors.append(f"{key} must be a list of tool names")
+
+    # Validate hook stdin cap (positive integer, not bool)
+    if "hook_payload_max_bytes" in config:
+        value = config["hook_payload_max_bytes"]
+        if isinstance(value, bool) or not isinstance(value, int) or value <= 0:
+            errors.append("hook_payload_max_bytes must be a positive integer")
+
+    # Validate feature module keys (outcome rules, hook log, event log, ...)
+    for validator in _VALIDATORS:
+        errors.extend(validator(config))
+
     return len(errors) == 0, errors
 
 
@@ -244,7 +543,7 @@ def reset_config(config_dir: Optional[str] = None) -> None:
 
 
 def merge_config(
-    base_config: Dict[str, Any], override_config: Dict[str, Any]
+    base_config: Mapping[str, Any], override_config: Mapping[str, Any]
 ) -> Dict[str, Any]:
     """
     Merge two configuration dictionaries
@@ -256,6 +555,140 @@ def merge_config(
     Returns:
         Merged configuration dictionary
     """
-    merged = base_config.copy()
+    merged = dict(base_config)
     merged.update(override_config)
     return merged
+
+
+def get_snapshot_path(config_file: Path) -> Path:
+    """
+    Get the config.sh snapshot path for a configuration file
+
+    Args:
+        config_file: Path to config.json
+
+    Returns:
+        Path to the snapshot next to it (config.json -> config.sh)
+    """
+    return Path(config_file).with_suffix(".sh")
+
+
+def compile_config_snapshot(config: Mapping[str, Any], warnings: Optional[List[str]] = None) -> str:
+    """
+    Compile configuration into shell-sourceable variable assignments
+
+    Values are merged over get_default_config(); values that fail
+    validate_config() are replaced by their defaults (or dropped when there
+    is no default). String and number spellings of enabled and
+    sound_enabled ("false", "no", 0, ...) are read as booleans first, as
+    notify.sh always has. Every value is shell-quoted, so sourcing the
+    result reproduces each string byte for byte, including non-ASCII text.
+
+    Args:
+        config: Configuration dictionary (usually the raw file contents)
+        warnings: When given, one message is appended per value replaced
+            by its default or dropped
+
+    Returns:
+        Shell script text defining WSL_TOAST_CFG_<KEY> variables
+    """
+    defaults = get_default_config()
+    merged = merge_config(defaults, config)
+    for key in _SHELL_BOOLEAN_KEYS:
+        value = merged.get(key)
+        if isinstance(value, (str, int, float)) and not isinstance(value, bool):
+            merged[key] = str(value).strip().lower() not in _SHELL_FALSE_WORDS
+
+    lines = [
+        "# config.sh - generated from config.json by src/config_loader.py; do not edit",
+        "# Rebuilt automatically when config.json is newer than this file.",
+    ]
+    for key in sorted(merged):
+        if not _SHELL_KEY_PATTERN.match(key):
+            continue
+        value = merged[key]
+        valid, errors = validate_config({key: value})
+        if not valid:
+            if warnings is not None:
+                fallback = f"using the default {defaults[key]!r}" if key in defaults else "ignored"
+                warnings.append(f"{errors[0]}; {fallback}")
+            if key not in defaults:
+                continue
+            value = defaults[key]
+
+        if value is None:
+            text = ""
+        elif isinstance(value, bool):
+            text = "true" if value else "false"
+        elif isinstance(value, (int, float, str)):
+            text = str(value)
+        else:
+            text = json.dumps(thaw_config(value), ensure_ascii=False)
+        lines.append(f"{SNAPSHOT_PREFIX}{key.upper()}={shlex.quote(text)}")
+
+    lines.append(f"{SNAPSHOT_PREFIX}LOADED=1")
+    return "\n".join(lines) + "\n"
+
+
+def write_config_snapshot(config: Mapping[str, Any], config_file: Path,
+                          warnings: Optional[List[str]] = None) -> Path:
+    """
+    Write the config.sh snapshot next to a configuration file
+
+    The snapshot is written to a temporary file and renamed into place, so a
+    concurrent `source` never sees a partial file.
+
+    Args:
+        config: Configuration dictionary
+        config_file: Path to config.json
+        warnings: Collects values replaced by defaults (see compile_config_snapshot)
+
+    Returns:
+        Path to the written snapshot
+    """
+    snapshot = get_snapshot_path(config_file)
+    tmp = snapshot.with_name(f".{snapshot.name}.{os.getpid()}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(compile_config_snapshot(config, warnings))
+    os.replace(tmp, snapshot)
+    return snapshot
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command-line entry point: python3 -m src.config_loader compile [config.json]
+
+    Args:
+        argv: Arguments (default: sys.argv[1:])
+
+    Returns:
+        Exit code
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] != "compile" or len(argv) > 2:
+        sys.stderr.write("Usage: python3 -m src.config_loader compile [config.json]\n")
+        return 2
+
+    if __package__:
+        for name in _VALIDATOR_MODULES:
+            importlib.import_module(f"{__package__}.{name}")
+
+    config_file = Path(argv[1]) if len(argv) == 2 else get_config_path()
+    warnings: List[str] = []
+    try:
+        snapshot = write_config_snapshot(read_config_file(config_file), config_file, warnings)
+    except OSError as e:
+        sys.stderr.write(f"Error writing config snapshot: {e}\n")
+        return 1
+    for warning in warnings:
+        sys.stderr.write(f"Warning: {config_file}: {warning}\n")
+    print(snapshot)
+    return 0
+
+
+if __name__ == "__main__":
+    # Under python3 -m, run the src.config_loader copy of this module: that
+    # is the one the feature modules register their validators with
+    if __package__:
+        sys.exit(importlib.import_module(f"{__package__}.config_loader").main())
+    sys.exit(main())
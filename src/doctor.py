@@ -0,0 +1,338 @@
+# doctor.py
+# wsl-toast doctor --bench: measure what a toast costs on this machine
+#
+# Usage: wsl-toast doctor --bench [--runs 3] [--sessions 4] [--no-toast] [--json]
+#
+# Times every step a toast depends on:
+# - cold and warm powershell.exe startup
+# - Get-Module -ListAvailable and the BurntToast import (timed inside PowerShell)
+# - wslpath and python3 startup
+# - config and template loading
+# - notify.sh round trips in mock and real mode
+# It then recommends a configuration for this host.
+#
+# Author: Claude Code TDD Implementation
+# Version: 1.0.0
+
+import argparse
+import json
+import math
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from .config_loader import clear_config_cache, load_config
+from .hooks import PACKAGE_ROOT, find_notify_script, find_templates_dir
+from .template_loader import TemplateLoader
+
+# Same search order as find_powershell in notify.sh
+POWERSHELL_CANDIDATES = (
+    "/mnt/c/Windows/System32/WindowsPowerShell/v1.0/powershell.exe",
+    "/mnt/c/WINDOWS/System32/WindowsPowerShell/v1.0/powershell.exe",
+    "/mnt/c/Windows/SysWOW64/WindowsPowerShell/v1.0/powershell.exe",
+    "/mnt/c/Program Files/PowerShell/7/pwsh.exe",
+    "powershell.exe",
+    "pwsh.exe",
+)
+
+# Times the module lookup and import inside one PowerShell process, so
+# startup is not counted twice
+MODULE_PROBE = (
+    "$m = (Measure-Command { $null = Get-Module -ListAvailable -Name BurntToast }).TotalMilliseconds; "
+    "$a = [bool](Get-Module -ListAvailable -Name BurntToast); "
+    "$i = if ($a) { (Measure-Command { Import-Module BurntToast }).TotalMilliseconds } else { $null }; "
+    "@{ get_module_ms = $m; import_ms = $i; burnttoast = $a } | ConvertTo-Json -Compress"
+)
+
+# Thresholds behind the recommendations (milliseconds)
+SLOW_POWERSHELL_MS = 500
+SLOW_WSLPATH_MS = 20
+BURST_WINDOW_MS = 1000
+
+# Seconds before a single measured command is abandoned
+COMMAND_TIMEOUT = 60
+
+
+def find_powershell() -> Optional[str]:
+    """
+    Locate powershell.exe the way notify.sh does
+
+    Returns:
+        Path or command name, or None if PowerShell is unreachable
+    """
+    for candidate in POWERSHELL_CANDIDATES:
+        if "/" in candidate:
+            if os.access(candidate, os.X_OK):
+                return candidate
+        elif shutil.which(candidate):
+            return shutil.which(candidate)
+    return None
+
+
+def time_command(command: List[str], env: Optional[Dict[str, str]] = None,
+                 cwd: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Run a command once and time it
+
+    Args:
+        command: Command and arguments
+        env: Environment (default: inherited)
+        cwd: Working directory
+
+    Returns:
+        Dictionary with 'ms', 'exit' and 'stdout', or 'error'
+    """
+    started = time.perf_counter()
+    try:
+        completed = subprocess.run(
+            command, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            env=env, cwd=cwd, timeout=COMMAND_TIMEOUT, check=False,
+        )
+    except (OSError, subprocess.TimeoutExpired) as e:
+        return {"error": type(e).__name__}
+    return {
+        "ms": (time.perf_counter() - started) * 1000,
+        "exit": completed.returncode,
+        "stdout": completed.stdout.decode("utf-8", errors="replace"),
+    }
+
+
+def time_call(func: Callable[[], Any]) -> float:
+    """Time one in-process call in milliseconds"""
+    started = time.perf_counter()
+    func()
+    return (time.perf_counter() - started) * 1000
+
+
+def summarize(samples: List[float]) -> Dict[str, Any]:
+    """
+    Summarise repeated timings
+
+    Args:
+        samples: Milliseconds per run, in run order
+
+    Returns:
+        Dictionary with first, median and min (ms, rounded) and runs
+    """
+    return {
+        "first_ms": round(samples[0], 2),
+        "median_ms": round(statistics.median(samples), 2),
+        "min_ms": round(min(samples), 2),
+        "runs": len(samples),
+    }
+
+
+def _repeat(command: List[str], runs: int, **kwargs: Any) -> Dict[str, Any]:
+    """Time a command several times; stop at the first failure"""
+    samples = []
+    for _ in range(runs):
+        result = time_command(command, **kwargs)
+        if "error" in result:
+            return {"skipped": result["error"]}
+        if result["exit"] != 0:
+            return {"skipped": f"exit code {result['exit']}"}
+        samples.append(result["ms"])
+    return summarize(samples)
+
+
+def bench(runs: int = 3, real: bool = True) -> Dict[str, Dict[str, Any]]:
+    """
+    Measure every step a toast depends on
+
+    Args:
+        runs: Repetitions per measurement (the first PowerShell run is cold)
+        real: Also time one real notify.sh round trip (shows a toast)
+
+    Returns:
+        Dictionary mapping measurement name to its summary, or to
+        {'skipped': reason} when it cannot run here
+    """
+    results: Dict[str, Dict[str, Any]] = {}
+    powershell = find_powershell()
+    ps_command = [powershell, "-NoProfile", "-NonInteractive"] if powershell else []
+
+    if powershell:
+        startup = _repeat(ps_command + ["-Command", "exit 0"], max(runs, 2))
+        results["powershell_startup"] = startup
+        probe = time_command(ps_command + ["-Command", MODULE_PROBE])
+        try:
+            module = json.loads(probe.get("stdout", "").strip().splitlines()[-1])
+        except (ValueError, IndexError):
+            module = None
+        if isinstance(module, dict):
+            results["get_module"] = {"median_ms": round(module.get("get_module_ms") or 0, 2), "runs": 1}
+            if module.get("import_ms") is not None:
+                results["burnttoast_import"] = {"median_ms": round(module["import_ms"], 2), "runs": 1}
+            else:
+                results["burnttoast_import"] = {"skipped": "BurntToast not installed"}
+        else:
+            results["get_module"] = results["burnttoast_import"] = {"skipped": "module probe failed"}
+    else:
+        for name in ("powershell_startup", "get_module", "burnttoast_import"):
+            results[name] = {"skipped": "powershell.exe not found"}
+
+    wslpath = shutil.which("wslpath")
+    results["wslpath"] = (
+        _repeat([wslpath, "-w", str(PACKAGE_ROOT)], runs) if wslpath else {"skipped": "wslpath not found"}
+    )
+
+    results["python_startup"] = _repeat([sys.executable, "-c", "pass"], runs)
+    results["hook_import"] = _repeat([sys.executable, "-c", "import src.hooks"], runs, cwd=str(PACKAGE_ROOT))
+
+    def load_fresh_config() -> None:
+        clear_config_cache()
+        load_config()
+
+    def load_fresh_template() -> None:
+        TemplateLoader(find_templates_dir()).get_template("stop", load_config().get("language", "en"))
+
+    results["config_load"] = summarize([time_call(load_fresh_config) for _ in range(runs)])
+    results["template_load"] = summarize([time_call(load_fresh_template) for _ in range(runs)])
+
+    notify = find_notify_script()
+    if notify is None:
+        results["notify_mock"] = results["notify_real"] = {"skipped": "notify.sh not found"}
+        return results
+    notify_command = ["bash", str(notify), "--title", "wsl-toast doctor", "--message", "Benchmark toast"]
+    results["notify_mock"] = _repeat(
+        notify_command + ["--mock"], runs, env=dict(os.environ, MOCK_MODE="true")
+    )
+    if not real:
+        results["notify_real"] = {"skipped": "--no-toast"}
+    elif not powershell:
+        results["notify_real"] = {"skipped": "powershell.exe not found"}
+    else:
+        env = dict(os.environ)
+        env.pop("MOCK_MODE", None)
+        results["notify_real"] = _repeat(notify_command, 1, env=env)
+    return results
+
+
+def _ms(results: Dict[str, Dict[str, Any]], name: str, key: str = "median_ms") -> Optional[float]:
+    """A measurement's value, or None if it was skipped"""
+    return results.get(name, {}).get(key)
+
+
+def recommend(results: Dict[str, Dict[str, Any]], sessions: int = 4) -> Dict[str, Any]:
+    """
+    Derive a configuration from the measurements
+
+    Args:
+        results: Output of bench()
+        sessions: Concurrent Claude Code sessions to plan for
+
+    Returns:
+        Dictionary with backend, resident_server, pool_size and reasons
+    """
+    reasons: List[str] = []
+    cold = _ms(results, "powershell_startup", "first_ms")
+    warm = _ms(results, "powershell_startup")
+    import_ms = _ms(results, "burnttoast_import")
+
+    if cold is None:
+        backend = "none"
+        reasons.append("powershell.exe is unreachable from WSL; toasts cannot be shown (use --mock to test)")
+    elif import_ms is None:
+        backend = "balloon"
+        reasons.append("BurntToast is not installed; wsl-toast.ps1 falls back to balloon tips "
+                       "(Install-Module BurntToast -Scope CurrentUser for Action Center toasts)")
+    else:
+        backend = "burnttoast"
+        reasons.append(f"BurntToast imports in {import_ms:.0f} ms")
+
+    spawn_ms = (warm or 0) + (import_ms or 0)
+    resident = cold is not None and spawn_ms >= SLOW_POWERSHELL_MS
+    if cold is not None:
+        verdict = "would pay off" if resident else "is not worth it"
+        reasons.append(f"each toast spends about {spawn_ms:.0f} ms starting PowerShell and importing; "
+                       f"a resident PowerShell server {verdict}")
+
+    # Warm processes needed to show a burst of one toast per session within BURST_WINDOW_MS
+    per_toast = max(spawn_ms, 1.0)
+    pool_size = 0
+    if resident:
+        pool_size = max(1, min(sessions, math.ceil(sessions * per_toast / BURST_WINDOW_MS)))
+        reasons.append(f"{pool_size} warm process(es) absorb a burst from {sessions} sessions "
+                       f"within {BURST_WINDOW_MS} ms")
+
+    wslpath = _ms(results, "wslpath")
+    if wslpath is not None and wslpath >= SLOW_WSLPATH_MS:
+        reasons.append(f"wslpath takes {wslpath:.0f} ms; re-run setup.sh so the rendered hooks "
+                       f"pass WSL_TOAST_PS_SCRIPT_DIR and skip it")
+
+    return {
+        "backend": backend,
+        "resident_server": resident,
+        "pool_size": pool_size,
+        "sessions": sessions,
+        "reasons": reasons,
+    }
+
+
+def format_report(results: Dict[str, Dict[str, Any]], recommendation: Dict[str, Any]) -> str:
+    """
+    Format measurements and recommendations as plain text
+
+    Args:
+        results: Output of bench()
+        recommendation: Output of recommend()
+
+    Returns:
+        Multi-line text
+    """
+    lines = [f"{'measurement':<22}{'first ms':>10}{'median ms':>11}{'min ms':>10}{'runs':>6}"]
+    for name, result in results.items():
+        if "skipped" in result:
+            lines.append(f"{name:<22}  skipped: {result['skipped']}")
+            continue
+        lines.append(
+            f"{name:<22}{result.get('first_ms', '-'):>10}{result.get('median_ms', '-'):>11}"
+            f"{result.get('min_ms', '-'):>10}{result.get('runs', '-'):>6}"
+        )
+    lines += [
+        "",
+        "Recommended configuration:",
+        f"  backend:         {recommendation['backend']}",
+        f"  resident server: {'yes' if recommendation['resident_server'] else 'no'}",
+        f"  pool size:       {recommendation['pool_size']} (for {recommendation['sessions']} sessions)",
+    ]
+    lines += [f"  - {reason}" for reason in recommendation["reasons"]]
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point: wsl-toast doctor (python3 -m src.doctor)"""
+    parser = argparse.ArgumentParser(prog="wsl-toast doctor", description="Check and benchmark this host")
+    parser.add_argument("--bench", action="store_true", help="measure toast costs on this machine")
+    parser.add_argument("--runs", type=int, default=3, help="repetitions per measurement (default: 3)")
+    parser.add_argument("--sessions", type=int, default=4,
+                        help="concurrent sessions to plan the pool for (default: 4)")
+    parser.add_argument("--no-toast", action="store_true", help="skip the real notify.sh round trip")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args(argv)
+    if args.runs < 1 or args.sessions < 1:
+        parser.error("--runs and --sessions must be at least 1")
+
+    if not args.bench:
+        powershell = find_powershell()
+        print(f"powershell.exe: {powershell or 'not found'}")
+        print(f"notify.sh:      {find_notify_script() or 'not found'}")
+        print("Run 'wsl-toast doctor --bench' to measure toast costs on this machine.")
+        return 0 if powershell else 1
+
+    results = bench(args.runs, real=not args.no_toast)
+    recommendation = recommend(results, args.sessions)
+    if args.json:
+        print(json.dumps({"results": results, "recommendation": recommendation}, indent=2))
+    else:
+        print(format_report(results, recommendation))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+# event_queries.py
+# Questions answered from the SQLite event store (see event_store.py)
+#
+# Counts are weighted by 1 / sample_rate, so sampled events such as
+# PostToolUse are estimated back to their true volume. Latency
+# percentiles use the sampled rows as they are: sampling is uniform, so
+# it does not bias them.
+#
+# The store only holds what has been ingested from events.jsonl. Open it
+# with event_store.open_store() so new journal lines are ingested first.
+#
+# Author: Claude Code TDD Implementation
+# Version: 1.0.0
+
+import math
+import sqlite3
+from typing import Dict, List, Optional, Tuple
+
+# Weight of one row: 1 / sample_rate (rows without a positive rate count once)
+_ROW_WEIGHT = "1.0 / CASE WHEN sample_rate > 0 THEN sample_rate ELSE 1.0 END"
+
+# Weighted count of the rows matched by a query
+_WEIGHT = f"SUM({_ROW_WEIGHT})"
+
+
+def _since_clause(since: Optional[float], prefix: str = "WHERE") -> Tuple[str, Tuple[float, ...]]:
+    """SQL condition and parameters restricting rows to ts >= since"""
+    if since is None:
+        return "", ()
+    return f" {prefix} ts >= ?", (since,)
+
+
+def toasts_per_session(
+    conn: sqlite3.Connection, since: Optional[float] = None, limit: int = 20
+) -> List[Dict[str, object]]:
+    """
+    Count delivered toasts per session, busiest first
+
+    Args:
+        conn: Event store connection
+        since: Only count events at or after this Unix time
+        limit: Most sessions returned
+
+    Returns:
+        List of dicts with session_id, toasts, first_ts and last_ts
+    """
+    where, params = _since_clause(since, "AND")
+    rows = conn.execute(
+        f"SELECT session_id, {_WEIGHT}, MIN(ts), MAX(ts) FROM events"
+        f" WHERE decision = 'delivered' AND session_id IS NOT NULL{where}"
+        f" GROUP BY session_id ORDER BY 2 DESC LIMIT ?",
+        params + (limit,),
+    )
+    return [
+        {"session_id": session, "toasts": round(toasts), "first_ts": first, "last_ts": last}
+        for session, toasts, first, last in rows
+    ]
+
+
+def delivery_latency(
+    conn: sqlite3.Connection, percentile: float = 95, since: Optional[float] = None
+) -> Dict[str, float]:
+    """
+    Delivery latency percentile per event (nearest-rank)
+
+    Args:
+        conn: Event store connection
+        percentile: Percentile between 0 and 100
+        since: Only use events at or after this Unix time
+
+    Returns:
+        Dictionary mapping event name to latency in milliseconds
+    """
+    where, params = _since_clause(since, "AND")
+    counts = dict(conn.execute(
+        f"SELECT event, COUNT(*) FROM events WHERE deliver_ms IS NOT NULL{where} GROUP BY event",
+        params,
+    ))
+    result = {}
+    for event, count in counts.items():
+        rank = max(1, math.ceil(percentile / 100 * count))
+        # (event, ts) index narrows the scan to one event
+        row = conn.execute(
+            f"SELECT deliver_ms FROM events WHERE event = ? AND deliver_ms IS NOT NULL{where}"
+            f" ORDER BY deliver_ms LIMIT 1 OFFSET ?",
+            (event,) + params + (rank - 1,),
+        ).fetchone()
+        result[event] = row[0]
+    return result
+
+
+def noisy_tools(
+    conn: sqlite3.Connection, since: Optional[float] = None, limit: int = 10
+) -> List[Dict[str, object]]:
+    """
+    Tools with the most PostToolUse invocations
+
+    Args:
+        conn: Event store connection
+        since: Only count events at or after this Unix time
+        limit: Most tools returned
+
+    Returns:
+        List of dicts with tool, invocations, toasts and failures
+    """
+    where, params = _since_clause(since, "AND")
+    rows = conn.execute(
+        f"SELECT tool, {_WEIGHT},"
+        f" SUM(CASE WHEN decision = 'delivered' THEN {_ROW_WEIGHT} ELSE 0 END),"
+        f" SUM(CASE WHEN outcome = 'failure' THEN {_ROW_WEIGHT} ELSE 0 END)"
+        f" FROM events WHERE event = 'PostToolUse' AND tool IS NOT NULL{where}"
+        f" GROUP BY tool ORDER BY 2 DESC LIMIT ?",
+        params + (limit,),
+    )
+    return [
+        {"tool": tool, "invocations": round(total), "toasts": round(toasts), "failures": round(failures)}
+        for tool, total, toasts, failures in rows
+    ]
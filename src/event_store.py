@@ -0,0 +1,434 @@
+# event_store.py
+# Optional SQLite store for the structured event log (~/.wsl-toast/events.db)
+#
+# Hooks never open the database: their only write stays the single
+# events.jsonl append (see events.py), which acts as the store's journal.
+# The store ingests new journal lines in batched transactions, in WAL mode
+# with synchronous=NORMAL, so commits do not wait on fsync. Ingestion and
+# retention pruning run off the hot path: on demand before queries
+# (open_store, python3 -m src.event_store --report), once per session in a
+# detached python3 -m src.event_store started by the SessionEnd hook, or
+# continuously in the background Compactor thread (--follow). The store
+# only holds what was ingested before events.jsonl rotated away.
+#
+# Author: Claude Code TDD Implementation
+# Version: 1.0.0
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .events import EVENT_LOG_NAME, event_log_files
+
+DB_NAME = "events.db"
+
+# Journal lines inserted per transaction
+DEFAULT_BATCH_SIZE = 500
+
+# Rows older than this are deleted by prune()
+DEFAULT_RETENTION_DAYS = 90
+
+# Leading journal bytes compared to detect a replaced journal (records
+# start with their ts and event, so a new file differs from the first line)
+FINGERPRINT_BYTES = 256
+
+# Seconds between Compactor passes
+DEFAULT_COMPACT_INTERVAL = 60.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    ts REAL NOT NULL,
+    pid INTEGER NOT NULL,
+    event TEXT NOT NULL,
+    session_id TEXT,
+    tool TEXT,
+    decision TEXT,
+    type TEXT,
+    backend TEXT,
+    outcome TEXT,
+    deliver_ms REAL,
+    total_ms REAL,
+    sample_rate REAL NOT NULL DEFAULT 1.0,
+    record TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_events_record ON events (ts, pid, event);
+CREATE INDEX IF NOT EXISTS idx_events_session_ts ON events (session_id, ts);
+CREATE INDEX IF NOT EXISTS idx_events_event_ts ON events (event, ts);
+CREATE TABLE IF NOT EXISTS ingest_state (
+    path TEXT PRIMARY KEY,
+    inode INTEGER NOT NULL,
+    offset INTEGER NOT NULL,
+    fingerprint TEXT NOT NULL
+);
+"""
+
+_INSERT = """
+INSERT OR IGNORE INTO events (
+    ts, pid, event, session_id, tool, decision, type, backend, outcome,
+    deliver_ms, total_ms, sample_rate, record
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def connect(path: Path) -> sqlite3.Connection:
+    """
+    Open the event database in WAL mode, creating the schema if needed
+
+    Args:
+        path: Database file path
+
+    Returns:
+        sqlite3 connection
+    """
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(path), timeout=5.0, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    # In WAL mode NORMAL only syncs at checkpoints, never on commit
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def record_row(record: Dict[str, Any]) -> Optional[Tuple[Any, ...]]:
+    """
+    Convert an events.jsonl record into an events table row
+
+    Args:
+        record: Parsed record
+
+    Returns:
+        Row tuple, or None if the record lacks ts, pid or event
+    """
+    try:
+        ts = float(record["ts"])
+        pid = int(record["pid"])
+        event = str(record["event"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    stages = record.get("stages_ms")
+    deliver_ms = stages.get("deliver") if isinstance(stages, dict) else None
+    return (
+        ts, pid, event,
+        record.get("session"), record.get("tool"), record.get("decision"),
+        record.get("type"), record.get("backend"), record.get("outcome"),
+        deliver_ms, record.get("total_ms"), record.get("sample_rate", 1.0),
+        json.dumps(record, ensure_ascii=False, separators=(",", ":")),
+    )
+
+
+def _parse_lines(lines: Iterable[bytes]) -> Iterator[Tuple[Any, ...]]:
+    """Yield rows for the well-formed records among journal lines"""
+    for line in lines:
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(record, dict):
+            row = record_row(record)
+            if row is not None:
+                yield row
+
+
+def _fingerprint(f: BinaryIO, offset: int) -> str:
+    """Hash of the first FINGERPRINT_BYTES of the journal, up to offset"""
+    f.seek(0)
+    return hashlib.sha1(f.read(min(offset, FINGERPRINT_BYTES))).hexdigest()
+
+
+class EventStore:
+    """SQLite event store fed from the events.jsonl journal"""
+
+    def __init__(
+        self,
+        db_path: Path,
+        log_dir: Path,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        retention_days: float = DEFAULT_RETENTION_DAYS,
+    ):
+        """
+        Open the store
+
+        Args:
+            db_path: Database file path
+            log_dir: Directory holding events.jsonl and its rotated files
+            batch_size: Journal lines inserted per transaction
+            retention_days: Age after which rows are pruned (0 keeps everything)
+        """
+        self.db_path = Path(db_path)
+        self.journal = Path(log_dir) / EVENT_LOG_NAME
+        self.batch_size = batch_size
+        self.retention = retention_days * 86400
+        self.conn = connect(self.db_path)
+
+    @classmethod
+    def from_config(cls, state_dir: Path, config: Dict[str, Any]) -> "EventStore":
+        """
+        Open the store for a configuration
+
+        Args:
+            state_dir: State directory (~/.wsl-toast)
+            config: Configuration dictionary (event_store_* keys)
+
+        Returns:
+            EventStore instance
+        """
+        return cls(
+            Path(state_dir) / DB_NAME,
+            Path(state_dir) / "logs",
+            retention_days=config.get("event_store_retention_days", DEFAULT_RETENTION_DAYS),
+        )
+
+    def close(self) -> None:
+        """Close the database connection"""
+        self.conn.close()
+
+    def __enter__(self) -> "EventStore":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def _insert(self, rows: Iterable[Tuple[Any, ...]], state: Optional[Tuple[int, int, str]] = None) -> int:
+        """Insert rows in batch_size transactions; save state with the last one"""
+        inserted = 0
+        batch: List[Tuple[Any, ...]] = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= self.batch_size:
+                with self.conn:
+                    inserted += self.conn.executemany(_INSERT, batch).rowcount
+                batch = []
+        with self.conn:
+            if batch:
+                inserted += self.conn.executemany(_INSERT, batch).rowcount
+            if state is not None:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO ingest_state (path, inode, offset, fingerprint)"
+                    " VALUES (?, ?, ?, ?)",
+                    (str(self.journal),) + state,
+                )
+        return inserted
+
+    def ingest(self) -> int:
+        """
+        Insert journal records appended since the last ingest
+
+        Only complete lines are consumed. On the first ingest, or when
+        events.jsonl has been rotated since the last one, the rotated files
+        are read in full first; records already stored are ignored.
+
+        Returns:
+            Number of new rows
+        """
+        row = self.conn.execute(
+            "SELECT inode, offset, fingerprint FROM ingest_state WHERE path = ?",
+            (str(self.journal),),
+        ).fetchone()
+        inode, offset, fingerprint = row if row else (None, 0, "")
+        inserted = 0
+
+        try:
+            f = open(self.journal, "rb")
+        except FileNotFoundError:
+            f = None
+        try:
+            stat = os.fstat(f.fileno()) if f else None
+            # First ingest, or events.jsonl rotated since the last one
+            if (
+                inode is None or stat is None or stat.st_ino != inode
+                or stat.st_size < offset or _fingerprint(f, offset) != fingerprint
+            ):
+                for rotated in event_log_files(self.journal.parent)[:-1 if f else None]:
+                    opener = gzip.open if rotated.suffix == ".gz" else open
+                    with opener(rotated, "rb") as r:
+                        inserted += self._insert(_parse_lines(r))
+                offset = 0
+            if f is None:
+                return inserted
+
+            f.seek(offset)
+            data = f.read(stat.st_size - offset)
+            end = offset + data.rfind(b"\n") + 1
+            inserted += self._insert(
+                _parse_lines(data[:end - offset].splitlines()),
+                (stat.st_ino, end, _fingerprint(f, end)),
+            )
+            return inserted
+        finally:
+            if f:
+                f.close()
+
+    def prune(self, now: Optional[float] = None) -> int:
+        """
+        Delete rows older than the retention period and checkpoint the WAL
+
+        Args:
+            now: Current time (default: time.time())
+
+        Returns:
+            Number of deleted rows
+        """
+        if not self.retention:
+            return 0
+        cutoff = (time.time() if now is None else now) - self.retention
+        with self.conn:
+            deleted = self.conn.execute("DELETE FROM events WHERE ts < ?", (cutoff,)).rowcount
+        self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        return deleted
+
+
+class Compactor(threading.Thread):
+    """Background task that ingests the journal and prunes old rows"""
+
+    def __init__(self, store: EventStore, interval: float = DEFAULT_COMPACT_INTERVAL):
+        """
+        Create the task (call start() to run it)
+
+        Args:
+            store: Event store to maintain
+            interval: Seconds between passes
+        """
+        super().__init__(name="wsl-toast-compactor", daemon=True)
+        self.store = store
+        self.interval = interval
+        self._stop_event = threading.Event()
+        self.passes = 0
+
+    def run(self) -> None:
+        """Run passes until stop() is called"""
+        while True:
+            try:
+                self.store.ingest()
+                self.store.prune()
+            except (OSError, sqlite3.Error) as e:
+                sys.stderr.write(f"wsl-toast event store: {e}\n")
+            self.passes += 1
+            if self._stop_event.wait(self.interval):
+                return
+
+    def stop(self) -> None:
+        """Stop after the current pass and wait for it to finish"""
+        self._stop_event.set()
+        self.join()
+
+
+def sync_store(state_dir: Path, config: Dict[str, Any]) -> int:
+    """
+    Ingest and prune once if the store is enabled
+
+    Args:
+        state_dir: State directory (~/.wsl-toast)
+        config: Configuration dictionary
+
+    Returns:
+        Number of new rows (0 when disabled or on error)
+    """
+    if config.get("event_store_enabled") is not True:
+        return 0
+    try:
+        with EventStore.from_config(state_dir, config) as store:
+            inserted = store.ingest()
+            store.prune()
+            return inserted
+    except (OSError, sqlite3.Error):
+        return 0
+
+
+def open_store(state_dir: Path, config: Dict[str, Any]) -> EventStore:
+    """
+    Open the store for queries, ingesting new journal lines first
+
+    Queries (see event_queries.py) should use this connection, so they
+    also see events logged since the last SessionEnd sync. A journal that
+    cannot be read leaves the stored rows as they are.
+
+    Args:
+        state_dir: State directory (~/.wsl-toast)
+        config: Configuration dictionary (event_store_* keys)
+
+    Returns:
+        EventStore instance; its conn is ready for queries
+    """
+    store = EventStore.from_config(state_dir, config)
+    try:
+        store.ingest()
+    except OSError:
+        pass
+    return store
+
+
+def report(store: EventStore, since: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Answer every event_queries question from the store
+
+    Args:
+        store: Event store
+        since: Only count events at or after this Unix time
+
+    Returns:
+        Dict with toasts_per_session, delivery_latency_p95 and noisy_tools
+    """
+    from .event_queries import delivery_latency, noisy_tools, toasts_per_session
+
+    return {
+        "toasts_per_session": toasts_per_session(store.conn, since=since),
+        "delivery_latency_p95": delivery_latency(store.conn, 95, since=since),
+        "noisy_tools": noisy_tools(store.conn, since=since),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point: python3 -m src.event_store [--follow SECONDS | --report]"""
+    from .config_loader import load_config
+    from .stats import parse_since
+
+    parser = argparse.ArgumentParser(prog="python3 -m src.event_store")
+    parser.add_argument("--state-dir", default=str(Path.home() / ".wsl-toast"))
+    parser.add_argument("--follow", type=float, metavar="SECONDS",
+                        help="keep ingesting and pruning every SECONDS until interrupted")
+    parser.add_argument("--report", action="store_true",
+                        help="ingest new events, then print the stored query results as JSON")
+    parser.add_argument("--since", help="with --report: only count events after this (30m, 24h, 7d, ...)")
+    args = parser.parse_args(argv)
+
+    try:
+        since = parse_since(args.since) if args.since else None
+    except ValueError:
+        parser.error(f"invalid --since value: {args.since}")
+
+    config = load_config(args.state_dir)
+    if args.report:
+        with open_store(Path(args.state_dir), config) as store:
+            print(json.dumps(report(store, since), indent=2))
+        return 0
+
+    store = EventStore.from_config(Path(args.state_dir), config)
+    if args.follow is None:
+        inserted = store.ingest()
+        deleted = store.prune()
+        store.close()
+        print(f"ingested {inserted} events, pruned {deleted}")
+        return 0
+
+    compactor = Compactor(store, args.follow)
+    compactor.start()
+    try:
+        while compactor.is_alive():
+            compactor.join(1.0)
+    except KeyboardInterrupt:
+        compactor.stop()
+    store.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,195 @@
+# events.py
+# Structured per-invocation event log (~/.wsl-toast/logs/events.jsonl)
+#
+# Every hook invocation produces at most one compact JSON line: event,
+# session, tool, decision, backend, outcome, per-stage timings and the
+# sampling rate it was kept at. Rates are configurable per event, so
+# chatty events such as PostToolUse can be logged at 1% while rare ones
+# are always kept. Errors and profiled invocations are always kept.
+# The file is rotated like hooks.log (see hooklog.py).
+#
+# Author: Claude Code TDD Implementation
+# Version: 1.0.0
+
+import json
+import os
+import random
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Mapping, Optional
+
+from .config_loader import register_validator
+from .hooklog import HookLog
+
+EVENT_LOG_NAME = "events.jsonl"
+
+# Default event_log_sample_rates: '*' applies to events without their own rate
+DEFAULT_SAMPLE_RATES: Dict[str, float] = {"*": 1.0, "PostToolUse": 0.01}
+
+# Decisions recorded for an invocation
+DELIVERED = "delivered"
+SUPPRESSED = "suppressed"
+FILTERED = "filtered"
+DISABLED = "disabled"
+ERROR = "error"
+
+
+def event_log_files(log_dir: Path) -> List[Path]:
+    """
+    List events.jsonl and its rotated files, oldest first
+
+    Args:
+        log_dir: Directory holding the event log
+
+    Returns:
+        Existing paths (events.jsonl.N[.gz] ... events.jsonl)
+    """
+    base = Path(log_dir) / EVENT_LOG_NAME
+    rotated = []
+    for path in base.parent.glob(base.name + ".*"):
+        index = path.name[len(base.name) + 1:].partition(".")[0]
+        if index.isdigit():
+            rotated.append((int(index), path))
+    files = [path for _, path in sorted(rotated, reverse=True)]
+    if base.exists():
+        files.append(base)
+    return files
+
+
+def get_sample_rate(config: Dict[str, Any], event: str) -> float:
+    """
+    Get the sampling rate for an event
+
+    Args:
+        config: Configuration dictionary (event_log_sample_rates)
+        event: Hook event name
+
+    Returns:
+        Fraction of invocations to record, between 0 and 1
+    """
+    rates = dict(DEFAULT_SAMPLE_RATES)
+    configured = config.get("event_log_sample_rates")
+    if isinstance(configured, Mapping):
+        rates.update(configured)
+    rate = rates.get(event, rates.get("*", 1.0))
+    if isinstance(rate, bool) or not isinstance(rate, (int, float)):
+        return 1.0
+    return min(max(float(rate), 0.0), 1.0)
+
+
+class EventRecorder:
+    """Collects one invocation's event record and writes it if sampled"""
+
+    def __init__(self, event: str, log_dir: Path, config: Dict[str, Any]):
+        """
+        Start recording an invocation
+
+        Args:
+            event: Hook event name
+            log_dir: Directory holding events.jsonl
+            config: Configuration dictionary
+        """
+        self.event = event
+        self.config = config
+        self.log = HookLog(
+            Path(log_dir) / EVENT_LOG_NAME,
+            max_bytes=config.get("hook_log_max_bytes", 1024 * 1024),
+            backups=config.get("hook_log_backups", 3),
+            max_age_days=config.get("hook_log_max_age_days", 7),
+            compress=config.get("hook_log_compress", True),
+        )
+        self.started = time.monotonic()
+        # Set to bypass sampling (e.g. profiled invocations)
+        self.keep = False
+        self.stages: Dict[str, float] = {}
+        self.fields: Dict[str, Any] = {}
+
+    def set(self, **fields: Any) -> None:
+        """Set record fields (None values are left out)"""
+        self.fields.update(fields)
+
+    def add_stage(self, name: str, seconds: float) -> None:
+        """Add a stage duration measured elsewhere"""
+        self.stages[name] = round(self.stages.get(name, 0.0) + seconds * 1000, 3)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time a stage of the invocation"""
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.add_stage(name, time.monotonic() - started)
+
+    def record(self) -> Dict[str, Any]:
+        """
+        Build the record for this invocation
+
+        Returns:
+            Record dictionary
+        """
+        record = {
+            "ts": round(time.time(), 3),
+            "event": self.event,
+            "pid": os.getpid(),
+        }
+        record.update({k: v for k, v in self.fields.items() if v is not None})
+        record["stages_ms"] = self.stages
+        record["total_ms"] = round((time.monotonic() - self.started) * 1000, 3)
+        return record
+
+    def finish(self, sample: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Write the record if this invocation is sampled
+
+        Args:
+            sample: Random draw in [0, 1) (default: random.random())
+
+        Returns:
+            The written record, or None if it was sampled out or disabled
+        """
+        if self.config.get("event_log_enabled", True) is False:
+            return None
+        rate = get_sample_rate(self.config, self.event)
+        if self.fields.get("decision") != ERROR and not self.keep:
+            draw = random.random() if sample is None else sample
+            if draw >= rate:
+                return None
+        else:
+            rate = 1.0
+        record = self.record()
+        record["sample_rate"] = rate
+        self.log.log(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+        self.log.flush()
+        return record
+
+
+@register_validator
+def validate_event_config(config: Dict[str, Any]) -> List[str]:
+    """
+    Validate the event_log_* and event_store_* configuration keys
+
+    Args:
+        config: Configuration dictionary
+
+    Returns:
+        List of error messages (empty if valid)
+    """
+    errors = []
+    if "event_log_enabled" in config and not isinstance(config["event_log_enabled"], bool):
+        errors.append("event_log_enabled must be a boolean")
+    if "event_log_sample_rates" in config:
+        rates = config["event_log_sample_rates"]
+        if not isinstance(rates, Mapping) or not all(
+            isinstance(v, (int, float)) and not isinstance(v, bool) and 0 <= v <= 1
+            for v in rates.values()
+        ):
+            errors.append("event_log_sample_rates must map event names to rates between 0 and 1")
+    if "event_store_enabled" in config and not isinstance(config["event_store_enabled"], bool):
+        errors.append("event_store_enabled must be a boolean")
+    if "event_store_retention_days" in config:
+        value = config["event_store_retention_days"]
+        if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+            errors.append("event_store_retention_days must be a non-negative integer")
+    return errors
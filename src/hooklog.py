@@ -0,0 +1,288 @@
+# hooklog.py
+# Rotating, size-capped hook log (~/.wsl-toast/logs/hooks.log)
+#
+# Records are buffered for the lifetime of one hook invocation and written
+# with a single O_APPEND write, so concurrent hooks never interleave
+# partial records. Writers hold a shared flock on hooks.log.lock; the
+# writer that finds the log over its size or age limit takes the lock
+# exclusively and rotates hooks.log -> hooks.log.1[.gz] -> ...
+#
+# Author: Claude Code TDD Implementation
+# Version: 1.0.0
+
+import gzip
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .config_loader import register_validator
+
+try:
+    import fcntl
+except ImportError:  # non-POSIX: write without locking
+    fcntl = None
+
+# Verbosity levels (hook_log_level); a record is written when its level
+# is at or below the configured one
+LEVELS = {"off": 0, "error": 1, "info": 2, "debug": 3}
+
+LOG_NAME = "hooks.log"
+
+# Defaults for the hook_log_* config keys
+DEFAULT_LEVEL = "info"
+DEFAULT_MAX_BYTES = 1024 * 1024
+DEFAULT_BACKUPS = 3
+DEFAULT_MAX_AGE_DAYS = 7
+DEFAULT_FIELD_MAX = 256
+
+
+def truncate_fields(value: Any, max_chars: int) -> Any:
+    """
+    Shorten every string inside a payload to max_chars characters
+
+    Args:
+        value: Payload value (dicts and lists are copied)
+        max_chars: Longest string kept (0 keeps everything)
+
+    Returns:
+        Copy with long strings cut and marked with the number of dropped chars
+    """
+    if isinstance(value, str):
+        if max_chars and len(value) > max_chars:
+            return f"{value[:max_chars]}…[+{len(value) - max_chars} chars]"
+        return value
+    if isinstance(value, dict):
+        return {k: truncate_fields(v, max_chars) for k, v in value.items()}
+    if isinstance(value, list):
+        return [truncate_fields(v, max_chars) for v in value]
+    return value
+
+
+class HookLog:
+    """Buffered writer for hooks.log with rotation and cross-process locking"""
+
+    def __init__(
+        self,
+        path: Path,
+        level: str = DEFAULT_LEVEL,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        backups: int = DEFAULT_BACKUPS,
+        max_age_days: float = DEFAULT_MAX_AGE_DAYS,
+        compress: bool = True,
+        field_max: int = DEFAULT_FIELD_MAX,
+    ):
+        """
+        Create a hook log
+
+        Args:
+            path: Log file path
+            level: Verbosity (off, error, info, debug; payload dumps are debug)
+            max_bytes: Rotate once the log would grow past this size
+            backups: Rotated files kept (hooks.log.1 is the newest)
+            max_age_days: Rotate a log started longer ago than this, and
+                delete backups older than this (0 disables age limits)
+            compress: gzip rotated files
+            field_max: Longest payload string in payload dumps (0: raw)
+        """
+        self.path = Path(path)
+        self.lock_path = self.path.with_name(self.path.name + ".lock")
+        self.level = LEVELS.get(level, LEVELS[DEFAULT_LEVEL])
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.max_age = max_age_days * 86400
+        self.compress = compress
+        self.field_max = field_max
+        self._buffer: List[str] = []
+
+    @classmethod
+    def from_config(cls, log_dir: Path, config: Dict[str, Any]) -> "HookLog":
+        """
+        Create the hook log for a configuration
+
+        Args:
+            log_dir: Directory holding hooks.log
+            config: Configuration dictionary (hook_log_* keys)
+
+        Returns:
+            HookLog instance
+        """
+        return cls(
+            Path(log_dir) / LOG_NAME,
+            level=config.get("hook_log_level", DEFAULT_LEVEL),
+            max_bytes=config.get("hook_log_max_bytes", DEFAULT_MAX_BYTES),
+            backups=config.get("hook_log_backups", DEFAULT_BACKUPS),
+            max_age_days=config.get("hook_log_max_age_days", DEFAULT_MAX_AGE_DAYS),
+            compress=config.get("hook_log_compress", True),
+            field_max=config.get("hook_log_field_max", DEFAULT_FIELD_MAX),
+        )
+
+    def enabled(self, level: str) -> bool:
+        """Check whether records of a level are written"""
+        return 0 < LEVELS.get(level, LEVELS["debug"]) <= self.level
+
+    def log(self, text: str, level: str = "info") -> None:
+        """
+        Buffer a record (written by flush())
+
+        Args:
+            text: Record text, including its trailing newline
+            level: Record level
+        """
+        if self.enabled(level):
+            self._buffer.append(text)
+
+    def log_payload(self, event: str, raw: str, payload: Optional[Dict[str, Any]]) -> None:
+        """
+        Buffer a payload between '=== <Event> Hook <date> ===' markers
+
+        Payload dumps are debug records (events.jsonl holds the per-call
+        summary). The payload is written as one JSON line with long strings
+        cut to field_max; with field_max 0 the raw text is kept.
+
+        Args:
+            event: Hook event name
+            raw: Raw payload text
+            payload: Parsed payload (may be empty)
+        """
+        if not self.enabled("debug"):
+            return
+        stamp = time.strftime("%a %b %e %H:%M:%S %Z %Y")
+        if not self.field_max:
+            body = raw
+        elif payload:
+            body = json.dumps(truncate_fields(payload, self.field_max), ensure_ascii=False)
+        else:
+            body = truncate_fields(raw.strip(), self.field_max)
+        self._buffer.append(f"=== {event} Hook {stamp} ===\n{body}\n")
+
+    def flush(self) -> None:
+        """Write buffered records with one append, rotating first if needed"""
+        if not self._buffer:
+            return
+        data = "".join(self._buffer).encode("utf-8", errors="replace")
+        self._buffer.clear()
+        try:
+            self._write(data)
+        except OSError:
+            pass
+
+    def _write(self, data: bytes) -> None:
+        """Append data under a shared lock (exclusive while rotating)"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        lock_fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if fcntl is not None:
+                fcntl.flock(lock_fd, fcntl.LOCK_SH)
+            if self._needs_rotation(len(data)):
+                if fcntl is not None:
+                    fcntl.flock(lock_fd, fcntl.LOCK_EX)
+                # Another writer may have rotated while we waited
+                if self._needs_rotation(len(data)):
+                    self.rotate()
+                if fcntl is not None:
+                    fcntl.flock(lock_fd, fcntl.LOCK_SH)
+
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+            try:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
+        finally:
+            os.close(lock_fd)
+
+    def _needs_rotation(self, incoming: int) -> bool:
+        """Check the size and age limits before appending incoming bytes"""
+        try:
+            size = os.stat(self.path).st_size
+        except FileNotFoundError:
+            return False
+        if not size:
+            return False
+        if self.max_bytes and size + incoming > self.max_bytes:
+            return True
+        # The lock file is touched on every rotation, so its mtime is when
+        # the current log was started
+        if self.max_age:
+            try:
+                return time.time() - os.stat(self.lock_path).st_mtime > self.max_age
+            except OSError:
+                return False
+        return False
+
+    def _backup_path(self, index: int) -> Path:
+        """Path of rotated file number index"""
+        suffix = f".{index}.gz" if self.compress else f".{index}"
+        return self.path.with_name(self.path.name + suffix)
+
+    def rotate(self) -> None:
+        """
+        Rotate hooks.log now (caller holds the exclusive lock)
+
+        Backups beyond the configured count or older than max_age are
+        deleted; the newest backup is gzipped when compress is set.
+        """
+        # Shift hooks.log.N[.gz] -> N+1, newest last so nothing is overwritten
+        backups = []
+        for backup in self.path.parent.glob(self.path.name + ".*"):
+            index, _, ext = backup.name[len(self.path.name) + 1:].partition(".")
+            if index.isdigit():
+                backups.append((int(index), ext, backup))
+        for index, ext, backup in sorted(backups, reverse=True):
+            if index >= self.backups:
+                backup.unlink()
+            else:
+                backup.rename(backup.with_name(
+                    f"{self.path.name}.{index + 1}" + (f".{ext}" if ext else "")
+                ))
+
+        if self.backups:
+            if self.compress:
+                with open(self.path, "rb") as src, gzip.open(self._backup_path(1), "wb") as dst:
+                    shutil.copyfileobj(src, dst)
+                self.path.unlink()
+            else:
+                self.path.rename(self._backup_path(1))
+        else:
+            self.path.unlink()
+
+        if self.max_age:
+            cutoff = time.time() - self.max_age
+            for backup in self.path.parent.glob(self.path.name + ".*"):
+                if backup != self.lock_path and backup.stat().st_mtime < cutoff:
+                    backup.unlink()
+        os.utime(self.lock_path)
+
+
+@register_validator
+def validate_log_config(config: Dict[str, Any]) -> List[str]:
+    """
+    Validate the hook_log_* configuration keys
+
+    Args:
+        config: Configuration dictionary
+
+    Returns:
+        List of error messages (empty if valid)
+    """
+    errors = []
+    if "hook_log_level" in config and config["hook_log_level"] not in LEVELS:
+        errors.append(f"hook_log_level must be one of {list(LEVELS)}, got '{config['hook_log_level']}'")
+    for key, minimum in (
+        ("hook_log_max_bytes", 1),
+        ("hook_log_backups", 0),
+        ("hook_log_max_age_days", 0),
+        ("hook_log_field_max", 0),
+    ):
+        if key in config:
+            value = config[key]
+            if isinstance(value, bool) or not isinstance(value, int) or value < minimum:
+                kind = "positive" if minimum else "non-negative"
+                errors.append(f"{key} must be a {kind} integer")
+    if "hook_log_compress" in config and not isinstance(config["hook_log_compress"], bool):
+        errors.append("hook_log_compress must be a boolean")
+    return errors
@@ -0,0 +1,763 @@
+# hooks.py
+# Single-process dispatcher for Claude Code hooks
+#
+# Usage: python3 -m src.hooks <EventName> < payload.json
+#
+# The hooks/*.sh scripts are thin shims around this module: stdin is read
+# once, and config, templates, payload parsing, message extraction and
+# delivery all happen in one interpreter.
+#
+# Author: Claude Code TDD Implementation
+# Version: 1.0.0
+
+import io
+import json
+import os
+import secrets
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from .config_loader import load_config
+from .events import DELIVERED, DISABLED, ERROR, FILTERED, SUPPRESSED, EventRecorder
+from .hooklog import HookLog
+from .matchers import get_tool_matcher, matches_tool
+from .outcome import FAILURE, INTERRUPTED, classify, get_rule_table, payload_fields
+from .payload import DEFAULT_MAX_BYTES, drain, read_capped, read_fields
+from .spinner import stop_spinner
+from .template_loader import TemplateLoader
+from .tracing import SPAN_KIND_CLIENT, hook_tracer
+from .transcript import first_sentence, get_last_assistant_message
+
+# Project root in a checkout, or ~/.claude/hooks/wsl-toast when installed
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+
+# Notification dictionary returned by handlers:
+#   {"title": str, "message": str, "type": str, "background": bool}
+Notification = Dict[str, Any]
+HookHandler = Callable[["HookContext"], Optional[Notification]]
+
+# Payload fields a handler reads: dotted paths, or a function of the config
+PayloadFields = Union[Tuple[str, ...], Callable[[Dict[str, Any]], Tuple[str, ...]]]
+
+# Event name -> handler. New events only need a @register entry.
+HANDLERS: Dict[str, HookHandler] = {}
+
+# Event name -> payload fields the handler reads. Events listed here get
+# only these fields from a streaming parse; ctx.raw is empty for them.
+PAYLOAD_FIELDS: Dict[str, PayloadFields] = {}
+
+# Payload fields HookContext reads for every event, added to each
+# handler's declared fields by read_stdin()
+CONTEXT_FIELDS: Tuple[str, ...] = ("session_id", "tool_name")
+
+
+def register(
+    event: str, fields: Optional[PayloadFields] = None
+) -> Callable[[HookHandler], HookHandler]:
+    """
+    Register a handler for a Claude Code hook event
+
+    Args:
+        event: Hook event name (e.g. 'Stop', 'PostToolUse')
+        fields: Dotted payload fields the handler needs, or a function
+            returning them for a config (default: the whole payload,
+            parsed and kept in ctx.raw)
+
+    Returns:
+        Decorator that adds the handler to HANDLERS
+    """
+
+    def decorator(handler: HookHandler) -> HookHandler:
+        HANDLERS[event] = handler
+        if fields:
+            PAYLOAD_FIELDS[event] = fields if callable(fields) else tuple(fields)
+        return handler
+
+    return decorator
+
+
+def find_templates_dir() -> Path:
+    """
+    Locate the notification templates directory
+
+    Returns:
+        templates/notifications in a checkout, templates/ when installed
+    """
+    override = os.environ.get("WSL_TOAST_TEMPLATES_DIR")
+    if override:
+        return Path(override)
+    project_dir = PACKAGE_ROOT / "templates" / "notifications"
+    if project_dir.is_dir():
+        return project_dir
+    return PACKAGE_ROOT / "templates"
+
+
+def find_notify_script() -> Optional[Path]:
+    """
+    Locate notify.sh: installed next to the hooks, or in scripts/ of a checkout
+
+    Returns:
+        Path to notify.sh or None if it cannot be found
+    """
+    override = os.environ.get("WSL_TOAST_NOTIFY_SCRIPT")
+    candidates = [Path(override)] if override else []
+    candidates += [PACKAGE_ROOT / "notify.sh", PACKAGE_ROOT / "scripts" / "notify.sh"]
+    for candidate in candidates:
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def is_enabled(value: Any) -> bool:
+    """Interpret the config 'enabled' value the same way notify.sh does"""
+    if isinstance(value, str):
+        return value.strip().lower() not in ("false", "0", "no")
+    return value is not False and value != 0
+
+
+def capture_enabled(config: Dict[str, Any]) -> bool:
+    """
+    Check whether raw payloads should be captured for debugging
+
+    Args:
+        config: Configuration dictionary
+
+    Returns:
+        True if WSL_TOAST_CAPTURE_PAYLOADS or hook_capture_payloads is set
+    """
+    env = os.environ.get("WSL_TOAST_CAPTURE_PAYLOADS")
+    if env is not None:
+        return env.strip().lower() in ("1", "true", "yes")
+    return config.get("hook_capture_payloads") is True
+
+
+def profile_enabled() -> bool:
+    """Check whether WSL_TOAST_PROFILE=1 asks for a per-stage breakdown"""
+    return os.environ.get("WSL_TOAST_PROFILE") == "1"
+
+
+def parse_profile_line(output: str) -> Optional[Dict[str, Any]]:
+    """
+    Extract the breakdown record notify.sh prints when profiling
+
+    notify.sh prints 'WSL_TOAST_PROFILE {...}' with its own stages and
+    wsl-toast.ps1's JSON result, whose Timing holds the PowerShell stages.
+
+    Args:
+        output: notify.sh stdout
+
+    Returns:
+        Dictionary with 'notify' and 'powershell' breakdowns, or None
+    """
+    for line in reversed(output.splitlines()):
+        if not line.startswith("WSL_TOAST_PROFILE "):
+            continue
+        try:
+            record = json.loads(line[len("WSL_TOAST_PROFILE "):])
+        except ValueError:
+            return None
+        result = record.get("powershell") or {}
+        timing = result.get("Timing") if isinstance(result, dict) else None
+        breakdown: Dict[str, Any] = {
+            "notify": {k: record.get(k) for k in ("spawn_ms", "stages_ms", "total_ms")},
+        }
+        if isinstance(timing, dict):
+            breakdown["powershell"] = {
+                "method": result.get("DisplayMethod"),
+                "stages_ms": timing.get("StagesMs"),
+                "total_ms": timing.get("TotalMs"),
+            }
+        return breakdown
+    return None
+
+
+def parse_payload(raw: str) -> Dict[str, Any]:
+    """
+    Parse a hook payload, tolerating empty or invalid input
+
+    Args:
+        raw: Raw JSON text from stdin
+
+    Returns:
+        Payload dictionary (empty if the payload is not a JSON object)
+    """
+    if not raw.strip():
+        return {}
+    try:
+        data = json.loads(raw)
+    except json.JSONDecodeError:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+class HookContext:
+    """Per-invocation state shared by every consumer in a hook"""
+
+    def __init__(
+        self,
+        event: str,
+        raw: str,
+        config_dir: Optional[str] = None,
+        templates_dir: Optional[Path] = None,
+        payload: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Build the context for one hook invocation
+
+        Args:
+            event: Hook event name
+            raw: Raw payload text read from stdin
+            config_dir: Configuration directory (default: ~/.wsl-toast)
+            templates_dir: Templates directory (default: find_templates_dir())
+            payload: Already-extracted payload (default: parse raw)
+        """
+        self.event = event
+        self.raw = raw
+        self.payload = parse_payload(raw) if payload is None else payload
+        self.config = load_config(config_dir)
+        self.language = os.environ.get("WSL_TOAST_LANGUAGE") or self.config.get(
+            "language", "en"
+        )
+        self.loader = TemplateLoader(templates_dir or find_templates_dir())
+        self.session_id = str(self.payload.get("session_id") or "")
+        # Correlation id passed to notify.sh and wsl-toast.ps1 (profiling only)
+        self.trace_id = (
+            os.environ.get("WSL_TOAST_TRACE_ID") or secrets.token_hex(8)
+        ) if profile_enabled() else None
+        state_dir = Path(config_dir) if config_dir else Path.home() / ".wsl-toast"
+        self.state_dir = state_dir
+        self.log_dir = state_dir / "logs"
+        self.cache_dir = state_dir / "cache"
+        self.logger = HookLog.from_config(self.log_dir, self.config)
+        self.events = EventRecorder(event, self.log_dir, self.config)
+        self.events.set(session=self.session_id or None, tool=self.payload.get("tool_name"))
+        self.tracer = hook_tracer(event, self.session_id, self.log_dir, self.config)
+        if self.trace_id:
+            # A profiled invocation always gets its breakdown record
+            self.events.keep = True
+            self.events.set(trace_id=self.trace_id)
+
+    def template(self, key: str, title: str, message: str) -> Tuple[str, str]:
+        """
+        Get a template title and message, falling back to the given defaults
+
+        Args:
+            key: Template key
+            title: Default title
+            message: Default message
+
+        Returns:
+            Tuple of (title, message)
+        """
+        with self.tracer.span("template.render", template=key, language=self.language):
+            try:
+                template = self.loader.get_template(key, self.language)
+            except (KeyError, ValueError, OSError, json.JSONDecodeError):
+                return title, message
+        return template["title"], template["message"]
+
+    def log(self, text: str, level: str = "info") -> None:
+        """Buffer text for ~/.wsl-toast/logs/hooks.log (written by run_hook)"""
+        self.logger.log(text, level)
+
+    def capture_payload(self) -> Optional[Path]:
+        """
+        Write the raw payload to its own file when capture is enabled
+
+        Each invocation gets a new file under logs/payloads/, created with
+        O_EXCL, so concurrent hooks never share or overwrite a capture.
+
+        Returns:
+            Path of the capture, or None if disabled or not written
+        """
+        if not capture_enabled(self.config):
+            return None
+        capture_dir = self.log_dir / "payloads"
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        path = capture_dir / f"{self.event}-{stamp}-{os.getpid()}-{secrets.token_hex(4)}.json"
+        try:
+            capture_dir.mkdir(parents=True, exist_ok=True)
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(self.raw)
+        except OSError:
+            return None
+        return path
+
+    def log_payload(self) -> None:
+        """Record the payload between '=== <Event> Hook <date> ===' markers"""
+        self.logger.log_payload(self.event, self.raw, self.payload)
+
+
+#############################################################################
+# Delivery
+#############################################################################
+
+
+def run_notify(args: List[str], profile: Optional[Dict[str, Any]] = None) -> int:
+    """
+    Run notify.sh with the given arguments
+
+    Args:
+        args: notify.sh command-line arguments
+        profile: When profiling, a dict holding 'trace_id'; notify.sh's
+            breakdown is added to it under 'notify' and 'powershell'
+
+    Returns:
+        notify.sh exit code (0 if notify.sh is missing)
+    """
+    notify_script = find_notify_script()
+    if notify_script is None:
+        return 0
+    command = [str(notify_script)] + args
+    if not os.access(notify_script, os.X_OK):
+        command.insert(0, "bash")
+    env = None
+    if profile is not None:
+        env = dict(
+            os.environ,
+            WSL_TOAST_PROFILE="1",
+            WSL_TOAST_TRACE_ID=profile["trace_id"],
+            WSL_TOAST_PROFILE_T0=str(time.time_ns() // 1000),
+        )
+    try:
+        completed = subprocess.run(
+            command,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE if profile is not None else subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            env=env,
+            check=False,
+        )
+    except OSError:
+        return 1
+    if profile is not None:
+        breakdown = parse_profile_line(completed.stdout.decode("utf-8", errors="replace"))
+        if breakdown:
+            profile.update(breakdown)
+    return completed.returncode
+
+
+def spawn_store_sync(state_dir: Path) -> bool:
+    """
+    Start python3 -m src.event_store detached, without waiting for it
+
+    The ingest, prune and WAL checkpoint (which fsyncs) then run after the
+    hook has exited, as notify.sh --background does for PowerShell.
+
+    Args:
+        state_dir: State directory (~/.wsl-toast)
+
+    Returns:
+        True if the process was started
+    """
+    try:
+        subprocess.Popen(
+            [sys.executable, "-m", "src.event_store", "--state-dir", str(state_dir)],
+            cwd=str(PACKAGE_ROOT),
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError:
+        return False
+    return True
+
+
+def notify_backend() -> str:
+    """
+    Name the delivery backend notify.sh will use, for the event log
+
+    Returns:
+        'none' (notify.sh not found), 'mock' (MOCK_MODE=true) or 'powershell'
+    """
+    if find_notify_script() is None:
+        return "none"
+    if os.environ.get("MOCK_MODE") == "true":
+        return "mock"
+    return "powershell"
+
+
+def deliver(ctx: HookContext, notification: Notification) -> int:
+    """
+    Send a handler's notification through notify.sh
+
+    Args:
+        ctx: Hook context
+        notification: Notification returned by the handler
+
+    Returns:
+        notify.sh exit code
+    """
+    args = [
+        "--title",
+        notification["title"],
+        "--message",
+        notification["message"],
+        "--type",
+        notification.get("type", "Information"),
+    ]
+    if ctx.session_id and notification.get("tag_session", True):
+        args += ["--session", ctx.session_id]
+    if notification.get("background"):
+        args.append("--background")
+    if ctx.trace_id is None:
+        return run_notify(args)
+    profile: Dict[str, Any] = {"trace_id": ctx.trace_id}
+    exit_code = run_notify(args, profile)
+    ctx.events.set(notify=profile.get("notify"), powershell=profile.get("powershell"))
+    display = profile.get("powershell")
+    if display and isinstance(display.get("total_ms"), (int, float)):
+        # wsl-toast.ps1 ran last inside notify.sh: place its span at the end
+        end_ns = time.time_ns()
+        ctx.tracer.record(
+            "windows.display", end_ns - int(display["total_ms"] * 1e6), end_ns,
+            method=display.get("method"),
+            **{f"stage.{k}_ms": v for k, v in (display.get("stages_ms") or {}).items()},
+        )
+    return exit_code
+
+
+#############################################################################
+# Handlers
+#############################################################################
+
+
+@register("Stop")
+def handle_stop(ctx: HookContext) -> Optional[Notification]:
+    """Claude finished responding: toast the last assistant message"""
+    ctx.log_payload()
+    # Clear the terminal spinner first so it stops even if the toast bails out
+    stop_spinner()
+
+    title, message = ctx.template(
+        "stop",
+        "Claude Code Ready",
+        "Claude has finished and is waiting for your next instruction",
+    )
+    # The sidecar index makes repeated Stops parse only newly appended bytes
+    last_message = get_last_assistant_message(
+        str(ctx.payload.get("transcript_path") or ""), ctx.cache_dir / "transcripts"
+    )
+    if last_message:
+        message = first_sentence(last_message, 150)
+
+    return {"title": title, "message": message, "type": "Success"}
+
+
+@register("Notification")
+def handle_notification(ctx: HookContext) -> Optional[Notification]:
+    """Claude Code notification (permission prompt, idle prompt, ...)"""
+    ctx.log_payload()
+    # Any Notification event means Claude is waiting on the user
+    stop_spinner()
+
+    # idle_prompt fires ~10s after Stop with the same meaning; Stop already toasted
+    if ctx.payload.get("notification_type") == "idle_prompt":
+        ctx.log("[suppressed idle_prompt duplicate]\n")
+        ctx.events.set(decision=SUPPRESSED, reason="idle_prompt")
+        return None
+
+    title, message = ctx.template(
+        "notification", "Claude Code Notification", "Claude Code sent a notification"
+    )
+    text = ctx.payload.get("message")
+    if isinstance(text, str) and text.strip():
+        message = first_sentence(text, 150)
+
+    return {"title": title, "message": message, "type": "Information"}
+
+
+def extract_text(value: Any) -> str:
+    """
+    Flatten a payload value into text, preferring human-readable keys
+
+    Args:
+        value: Any JSON value
+
+    Returns:
+        Extracted text (may be empty)
+    """
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, dict):
+        preferred_keys = (
+            "text",
+            "message",
+            "content",
+            "summary",
+            "body",
+            "detail",
+            "reason",
+            "prompt",
+            "description",
+            "command",
+        )
+        for key in preferred_keys:
+            if key in value:
+                text = extract_text(value.get(key))
+                if text:
+                    return text
+        for val in value.values():
+            text = extract_text(val)
+            if text:
+                return text
+        return ""
+    if isinstance(value, list):
+        parts = [extract_text(item) for item in value]
+        return " ".join([part for part in parts if part])
+    return str(value)
+
+
+@register("PermissionRequest")
+def handle_permission_request(ctx: HookContext) -> Optional[Notification]:
+    """Claude needs permission to use a tool"""
+    data = ctx.payload
+    title, message = ctx.template(
+        "permission_request",
+        "Permission Required",
+        "Claude needs your permission to continue",
+    )
+
+    tool_name = extract_text(data.get("tool_name") or data.get("tool") or data.get("name") or "")
+    detail = extract_text(
+        data.get("reason")
+        or data.get("message")
+        or data.get("description")
+        or data.get("prompt")
+        or data.get("tool_input")
+        or data.get("arguments")
+        or data.get("params")
+        or data.get("input")
+    )
+    if not detail:
+        detail = extract_text(data)
+    if not detail:
+        detail = ctx.raw.strip()
+    detail = first_sentence(detail, 200)
+
+    if detail:
+        message = detail
+    elif tool_name:
+        message = f"Claude needs your permission to use {tool_name}"
+
+    return {"title": title, "message": message, "type": "Warning"}
+
+
+@register("PostToolUse", fields=payload_fields)
+def handle_post_tool_use(ctx: HookContext) -> Optional[Notification]:
+    """A tool finished: toast success, failure or interruption"""
+    data = ctx.payload
+    tool_name = str(data.get("tool_name") or data.get("tool") or "Unknown") if data else "Tool"
+
+    # settings.json normally filters tools via the generated matcher; this
+    # covers installs still registered with a catch-all '.*'
+    if data and not matches_tool(get_tool_matcher(ctx.config), tool_name):
+        ctx.events.set(decision=FILTERED)
+        return None
+
+    outcome = classify(tool_name, data.get("tool_response"), get_rule_table(ctx.config))
+    ctx.events.set(outcome=outcome)
+    if outcome == FAILURE:
+        status, notification_type, key = "failed", "Error", "tool_failed"
+    elif outcome == INTERRUPTED:
+        status, notification_type, key = "interrupted", "Warning", "tool_failed"
+    else:
+        status, notification_type, key = "completed", "Success", "tool_completed"
+
+    title, message = ctx.template(key, f"Tool {status}", f"The {tool_name} has {status}")
+    return {
+        "title": title,
+        "message": message,
+        "type": notification_type,
+        "background": True,
+    }
+
+
+@register("SessionStart")
+def handle_session_start(ctx: HookContext) -> Optional[Notification]:
+    """A Claude Code session started"""
+    title, message = ctx.template(
+        "session_start",
+        "Session Started",
+        "Welcome back! Your Claude Code session has started",
+    )
+    return {"title": title, "message": message, "type": "Success", "background": True}
+
+
+@register("SessionEnd")
+def handle_session_end(ctx: HookContext) -> Optional[Notification]:
+    """A Claude Code session ended: clear its toasts, then say goodbye"""
+    if ctx.session_id:
+        run_notify(["--clear-session", "--session", ctx.session_id, "--background"])
+
+    title, message = ctx.template(
+        "session_end", "Session Ended", "Your Claude Code session has ended"
+    )
+    # Untagged so the clear above cannot race with this toast
+    return {
+        "title": title,
+        "message": message,
+        "type": "Information",
+        "background": True,
+        "tag_session": False,
+    }
+
+
+#############################################################################
+# Entry point
+#############################################################################
+
+
+def read_stdin(event: str, config: Dict[str, Any]) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """
+    Read the hook payload from stdin, at most max_bytes of it
+
+    Events with declared PAYLOAD_FIELDS are parsed while streaming and only
+    those fields (plus CONTEXT_FIELDS) are kept; other events (and every event while payload
+    capture is enabled) get the raw text. Whatever is left past the cap is
+    discarded unread.
+
+    Args:
+        event: Hook event name
+        config: Configuration (hook_payload_max_bytes, field functions)
+
+    Returns:
+        Tuple of (raw text, extracted payload or None to parse raw)
+    """
+    if sys.stdin is None or sys.stdin.isatty():
+        return "", None
+    try:
+        max_bytes = int(config.get("hook_payload_max_bytes", DEFAULT_MAX_BYTES))
+    except (TypeError, ValueError):
+        max_bytes = DEFAULT_MAX_BYTES
+    stream = sys.stdin.buffer
+    fields = PAYLOAD_FIELDS.get(event)
+    if callable(fields):
+        fields = fields(config)
+    if fields:
+        fields = CONTEXT_FIELDS + tuple(f for f in fields if f not in CONTEXT_FIELDS)
+    if fields and not capture_enabled(config):
+        raw, payload = "", read_fields(stream, fields, max_bytes)
+    else:
+        data = read_capped(stream, max_bytes)
+        raw = data.decode("utf-8", errors="replace")
+        payload = read_fields(io.BytesIO(data), fields, max_bytes) if fields else None
+    drain(stream)
+    return raw, payload
+
+
+def run_hook(
+    event: str,
+    raw: str,
+    config_dir: Optional[str] = None,
+    templates_dir: Optional[Path] = None,
+    payload: Optional[Dict[str, Any]] = None,
+    stages: Optional[Dict[str, float]] = None,
+) -> Optional[Notification]:
+    """
+    Run the handler for an event and deliver its notification
+
+    One record is written to the event log (events.jsonl) if sampled.
+
+    Args:
+        event: Hook event name
+        raw: Raw payload text
+        config_dir: Configuration directory (default: ~/.wsl-toast)
+        templates_dir: Templates directory (default: find_templates_dir())
+        payload: Already-extracted payload (default: parse raw)
+        stages: Seconds spent in stages before this call (e.g. 'read')
+
+    Returns:
+        The delivered notification, or None if nothing was sent
+
+    Raises:
+        KeyError: If no handler is registered for the event
+    """
+    handler = HANDLERS[event]
+    started = time.monotonic()
+    started_ns = time.time_ns()
+    ctx = HookContext(event, raw, config_dir, templates_dir, payload)
+    events = ctx.events
+    earlier = sum((stages or {}).values())
+    events.started = started - earlier
+    for name, seconds in (stages or {}).items():
+        events.add_stage(name, seconds)
+    events.add_stage("context", time.monotonic() - started)
+
+    tracer = ctx.tracer
+    root = tracer.start("hook", start_ns=started_ns - int(earlier * 1e9), tool=ctx.payload.get("tool_name"))
+    if root is not None and stages and "read" in stages:
+        tracer.record("payload.parse", root.start_ns, root.start_ns + int(stages["read"] * 1e9))
+    ctx.capture_payload()
+    try:
+        with events.stage("handler"):
+            notification = handler(ctx)
+        if notification is None:
+            events.set(decision=events.fields.get("decision") or SUPPRESSED)
+            return None
+        events.set(type=notification.get("type", "Information"))
+        if not is_enabled(ctx.config.get("enabled", True)):
+            events.set(decision=DISABLED)
+            return None
+        backend = notify_backend()
+        with events.stage("deliver"), tracer.span("transport", kind=SPAN_KIND_CLIENT, backend=backend) as span:
+            exit_code = deliver(ctx, notification)
+            if span is not None:
+                span.set(exit_code=exit_code)
+        events.set(decision=DELIVERED, backend=backend, exit=exit_code)
+        return notification
+    except Exception as e:
+        events.set(decision=ERROR, error=type(e).__name__)
+        if root is not None:
+            root.error = type(e).__name__
+        raise
+    finally:
+        # One append per invocation, after the toast is on its way
+        ctx.logger.flush()
+        events.finish()
+        if root is not None:
+            root.set(decision=events.fields.get("decision"))
+            tracer.stop(root)
+            tracer.flush()
+        if event == "SessionEnd" and ctx.config.get("event_store_enabled") is True:
+            # Once per session, after the last toast: batch this session's
+            # journal lines into the SQLite store and prune old rows, in a
+            # detached process so the hook never waits on the checkpoint
+            spawn_store_sync(ctx.state_dir)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command-line entry point: python3 -m src.hooks <EventName>
+
+    Args:
+        argv: Arguments (default: sys.argv[1:])
+
+    Returns:
+        Exit code (hooks always exit 0 once the event is known)
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 1 or argv[0] not in HANDLERS:
+        events = ", ".join(sorted(HANDLERS))
+        sys.stderr.write(f"Usage: python3 -m src.hooks <EventName>\nEvents: {events}\n")
+        return 2
+
+    started = time.monotonic()
+    raw, payload = read_stdin(argv[0], load_config())
+    read_seconds = time.monotonic() - started
+    try:
+        run_hook(argv[0], raw, payload=payload, stages={"read": read_seconds})
+    except Exception as e:  # A hook must never break the Claude Code session
+        sys.stderr.write(f"wsl-toast {argv[0]} hook failed: {e}\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
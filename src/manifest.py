@@ -0,0 +1,289 @@
+# manifest.py
+# Install manifest for ~/.claude/hooks/wsl-toast
+#
+# Usage: python3 -m src.manifest write <dir> [--meta key=value ...]
+#        python3 -m src.manifest check <dir> [--config config.json]
+#        python3 -m src.manifest remove <dir>
+#
+# setup.sh records a sha256 for every file it installs (including the
+# rendered hook scripts) so re-runs and uninstall.sh can tell which files
+# were edited after installation.
+#
+# Author: Claude Code TDD Implementation
+# Version: 1.0.0
+
+import hashlib
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+# Directory names never recorded in the manifest
+_SKIPPED_DIRS = {"__pycache__"}
+
+
+def file_sha256(path: Path) -> str:
+    """
+    Hash a file
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Hex sha256 digest
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _installed_files(target_dir: Path) -> List[Path]:
+    """List files under target_dir, relative to it, excluding the manifest"""
+    files = []
+    for root, dirs, names in os.walk(target_dir):
+        dirs[:] = sorted(d for d in dirs if d not in _SKIPPED_DIRS)
+        for name in sorted(names):
+            path = Path(root, name).relative_to(target_dir)
+            if path != Path(MANIFEST_NAME):
+                files.append(path)
+    return files
+
+
+def build_manifest(target_dir: Path, metadata: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """
+    Build a manifest for every file currently in target_dir
+
+    Args:
+        target_dir: Install directory
+        metadata: Install-time settings baked into the rendered hooks
+
+    Returns:
+        Manifest dictionary
+    """
+    target_dir = Path(target_dir)
+    return {
+        "version": MANIFEST_VERSION,
+        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "metadata": dict(metadata or {}),
+        "files": {
+            path.as_posix(): file_sha256(target_dir / path)
+            for path in _installed_files(target_dir)
+        },
+    }
+
+
+def write_manifest(target_dir: Path, metadata: Optional[Dict[str, str]] = None) -> Path:
+    """
+    Write manifest.json into target_dir
+
+    Args:
+        target_dir: Install directory
+        metadata: Install-time settings baked into the rendered hooks
+
+    Returns:
+        Path to the written manifest
+    """
+    target_dir = Path(target_dir)
+    manifest_path = target_dir / MANIFEST_NAME
+    manifest = build_manifest(target_dir, metadata)
+    tmp = manifest_path.with_name(f".{MANIFEST_NAME}.{os.getpid()}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+    os.replace(tmp, manifest_path)
+    return manifest_path
+
+
+def load_manifest(target_dir: Path) -> Optional[Dict[str, Any]]:
+    """
+    Load manifest.json from target_dir
+
+    Args:
+        target_dir: Install directory
+
+    Returns:
+        Manifest dictionary, or None if missing or unreadable
+    """
+    try:
+        with open(Path(target_dir) / MANIFEST_NAME, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    if not isinstance(manifest, dict) or not isinstance(manifest.get("files"), dict):
+        return None
+    return manifest
+
+
+def check_drift(target_dir: Path, manifest: Dict[str, Any]) -> Dict[str, List[str]]:
+    """
+    Compare installed files against a manifest
+
+    Args:
+        target_dir: Install directory
+        manifest: Manifest from load_manifest()
+
+    Returns:
+        Dictionary with 'modified' and 'missing' relative paths
+    """
+    target_dir = Path(target_dir)
+    drift: Dict[str, List[str]] = {"modified": [], "missing": []}
+    for name, expected in sorted(manifest["files"].items()):
+        path = target_dir / name
+        if not path.is_file():
+            drift["missing"].append(name)
+        elif file_sha256(path) != expected:
+            drift["modified"].append(name)
+    return drift
+
+
+def check_language_drift(manifest: Dict[str, Any], config_file: Path) -> Optional[str]:
+    """
+    Compare the language baked into the hooks with the configured language
+
+    Args:
+        manifest: Manifest from load_manifest()
+        config_file: Path to config.json
+
+    Returns:
+        Configured language if it differs from the baked one, otherwise None
+    """
+    baked = manifest.get("metadata", {}).get("language")
+    try:
+        with open(config_file, "r", encoding="utf-8") as f:
+            configured = json.load(f).get("language")
+    except (OSError, json.JSONDecodeError, AttributeError):
+        return None
+    if baked and isinstance(configured, str) and configured != baked:
+        return configured
+    return None
+
+
+def remove_installed(target_dir: Path, manifest: Dict[str, Any]) -> List[str]:
+    """
+    Remove unmodified installed files and the manifest
+
+    Files edited since installation are left in place. Directories left
+    empty afterwards are removed.
+
+    Args:
+        target_dir: Install directory
+        manifest: Manifest from load_manifest()
+
+    Returns:
+        Relative paths of modified files that were kept
+    """
+    target_dir = Path(target_dir)
+    kept = check_drift(target_dir, manifest)["modified"]
+    for name in manifest["files"]:
+        if name in kept:
+            continue
+        try:
+            (target_dir / name).unlink()
+        except OSError:
+            pass
+    try:
+        (target_dir / MANIFEST_NAME).unlink()
+    except OSError:
+        pass
+
+    for root, dirs, _ in os.walk(target_dir, topdown=False):
+        for name in dirs:
+            path = Path(root, name)
+            if name in _SKIPPED_DIRS:
+                for cached in path.iterdir():
+                    try:
+                        cached.unlink()
+                    except OSError:
+                        pass
+            try:
+                path.rmdir()
+            except OSError:
+                pass
+    try:
+        target_dir.rmdir()
+    except OSError:
+        pass
+    return kept
+
+
+def _parse_meta(pairs: List[str]) -> Dict[str, str]:
+    """Parse key=value pairs from --meta options"""
+    metadata = {}
+    for pair in pairs:
+        key, sep, value = pair.partition("=")
+        if not sep or not key:
+            raise ValueError(f"Invalid --meta value: {pair}")
+        metadata[key] = value
+    return metadata
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command-line entry point used by setup.sh and uninstall.sh
+
+    check exits 0 when the install matches the manifest, 1 on drift and 3
+    when there is no manifest. Drifted files are printed one per line as
+    'modified <path>' or 'missing <path>'.
+
+    Args:
+        argv: Arguments (default: sys.argv[1:])
+
+    Returns:
+        Exit code
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    usage = (
+        "Usage: python3 -m src.manifest write <dir> [--meta key=value ...]\n"
+        "       python3 -m src.manifest check <dir> [--config config.json]\n"
+        "       python3 -m src.manifest remove <dir>\n"
+    )
+    if len(argv) < 2 or argv[0] not in ("write", "check", "remove"):
+        sys.stderr.write(usage)
+        return 2
+
+    command, target_dir, options = argv[0], Path(argv[1]), argv[2:]
+
+    if command == "write":
+        if len(options) % 2 or any(opt != "--meta" for opt in options[::2]):
+            sys.stderr.write(usage)
+            return 2
+        try:
+            print(write_manifest(target_dir, _parse_meta(options[1::2])))
+        except (OSError, ValueError) as e:
+            sys.stderr.write(f"Error writing manifest: {e}\n")
+            return 1
+        return 0
+
+    manifest = load_manifest(target_dir)
+    if manifest is None:
+        return 3
+
+    if command == "remove":
+        for name in remove_installed(target_dir, manifest):
+            print(f"kept {name}")
+        return 0
+
+    if options and (len(options) != 2 or options[0] != "--config"):
+        sys.stderr.write(usage)
+        return 2
+    drift = check_drift(target_dir, manifest)
+    for kind in ("modified", "missing"):
+        for name in drift[kind]:
+            print(f"{kind} {name}")
+    if options:
+        language = check_language_drift(manifest, Path(options[1]))
+        if language:
+            print(f"language {language}")
+            return 1
+    return 1 if drift["modified"] or drift["missing"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
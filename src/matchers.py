@@ -0,0 +1,207 @@
+# matchers.py
+# Generate Claude Code hook matchers from the tool allow-list / deny-list
+#
+# Usage: python3 -m src.matchers [--config config.json] [--mix Tool=N,...]
+#
+# Claude Code only launches a PostToolUse hook when the tool name matches
+# the hook's "matcher" regex, so a narrow matcher skips the process launch
+# entirely for tools nobody wants toasts for (Read, Glob, Grep, ...).
+#
+# Author: Claude Code TDD Implementation
+# Version: 1.0.0
+
+import re
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from .config_loader import get_config_path, get_default_config, merge_config, read_config_file
+
+# Matcher that lets every tool through
+MATCH_ALL = ".*"
+
+# Tool names accepted in hook_tool_allowlist / hook_tool_denylist
+# (built-in tools and MCP tools such as mcp__github__create_issue)
+TOOL_NAME_PATTERN = re.compile(r"^[A-Za-z0-9_-]+$")
+
+# Typical tool calls per assistant turn, used to estimate hook savings.
+# Read-only tools dominate a coding turn; edits and shell commands are rarer.
+REFERENCE_TOOL_MIX: Dict[str, float] = {
+    "Read": 6.0,
+    "Grep": 3.0,
+    "Glob": 2.0,
+    "Bash": 3.0,
+    "Edit": 3.0,
+    "Write": 1.0,
+    "TodoWrite": 1.5,
+    "Task": 0.5,
+    "WebFetch": 0.5,
+    "WebSearch": 0.5,
+}
+
+
+def _tool_names(tools: Optional[Iterable[Any]]) -> List[str]:
+    """Return the valid, de-duplicated tool names in a config list"""
+    names = []
+    for tool in tools or []:
+        if isinstance(tool, str) and TOOL_NAME_PATTERN.match(tool) and tool not in names:
+            names.append(tool)
+    return names
+
+
+def build_tool_matcher(
+    allowlist: Optional[Iterable[Any]] = None,
+    denylist: Optional[Iterable[Any]] = None,
+) -> str:
+    """
+    Build an anchored matcher regex from an allow-list or deny-list
+
+    A non-empty allow-list wins over the deny-list. Names are anchored so
+    'Read' does not also match 'NotebookRead'.
+
+    Args:
+        allowlist: Tools that should fork the hook
+        denylist: Tools that should never fork the hook
+
+    Returns:
+        Matcher regex (MATCH_ALL when both lists are empty)
+    """
+    allowed = _tool_names(allowlist)
+    if allowed:
+        return "^(" + "|".join(allowed) + ")$"
+    denied = _tool_names(denylist)
+    if denied:
+        return "^(?!(" + "|".join(denied) + ")$).*"
+    return MATCH_ALL
+
+
+def get_tool_matcher(config: Dict[str, Any]) -> str:
+    """
+    Build the PostToolUse matcher for a configuration
+
+    Args:
+        config: Configuration dictionary
+
+    Returns:
+        Matcher regex
+    """
+    return build_tool_matcher(
+        config.get("hook_tool_allowlist"), config.get("hook_tool_denylist")
+    )
+
+
+def matches_tool(matcher: str, tool_name: str) -> bool:
+    """
+    Check whether Claude Code would run a hook with this matcher for a tool
+
+    Args:
+        matcher: Matcher regex ('' and '*' match everything, like Claude Code)
+        tool_name: Tool name
+
+    Returns:
+        True if the hook would be launched
+    """
+    if matcher in ("", "*"):
+        return True
+    try:
+        return re.search(matcher, tool_name) is not None
+    except re.error:
+        return True
+
+
+def estimate_invocations(matcher: str, mix: Optional[Dict[str, float]] = None) -> Dict[str, float]:
+    """
+    Estimate per-turn hook invocations for a matcher
+
+    Args:
+        matcher: Matcher regex
+        mix: Tool calls per turn (default: REFERENCE_TOOL_MIX)
+
+    Returns:
+        Dictionary with 'total', 'invoked', 'saved' and 'saved_percent'
+    """
+    mix = REFERENCE_TOOL_MIX if mix is None else mix
+    total = sum(mix.values())
+    invoked = sum(count for tool, count in mix.items() if matches_tool(matcher, tool))
+    saved = total - invoked
+    return {
+        "total": total,
+        "invoked": invoked,
+        "saved": saved,
+        "saved_percent": (saved / total * 100.0) if total else 0.0,
+    }
+
+
+def format_savings(matcher: str, mix: Optional[Dict[str, float]] = None) -> str:
+    """
+    Describe the expected savings of a matcher in one line
+
+    Args:
+        matcher: Matcher regex
+        mix: Tool calls per turn (default: REFERENCE_TOOL_MIX)
+
+    Returns:
+        Human-readable summary
+    """
+    estimate = estimate_invocations(matcher, mix)
+    return (
+        f"PostToolUse matcher {matcher!r}: {estimate['invoked']:g} of "
+        f"{estimate['total']:g} tool calls per turn launch the hook "
+        f"({estimate['saved']:g} saved, {estimate['saved_percent']:.0f}%)"
+    )
+
+
+def parse_mix(text: str) -> Dict[str, float]:
+    """
+    Parse a tool mix such as 'Read=6,Bash=3'
+
+    Args:
+        text: Comma-separated Tool=count pairs
+
+    Returns:
+        Tool name -> calls per turn
+
+    Raises:
+        ValueError: If a pair is malformed
+    """
+    mix = {}
+    for pair in text.split(","):
+        tool, sep, count = pair.strip().partition("=")
+        if not sep or not tool:
+            raise ValueError(f"Invalid tool mix entry: {pair!r}")
+        mix[tool] = float(count)
+    return mix
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command-line entry point: print the matcher and its expected savings
+
+    Args:
+        argv: Arguments (default: sys.argv[1:])
+
+    Returns:
+        Exit code
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    usage = "Usage: python3 -m src.matchers [--config config.json] [--mix Tool=N,...]\n"
+    if len(argv) % 2 or any(opt not in ("--config", "--mix") for opt in argv[::2]):
+        sys.stderr.write(usage)
+        return 2
+    options = dict(zip(argv[::2], argv[1::2]))
+
+    try:
+        mix = parse_mix(options["--mix"]) if "--mix" in options else None
+    except ValueError as e:
+        sys.stderr.write(f"{e}\n")
+        return 2
+
+    config_file = Path(options["--config"]) if "--config" in options else get_config_path()
+    config = merge_config(get_default_config(), read_config_file(config_file))
+
+    print(format_savings(get_tool_matcher(config), mix))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
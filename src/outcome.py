@@ -0,0 +1,268 @@
+# outcome.py
+# Classify PostToolUse results from structured tool_response fields
+#
+# Each tool gets a rule (merged over the '*' defaults) naming the
+# tool_response fields that signal failure: boolean error flags, error
+# messages, exit codes and interrupted flags, plus an optional regex for
+# error lines in stderr. Tool output such as stdout or file contents is
+# never inspected, so a file that merely contains the word "error" is not
+# a failure.
+#
+# Author: Claude Code TDD Implementation
+# Version: 1.0.0
+
+import fnmatch
+import json
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from .config_loader import register_validator
+
+# Outcomes returned by classify()
+SUCCESS = "success"
+FAILURE = "failure"
+INTERRUPTED = "interrupted"
+
+# Rule keys whose values are lists of tool_response field names
+RULE_FIELD_KEYS = ("error_flags", "error_fields", "exit_code_fields", "interrupted_flags")
+
+# Rule key for the stderr error-line regex (matched case-insensitively, per line)
+STDERR_PATTERN_KEY = "stderr_pattern"
+
+# Built-in rules. Keys are tool names or fnmatch patterns ('mcp__*');
+# '*' applies to every tool and is what specific rules are merged over.
+DEFAULT_OUTCOME_RULES: Dict[str, Dict[str, Any]] = {
+    "*": {
+        "error_flags": ["is_error", "isError"],
+        "error_fields": ["error"],
+    },
+    "Bash": {
+        "exit_code_fields": ["exit_code", "exitCode", "returncode"],
+        "interrupted_flags": ["interrupted"],
+        STDERR_PATTERN_KEY: r"^\s*(?:error|fatal|exception|traceback)\b",
+    },
+}
+
+
+class RuleTable:
+    """Compiled outcome rules with a per-tool lookup cache"""
+
+    def __init__(self, rules: Dict[str, Dict[str, Any]]):
+        """
+        Compile a rule table
+
+        Args:
+            rules: Tool name or pattern -> rule (see DEFAULT_OUTCOME_RULES)
+
+        Raises:
+            re.error: If a stderr_pattern does not compile
+        """
+        self.default = self._compile(rules.get("*", {}))
+        self.exact: Dict[str, Dict[str, Any]] = {}
+        self.patterns: List[Tuple[str, Dict[str, Any]]] = []
+        for name, rule in rules.items():
+            if name == "*":
+                continue
+            compiled = self._compile(rule, self.default)
+            if any(c in name for c in "*?["):
+                self.patterns.append((name, compiled))
+            else:
+                self.exact[name] = compiled
+        self._by_tool: Dict[str, Dict[str, Any]] = {}
+
+    @staticmethod
+    def _compile(rule: Dict[str, Any], base: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Merge a rule over base and compile its stderr pattern"""
+        compiled = dict(base or {key: () for key in RULE_FIELD_KEYS})
+        compiled.setdefault("stderr_re", None)
+        for key in RULE_FIELD_KEYS:
+            if key in rule:
+                compiled[key] = tuple(rule[key])
+        if STDERR_PATTERN_KEY in rule:
+            pattern = rule[STDERR_PATTERN_KEY]
+            compiled["stderr_re"] = (
+                re.compile(pattern, re.IGNORECASE | re.MULTILINE) if pattern else None
+            )
+        return compiled
+
+    def rule_for(self, tool_name: str) -> Dict[str, Any]:
+        """
+        Get the compiled rule for a tool
+
+        Args:
+            tool_name: Tool name
+
+        Returns:
+            Exact rule, else the first matching pattern rule, else '*'
+        """
+        rule = self._by_tool.get(tool_name)
+        if rule is None:
+            rule = self.exact.get(tool_name)
+            if rule is None:
+                rule = next(
+                    (r for name, r in self.patterns if fnmatch.fnmatchcase(tool_name, name)),
+                    self.default,
+                )
+            self._by_tool[tool_name] = rule
+        return rule
+
+    def fields(self) -> Tuple[str, ...]:
+        """
+        List every tool_response field any rule reads
+
+        Returns:
+            Sorted field names (used to declare the streamed payload fields)
+        """
+        names = set()
+        for rule in [self.default, *self.exact.values(), *(r for _, r in self.patterns)]:
+            for key in RULE_FIELD_KEYS:
+                names.update(rule[key])
+            if rule["stderr_re"] is not None:
+                names.add("stderr")
+        return tuple(sorted(names))
+
+
+def merge_rules(overrides: Optional[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Merge hook_outcome_rules from config over DEFAULT_OUTCOME_RULES
+
+    Args:
+        overrides: Tool name or pattern -> rule keys to replace
+
+    Returns:
+        Merged rules
+    """
+    rules = {name: dict(rule) for name, rule in DEFAULT_OUTCOME_RULES.items()}
+    for name, rule in (overrides or {}).items():
+        if isinstance(rule, Mapping):
+            rules.setdefault(name, {}).update(rule)
+    return rules
+
+
+@lru_cache(maxsize=8)
+def _compile_rules(canonical: str) -> RuleTable:
+    """Compile rules given as canonical JSON (cached per distinct table)"""
+    return RuleTable(merge_rules(json.loads(canonical)))
+
+
+def get_rule_table(config: Dict[str, Any]) -> RuleTable:
+    """
+    Get the compiled rule table for a configuration
+
+    Invalid overrides are ignored in favour of the built-in rules, so a bad
+    config never breaks the hook.
+
+    Args:
+        config: Configuration dictionary
+
+    Returns:
+        Compiled (and cached) rule table
+    """
+    overrides = config.get("hook_outcome_rules") or {}
+    try:
+        # default=dict serializes the read-only views load_config() returns
+        return _compile_rules(json.dumps(overrides, sort_keys=True, default=dict))
+    except (TypeError, ValueError, re.error):
+        return _compile_rules("{}")
+
+
+def payload_fields(config: Dict[str, Any]) -> Tuple[str, ...]:
+    """
+    List the PostToolUse payload fields classification needs
+
+    Args:
+        config: Configuration dictionary
+
+    Returns:
+        Dotted payload field paths
+    """
+    return ("tool_name", "tool") + tuple(
+        f"tool_response.{name}" for name in get_rule_table(config).fields()
+    )
+
+
+def _is_set(value: Any) -> bool:
+    """Truthy error value: a non-blank string, or any other truthy non-bool"""
+    if isinstance(value, str):
+        return bool(value.strip())
+    return value is not None and value is not False and value != 0 and value != {} and value != []
+
+
+def classify(tool_name: str, response: Any, table: RuleTable) -> str:
+    """
+    Classify a tool call from its tool_response
+
+    Args:
+        tool_name: Tool name
+        response: tool_response value from the payload
+        table: Compiled rule table
+
+    Returns:
+        SUCCESS, FAILURE or INTERRUPTED
+    """
+    if not isinstance(response, dict):
+        return SUCCESS
+    rule = table.rule_for(tool_name)
+    if any(response.get(field) is True for field in rule["interrupted_flags"]):
+        return INTERRUPTED
+    if any(response.get(field) is True for field in rule["error_flags"]):
+        return FAILURE
+    if any(_is_set(response.get(field)) for field in rule["error_fields"]):
+        return FAILURE
+    for field in rule["exit_code_fields"]:
+        code = response.get(field)
+        if isinstance(code, int) and not isinstance(code, bool) and code != 0:
+            return FAILURE
+    stderr = response.get("stderr")
+    if rule["stderr_re"] is not None and isinstance(stderr, str) and rule["stderr_re"].search(stderr):
+        return FAILURE
+    return SUCCESS
+
+
+def validate_rules(rules: Any) -> List[str]:
+    """
+    Validate a hook_outcome_rules value
+
+    Args:
+        rules: Value from config
+
+    Returns:
+        List of error messages (empty if valid)
+    """
+    if not isinstance(rules, Mapping):
+        return ["hook_outcome_rules must be an object of tool name -> rule"]
+    errors = []
+    for name, rule in rules.items():
+        if not isinstance(rule, Mapping):
+            errors.append(f"hook_outcome_rules.{name} must be an object")
+            continue
+        for key, value in rule.items():
+            if key in RULE_FIELD_KEYS:
+                if not isinstance(value, (list, tuple)) or not all(isinstance(v, str) and v for v in value):
+                    errors.append(f"hook_outcome_rules.{name}.{key} must be a list of field names")
+            elif key == STDERR_PATTERN_KEY:
+                try:
+                    if value is not None:
+                        re.compile(value)
+                except (TypeError, re.error):
+                    errors.append(f"hook_outcome_rules.{name}.{key} must be a valid regex")
+            else:
+                errors.append(f"hook_outcome_rules.{name}: unknown key '{key}'")
+    return errors
+
+
+@register_validator
+def validate_outcome_config(config: Mapping[str, Any]) -> List[str]:
+    """
+    Validate the hook_outcome_rules configuration key
+
+    Args:
+        config: Configuration dictionary
+
+    Returns:
+        List of error messages (empty if valid)
+    """
+    if "hook_outcome_rules" not in config:
+        return []
+    return validate_rules(config["hook_outcome_rules"])
@@ -0,0 +1,368 @@
+# payload.py
+# Bounded streaming reader for hook stdin payloads
+#
+# Claude Code sends PostToolUse the complete tool input and output on
+# stdin, which can be many MB for Read or Bash. read_fields() walks the
+# JSON stream and keeps only the fields a handler declared (for example
+# 'tool_name' or 'tool_response.is_error'); every other value is skipped
+# with C-speed regex scans, never decoded or held in memory as a whole.
+#
+# Author: Claude Code TDD Implementation
+# Version: 1.0.0
+
+import json
+import re
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional
+
+# Bytes read from the stream per step
+CHUNK_SIZE = 64 * 1024
+
+# Default cap on payload bytes read (hook_payload_max_bytes)
+DEFAULT_MAX_BYTES = 8 * 1024 * 1024
+
+# Longest string or container value kept for a declared field
+DEFAULT_MAX_VALUE_BYTES = 4096
+
+# Longest run of string content (plain bytes and whole escapes), matched in C
+_STRING_BODY = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*', re.DOTALL)
+
+_QUOTE = ord('"')
+
+# Next byte that matters while skipping a nested value
+_STRUCTURE = re.compile(rb'["\[\]{}]')
+
+# End of a number or true/false/null literal
+_SCALAR_END = re.compile(rb"[\s,}\]]")
+
+_WHITESPACE = b" \t\r\n"
+
+
+class _Truncated(Exception):
+    """The stream ended (or hit the byte cap) in the middle of the payload"""
+
+
+def _field_tree(fields: Iterable[str]) -> Dict[str, Any]:
+    """Turn dotted field paths into a nested dict (leaves are None)"""
+    tree: Dict[str, Any] = {}
+    for field in fields:
+        node = tree
+        parts = field.split(".")
+        for part in parts[:-1]:
+            child = node.get(part)
+            if not isinstance(child, dict):
+                child = node[part] = {}
+            node = child
+        node.setdefault(parts[-1], None)
+    return tree
+
+
+def _count_leaves(tree: Dict[str, Any]) -> int:
+    """Count the field paths in a tree"""
+    return sum(_count_leaves(v) if isinstance(v, dict) else 1 for v in tree.values())
+
+
+def _decode_string(raw: bytes) -> str:
+    """Decode the bytes between a string's quotes, tolerating a cut-off tail"""
+    try:
+        return json.loads(b'"' + raw + b'"')
+    except ValueError:
+        pass
+    # Cut inside an escape or multi-byte character: drop the partial tail
+    backslash = raw.rfind(b"\\", max(0, len(raw) - 6))
+    if backslash != -1:
+        raw = raw[:backslash]
+    try:
+        return json.loads(b'"' + raw.decode("utf-8", errors="ignore").encode("utf-8") + b'"')
+    except ValueError:
+        return raw.decode("utf-8", errors="replace")
+
+
+class _Scanner:
+    """Incremental JSON scanner over a byte stream with a total byte cap"""
+
+    def __init__(self, stream: BinaryIO, max_bytes: int, max_value_bytes: int, chunk_size: int):
+        self.stream = stream
+        self.budget = max_bytes
+        self.max_value_bytes = max_value_bytes
+        self.chunk_size = chunk_size
+        self.buf = b""
+        self.pos = 0
+
+    def fill(self) -> None:
+        """Append the next chunk to the unread part of the buffer"""
+        if self.budget <= 0:
+            raise _Truncated()
+        chunk = self.stream.read(min(self.chunk_size, self.budget))
+        if not chunk:
+            raise _Truncated()
+        self.budget -= len(chunk)
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+
+    def peek(self) -> int:
+        """Skip whitespace and return the next byte without consuming it"""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            self.fill()
+
+    def expect(self, byte: bytes) -> None:
+        """Consume one structural byte"""
+        if self.peek() != byte[0]:
+            raise ValueError(f"expected {byte!r}")
+        self.pos += 1
+
+    def string(self, keep: Optional[int]) -> bytes:
+        """
+        Consume a string (opening quote already consumed)
+
+        Args:
+            keep: Bytes of content to keep (None keeps everything)
+
+        Returns:
+            Raw content between the quotes, up to keep bytes
+        """
+        pieces: List[bytes] = []
+        kept = 0
+
+        def take(end: int) -> None:
+            nonlocal kept
+            if keep is None or kept < keep:
+                piece = self.buf[self.pos:end]
+                if keep is not None:
+                    piece = piece[: keep - kept]
+                pieces.append(piece)
+                kept += len(piece)
+            self.pos = end
+
+        while True:
+            take(_STRING_BODY.match(self.buf, self.pos).end())
+            if self.pos < len(self.buf) and self.buf[self.pos] == _QUOTE:
+                self.pos += 1
+                return b"".join(pieces)
+            # End of buffer, possibly with a backslash whose escaped byte is
+            # in the next chunk: read on with the backslash kept
+            self.fill()
+
+    def skip_container(self, depth: int = 1) -> None:
+        """Consume the rest of an object or array nested depth levels deep"""
+        while depth:
+            match = _STRUCTURE.search(self.buf, self.pos)
+            if match is None:
+                self.pos = len(self.buf)
+                self.fill()
+                continue
+            self.pos = match.end()
+            byte = match.group()
+            if byte == b'"':
+                self.string(keep=0)
+            elif byte in b"[{":
+                depth += 1
+            else:
+                depth -= 1
+
+    def capture_container(self) -> Optional[bytes]:
+        """Consume an object or array, returning its bytes if small enough"""
+        start_budget = self.budget + len(self.buf) - self.pos
+        pieces = [self.buf[self.pos:self.pos + 1]]
+        self.pos += 1
+        depth = 1
+        while depth:
+            match = _STRUCTURE.search(self.buf, self.pos)
+            if match is None:
+                pieces.append(self.buf[self.pos:])
+                self.pos = len(self.buf)
+            else:
+                pieces.append(self.buf[self.pos:match.end()])
+                self.pos = match.end()
+                byte = match.group()
+                if byte == b'"':
+                    pieces.append(self.string(keep=self.max_value_bytes) + b'"')
+                elif byte in b"[{":
+                    depth += 1
+                else:
+                    depth -= 1
+            consumed = start_budget - (self.budget + len(self.buf) - self.pos)
+            if consumed > self.max_value_bytes:
+                if depth:
+                    self.skip_container(depth)
+                return None
+            if match is None:
+                self.fill()
+        return b"".join(pieces)
+
+    def scalar(self) -> bytes:
+        """Consume a number or true/false/null literal"""
+        pieces = []
+        while True:
+            match = _SCALAR_END.search(self.buf, self.pos)
+            if match is not None:
+                pieces.append(self.buf[self.pos:match.start()])
+                self.pos = match.start()
+                return b"".join(pieces)
+            pieces.append(self.buf[self.pos:])
+            self.pos = len(self.buf)
+            try:
+                self.fill()
+            except _Truncated:
+                # A bare scalar may end the stream
+                return b"".join(pieces)
+
+    def value(self, keep: bool) -> Any:
+        """
+        Consume any value
+
+        Args:
+            keep: Decode and return the value (bounded by max_value_bytes)
+
+        Returns:
+            Decoded value, or None when skipped or too large
+        """
+        byte = self.peek()
+        if byte == _QUOTE:
+            self.pos += 1
+            raw = self.string(self.max_value_bytes if keep else 0)
+            return _decode_string(raw) if keep else None
+        if byte in b"[{":
+            if not keep:
+                self.pos += 1
+                self.skip_container()
+                return None
+            raw = self.capture_container()
+            return json.loads(raw) if raw is not None else None
+        token = self.scalar()
+        return json.loads(token) if keep else None
+
+    def fields(self, tree: Dict[str, Any], found: Dict[str, Any], remaining: List[int]) -> None:
+        """
+        Walk an object (opening brace already consumed), keeping fields in tree
+
+        Args:
+            tree: Field tree for this object
+            found: Output dictionary for this object
+            remaining: One-element list with the number of leaves still wanted
+        """
+        if self.peek() == ord("}"):
+            self.pos += 1
+            return
+        while True:
+            self.expect(b'"')
+            key = _decode_string(self.string(keep=self.max_value_bytes))
+            self.expect(b":")
+            if key in tree and remaining[0]:
+                wanted = tree[key]
+                if isinstance(wanted, dict):
+                    if self.peek() == ord("{"):
+                        self.pos += 1
+                        child = found.setdefault(key, {})
+                        if isinstance(child, dict):
+                            self.fields(wanted, child, remaining)
+                    else:
+                        self.value(keep=False)
+                else:
+                    if key not in found:
+                        remaining[0] -= 1
+                    found[key] = self.value(keep=True)
+            else:
+                self.value(keep=False)
+
+            byte = self.peek()
+            self.pos += 1
+            if byte == ord("}"):
+                return
+            if byte != ord(","):
+                raise ValueError("expected ',' or '}'")
+            if not remaining[0]:
+                # Everything declared was found: stop reading
+                return
+
+
+def read_fields(
+    stream: BinaryIO,
+    fields: Iterable[str],
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    max_value_bytes: int = DEFAULT_MAX_VALUE_BYTES,
+    chunk_size: int = CHUNK_SIZE,
+) -> Dict[str, Any]:
+    """
+    Extract declared fields from a JSON object on a byte stream
+
+    Fields are dotted paths into nested objects ('tool_response.is_error').
+    Memory use is bounded by chunk_size plus max_value_bytes per field,
+    whatever the size of the values that are skipped. Reading stops once
+    every field was seen, at max_bytes, or at the first malformed byte;
+    whatever was found by then is returned.
+
+    Args:
+        stream: Binary stream positioned at the payload
+        fields: Field paths to keep
+        max_bytes: Maximum payload bytes to read
+        max_value_bytes: Longest string or container kept per field
+            (longer strings are cut, longer containers are dropped)
+        chunk_size: Bytes read per step
+
+    Returns:
+        Nested dictionary holding only the fields that were found
+    """
+    tree = _field_tree(fields)
+    found: Dict[str, Any] = {}
+    scanner = _Scanner(stream, max_bytes, max_value_bytes, chunk_size)
+    try:
+        if scanner.peek() == ord("{"):
+            scanner.pos += 1
+            scanner.fields(tree, found, [_count_leaves(tree)])
+    except (_Truncated, ValueError):
+        pass
+    return found
+
+
+def read_capped(stream: BinaryIO, max_bytes: int = DEFAULT_MAX_BYTES) -> bytes:
+    """
+    Read a whole payload, up to max_bytes
+
+    Args:
+        stream: Binary stream
+        max_bytes: Maximum bytes to read
+
+    Returns:
+        Payload bytes (cut at max_bytes)
+    """
+    pieces = []
+    while max_bytes > 0:
+        chunk = stream.read(min(CHUNK_SIZE, max_bytes))
+        if not chunk:
+            break
+        pieces.append(chunk)
+        max_bytes -= len(chunk)
+    return b"".join(pieces)
+
+
+def drain(stream: BinaryIO, chunk_size: int = CHUNK_SIZE) -> int:
+    """
+    Discard the rest of a stream in constant memory
+
+    Claude Code writes the payload before it waits for the hook, so the
+    rest is consumed rather than left for the writer to hit a closed pipe.
+
+    Args:
+        stream: Binary stream
+        chunk_size: Buffer size
+
+    Returns:
+        Number of bytes discarded
+    """
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    total = 0
+    readinto = getattr(stream, "readinto", None)
+    while True:
+        if readinto is not None:
+            count = readinto(view)
+        else:
+            chunk = stream.read(chunk_size)
+            count = len(chunk)
+        if not count:
+            return total
+        total += count
@@ -0,0 +1,96 @@
+# spinner.py
+# Python port of spinner_stop from hooks/_spinner.sh
+#
+# Author: Claude Code TDD Implementation
+# Version: 1.0.0
+
+import os
+from pathlib import Path
+from typing import Optional
+
+# Clears the Windows Terminal taskbar pulse (OSC 9;4;0)
+SPINNER_CLEAR_SEQUENCE = "\033]9;4;0;0\033\\"
+
+# Maximum number of parent processes inspected while looking for a tty
+MAX_HOPS = 20
+
+
+def _parent_pid(pid: int) -> int:
+    """Return the parent pid of a process from /proc, or 0 if unknown"""
+    try:
+        with open(f"/proc/{pid}/status", "r", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("PPid:"):
+                    return int(line.split()[1])
+    except (OSError, ValueError, IndexError):
+        pass
+    return 0
+
+
+def find_user_tty(start_pid: Optional[int] = None) -> Optional[str]:
+    """
+    Walk up the parent-process chain to find the user's terminal device
+
+    Args:
+        start_pid: Process to start from (default: our parent)
+
+    Returns:
+        Terminal device path (e.g. /dev/pts/3) or None
+    """
+    pid = os.getppid() if start_pid is None else start_pid
+    hops = 0
+    while pid > 1 and hops < MAX_HOPS:
+        for fd in (0, 1):
+            try:
+                target = os.readlink(f"/proc/{pid}/fd/{fd}")
+            except OSError:
+                continue
+            if target.startswith("/dev/pts/") or target.startswith("/dev/tty"):
+                return target
+        pid = _parent_pid(pid)
+        hops += 1
+    return None
+
+
+def spinner_file_prefix(tty: str, spinner_dir: Path) -> Path:
+    """Convert /dev/pts/3 into <spinner_dir>/spinner-dev_pts_3"""
+    key = tty.lstrip("/").replace("/", "_")
+    return spinner_dir / f"spinner-{key}"
+
+
+def stop_spinner(spinner_dir: Optional[Path] = None) -> None:
+    """
+    Clear the taskbar pulse started by UserPromptSubmit.sh
+
+    Mirrors spinner_stop in hooks/_spinner.sh without forking readlink/awk.
+
+    Args:
+        spinner_dir: State directory (default: ~/.wsl-toast)
+    """
+    if spinner_dir is None:
+        spinner_dir = Path.home() / ".wsl-toast"
+
+    # One-time cleanup of pre-v1.3.1 single-instance state files
+    for name in ("spinner.pid", "spinner.tty", "spinner.title"):
+        try:
+            (spinner_dir / name).unlink()
+        except OSError:
+            pass
+
+    tty = find_user_tty()
+    if not tty:
+        return
+
+    if os.access(tty, os.W_OK):
+        try:
+            with open(tty, "w", encoding="utf-8") as f:
+                f.write(SPINNER_CLEAR_SEQUENCE)
+        except OSError:
+            pass
+
+    prefix = spinner_file_prefix(tty, spinner_dir)
+    for suffix in (".tty", ".title", ".pid"):
+        try:
+            Path(f"{prefix}{suffix}").unlink()
+        except OSError:
+            pass
@@ -0,0 +1,271 @@
+# stats.py
+# wsl-toast stats: counts and latency percentiles from the event log
+#
+# Usage: wsl-toast stats [--since 24h] [--session ID] [--json]
+#
+# Streams ~/.wsl-toast/logs/events.jsonl and its rotated (gzipped) files
+# line by line. Latencies go into a fixed log-scale histogram, so memory
+# stays constant however large the logs are. Every record counts as
+# 1 / sample_rate invocations, undoing the event log's sampling.
+#
+# Author: Claude Code TDD Implementation
+# Version: 1.0.0
+
+import argparse
+import gzip
+import json
+import math
+import re
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from .events import DELIVERED, ERROR, SUPPRESSED, event_log_files
+
+# Percentiles reported for hook latency
+PERCENTILES = (50, 95, 99)
+
+# Histogram resolution: bucket bounds grow by 5%, starting at 10 µs
+_BUCKET_GROWTH = 1.05
+_BUCKET_BASE_MS = 0.01
+
+_DURATION = re.compile(r"^(\d+(?:\.\d+)?)([smhdw])$")
+_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+
+class LatencyHistogram:
+    """Weighted log-scale histogram with about 5% percentile error"""
+
+    def __init__(self):
+        self.buckets: Dict[int, float] = defaultdict(float)
+        self.total = 0.0
+
+    def add(self, ms: float, weight: float = 1.0) -> None:
+        """Record one latency"""
+        if ms <= _BUCKET_BASE_MS:
+            index = 0
+        else:
+            index = math.ceil(math.log(ms / _BUCKET_BASE_MS, _BUCKET_GROWTH))
+        self.buckets[index] += weight
+        self.total += weight
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """
+        Get a latency percentile
+
+        Args:
+            pct: Percentile between 0 and 100
+
+        Returns:
+            Upper bound of the bucket holding the percentile, in ms (None if empty)
+        """
+        if not self.total:
+            return None
+        target = self.total * pct / 100
+        seen = 0.0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= target:
+                return round(_BUCKET_BASE_MS * _BUCKET_GROWTH ** index, 2)
+        return None
+
+
+def parse_since(text: str, now: Optional[float] = None) -> float:
+    """
+    Parse a --since value
+
+    Args:
+        text: Duration before now ('30m', '24h', '7d'), ISO date/time or Unix time
+        now: Current time (default: time.time())
+
+    Returns:
+        Unix time
+
+    Raises:
+        ValueError: If text is not understood
+    """
+    now = time.time() if now is None else now
+    match = _DURATION.match(text.strip())
+    if match:
+        return now - float(match.group(1)) * _UNITS[match.group(2)]
+    try:
+        return float(text)
+    except ValueError:
+        return datetime.fromisoformat(text).timestamp()
+
+
+def iter_records(paths: Iterable[Path]) -> Iterator[Dict[str, Any]]:
+    """
+    Stream records from event log files, skipping damaged lines
+
+    Args:
+        paths: Log files (.gz files are decompressed on the fly)
+
+    Yields:
+        Record dictionaries
+    """
+    for path in paths:
+        opener = gzip.open if path.suffix == ".gz" else open
+        try:
+            with opener(path, "rb") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    if isinstance(record, dict):
+                        yield record
+        except (OSError, EOFError):
+            continue
+
+
+class Stats:
+    """Aggregates event records into counts and latency histograms"""
+
+    def __init__(self, since: Optional[float] = None, session: Optional[str] = None):
+        """
+        Create an empty aggregate
+
+        Args:
+            since: Ignore records before this Unix time
+            session: Only count records of this session
+        """
+        self.since = since
+        self.session = session
+        self.records = 0
+        self.first_ts: Optional[float] = None
+        self.last_ts: Optional[float] = None
+        self.events: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        self.backends: Dict[str, float] = defaultdict(float)
+        self.suppressed: Dict[str, float] = defaultdict(float)
+        self.failures: Dict[str, float] = defaultdict(float)
+        self.powershell_spawns = 0.0
+        self.latency: Dict[str, LatencyHistogram] = defaultdict(LatencyHistogram)
+
+    def add(self, record: Dict[str, Any]) -> None:
+        """Count one record, if it passes the filters"""
+        ts = record.get("ts")
+        if not isinstance(ts, (int, float)):
+            return
+        if self.since is not None and ts < self.since:
+            return
+        if self.session is not None and record.get("session") != self.session:
+            return
+        rate = record.get("sample_rate", 1.0)
+        weight = 1.0 / rate if isinstance(rate, (int, float)) and rate > 0 else 1.0
+        event = str(record.get("event", "?"))
+        decision = str(record.get("decision", "?"))
+
+        self.records += 1
+        self.first_ts = ts if self.first_ts is None else min(self.first_ts, ts)
+        self.last_ts = ts if self.last_ts is None else max(self.last_ts, ts)
+        self.events[event]["invocations"] += weight
+        self.events[event][decision] += weight
+        if decision == DELIVERED:
+            backend = str(record.get("backend", "?"))
+            self.backends[backend] += weight
+            if backend == "powershell":
+                self.powershell_spawns += weight
+            if record.get("exit") not in (None, 0):
+                self.failures[f"exit {record['exit']}"] += weight
+        elif decision == SUPPRESSED:
+            self.suppressed[str(record.get("reason", "handler"))] += weight
+        elif decision == ERROR:
+            self.failures[str(record.get("error", "error"))] += weight
+        total_ms = record.get("total_ms")
+        if isinstance(total_ms, (int, float)):
+            self.latency[event].add(total_ms, weight)
+            self.latency["*"].add(total_ms, weight)
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Build the report
+
+        Returns:
+            JSON-serialisable dictionary (counts rounded to whole invocations)
+        """
+        def counts(values: Dict[str, float]) -> Dict[str, int]:
+            return {k: round(v) for k, v in sorted(values.items(), key=lambda kv: -kv[1])}
+
+        return {
+            "records": self.records,
+            "since": self.since,
+            "session": self.session,
+            "first_ts": self.first_ts,
+            "last_ts": self.last_ts,
+            "events": {event: counts(values) for event, values in sorted(self.events.items())},
+            "backends": counts(self.backends),
+            "powershell_spawns": round(self.powershell_spawns),
+            "suppressed": counts(self.suppressed),
+            "failures": counts(self.failures),
+            "latency_ms": {
+                event: {f"p{p}": hist.percentile(p) for p in PERCENTILES}
+                for event, hist in sorted(self.latency.items())
+            },
+        }
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """
+    Format a report as plain text tables
+
+    Args:
+        report: Report from Stats.report()
+
+    Returns:
+        Multi-line text
+    """
+    def stamp(ts: Optional[float]) -> str:
+        return datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M:%S") if ts else "-"
+
+    lines = [f"{report['records']} records, {stamp(report['first_ts'])} .. {stamp(report['last_ts'])}"]
+    if not report["records"]:
+        return lines[0]
+
+    lines += ["", f"{'event':<18}{'invocations':>12}{'delivered':>11}{'suppressed':>11}"
+              f"{'filtered':>10}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"]
+    for event, values in report["events"].items():
+        latency = report["latency_ms"].get(event, {})
+        lines.append(
+            f"{event:<18}{values.get('invocations', 0):>12}{values.get('delivered', 0):>11}"
+            f"{values.get('suppressed', 0):>11}{values.get('filtered', 0):>10}{values.get('error', 0):>8}"
+            + "".join(f"{latency.get(f'p{p}') or '-':>10}" for p in PERCENTILES)
+        )
+    overall = report["latency_ms"].get("*", {})
+    lines.append(f"{'all':<70}" + "".join(f"{overall.get(f'p{p}') or '-':>10}" for p in PERCENTILES))
+
+    lines += ["", f"PowerShell spawns: {report['powershell_spawns']}"]
+    for title, key in (("Backends", "backends"), ("Suppressed", "suppressed"), ("Failures", "failures")):
+        values = report[key]
+        lines.append(f"{title}: " + (", ".join(f"{k} {v}" for k, v in values.items()) or "none"))
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point: wsl-toast stats (python3 -m src.stats)"""
+    parser = argparse.ArgumentParser(prog="wsl-toast stats", description="Summarise the hook event log")
+    parser.add_argument("--since", help="only count events after this: 30m, 24h, 7d, ISO date or Unix time")
+    parser.add_argument("--session", help="only count events of this Claude Code session")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    parser.add_argument("--log-dir", default=str(Path.home() / ".wsl-toast" / "logs"),
+                        help="directory holding events.jsonl (default: ~/.wsl-toast/logs)")
+    args = parser.parse_args(argv)
+
+    try:
+        since = parse_since(args.since) if args.since else None
+    except ValueError:
+        parser.error(f"invalid --since value: {args.since}")
+
+    stats = Stats(since=since, session=args.session)
+    for record in iter_records(event_log_files(Path(args.log_dir))):
+        stats.add(record)
+    report = stats.report()
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
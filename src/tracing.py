@@ -0,0 +1,402 @@
+# tracing.py
+# OpenTelemetry-compatible trace spans written to a local file
+#
+# Spans use the OTLP/JSON encoding (resourceSpans -> scopeSpans -> spans),
+# one export request per line in ~/.wsl-toast/logs/traces.jsonl, the
+# format of the OpenTelemetry Collector file exporter. No collector or
+# network is needed. Every hook of a session shares one trace id, derived
+# from the session id, so a session's hooks line up in one trace view:
+#
+#   python3 -m src.tracing --session <id> > trace.json
+#
+# Tracer is usable from any module in src/; with no exporter it is a
+# no-op, and InMemoryExporter keeps spans in process.
+#
+# Author: Claude Code TDD Implementation
+# Version: 1.0.0
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import secrets
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from .config_loader import register_validator
+from .hooklog import HookLog
+
+TRACE_LOG_NAME = "traces.jsonl"
+
+# Instrumentation scope and service name reported with every span
+SCOPE_NAME = "wsl-toast"
+SCOPE_VERSION = "1.0.0"
+
+# OTLP span kind and status codes
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_CLIENT = 3
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+
+def tracing_enabled(config: Dict[str, Any]) -> bool:
+    """
+    Check whether hook spans should be written
+
+    Args:
+        config: Configuration dictionary
+
+    Returns:
+        True if WSL_TOAST_TRACE or trace_enabled is set
+    """
+    env = os.environ.get("WSL_TOAST_TRACE")
+    if env is not None:
+        return env.strip().lower() in ("1", "true", "yes")
+    return config.get("trace_enabled") is True
+
+
+def session_trace_id(session_id: str) -> str:
+    """
+    Get the trace id shared by every hook of a session
+
+    Args:
+        session_id: Claude Code session id (empty: a new random trace)
+
+    Returns:
+        32 hex digit trace id
+    """
+    if not session_id:
+        return secrets.token_hex(16)
+    return hashlib.sha256(session_id.encode("utf-8")).hexdigest()[:32]
+
+
+class Span:
+    """One timed operation"""
+
+    __slots__ = ("trace_id", "span_id", "parent_id", "name", "kind",
+                 "start_ns", "end_ns", "attributes", "error")
+
+    def __init__(self, trace_id: str, name: str, parent_id: Optional[str] = None,
+                 start_ns: Optional[int] = None, kind: int = SPAN_KIND_INTERNAL):
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent_id
+        self.name = name
+        self.kind = kind
+        self.start_ns = time.time_ns() if start_ns is None else start_ns
+        self.end_ns: Optional[int] = None
+        self.attributes: Dict[str, Any] = {}
+        self.error: Optional[str] = None
+
+    def set(self, **attributes: Any) -> None:
+        """Set span attributes (None values are left out)"""
+        self.attributes.update({k: v for k, v in attributes.items() if v is not None})
+
+    def end(self, end_ns: Optional[int] = None) -> None:
+        """End the span (now, unless given)"""
+        self.end_ns = time.time_ns() if end_ns is None else end_ns
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """Encode the span as OTLP/JSON"""
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns or self.start_ns),
+            "attributes": [_attribute(k, v) for k, v in self.attributes.items()],
+            "status": {"code": STATUS_ERROR, "message": self.error} if self.error else {"code": STATUS_OK},
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        return span
+
+
+def _attribute(key: str, value: Any) -> Dict[str, Any]:
+    """Encode one attribute as an OTLP KeyValue"""
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+def export_request(spans: List[Span], resource: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Build an OTLP/JSON ExportTraceServiceRequest
+
+    Args:
+        spans: Finished spans
+        resource: Resource attributes (service.name is always set)
+
+    Returns:
+        Request dictionary
+    """
+    attributes = {"service.name": SCOPE_NAME}
+    attributes.update(resource or {})
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": [_attribute(k, v) for k, v in attributes.items()]},
+            "scopeSpans": [{
+                "scope": {"name": SCOPE_NAME, "version": SCOPE_VERSION},
+                "spans": [span.to_otlp() for span in spans],
+            }],
+        }]
+    }
+
+
+class InMemoryExporter:
+    """Keeps exported spans in process (for tests and in-process consumers)"""
+
+    def __init__(self):
+        self.spans: List[Span] = []
+
+    def export(self, spans: List[Span]) -> None:
+        """Keep finished spans"""
+        self.spans.extend(spans)
+
+
+class FileExporter:
+    """Appends one OTLP/JSON line per export to traces.jsonl"""
+
+    def __init__(self, log: HookLog):
+        """
+        Create the exporter
+
+        Args:
+            log: Rotating log the lines are appended to
+        """
+        self.log = log
+
+    @classmethod
+    def from_config(cls, log_dir: Path, config: Dict[str, Any]) -> "FileExporter":
+        """
+        Create the exporter for a configuration (rotated like hooks.log)
+
+        Args:
+            log_dir: Directory holding traces.jsonl
+            config: Configuration dictionary (hook_log_* rotation keys)
+
+        Returns:
+            FileExporter instance
+        """
+        return cls(HookLog(
+            Path(log_dir) / TRACE_LOG_NAME,
+            max_bytes=config.get("hook_log_max_bytes", 1024 * 1024),
+            backups=config.get("hook_log_backups", 3),
+            max_age_days=config.get("hook_log_max_age_days", 7),
+            compress=config.get("hook_log_compress", True),
+        ))
+
+    def export(self, spans: List[Span]) -> None:
+        """Write finished spans as one line with a single append"""
+        if spans:
+            line = json.dumps(export_request(spans), ensure_ascii=False, separators=(",", ":"))
+            self.log.log(line + "\n")
+            self.log.flush()
+
+
+class Tracer:
+    """Creates nested spans and hands them to an exporter when finished"""
+
+    def __init__(self, exporter: Any = None, trace_id: Optional[str] = None,
+                 attributes: Optional[Dict[str, Any]] = None):
+        """
+        Create a tracer
+
+        Args:
+            exporter: Object with export(spans); None disables tracing
+            trace_id: Trace id (default: random)
+            attributes: Attributes set on every span (e.g. session_id, event)
+        """
+        self.exporter = exporter
+        self.trace_id = trace_id or secrets.token_hex(16)
+        self.attributes = {k: v for k, v in (attributes or {}).items() if v is not None}
+        self.finished: List[Span] = []
+        self._stack: List[Span] = []
+
+    @property
+    def enabled(self) -> bool:
+        """Whether spans are recorded"""
+        return self.exporter is not None
+
+    @property
+    def current(self) -> Optional[Span]:
+        """The innermost open span"""
+        return self._stack[-1] if self._stack else None
+
+    def start(self, name: str, start_ns: Optional[int] = None, kind: int = SPAN_KIND_INTERNAL,
+              **attributes: Any) -> Optional[Span]:
+        """
+        Open a span as a child of the current one
+
+        Args:
+            name: Span name
+            start_ns: Start time in Unix nanoseconds (default: now)
+            kind: OTLP span kind
+            **attributes: Span attributes
+
+        Returns:
+            The span, or None when tracing is disabled
+        """
+        if not self.enabled:
+            return None
+        parent = self.current
+        span = Span(self.trace_id, name, parent.span_id if parent else None, start_ns, kind)
+        span.set(**self.attributes)
+        span.set(**attributes)
+        self._stack.append(span)
+        return span
+
+    def stop(self, span: Optional[Span], end_ns: Optional[int] = None) -> None:
+        """Close a span opened with start()"""
+        if span is None:
+            return
+        span.end(end_ns)
+        if span in self._stack:
+            self._stack.remove(span)
+        self.finished.append(span)
+
+    @contextmanager
+    def span(self, name: str, kind: int = SPAN_KIND_INTERNAL, **attributes: Any) -> Iterator[Optional[Span]]:
+        """
+        Time a block as a child span; exceptions mark it as an error
+
+        Args:
+            name: Span name
+            kind: OTLP span kind
+            **attributes: Span attributes
+
+        Yields:
+            The span, or None when tracing is disabled
+        """
+        span = self.start(name, kind=kind, **attributes)
+        try:
+            yield span
+        except BaseException as e:
+            if span is not None:
+                span.error = type(e).__name__
+            raise
+        finally:
+            self.stop(span)
+
+    def record(self, name: str, start_ns: int, end_ns: int, **attributes: Any) -> Optional[Span]:
+        """
+        Add a finished child span measured elsewhere
+
+        Args:
+            name: Span name
+            start_ns: Start time in Unix nanoseconds
+            end_ns: End time in Unix nanoseconds
+            **attributes: Span attributes
+
+        Returns:
+            The span, or None when tracing is disabled
+        """
+        span = self.start(name, start_ns=start_ns, **attributes)
+        self.stop(span, end_ns)
+        return span
+
+    def flush(self) -> None:
+        """Export finished spans"""
+        if self.enabled and self.finished:
+            spans, self.finished = self.finished, []
+            try:
+                self.exporter.export(spans)
+            except OSError:
+                pass
+
+
+def hook_tracer(event: str, session_id: str, log_dir: Path, config: Dict[str, Any]) -> Tracer:
+    """
+    Create the tracer for one hook invocation
+
+    Args:
+        event: Hook event name
+        session_id: Claude Code session id
+        log_dir: Directory holding traces.jsonl
+        config: Configuration dictionary
+
+    Returns:
+        Tracer writing to traces.jsonl, or a disabled tracer
+    """
+    if not tracing_enabled(config):
+        return Tracer()
+    return Tracer(
+        FileExporter.from_config(log_dir, config),
+        session_trace_id(session_id),
+        {"session_id": session_id or None, "event": event},
+    )
+
+
+def session_trace(log_dir: Path, session_id: str) -> Dict[str, Any]:
+    """
+    Collect a session's spans from traces.jsonl and its rotated files
+
+    Args:
+        log_dir: Directory holding traces.jsonl
+        session_id: Claude Code session id
+
+    Returns:
+        One OTLP/JSON request holding every span of the session's trace
+    """
+    trace_id = session_trace_id(session_id)
+    base = Path(log_dir) / TRACE_LOG_NAME
+    paths = sorted(base.parent.glob(base.name + ".*"), reverse=True) + [base]
+    spans = []
+    for path in paths:
+        if not path.exists() or path.name.endswith(".lock"):
+            continue
+        opener = gzip.open if path.suffix == ".gz" else open
+        with opener(path, "rb") as f:
+            for line in f:
+                try:
+                    request = json.loads(line)
+                except ValueError:
+                    continue
+                for resource in request.get("resourceSpans", []):
+                    for scope in resource.get("scopeSpans", []):
+                        spans += [s for s in scope.get("spans", []) if s.get("traceId") == trace_id]
+    request = export_request([])
+    request["resourceSpans"][0]["scopeSpans"][0]["spans"] = spans
+    return request
+
+
+@register_validator
+def validate_trace_config(config: Dict[str, Any]) -> List[str]:
+    """
+    Validate the trace_enabled configuration key
+
+    Args:
+        config: Configuration dictionary
+
+    Returns:
+        List of error messages (empty if valid)
+    """
+    if "trace_enabled" in config and not isinstance(config["trace_enabled"], bool):
+        return ["trace_enabled must be a boolean"]
+    return []
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point: python3 -m src.tracing --session <id>"""
+    parser = argparse.ArgumentParser(
+        prog="python3 -m src.tracing", description="Print a session's trace as OTLP/JSON"
+    )
+    parser.add_argument("--session", required=True, help="Claude Code session id")
+    parser.add_argument("--log-dir", default=str(Path.home() / ".wsl-toast" / "logs"),
+                        help="directory holding traces.jsonl (default: ~/.wsl-toast/logs)")
+    args = parser.parse_args(argv)
+    print(json.dumps(session_trace(Path(args.log_dir), args.session), ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,332 @@
+# transcript.py
+# Claude Code transcript helpers for the Stop hook
+#
+# Author: Claude Code TDD Implementation
+# Version: 1.0.0
+
+import hashlib
+import json
+import os
+import re
+import time
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # non-POSIX: the index is used without locking
+    fcntl = None
+
+
+def extract_text_from_content(content: List[Any]) -> str:
+    """
+    Extract text from an assistant message content array
+
+    Text blocks win; thinking and tool_use blocks are only used as a fallback.
+
+    Args:
+        content: Message content blocks
+
+    Returns:
+        Stripped text or an empty string
+    """
+    if not content or not isinstance(content, list):
+        return ""
+
+    for block in reversed(content):
+        if isinstance(block, dict):
+            if block.get("type", "") == "text" and block.get("text"):
+                return block["text"].strip()
+
+    for block in reversed(content):
+        if isinstance(block, dict):
+            if block.get("text"):
+                return block["text"].strip()
+            if block.get("thinking"):
+                return block["thinking"].strip()
+    return ""
+
+
+# Bytes read per backward step in iter_lines_reverse
+REVERSE_BLOCK_SIZE = 64 * 1024
+
+# Transcript index sidecar format version
+INDEX_VERSION = 1
+
+# Bytes before the indexed offset compared to detect in-place rewrites
+INDEX_FINGERPRINT_BYTES = 64
+
+# Sidecars of transcripts untouched for this long are removed
+INDEX_MAX_AGE_SEC = 7 * 24 * 3600
+
+
+def iter_lines_reverse(
+    f: BinaryIO,
+    block_size: int = REVERSE_BLOCK_SIZE,
+    start: int = 0,
+    end: Optional[int] = None,
+) -> Iterator[bytes]:
+    """
+    Yield the lines of a binary file (or a byte range of it) from the last to the first
+
+    Lines are split on the b"\\n" byte, which never occurs inside a
+    multi-byte UTF-8 sequence, so characters split across block boundaries
+    are reassembled intact. Lines longer than block_size are collected
+    chunk by chunk and joined once.
+
+    Args:
+        f: File opened in binary mode
+        block_size: Bytes read per step
+        start: First byte of the range (should be the start of a line)
+        end: End of the range (default: end of file)
+
+    Returns:
+        Iterator of lines without their trailing newline
+    """
+    position = f.seek(0, os.SEEK_END) if end is None else end
+    # Pieces of the line currently being assembled, last piece first
+    pending: List[bytes] = []
+    while position > start:
+        read_size = min(block_size, position - start)
+        position -= read_size
+        f.seek(position)
+        block = f.read(read_size)
+
+        end = len(block)
+        newline = block.rfind(b"\n", 0, end)
+        while newline != -1:
+            pending.append(block[newline + 1 : end])
+            yield b"".join(reversed(pending))
+            pending = []
+            end = newline
+            newline = block.rfind(b"\n", 0, end)
+        pending.append(block[:end])
+    yield b"".join(reversed(pending))
+
+
+def find_last_assistant_text(lines: Iterable[bytes]) -> str:
+    """
+    Return the text of the first assistant message with text in lines
+
+    Lines that cannot contain an assistant message are skipped without
+    being decoded or parsed.
+
+    Args:
+        lines: Transcript lines (newest first for the last message)
+
+    Returns:
+        Message text or an empty string
+    """
+    for line in lines:
+        if b'"assistant"' not in line:
+            continue
+        try:
+            entry = json.loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            continue
+        msg = entry.get("message", {}) if isinstance(entry, dict) else {}
+        if isinstance(msg, dict) and msg.get("role") == "assistant":
+            text = extract_text_from_content(msg.get("content", []))
+            if text:
+                return text
+    return ""
+
+
+def _complete_lines_end(f: BinaryIO, start: int, end: int) -> int:
+    """Return the offset just past the last newline in [start, end), or start"""
+    position = end
+    while position > start:
+        read_size = min(REVERSE_BLOCK_SIZE, position - start)
+        position -= read_size
+        f.seek(position)
+        newline = f.read(read_size).rfind(b"\n")
+        if newline != -1:
+            return position + newline + 1
+    return start
+
+
+def _fingerprint(f: BinaryIO, offset: int) -> str:
+    """Hash the bytes just before offset"""
+    begin = max(0, offset - INDEX_FINGERPRINT_BYTES)
+    f.seek(begin)
+    return hashlib.sha1(f.read(offset - begin)).hexdigest()
+
+
+def get_index_path(index_dir: Path, transcript_path: str) -> Path:
+    """
+    Get the sidecar index file for a transcript
+
+    Args:
+        index_dir: Directory holding transcript indexes
+        transcript_path: Transcript path
+
+    Returns:
+        Path of the sidecar (one file per transcript)
+    """
+    key = hashlib.sha1(os.path.abspath(transcript_path).encode("utf-8")).hexdigest()
+    return Path(index_dir) / f"{key}.json"
+
+
+def _read_index(index_path: Path) -> Dict[str, Any]:
+    """Load a sidecar index, or {} if missing, invalid or from another version"""
+    try:
+        with open(index_path, "r", encoding="utf-8") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(index, dict) or index.get("version") != INDEX_VERSION:
+        return {}
+    return index
+
+
+def _write_index(index_path: Path, index: Dict[str, Any]) -> None:
+    """Atomically replace a sidecar index"""
+    tmp = index_path.with_name(f".{index_path.name}.{os.getpid()}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False)
+    os.replace(tmp, index_path)
+
+
+def prune_index_dir(index_dir: Path, max_age: float = INDEX_MAX_AGE_SEC) -> None:
+    """Remove sidecars (and their lock files) not updated within max_age seconds"""
+    cutoff = time.time() - max_age
+    try:
+        entries = [e for e in os.scandir(index_dir) if e.name.endswith(".json")]
+    except OSError:
+        return
+    for entry in entries:
+        try:
+            if entry.stat().st_mtime < cutoff:
+                os.unlink(entry.path)
+                os.unlink(entry.path[: -len(".json")] + ".lock")
+        except OSError:
+            pass
+
+
+def _scan_with_index(
+    f: BinaryIO, stat: os.stat_result, index: Dict[str, Any], transcript_path: str
+) -> Dict[str, Any]:
+    """
+    Find the last assistant message, parsing only bytes appended since the index
+
+    Args:
+        f: Transcript opened in binary mode
+        stat: os.fstat() of the transcript
+        index: Previous sidecar contents ({} for none)
+        transcript_path: Transcript path stored in the index
+
+    Returns:
+        Updated index
+    """
+    offset = index.get("offset")
+    resumable = (
+        index.get("path") == transcript_path
+        and index.get("inode") == stat.st_ino
+        and index.get("device") == stat.st_dev
+        and isinstance(offset, int)
+        and 0 <= offset <= stat.st_size
+        and _fingerprint(f, offset) == index.get("fingerprint")
+    )
+
+    # A trailing line without newline is parsed but not indexed: it may
+    # still be being written, so the next run parses it again
+    end = _complete_lines_end(f, offset if resumable else 0, stat.st_size)
+    if resumable:
+        # Only the bytes appended since the last run
+        text = find_last_assistant_text(iter_lines_reverse(f, start=offset, end=stat.st_size))
+        message = text or index.get("message", "")
+    else:
+        # New, truncated, rotated or rewritten transcript: full backward scan
+        message = find_last_assistant_text(iter_lines_reverse(f, end=stat.st_size))
+
+    return {
+        "version": INDEX_VERSION,
+        "path": transcript_path,
+        "inode": stat.st_ino,
+        "device": stat.st_dev,
+        "size": stat.st_size,
+        "offset": end,
+        "fingerprint": _fingerprint(f, end),
+        "message": message,
+    }
+
+
+def get_last_assistant_message(transcript_path: str, index_dir: Optional[Path] = None) -> str:
+    """
+    Read a transcript and extract the last assistant message
+
+    The file is read backwards from EOF and reading stops at the newest
+    assistant message with text, so cost does not grow with transcript size.
+
+    With index_dir, a sidecar index records the offset of the last complete
+    line and the message found so far; later calls only parse the bytes
+    appended since then. Truncation, rotation (new inode) and in-place
+    rewrites fall back to a full scan. Concurrent hooks serialize on a
+    per-transcript lock; a hook that cannot get the lock scans without the
+    index instead of waiting.
+
+    Args:
+        transcript_path: Path to the transcript JSONL file
+        index_dir: Directory for sidecar indexes (default: no index)
+
+    Returns:
+        Text of the last assistant message, or an empty string
+    """
+    if not transcript_path or not os.path.exists(transcript_path):
+        return ""
+
+    try:
+        with open(transcript_path, "rb") as f:
+            if index_dir is None:
+                return find_last_assistant_text(iter_lines_reverse(f))
+            return _get_indexed_message(f, transcript_path, Path(index_dir))
+    except OSError:
+        return ""
+
+
+def _get_indexed_message(f: BinaryIO, transcript_path: str, index_dir: Path) -> str:
+    """Index-backed lookup for get_last_assistant_message"""
+    try:
+        index_dir.mkdir(parents=True, exist_ok=True)
+        index_path = get_index_path(index_dir, transcript_path)
+        lock = open(index_path.with_suffix(".lock"), "a")
+    except OSError:
+        return find_last_assistant_text(iter_lines_reverse(f))
+
+    with lock:
+        if fcntl is not None:
+            try:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                # Another hook is updating this transcript's index
+                return find_last_assistant_text(iter_lines_reverse(f))
+
+        previous = _read_index(index_path)
+        index = _scan_with_index(f, os.fstat(f.fileno()), previous, transcript_path)
+        try:
+            _write_index(index_path, index)
+        except OSError:
+            pass
+        if not previous:
+            prune_index_dir(index_dir)
+        return index["message"]
+
+
+def first_sentence(text: str, max_len: int = 150) -> str:
+    """
+    Truncate text to its first sentence or max_len characters
+
+    Args:
+        text: Text to truncate
+        max_len: Maximum length of the result, including the ellipsis
+
+    Returns:
+        First sentence, shortened with "..." when too long
+    """
+    text = (text or "").strip()
+    if not text:
+        return ""
+    sentence = re.split(r"(?<=[.!?])\s+", text, maxsplit=1)[0]
+    if len(sentence) > max_len:
+        sentence = sentence[: max_len - 3].rstrip() + "..."
+    return sentence
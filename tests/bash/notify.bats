@@ -261,3 +261,98 @@ echo '{\"Success\":true,\"Method\":\"Mock\",\"Message\":\"Mock notification disp
     run bash "$NOTIFY_SCRIPT" -t "Title" -m "Message 😀 🎊" --mock
     [[ "$output" != *"Missing required parameters"* ]]
 }
+
+# Action Center history
+@test "notify.sh: --clear-session requires --session" {
+    run bash "$NOTIFY_SCRIPT" --clear-session --mock
+    [ "$status" -eq 2 ]
+    [[ "$output" == *"--clear-session needs --session"* ]]
+}
+
+@test "notify.sh: --clear-session does not require title and message" {
+    run bash "$NOTIFY_SCRIPT" --clear-session --session "abc-123" --mock
+    [ "$status" -eq 0 ]
+    [[ "$output" == *"Clearing Action Center history for session: abc-123"* ]]
+}
+
+@test "notify.sh: --clear-session --mock passes through to wsl-toast.ps1 -MockMode" {
+    mkdir -p "$TEST_TEMP_DIR/bin"
+    cat > "$TEST_TEMP_DIR/bin/powershell.exe" <<'STUB'
+#!/usr/bin/env bash
+printf '%s\n' "$@" > "${TEST_TEMP_DIR}/ps-args"
+echo '{"Success":true,"HistoryPrune":{"Status":"Mock","Candidates":["abc-123-1"],"Removed":0}}'
+STUB
+    chmod +x "$TEST_TEMP_DIR/bin/powershell.exe"
+    export PATH="$TEST_TEMP_DIR/bin:$PATH"
+
+    run bash "$NOTIFY_SCRIPT" --clear-session --session "abc-123" --mock --background --verbose
+    [ "$status" -eq 0 ]
+    grep -qx -- "-ClearSession" "$TEST_TEMP_DIR/ps-args"
+    grep -qx -- "-MockMode" "$TEST_TEMP_DIR/ps-args"
+    [[ "$output" == *"abc-123-1"* ]]
+}
+
+@test "notify.sh: Accepts session with --session flag" {
+    run bash "$NOTIFY_SCRIPT" -t "Title" -m "Message" --session "abc-123" --mock
+    [ "$status" -eq 0 ]
+}
+
+# Config snapshot (config.sh)
+@test "notify.sh: String \"false\" for enabled still disables notifications" {
+    export HOME="$TEST_TEMP_DIR"
+    mkdir -p "$HOME/.wsl-toast"
+    echo '{"enabled": "false"}' > "$HOME/.wsl-toast/config.json"
+
+    run bash "$NOTIFY_SCRIPT" -t "Title" -m "Message" --mock
+    [ "$status" -eq 0 ]
+    [[ "$output" == *"Notifications are disabled in config"* ]]
+}
+
+@test "notify.sh: Warns when a config value falls back to its default" {
+    export HOME="$TEST_TEMP_DIR"
+    mkdir -p "$HOME/.wsl-toast"
+    echo '{"default_type": "Bogus"}' > "$HOME/.wsl-toast/config.json"
+
+    run bash "$NOTIFY_SCRIPT" -t "Title" -m "Message" --mock
+    [ "$status" -eq 0 ]
+    [[ "$output" == *"Warning:"*"default_type"* ]]
+}
+
+@test "notify.sh: Builds config.sh from config.json and honours it" {
+    export HOME="$TEST_TEMP_DIR"
+    mkdir -p "$HOME/.wsl-toast"
+    echo '{"default_type": "Warning"}' > "$HOME/.wsl-toast/config.json"
+
+    run bash "$NOTIFY_SCRIPT" -t "Title" -m "Message" --mock
+    [ "$status" -eq 0 ]
+    [ -f "$HOME/.wsl-toast/config.sh" ]
+    [[ "$output" == *"[Warning]"* ]]
+}
+
+@test "notify.sh: Rebuilds config.sh when config.json is newer" {
+    export HOME="$TEST_TEMP_DIR"
+    mkdir -p "$HOME/.wsl-toast"
+    echo '{"default_type": "Warning"}' > "$HOME/.wsl-toast/config.json"
+    run bash "$NOTIFY_SCRIPT" -t "Title" -m "Message" --mock
+
+    echo '{"enabled": false}' > "$HOME/.wsl-toast/config.json"
+    touch -d "+2 seconds" "$HOME/.wsl-toast/config.json"
+
+    run bash "$NOTIFY_SCRIPT" -t "Title" -m "Message" --mock
+    [ "$status" -eq 0 ]
+    [[ "$output" == *"Notifications are disabled in config"* ]]
+}
+
+# Stage profiling (WSL_TOAST_PROFILE=1)
+@test "notify.sh: WSL_TOAST_PROFILE=1 prints one breakdown record" {
+    WSL_TOAST_PROFILE=1 WSL_TOAST_TRACE_ID="abc123" run bash "$NOTIFY_SCRIPT" -t "Title" -m "Message" --mock
+    [ "$status" -eq 0 ]
+    [[ "$output" == *'WSL_TOAST_PROFILE {"trace_id":"abc123"'* ]]
+    [[ "$output" == *'"config":'* ]]
+}
+
+@test "notify.sh: No breakdown record without WSL_TOAST_PROFILE" {
+    run bash "$NOTIFY_SCRIPT" -t "Title" -m "Message" --mock
+    [ "$status" -eq 0 ]
+    [[ "$output" != *"WSL_TOAST_PROFILE"* ]]
+}
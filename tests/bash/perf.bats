@@ -0,0 +1,236 @@
+#!/usr/bin/env bats
+# Performance budget tests for notify.sh and the hooks (mock path)
+#
+# Time budgets are multiples of a calibration unit: the median time this
+# machine takes to start python3 (python3 -c pass), the fixed cost every
+# hook pays. The same budgets therefore hold on fast and slow machines.
+# Process budgets count the processes besides the one python3 launch a
+# hook makes; python3's own count is calibrated too, since it is more than
+# one where python3 is a wrapper (e.g. a pyenv shim). A change that adds
+# a fork, such as another python3 -c in a hook, fails here with the
+# measured count.
+#
+# Budgets can be overridden from the environment, e.g.
+#   PERF_HOOK_UNITS=20 PERF_RUNS=9 bats tests/bash/perf.bats
+#
+# Author: Claude Code TDD Implementation
+# Version: 1.0.0
+
+# Time budgets, in calibration units
+: "${PERF_NOTIFY_UNITS:=3}"
+: "${PERF_HOOK_UNITS:=15}"
+
+# Process budgets: processes created per run, the command itself included,
+# besides those of the hook's python3 launch
+: "${PERF_NOTIFY_FORKS:=8}"
+: "${PERF_HOOK_FORKS:=9}"
+: "${PERF_SESSION_END_FORKS:=15}"
+# UserPromptSubmit.sh is measured with the spinner's parent-process walk
+# stubbed out; the walk depends on how deeply the test runner is nested,
+# so it has its own budget: command substitutions per parent visited
+: "${PERF_USER_PROMPT_SUBMIT_FORKS:=10}"
+: "${PERF_SPINNER_HOP_SUBSTITUTIONS:=3}"
+
+# Timed runs per measurement (the median is compared)
+: "${PERF_RUNS:=5}"
+
+# Calibrate once per file
+setup_file() {
+    local samples=() i
+    for ((i = 0; i < PERF_RUNS; i++)); do
+        samples+=("$(elapsed_us python3 -c pass)")
+    done
+    PERF_UNIT_US="$(median "${samples[@]}")"
+    PERF_PYTHON_FORKS=0
+    PERF_SUBSTITUTION_FORKS=0
+    if [[ -r /proc/loadavg ]]; then
+        PERF_PYTHON_FORKS="$(forks python3 -c pass)"
+        # Processes one $(command 2>/dev/null) costs: one or two, depending
+        # on whether bash execs the command in the substitution's subshell
+        PERF_SUBSTITUTION_FORKS="$(( $(forks bash -c 'x=$(readlink /proc/self/fd/0 2>/dev/null)') - 1 ))"
+    fi
+    export PERF_UNIT_US PERF_PYTHON_FORKS PERF_SUBSTITUTION_FORKS
+}
+
+setup() {
+    SCRIPT_DIR="$(cd "${BATS_TEST_DIRNAME}/../.." && pwd)"
+    NOTIFY_SCRIPT="${SCRIPT_DIR}/scripts/notify.sh"
+    HOOKS_DIR="${SCRIPT_DIR}/hooks"
+
+    export MOCK_MODE="true"
+    export WSL_TOAST_ENABLED="true"
+    unset WSL_TOAST_PROFILE WSL_TOAST_TRACE
+
+    TEST_TEMP_DIR="$(mktemp -d)"
+    export HOME="${TEST_TEMP_DIR}/home"
+    mkdir -p "$HOME"
+    PAYLOAD='{"session_id":"perf","message":"Claude needs your permission","tool_name":"Bash","tool_response":{"stdout":"","stderr":"boom","exit_code":1}}'
+}
+
+teardown() {
+    if [[ -d "$TEST_TEMP_DIR" ]]; then
+        rm -rf "$TEST_TEMP_DIR"
+    fi
+}
+
+# Helper Functions
+
+# Wall time of one command in microseconds (output discarded)
+elapsed_us() {
+    local start="${EPOCHREALTIME/./}"
+    "$@" </dev/null >/dev/null 2>&1
+    echo $(( ${EPOCHREALTIME/./} - start ))
+}
+
+# Median of integer arguments
+median() {
+    printf '%s\n' "$@" | sort -n | awk '{ v[NR] = $1 } END { print v[int((NR + 1) / 2)] }'
+}
+
+# Median wall time of a command over PERF_RUNS runs, after one warm-up run
+median_us() {
+    local samples=() i
+    "$@" </dev/null >/dev/null 2>&1
+    for ((i = 0; i < PERF_RUNS; i++)); do
+        samples+=("$(elapsed_us "$@")")
+    done
+    median "${samples[@]}"
+}
+
+# Run a hook with $PAYLOAD on stdin
+run_hook() {
+    printf '%s' "$PAYLOAD" | bash "${HOOKS_DIR}/$1.sh" >/dev/null 2>&1
+}
+
+# Copy UserPromptSubmit.sh and _spinner.sh with the parent-process walk
+# stubbed out (no tty found), so the hook's own processes can be counted
+stub_spinner_walk() {
+    local dir="${TEST_TEMP_DIR}/hooks"
+    mkdir -p "$dir"
+    cp "${HOOKS_DIR}/UserPromptSubmit.sh" "${HOOKS_DIR}/_spinner.sh" "$dir/"
+    echo '_spinner_find_user_tty() { return 1; }' >> "$dir/_spinner.sh"
+    HOOKS_DIR="$dir"
+}
+
+# Parents _spinner_find_user_tty visits from a bash started by the caller,
+# counted with builtins only; written to the file given as $1
+count_spinner_hops() {
+    local pid=$PPID hops=0 key value
+    while [ -n "$pid" ] && [ "$pid" != "0" ] && [ "$pid" != "1" ] && [ "$hops" -lt 20 ]; do
+        value=""
+        while read -r key value; do
+            [[ "$key" == "PPid:" ]] && break
+            value=""
+        done < "/proc/$pid/status"
+        pid="$value"
+        hops=$((hops + 1))
+    done
+    echo "$hops" > "$1"
+}
+
+# Processes created by a command: the last allocated PID (in /proc/loadavg)
+# moves by one per process; the minimum of three runs filters out other
+# activity on the machine
+forks() {
+    local best="" i before after
+    for ((i = 0; i < 3; i++)); do
+        before="$(cut -d' ' -f5 /proc/loadavg)"
+        before="${before#*/}"
+        "$@" </dev/null >/dev/null 2>&1
+        after="$(cut -d' ' -f5 /proc/loadavg)"
+        after="${after#*/}"
+        # The cut that read the second value took one PID as well
+        local count=$(( after - before - 1 ))
+        if (( count >= 0 )) && [[ -z "$best" || count -lt best ]]; then
+            best=$count
+        fi
+    done
+    echo "${best:-0}"
+}
+
+# Fail with a readable message when a measurement exceeds its budget
+assert_within() {
+    local what="$1" value="$2" budget="$3" unit="$4" note="${5:-}"
+    if (( value > budget )); then
+        echo "${what}: ${value} ${unit} exceeds budget of ${budget} ${unit}${note:+ ($note)}" >&2
+        return 1
+    fi
+}
+
+assert_time_within() {
+    local what="$1" units="$2"
+    shift 2
+    local us budget
+    us="$(median_us "$@")"
+    budget=$(( PERF_UNIT_US * units ))
+    assert_within "$what" "$(( us / 1000 ))" "$(( budget / 1000 ))" ms \
+        "${units} x calibration unit of $(( PERF_UNIT_US / 1000 )) ms"
+}
+
+require_pid_counting() {
+    [[ -r /proc/loadavg ]] || skip "process counting needs /proc/loadavg"
+}
+
+@test "perf: calibration unit is measurable" {
+    (( PERF_UNIT_US > 0 ))
+}
+
+@test "perf: notify.sh --mock within time budget" {
+    assert_time_within "notify.sh --mock" "$PERF_NOTIFY_UNITS" \
+        bash "$NOTIFY_SCRIPT" --mock --title "Title" --message "Message"
+}
+
+@test "perf: notify.sh --mock within process budget" {
+    require_pid_counting
+    bash "$NOTIFY_SCRIPT" --mock --title "Title" --message "Message" >/dev/null 2>&1
+    assert_within "notify.sh --mock" \
+        "$(forks bash "$NOTIFY_SCRIPT" --mock --title "Title" --message "Message")" \
+        "$PERF_NOTIFY_FORKS" "processes"
+}
+
+@test "perf: every hook within time budget under mock" {
+    local hook failed=0
+    for hook in Stop Notification PermissionRequest PostToolUse SessionStart SessionEnd UserPromptSubmit; do
+        assert_time_within "${hook}.sh" "$PERF_HOOK_UNITS" run_hook "$hook" || failed=1
+    done
+    (( failed == 0 ))
+}
+
+@test "perf: every hook within process budget under mock" {
+    require_pid_counting
+    local hook budget failed=0
+    for hook in Stop Notification PermissionRequest PostToolUse SessionStart SessionEnd; do
+        case "$hook" in
+            SessionEnd) budget="$PERF_SESSION_END_FORKS" ;;
+            *) budget="$PERF_HOOK_FORKS" ;;
+        esac
+        budget=$(( budget + PERF_PYTHON_FORKS ))
+        run_hook "$hook"
+        assert_within "${hook}.sh" "$(forks run_hook "$hook")" "$budget" processes \
+            "python3 start-up counts ${PERF_PYTHON_FORKS}" || failed=1
+    done
+    (( failed == 0 ))
+}
+
+@test "perf: UserPromptSubmit.sh within process budget under mock" {
+    require_pid_counting
+    # Pure shell: no python3 start-up; the parent walk is budgeted below
+    stub_spinner_walk
+    run_hook UserPromptSubmit
+    assert_within "UserPromptSubmit.sh" "$(forks run_hook UserPromptSubmit)" \
+        "$PERF_USER_PROMPT_SUBMIT_FORKS" processes "spinner parent walk stubbed"
+}
+
+@test "perf: spinner parent walk within process budget per parent" {
+    require_pid_counting
+    local spinner="${HOOKS_DIR}/_spinner.sh" hops_file="${TEST_TEMP_DIR}/hops" count hops per_hop
+    # Both run through forks from here, so they visit the same parents;
+    # with no tty on stdin/stdout the walk goes all the way up
+    : "$(forks bash -c "$(declare -f count_spinner_hops); count_spinner_hops \"\$1\"" _ "$hops_file")"
+    count="$(forks bash -c '. "$1" && _spinner_find_user_tty' _ "$spinner")"
+    hops="$(<"$hops_file")"
+    per_hop=$(( PERF_SPINNER_HOP_SUBSTITUTIONS * PERF_SUBSTITUTION_FORKS ))
+    # One process is the bash itself
+    assert_within "_spinner_find_user_tty" "$(( count - 1 ))" "$(( per_hop * hops ))" processes \
+        "${PERF_SPINNER_HOP_SUBSTITUTIONS} substitutions of ${PERF_SUBSTITUTION_FORKS} per parent, ${hops} parents"
+}
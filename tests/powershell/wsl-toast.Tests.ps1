@@ -209,6 +209,94 @@ Describe 'wsl-toast.ps1 Unit Tests' {
         }
     }
 
+    Context 'Action Center History' {
+        BeforeAll {
+            function New-TestHistory {
+                param([string]$SessionKey = 'abc', [int]$Count = 5)
+                foreach ($i in 1..$Count) {
+                    $tag = 'wslt-{0}-{1}' -f $SessionKey, (1000 + $i)
+                    [PSCustomObject]@{ Tag = $tag; Group = $tag; SessionKey = $SessionKey; Ticks = [long](1000 + $i) }
+                }
+            }
+        }
+
+        It 'New-ToastTag embeds the session key and fits the 64 character tag limit' {
+            $tag = New-ToastTag -SessionId '0f3c2c1e-6f0b-4b8e-9d7a-2a1d5c9e8b10'
+            $tag | Should -Match '^wslt-0f3c2c1e6f0b4b8e9d7a2a1d5c9e8b10-\d+$'
+            $tag.Length | Should -BeLessOrEqual 64
+        }
+
+        It 'New-ToastTag works without a session' {
+            New-ToastTag | Should -Match '^wslt-nosession-\d+$'
+        }
+
+        It 'ConvertFrom-ToastTag ignores foreign tags' {
+            ConvertFrom-ToastTag -Tag 'someone-else' | Should -BeNullOrEmpty
+            (ConvertFrom-ToastTag -Tag 'wslt-abc-42').Ticks | Should -Be 42
+        }
+
+        It 'Select-ToastPruneCandidates keeps the most recent toasts' {
+            $history = @(New-TestHistory -Count 5)
+            $result = @(Select-ToastPruneCandidates -Entries $history -HistoryCap 2)
+            $result.Count | Should -Be 3
+            $result[0].Ticks | Should -Be 1001
+            $result[-1].Ticks | Should -Be 1003
+        }
+
+        It 'Select-ToastPruneCandidates selects only the requested session' {
+            $history = @(New-TestHistory -SessionKey 'abc' -Count 2) + @(New-TestHistory -SessionKey 'def' -Count 3)
+            $result = @(Select-ToastPruneCandidates -Entries $history -SessionId 'def')
+            $result.Count | Should -Be 3
+            ($result | Where-Object { $_.SessionKey -ne 'def' }) | Should -BeNullOrEmpty
+        }
+
+        It 'Invoke-ToastHistoryPrune in MockMode reports candidates without removing' {
+            $history = @(New-TestHistory -Count 4)
+            $result = Invoke-ToastHistoryPrune -HistoryCap 1 -PruneIntervalSec 0 -History $history -MockMode
+            $result.Status | Should -Be 'Mock'
+            $result.Candidates.Count | Should -Be 3
+            $result.Removed | Should -Be 0
+        }
+
+        It 'Invoke-ToastHistoryPrune is disabled when the cap is zero' {
+            $result = Invoke-ToastHistoryPrune -HistoryCap 0 -History @() -MockMode
+            $result.Status | Should -Be 'Disabled'
+        }
+
+        It 'Send-WSLToast reports history pruning in MockMode' {
+            $result = Send-WSLToast -Title 'Test' -Message 'Test Message' -HistoryCap 20 -PruneIntervalSec 0 -MockMode
+            $result.Success | Should -Be $true
+            $result.HistoryPrune.Status | Should -Be 'Mock'
+        }
+
+        It 'Clear-WSLToastSession requires a session id' {
+            $result = Clear-WSLToastSession -MockMode
+            $result.Success | Should -Be $false
+            $result.Error | Should -Not -BeNullOrEmpty
+        }
+    }
+
+    Context 'Stage Timing' {
+        AfterEach {
+            $script:Timing = $null
+        }
+
+        It 'Add-TimingMark does nothing without -Timing' {
+            $script:Timing = $null
+            { Add-TimingMark -Name 'show' } | Should -Not -Throw
+            $script:Timing | Should -BeNullOrEmpty
+        }
+
+        It 'Send-WSLToast records prepare, show and prune stages with -Timing' {
+            $script:TimingWatch = [System.Diagnostics.Stopwatch]::StartNew()
+            $script:TimingLastMs = 0.0
+            $script:Timing = [ordered]@{}
+            $null = Send-WSLToast -Title 'Test' -Message 'Test Message' -HistoryCap 20 -PruneIntervalSec 0 -MockMode
+            @($script:Timing.Keys) | Should -Be @('prepare', 'show', 'prune')
+            $script:Timing['show'] | Should -BeGreaterOrEqual 0
+        }
+    }
+
     Context 'Error Handling' {
         It 'Send-WSLToast handles null title gracefully' {
             # The parameter validation should catch this before execution
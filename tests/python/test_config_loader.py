@@ -4,8 +4,12 @@
 # Author: Claude Code TDD Implementation
 # Version: 1.0.0
 
-import pytest
 import json
+import multiprocessing
+import os
+from pathlib import Path
+
+import pytest
 
 
 class TestConfigLoaderDefaults:
@@ -112,12 +116,12 @@ class TestConfigLoaderLoad:
 
     def test_load_config_falls_back_to_defaults(self, tmp_path):
         """Test that loading config falls back to defaults when file doesn't exist"""
-        from src.config_loader import load_config, get_default_config
+        from src.config_loader import load_config, get_default_config, thaw_config
 
         config = load_config(str(tmp_path))
         defaults = get_default_config()
 
-        assert config == defaults
+        assert thaw_config(config) == defaults
 
     def test_load_config_with_partial_config(self, temp_config_dir):
         """Test loading partial configuration merges with defaults"""
@@ -139,18 +143,30 @@ class TestConfigLoaderLoad:
         invalid_file = temp_config_dir / "config.json"
         invalid_file.write_text("{invalid json content}", encoding="utf-8")
 
-        from src.config_loader import load_config, get_default_config
+        from src.config_loader import load_config, get_default_config, thaw_config
 
         # Should fall back to defaults
         config = load_config(str(temp_config_dir))
         defaults = get_default_config()
 
-        assert config == defaults
+        assert thaw_config(config) == defaults
+
+    def test_read_config_file_skips_defaults(self, temp_config_dir):
+        """Test that read_config_file returns the file as is"""
+        from src.config_loader import read_config_file
+
+        config_file = temp_config_dir / "custom.json"
+        assert read_config_file(config_file) == {}
+        config_file.write_text('{"language": "ko"}', encoding="utf-8")
+        assert read_config_file(config_file) == {"language": "ko"}
+        config_file.write_text("[1, 2]", encoding="utf-8")
+        assert read_config_file(config_file) == {}
 
     def test_load_config_caches_result(self, valid_config_file, monkeypatch):
-        """Test that loading configuration caches the result"""
+        """Test that loading configuration caches the result within the check interval"""
         from src.config_loader import load_config, clear_config_cache
 
+        monkeypatch.setenv("WSL_TOAST_CONFIG_CHECK_INTERVAL", "3600")
         clear_config_cache()
 
         # Load first time
@@ -159,12 +175,85 @@ class TestConfigLoaderLoad:
         # Modify file
         valid_config_file.write_text('{"enabled": false}', encoding="utf-8")
 
-        # Load second time (should be cached)
+        # Load second time (should be cached, the file is not checked yet)
         config2 = load_config(str(valid_config_file.parent))
 
-        assert config1 == config2
+        assert config1 is config2
         assert config1["enabled"] is True  # Should still be True from cache
 
+    def test_load_config_picks_up_file_changes(self, valid_config_file, monkeypatch):
+        """Test that a changed file replaces the cached result once the interval passes"""
+        from src.config_loader import load_config, clear_config_cache
+
+        monkeypatch.setenv("WSL_TOAST_CONFIG_CHECK_INTERVAL", "0")
+        clear_config_cache()
+
+        config1 = load_config(str(valid_config_file.parent))
+        assert load_config(str(valid_config_file.parent)) is config1  # Unchanged file
+
+        # Edit by hand, keeping the size and mtime so only the inode differs
+        stat = valid_config_file.stat()
+        replacement = valid_config_file.with_name("config.json.new")
+        replacement.write_text(valid_config_file.read_text(encoding="utf-8").replace('"ko"', '"ja"'),
+                               encoding="utf-8")
+        os.utime(replacement, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        os.replace(replacement, valid_config_file)
+
+        config2 = load_config(str(valid_config_file.parent))
+        assert config2["language"] == "ja"
+
+        # Removing the file falls back to defaults
+        valid_config_file.unlink()
+        assert load_config(str(valid_config_file.parent))["language"] == "en"
+
+    def test_load_config_returns_read_only_view(self, valid_config_file):
+        """Test that callers cannot modify the cached configuration"""
+        from src.config_loader import load_config, clear_config_cache
+
+        clear_config_cache()
+        config = load_config(str(valid_config_file.parent))
+
+        with pytest.raises(TypeError):
+            config["enabled"] = False
+        copy = dict(config)
+        copy["enabled"] = False
+
+        assert load_config(str(valid_config_file.parent))["enabled"] is True
+
+    def test_load_config_nested_values_are_read_only(self, temp_config_dir):
+        """Test that nested lists and objects cannot be changed either"""
+        from src.config_loader import load_config, clear_config_cache, save_config, validate_config
+
+        (temp_config_dir / "config.json").write_text(
+            '{"hook_outcome_rules": {"Bash": {"error_fields": ["stderr"]}}}', encoding="utf-8"
+        )
+        clear_config_cache()
+        config = load_config(str(temp_config_dir))
+
+        with pytest.raises(AttributeError):
+            config["hook_tool_denylist"].append("Bash")
+        with pytest.raises(TypeError):
+            config["event_log_sample_rates"]["*"] = 0
+        with pytest.raises(TypeError):
+            config["hook_outcome_rules"]["Bash"]["error_fields"] = []
+
+        again = load_config(str(temp_config_dir))
+        assert "Bash" not in again["hook_tool_denylist"]
+        assert again["event_log_sample_rates"]["*"] == 1.0
+        assert validate_config(again) == (True, [])
+
+        # Consumers still see the frozen values
+        from src.events import get_sample_rate
+        from src.outcome import get_rule_table
+        assert get_rule_table(again).rule_for("Bash")["error_fields"] == ("stderr",)
+        assert get_sample_rate(again, "PostToolUse") == 0.01
+
+        # A copy of the frozen config can still be saved
+        save_config(dict(again), str(temp_config_dir))
+        data = json.loads((temp_config_dir / "config.json").read_text(encoding="utf-8"))
+        assert data["hook_outcome_rules"] == {"Bash": {"error_fields": ["stderr"]}}
+        assert data["hook_tool_denylist"][0] == "Read"
+
     def test_clear_cache_works(self, valid_config_file, monkeypatch):
         """Test that clearing cache works correctly"""
         from src.config_loader import load_config, clear_config_cache
@@ -264,6 +353,112 @@ class TestConfigLoaderGetSet:
         assert data["enabled"] is True  # Should preserve existing
         assert data["language"] == "ko"  # Should update
 
+    def test_set_config_value_leaves_loaded_config_unchanged(self, temp_config_dir):
+        """Test that setting a value does not modify configs already loaded"""
+        from src.config_loader import load_config, set_config_value
+
+        before = load_config(str(temp_config_dir))
+        set_config_value("language", "zh", str(temp_config_dir))
+
+        assert before["language"] == "en"
+        assert load_config(str(temp_config_dir))["language"] == "zh"
+
+    def test_update_config_sets_many_keys(self, temp_config_dir):
+        """Test that update_config applies several keys in one write"""
+        from src.config_loader import update_config
+
+        config = update_config({"language": "ja", "sound_enabled": False}, config_dir=str(temp_config_dir))
+
+        data = json.loads((temp_config_dir / "config.json").read_text(encoding="utf-8"))
+        assert data["language"] == "ja" and data["sound_enabled"] is False
+        assert data["default_type"] == "Information"  # Defaults are kept
+        assert config["language"] == "ja"
+
+    def test_update_config_keys_do_not_collide_with_arguments(self, temp_config_dir):
+        """Test that a config key named config_dir is stored like any other"""
+        from src.config_loader import update_config
+
+        update_config({"config_dir": "/elsewhere"}, config_dir=str(temp_config_dir))
+
+        data = json.loads((temp_config_dir / "config.json").read_text(encoding="utf-8"))
+        assert data["config_dir"] == "/elsewhere"
+        with pytest.raises(TypeError):
+            update_config({"language": "ja"}, str(temp_config_dir))
+
+    def test_save_config_replaces_file_atomically(self, temp_config_dir):
+        """Test that saving renames a new file into place, keeping its mode"""
+        from src.config_loader import save_config
+
+        config_file = temp_config_dir / "config.json"
+        config_file.write_text("{}", encoding="utf-8")
+        config_file.chmod(0o600)
+        inode = config_file.stat().st_ino
+
+        save_config({"language": "ko"}, str(temp_config_dir))
+
+        assert config_file.stat().st_ino != inode
+        assert config_file.stat().st_mode & 0o777 == 0o600
+        assert not [p for p in temp_config_dir.iterdir() if p.name.endswith(".tmp")]
+
+
+class TestConfigConcurrency:
+    """Test suite for concurrent writers and readers in separate processes"""
+
+    def test_concurrent_updates_are_not_lost(self, tmp_path):
+        """Test many processes updating different keys at once"""
+        ctx = multiprocessing.get_context("fork")
+        with ctx.Pool(8) as pool:
+            pool.starmap(_updater, [(str(tmp_path), i) for i in range(8)])
+
+        data = json.loads((tmp_path / "config.json").read_text(encoding="utf-8"))
+        for worker in range(8):
+            assert data[f"worker_{worker}"] == 24
+            assert data[f"batch_{worker}"] == {"a": 24, "b": 24}
+
+    def test_readers_never_see_partial_file(self, tmp_path):
+        """Test that readers always parse a complete file while writers save"""
+        from src.config_loader import save_config
+
+        save_config({"payload": "x" * 65536, "writer": -1}, str(tmp_path))
+        ctx = multiprocessing.get_context("fork")
+        with ctx.Pool(6) as pool:
+            writers = pool.starmap_async(_saver, [(str(tmp_path), i) for i in range(3)])
+            failures = pool.starmap(_reader, [(str(tmp_path),)] * 3)
+            writers.get()
+
+        assert failures == [0, 0, 0]
+
+
+def _updater(directory, worker):
+    """Concurrency worker: 25 single-key and batch updates"""
+    from src.config_loader import set_config_value, update_config
+
+    for i in range(25):
+        set_config_value(f"worker_{worker}", i, directory)
+        update_config({f"batch_{worker}": {"a": i, "b": i}}, config_dir=directory)
+
+
+def _saver(directory, worker):
+    """Concurrency worker: 40 saves of a large file"""
+    from src.config_loader import save_config
+
+    for i in range(40):
+        save_config({"payload": str(worker) * 65536, "writer": worker, "i": i}, directory)
+
+
+def _reader(directory):
+    """Concurrency worker: read the raw file 300 times, counting unparsable reads"""
+    failures = 0
+    for _ in range(300):
+        try:
+            with open(os.path.join(directory, "config.json"), encoding="utf-8") as f:
+                data = json.load(f)
+            if len(data["payload"]) != 65536:
+                failures += 1
+        except (ValueError, KeyError):
+            failures += 1
+    return failures
+
 
 class TestConfigValidator:
     """Test suite for configuration validation"""
@@ -341,6 +536,97 @@ class TestConfigValidator:
         assert is_valid is False
         assert len(errors) > 0
 
+    def test_validate_history_settings(self):
+        """Test validating Action Center history settings"""
+        from src.config_loader import validate_config, get_default_config
+
+        is_valid, errors = validate_config(get_default_config())
+        assert is_valid is True
+
+        is_valid, errors = validate_config({"history_cap": -1})
+        assert is_valid is False
+        assert any("history_cap" in e for e in errors)
+
+        is_valid, errors = validate_config({"history_prune_interval": True})
+        assert is_valid is False
+        assert any("history_prune_interval" in e for e in errors)
+
+    def test_validate_history_settings_bounds(self):
+        """Test that history settings are limited to what wsl-toast.ps1 accepts"""
+        from src.config_loader import compile_config_snapshot, validate_config
+
+        assert validate_config({"history_cap": 1000, "history_prune_interval": 86400})[0] is True
+        assert validate_config({"history_cap": 0, "history_prune_interval": 0})[0] is True
+
+        is_valid, errors = validate_config({"history_cap": 1001, "history_prune_interval": 86401})
+        assert is_valid is False
+        assert any("history_cap" in e for e in errors)
+        assert any("history_prune_interval" in e for e in errors)
+
+        # The snapshot falls back to the defaults instead of passing them on
+        text = compile_config_snapshot({"history_cap": 5000})
+        assert "WSL_TOAST_CFG_HISTORY_CAP=20" in text
+
+    def test_validate_hook_tool_lists(self):
+        """Test validating PostToolUse tool allow/deny lists"""
+        from src.config_loader import validate_config
+
+        is_valid, errors = validate_config({"hook_tool_allowlist": ["Bash", "Edit"]})
+        assert is_valid is True
+
+        is_valid, errors = validate_config({"hook_tool_denylist": "Read"})
+        assert is_valid is False
+        assert any("hook_tool_denylist" in e for e in errors)
+
+    def test_validate_hook_payload_max_bytes(self):
+        """Test validating the hook stdin byte cap"""
+        from src.config_loader import validate_config
+
+        is_valid, errors = validate_config({"hook_payload_max_bytes": 1048576})
+        assert is_valid is True
+
+        is_valid, errors = validate_config({"hook_payload_max_bytes": 0})
+        assert is_valid is False
+        assert any("hook_payload_max_bytes" in e for e in errors)
+
+    def test_feature_validators_are_registered(self, tmp_path):
+        """Test that feature modules validate their own keys without config_loader importing them"""
+        import subprocess
+        import sys
+
+        project_root = str(Path(__file__).parent.parent.parent)
+        result = subprocess.run(
+            [sys.executable, "-c", "import sys, src.config_loader; "
+             "print(sorted(m for m in sys.modules if m.startswith('src.')))"],
+            cwd=project_root,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.strip() == "['src.config_loader']"
+
+        # The compile command loads them, so the snapshot checks every key
+        config_file = tmp_path / "config.json"
+        config_file.write_text('{"trace_enabled": "yes"}', encoding="utf-8")
+        result = subprocess.run(
+            [sys.executable, "-m", "src.config_loader", "compile", str(config_file)],
+            cwd=project_root,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert "trace_enabled must be a boolean" in result.stderr
+
+        from src import events, hooklog, outcome, tracing  # noqa: F401
+        from src.config_loader import validate_config
+
+        is_valid, errors = validate_config({
+            "hook_outcome_rules": [], "hook_log_level": "loud",
+            "event_log_enabled": "yes", "trace_enabled": "yes",
+        })
+        assert is_valid is False
+        assert len(errors) == 4
+
     def test_validate_invalid_position(self):
         """Test validating config with invalid position"""
         from src.config_loader import validate_config
@@ -358,3 +644,109 @@ class TestConfigValidator:
 
         assert is_valid is False
         assert len(errors) > 0
+
+
+class TestConfigSnapshot:
+    """Test suite for the shell-sourceable config.sh snapshot"""
+
+    @pytest.fixture
+    def temp_config_dir(self, tmp_path):
+        """Create temporary config directory"""
+        config_dir = tmp_path / ".wsl-toast"
+        config_dir.mkdir()
+        return config_dir
+
+    @staticmethod
+    def source_value(snapshot, name):
+        """Source a snapshot in bash and return one variable, byte for byte"""
+        import subprocess
+
+        result = subprocess.run(
+            ["bash", "-c", f'source "$1" && printf "%s" "${name}"', "bash", str(snapshot)],
+            capture_output=True,
+            check=True,
+        )
+        return result.stdout.decode("utf-8")
+
+    def test_save_config_writes_snapshot(self, temp_config_dir):
+        """Test that saving config writes config.sh next to config.json"""
+        from src.config_loader import save_config
+
+        save_config({"language": "ko"}, str(temp_config_dir))
+
+        snapshot = temp_config_dir / "config.sh"
+        assert snapshot.exists()
+        assert self.source_value(snapshot, "WSL_TOAST_CFG_LANGUAGE") == "ko"
+
+    def test_snapshot_includes_merged_defaults(self, temp_config_dir):
+        """Test that defaults missing from the file are still exported"""
+        from src.config_loader import save_config
+
+        save_config({"enabled": False}, str(temp_config_dir))
+
+        snapshot = temp_config_dir / "config.sh"
+        assert self.source_value(snapshot, "WSL_TOAST_CFG_ENABLED") == "false"
+        assert self.source_value(snapshot, "WSL_TOAST_CFG_DEFAULT_TYPE") == "Information"
+        assert self.source_value(snapshot, "WSL_TOAST_CFG_HISTORY_CAP") == "20"
+
+    def test_snapshot_replaces_invalid_values(self):
+        """Test that invalid values fall back to their defaults"""
+        from src.config_loader import compile_config_snapshot
+
+        text = compile_config_snapshot({"default_type": "Bogus", "history_cap": -5})
+
+        assert "WSL_TOAST_CFG_DEFAULT_TYPE=Information" in text
+        assert "WSL_TOAST_CFG_HISTORY_CAP=20" in text
+
+    def test_snapshot_round_trips_quoting(self, temp_config_dir):
+        """Test that non-ASCII text and shell metacharacters survive sourcing"""
+        from src.config_loader import save_config
+
+        tricky = "한글 日本語 中文 'single' \"double\" $HOME `cmd` \\ back\nnewline"
+        save_config({"title_prefix": tricky}, str(temp_config_dir))
+
+        snapshot = temp_config_dir / "config.sh"
+        assert self.source_value(snapshot, "WSL_TOAST_CFG_TITLE_PREFIX") == tricky
+
+    def test_snapshot_skips_unsafe_keys(self):
+        """Test that keys that are not shell identifiers are not exported"""
+        from src.config_loader import compile_config_snapshot
+
+        text = compile_config_snapshot({"bad-key": "x", "a;b": "y"})
+
+        assert "bad" not in text
+        assert "a;b" not in text
+
+    def test_snapshot_keeps_legacy_boolean_words(self):
+        """Test that "false", "no" and 0 still turn enabled and sound_enabled off"""
+        from src.config_loader import compile_config_snapshot
+
+        assert "WSL_TOAST_CFG_ENABLED=false" in compile_config_snapshot({"enabled": "false"})
+        assert "WSL_TOAST_CFG_ENABLED=false" in compile_config_snapshot({"enabled": "No"})
+        assert "WSL_TOAST_CFG_ENABLED=false" in compile_config_snapshot({"enabled": 0})
+        assert "WSL_TOAST_CFG_ENABLED=true" in compile_config_snapshot({"enabled": "yes"})
+        assert "WSL_TOAST_CFG_SOUND_ENABLED=false" in compile_config_snapshot({"sound_enabled": "0"})
+
+    def test_compile_command_warns_on_fallback(self, temp_config_dir, capsys):
+        """Test that values replaced by their defaults are reported on stderr"""
+        from src.config_loader import main
+
+        config_file = temp_config_dir / "config.json"
+        config_file.write_text('{"default_type": "Bogus", "enabled": "false"}', encoding="utf-8")
+
+        assert main(["compile", str(config_file)]) == 0
+        err = capsys.readouterr().err
+        assert "default_type must be one of" in err
+        assert "using the default 'Information'" in err
+        assert "enabled" not in err
+
+    def test_compile_command(self, temp_config_dir):
+        """Test python3 -m src.config_loader compile <config.json>"""
+        from src.config_loader import main
+
+        config_file = temp_config_dir / "config.json"
+        config_file.write_text('{"default_duration": "Long"}', encoding="utf-8")
+
+        assert main(["compile", str(config_file)]) == 0
+        snapshot = temp_config_dir / "config.sh"
+        assert self.source_value(snapshot, "WSL_TOAST_CFG_DEFAULT_DURATION") == "Long"
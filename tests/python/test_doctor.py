@@ -0,0 +1,166 @@
+# test_doctor.py
+# Python tests for wsl-toast doctor --bench
+#
+# Author: Claude Code TDD Implementation
+# Version: 1.0.0
+
+import json
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from src import doctor
+from src.doctor import bench, main, recommend, summarize
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+FAKE_POWERSHELL = """#!/bin/bash
+case "$*" in
+    *Get-Module*) echo '{MODULE}' ;;
+esac
+exit 0
+"""
+
+
+@pytest.fixture
+def fake_host(tmp_path, monkeypatch):
+    """PATH with fake powershell.exe and wslpath, and an empty home"""
+    def install(module_json='{"get_module_ms":120.5,"import_ms":300.25,"burnttoast":true}'):
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir(exist_ok=True)
+        for name, body in (
+            ("powershell.exe", FAKE_POWERSHELL.replace("{MODULE}", module_json)),
+            ("wslpath", "#!/bin/bash\necho 'C:\\\\fake'\n"),
+        ):
+            path = bin_dir / name
+            path.write_text(body)
+            path.chmod(0o755)
+        monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setenv("USER", "tester")
+        monkeypatch.setattr(doctor, "POWERSHELL_CANDIDATES", ("powershell.exe",))
+    return install
+
+
+class TestBench:
+    """Test suite for the measurements"""
+
+    def test_measures_every_step(self, fake_host):
+        """Test that each measurement is timed or parsed from the probe"""
+        fake_host()
+        results = bench(runs=2, real=False)
+
+        assert results["powershell_startup"]["runs"] == 2
+        assert results["get_module"]["median_ms"] == 120.5
+        assert results["burnttoast_import"]["median_ms"] == 300.25
+        for name in ("wslpath", "python_startup", "hook_import", "config_load", "template_load", "notify_mock"):
+            assert results[name]["median_ms"] >= 0, name
+        assert results["notify_real"] == {"skipped": "--no-toast"}
+
+    def test_missing_tools_are_skipped(self, tmp_path, monkeypatch):
+        """Test that steps needing PowerShell are skipped when it is unreachable"""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setenv("USER", "tester")
+        monkeypatch.setattr(doctor, "POWERSHELL_CANDIDATES", ("no-such-powershell.exe",))
+        results = bench(runs=1, real=True)
+
+        assert results["powershell_startup"] == {"skipped": "powershell.exe not found"}
+        assert results["burnttoast_import"] == {"skipped": "powershell.exe not found"}
+        assert results["notify_real"] == {"skipped": "powershell.exe not found"}
+        assert "median_ms" in results["notify_mock"]
+
+    def test_missing_burnttoast(self, fake_host):
+        """Test that a probe without BurntToast skips the import timing"""
+        fake_host('{"get_module_ms":80,"import_ms":null,"burnttoast":false}')
+        results = bench(runs=1, real=False)
+        assert results["burnttoast_import"] == {"skipped": "BurntToast not installed"}
+
+    def test_summarize(self):
+        """Test first, median and min of repeated timings"""
+        assert summarize([900.0, 100.0, 120.0]) == {
+            "first_ms": 900.0, "median_ms": 120.0, "min_ms": 100.0, "runs": 3
+        }
+
+
+class TestRecommend:
+    """Test suite for the recommended configuration"""
+
+    def _results(self, cold, warm, import_ms=None, wslpath=5.0):
+        results = {
+            "powershell_startup": {"first_ms": cold, "median_ms": warm, "min_ms": warm, "runs": 3},
+            "wslpath": {"median_ms": wslpath},
+        }
+        results["burnttoast_import"] = (
+            {"median_ms": import_ms} if import_ms is not None else {"skipped": "BurntToast not installed"}
+        )
+        return results
+
+    def test_slow_host_gets_resident_pool(self):
+        """Test that slow PowerShell and import recommend a resident pool"""
+        rec = recommend(self._results(1500, 600, import_ms=400), sessions=4)
+        assert rec["backend"] == "burnttoast"
+        assert rec["resident_server"] is True
+        # 4 sessions x 1000 ms per toast within one second
+        assert rec["pool_size"] == 4
+
+    def test_pool_size_scales_with_sessions(self):
+        """Test that the pool only grows as far as bursts need"""
+        rec = recommend(self._results(800, 300, import_ms=250), sessions=8)
+        assert rec["resident_server"] is True
+        assert rec["pool_size"] == 5
+
+    def test_fast_host_spawns_per_toast(self):
+        """Test that cheap PowerShell needs no resident server"""
+        rec = recommend(self._results(300, 150, import_ms=100))
+        assert rec["resident_server"] is False
+        assert rec["pool_size"] == 0
+
+    def test_balloon_fallback_without_burnttoast(self):
+        """Test the fallback backend and install hint"""
+        rec = recommend(self._results(400, 200))
+        assert rec["backend"] == "balloon"
+        assert any("Install-Module BurntToast" in reason for reason in rec["reasons"])
+
+    def test_no_powershell(self):
+        """Test the recommendation when PowerShell is unreachable"""
+        rec = recommend({"powershell_startup": {"skipped": "powershell.exe not found"}})
+        assert rec == {"backend": "none", "resident_server": False, "pool_size": 0,
+                       "sessions": 4, "reasons": rec["reasons"]}
+
+    def test_slow_wslpath(self):
+        """Test the hint for slow wslpath"""
+        rec = recommend(self._results(300, 150, import_ms=100, wslpath=45.0))
+        assert any("WSL_TOAST_PS_SCRIPT_DIR" in reason for reason in rec["reasons"])
+
+
+class TestCommandLine:
+    """Test suite for the doctor command"""
+
+    def test_bench_json(self, fake_host, capsys):
+        """Test the JSON report"""
+        fake_host()
+        assert main(["--bench", "--runs", "1", "--no-toast", "--json"]) == 0
+        report = json.loads(capsys.readouterr().out)
+        assert report["recommendation"]["backend"] == "burnttoast"
+        assert "notify_mock" in report["results"]
+
+    def test_bench_text(self, fake_host, capsys):
+        """Test the text report"""
+        fake_host()
+        main(["--bench", "--runs", "1", "--no-toast"])
+        out = capsys.readouterr().out
+        assert "powershell_startup" in out
+        assert "skipped: --no-toast" in out
+        assert "Recommended configuration:" in out
+
+    def test_notify_doctor_subcommand(self, tmp_path):
+        """Test that notify.sh doctor runs the checks"""
+        env = dict(os.environ, HOME=str(tmp_path), USER="tester")
+        result = subprocess.run(
+            ["bash", str(PROJECT_ROOT / "scripts" / "notify.sh"), "doctor", "--help"],
+            capture_output=True, text=True, env=env, timeout=30,
+        )
+        assert result.returncode == 0
+        assert "--bench" in result.stdout
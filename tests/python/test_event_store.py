@@ -0,0 +1,186 @@
+# test_event_store.py
+# Python tests for the SQLite event store and its queries
+#
+# Author: Claude Code TDD Implementation
+# Version: 1.0.0
+
+import gzip
+import json
+import time
+
+from src.event_queries import delivery_latency, noisy_tools, toasts_per_session
+from src.event_store import Compactor, EventStore, main, open_store, sync_store
+
+
+def _record(i, event="Stop", session="s1", decision="delivered", deliver_ms=10.0, **fields):
+    """Build an events.jsonl record"""
+    record = {
+        "ts": 1_700_000_000 + i, "event": event, "pid": 1000 + i, "session": session,
+        "decision": decision, "stages_ms": {"deliver": deliver_ms} if deliver_ms else {},
+        "total_ms": (deliver_ms or 0) + 5,
+        "sample_rate": 1.0,
+    }
+    record.update(fields)
+    return json.dumps(record) + "\n"
+
+
+def _append(log_dir, *lines):
+    """Append lines to events.jsonl"""
+    log_dir.mkdir(parents=True, exist_ok=True)
+    with open(log_dir / "events.jsonl", "a", encoding="utf-8") as f:
+        f.write("".join(lines))
+
+
+class TestEventStore:
+    """Test suite for EventStore"""
+
+    def test_wal_mode_and_indexes(self, tmp_path):
+        """Test the journal mode and that queries by session and event use indexes"""
+        with EventStore(tmp_path / "events.db", tmp_path / "logs") as store:
+            assert store.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            for sql in (
+                "SELECT * FROM events WHERE session_id = 's1' AND ts > 0",
+                "SELECT * FROM events WHERE event = 'Stop' AND ts > 0",
+            ):
+                plan = " ".join(row[-1] for row in store.conn.execute("EXPLAIN QUERY PLAN " + sql))
+                assert "USING INDEX" in plan
+
+    def test_ingest_is_batched_and_incremental(self, tmp_path):
+        """Test that only complete, new journal lines are inserted"""
+        logs = tmp_path / "logs"
+        _append(logs, *[_record(i) for i in range(5)])
+        with open(logs / "events.jsonl", "a", encoding="utf-8") as f:
+            f.write('{"ts": 1, "event": "St')
+        store = EventStore(tmp_path / "events.db", logs, batch_size=2)
+
+        assert store.ingest() == 5
+        assert store.ingest() == 0
+        with open(logs / "events.jsonl", "a", encoding="utf-8") as f:
+            f.write('op", "pid": 7}\n' + _record(5))
+
+        assert store.ingest() == 2
+        assert store.conn.execute("SELECT COUNT(*) FROM events").fetchone()[0] == 7
+
+    def test_ingest_reads_rotated_journal(self, tmp_path):
+        """Test that records rotated into events.jsonl.1.gz are not lost"""
+        logs = tmp_path / "logs"
+        _append(logs, _record(0))
+        store = EventStore(tmp_path / "events.db", logs)
+        store.ingest()
+        _append(logs, _record(1))
+        with open(logs / "events.jsonl", "rb") as src:
+            (logs / "events.jsonl.1.gz").write_bytes(gzip.compress(src.read()))
+        (logs / "events.jsonl").unlink()
+        _append(logs, _record(2))
+
+        assert store.ingest() == 2
+        assert store.conn.execute("SELECT COUNT(*) FROM events").fetchone()[0] == 3
+
+    def test_prune_by_retention(self, tmp_path):
+        """Test that rows older than the retention period are deleted"""
+        logs = tmp_path / "logs"
+        now = time.time()
+        _append(logs, _record(0, ts=now - 10 * 86400), _record(1, ts=now))
+        store = EventStore(tmp_path / "events.db", logs, retention_days=7)
+        store.ingest()
+
+        assert store.prune(now) == 1
+        assert store.conn.execute("SELECT COUNT(*) FROM events").fetchone()[0] == 1
+
+    def test_compactor_runs_in_background(self, tmp_path):
+        """Test that the compaction task ingests until stopped"""
+        logs = tmp_path / "logs"
+        _append(logs, _record(0))
+        store = EventStore(tmp_path / "events.db", logs, retention_days=0)
+        compactor = Compactor(store, interval=60)
+        compactor.start()
+        compactor.stop()
+
+        assert compactor.passes == 1
+        assert store.conn.execute("SELECT COUNT(*) FROM events").fetchone()[0] == 1
+
+    def test_sync_store_is_opt_in(self, tmp_path):
+        """Test that nothing is stored unless event_store_enabled is set"""
+        _append(tmp_path / "logs", _record(0))
+
+        assert sync_store(tmp_path, {}) == 0
+        assert not (tmp_path / "events.db").exists()
+        assert sync_store(tmp_path, {"event_store_enabled": True, "event_store_retention_days": 0}) == 1
+
+
+    def test_open_store_ingests_first(self, tmp_path):
+        """Test that queries see events logged since the last sync"""
+        logs = tmp_path / "logs"
+        _append(logs, _record(1, session="a"))
+        sync_store(tmp_path, {"event_store_enabled": True, "event_store_retention_days": 0})
+        _append(logs, _record(2, session="b"))
+
+        with open_store(tmp_path, {}) as store:
+            sessions = {r["session_id"] for r in toasts_per_session(store.conn)}
+
+        assert sessions == {"a", "b"}
+
+    def test_report_cli_ingests(self, tmp_path, capsys):
+        """Test that --report ingests the journal and prints every query"""
+        _append(tmp_path / "logs", _record(1, session="a"),
+                _record(2, event="PostToolUse", session="a", tool="Bash", outcome="failure"))
+
+        assert main(["--state-dir", str(tmp_path), "--report"]) == 0
+
+        result = json.loads(capsys.readouterr().out)
+        assert result["toasts_per_session"][0]["session_id"] == "a"
+        assert result["delivery_latency_p95"]["Stop"] == 10.0
+        assert result["noisy_tools"] == [{"tool": "Bash", "invocations": 1, "toasts": 1, "failures": 1}]
+
+
+class TestQueries:
+    """Test suite for event_queries"""
+
+    def _store(self, tmp_path):
+        logs = tmp_path / "logs"
+        lines = [_record(i, session="a", deliver_ms=float(i + 1)) for i in range(20)]
+        lines += [_record(100, session="b", event="Notification", deliver_ms=50.0)]
+        lines += [
+            _record(200 + i, event="PostToolUse", session="b", decision="filtered",
+                    deliver_ms=None, tool="Read", sample_rate=0.01)
+            for i in range(3)
+        ]
+        lines += [_record(300, event="PostToolUse", session="b", tool="Bash", outcome="failure")]
+        _append(logs, *lines)
+        store = EventStore(tmp_path / "events.db", logs)
+        store.ingest()
+        return store
+
+    def test_toasts_per_session(self, tmp_path):
+        """Test delivered toast counts per session"""
+        store = self._store(tmp_path)
+
+        result = toasts_per_session(store.conn)
+
+        assert [(r["session_id"], r["toasts"]) for r in result] == [("a", 20), ("b", 2)]
+        assert toasts_per_session(store.conn, since=1_700_000_100)[0]["session_id"] == "b"
+
+    def test_delivery_latency(self, tmp_path):
+        """Test the nearest-rank p95 per event"""
+        store = self._store(tmp_path)
+
+        assert delivery_latency(store.conn, 95) == {"Stop": 19.0, "Notification": 50.0, "PostToolUse": 10.0}
+        assert delivery_latency(store.conn, 50)["Stop"] == 10.0
+
+    def test_noisy_tools_weighted_by_sample_rate(self, tmp_path):
+        """Test that sampled invocations count as 1 / sample_rate"""
+        store = self._store(tmp_path)
+
+        assert noisy_tools(store.conn) == [
+            {"tool": "Read", "invocations": 300, "toasts": 0, "failures": 0},
+            {"tool": "Bash", "invocations": 1, "toasts": 1, "failures": 1},
+        ]
+
+    def test_noisy_tools_zero_sample_rate(self, tmp_path):
+        """Test that rows with sample_rate 0 count once instead of breaking the totals"""
+        logs = tmp_path / "logs"
+        _append(logs, _record(1, event="PostToolUse", tool="Bash", outcome="failure", sample_rate=0))
+        store = EventStore(tmp_path / "events.db", logs)
+        store.ingest()
+
+        assert noisy_tools(store.conn) == [{"tool": "Bash", "invocations": 1, "toasts": 1, "failures": 1}]
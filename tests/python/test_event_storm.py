@@ -0,0 +1,52 @@
+# test_event_storm.py
+# Python tests for the event storm load generator
+#
+# Author: Claude Code TDD Implementation
+# Version: 1.0.0
+
+import json
+import random
+
+import pytest
+
+from benchmarks.event_storm import format_report, make_payload, parse_mix, run
+
+
+class TestMix:
+    """Test suite for event mixes and payloads"""
+
+    def test_parse_mix(self):
+        """Test Event=weight pairs"""
+        assert parse_mix("PostToolUse=90, Stop=10") == {"PostToolUse": 90.0, "Stop": 10.0}
+        with pytest.raises(ValueError):
+            parse_mix("Stop=0")
+        with pytest.raises(ValueError):
+            parse_mix("Stop")
+
+    def test_post_tool_use_payload(self, tmp_path):
+        """Test that PostToolUse payloads carry a tool and a structured response"""
+        payload = json.loads(make_payload("PostToolUse", "s1", tmp_path / "t.jsonl", random.Random(3)))
+        assert payload["session_id"] == "s1"
+        assert payload["tool_name"]
+        assert payload["tool_response"]["exit_code"] in (0, 1)
+
+
+class TestStorm:
+    """Test suite for a short storm"""
+
+    def test_reports_throughput_latency_and_spawns(self):
+        """Test that every sent event is timed and toasts reach the stand-in"""
+        report = run(sessions=2, rate=240, duration=1.0, mix={"Notification": 1}, startup_ms=0)
+
+        sent = report["events"]["Notification"]
+        assert sent >= 2
+        assert report["dropped"] == {}
+        assert report["windows_processes"] == sent
+        assert report["achieved_per_second"] > 0
+        assert report["latency_ms"]["*"]["p50"] > 0
+        assert "Notification" in format_report(report)
+
+    def test_timeouts_count_as_dropped(self):
+        """Test that hooks slower than the timeout are dropped"""
+        report = run(sessions=1, rate=60, duration=0.5, mix={"Notification": 1}, startup_ms=2000, timeout=0.5)
+        assert report["dropped"] == {"Notification": report["events"]["Notification"]}
@@ -0,0 +1,88 @@
+# test_events.py
+# Python tests for the structured event log
+#
+# Author: Claude Code TDD Implementation
+# Version: 1.0.0
+
+import json
+
+from src.events import (
+    DELIVERED,
+    ERROR,
+    EventRecorder,
+    get_sample_rate,
+    validate_event_config,
+)
+
+
+def _records(log_dir):
+    """Read events.jsonl as a list of records"""
+    path = log_dir / "events.jsonl"
+    if not path.exists():
+        return []
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+class TestEventRecorder:
+    """Test suite for EventRecorder"""
+
+    def test_record_fields_and_stages(self, tmp_path):
+        """Test that a record carries fields, stage timings and its rate"""
+        recorder = EventRecorder("Stop", tmp_path, {})
+        recorder.set(session="s1", decision=DELIVERED, tool=None)
+        recorder.add_stage("read", 0.0015)
+        with recorder.stage("handler"):
+            pass
+
+        record = recorder.finish(sample=0.5)
+
+        assert _records(tmp_path) == [record]
+        assert record["session"] == "s1"
+        assert "tool" not in record
+        assert record["stages_ms"]["read"] == 1.5
+        assert set(record["stages_ms"]) == {"read", "handler"}
+        assert record["sample_rate"] == 1.0
+
+    def test_sampling_per_event(self, tmp_path):
+        """Test that PostToolUse is sampled at its own rate"""
+        config = {"event_log_sample_rates": {"PostToolUse": 0.25}}
+
+        assert EventRecorder("PostToolUse", tmp_path, config).finish(sample=0.3) is None
+        kept = EventRecorder("PostToolUse", tmp_path, config).finish(sample=0.2)
+
+        assert kept["sample_rate"] == 0.25
+        assert len(_records(tmp_path)) == 1
+
+    def test_errors_are_always_kept(self, tmp_path):
+        """Test that error records bypass sampling"""
+        config = {"event_log_sample_rates": {"*": 0.0}}
+        recorder = EventRecorder("Stop", tmp_path, config)
+        recorder.set(decision=ERROR, error="OSError")
+
+        assert recorder.finish(sample=0.99)["sample_rate"] == 1.0
+        assert EventRecorder("Stop", tmp_path, config).finish(sample=0.0) is None
+
+    def test_disabled(self, tmp_path):
+        """Test that event_log_enabled false writes nothing"""
+        assert EventRecorder("Stop", tmp_path, {"event_log_enabled": False}).finish() is None
+        assert not (tmp_path / "events.jsonl").exists()
+
+
+class TestHelpers:
+    """Test suite for rate lookup and validation"""
+
+    def test_get_sample_rate(self):
+        """Test default, wildcard and clamped rates"""
+        assert get_sample_rate({}, "Stop") == 1.0
+        assert get_sample_rate({}, "PostToolUse") == 0.01
+        assert get_sample_rate({"event_log_sample_rates": {"*": 0.5}}, "Stop") == 0.5
+        assert get_sample_rate({"event_log_sample_rates": {"Stop": "x"}}, "Stop") == 1.0
+
+    def test_validate_event_config(self):
+        """Test validation of the event_log_* keys"""
+        assert validate_event_config({"event_log_enabled": True, "event_log_sample_rates": {"*": 0}}) == []
+        assert validate_event_config({"event_log_enabled": "yes"}) != []
+        assert validate_event_config({"event_log_sample_rates": {"Stop": 2}}) != []
+        assert validate_event_config({"event_log_sample_rates": [1]}) != []
+        assert validate_event_config({"event_store_enabled": True, "event_store_retention_days": 0}) == []
+        assert validate_event_config({"event_store_retention_days": -1}) != []
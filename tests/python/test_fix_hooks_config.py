@@ -0,0 +1,257 @@
+# test_fix_hooks_config.py
+# Python tests for the fix_hooks_config.py fleet scan
+#
+# Author: Claude Code TDD Implementation
+# Version: 1.0.0
+
+import io
+import json
+
+import pytest
+
+
+def _command_hook(command):
+    """Build a settings.json hook entry running one command"""
+    return {"hooks": [{"type": "command", "command": command}]}
+
+
+def _write(path, hooks):
+    """Write a settings file with the given hooks object"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"hooks": hooks}), encoding="utf-8")
+
+
+@pytest.fixture
+def fleet(tmp_path):
+    """Create a user settings file and a tree of projects"""
+    user = tmp_path / "home" / ".claude" / "settings.json"
+    _write(user, {"Stop": [_command_hook("$HOME/.claude/hooks/wsl-toast/Stop.sh")]})
+
+    root = tmp_path / "mono"
+    _write(root / "app" / ".claude" / "settings.json", {
+        "Stop": [_command_hook("$CLAUDE_PROJECT_DIR/hooks/Stop.sh")],
+        "SessionStart": [{"type": "command", "command": "start.sh"}],
+    })
+    _write(root / "app" / ".claude" / "settings.local.json", {
+        "Stop": [_command_hook("$CLAUDE_PROJECT_DIR/hooks/Stop.sh")],
+    })
+    _write(root / "lib" / "core" / ".claude" / "settings.json", {
+        "PreToolUse": [{"matcher": "Bash", **_command_hook("lint.sh")}],
+    })
+    _write(root / "node_modules" / "pkg" / ".claude" / "settings.json", {
+        "Stop": [_command_hook("Stop.sh"), _command_hook("Stop.sh")],
+    })
+    return user, root
+
+
+class TestHookIdentity:
+    """Test suite for hook_identity"""
+
+    def test_wsl_toast_hooks_match_by_script(self):
+        """Test that our hooks are the same hook wherever they are installed"""
+        from fix_hooks_config import hook_identity
+
+        assert hook_identity("$HOME/.claude/hooks/wsl-toast/Stop.sh") == hook_identity(
+            '"$CLAUDE_PROJECT_DIR"/hooks/Stop.sh'
+        )
+        assert hook_identity("bash ~/.claude/hooks/wsl-toast/Stop.sh") == "wsl-toast:Stop.sh"
+
+    def test_same_name_elsewhere_is_not_ours(self):
+        """Test that a third-party script called Stop.sh keeps its own identity"""
+        from fix_hooks_config import hook_identity
+
+        lint = "python3 $CLAUDE_PROJECT_DIR/.claude/hooks/lint/Stop.sh --run-tests"
+        assert hook_identity(lint) != hook_identity("$HOME/.claude/hooks/wsl-toast/Stop.sh")
+        assert hook_identity(lint) != hook_identity(lint.replace(" --run-tests", ""))
+        assert hook_identity("bash ~/hooks/Stop.sh") != "wsl-toast:Stop.sh"
+
+    def test_other_commands_match_by_text(self):
+        """Test that unrelated commands are compared by normalized text"""
+        from fix_hooks_config import hook_identity
+
+        assert hook_identity("~/bin/lint.sh  --fast") == hook_identity("$HOME/bin/lint.sh --fast")
+        assert hook_identity("lint.sh") != hook_identity("format.sh")
+
+
+class TestFleetScan:
+    """Test suite for --scan"""
+
+    def test_find_settings_dirs_skips_vendored_trees(self, fleet):
+        """Test that node_modules and hidden directories are not scanned"""
+        from fix_hooks_config import find_settings_dirs
+
+        _, root = fleet
+        found = find_settings_dirs(root, workers=4)
+
+        assert [p.parent.name for p in found] == ["app", "core"]
+
+    def test_reports_duplicates_and_legacy(self, fleet):
+        """Test finding user-level, cross-file and legacy entries"""
+        from fix_hooks_config import scan_project, load_hooks
+
+        user, root = fleet
+        user_hooks = load_hooks(user)[0]["hooks"]
+        report = scan_project(root / "app" / ".claude", user_hooks, str(user))
+
+        assert report["duplicates"] == 2
+        assert report["legacy"] == 1
+        assert report["before"] == {"Stop": 3, "SessionStart": 1}
+        assert report["after"] == {"Stop": 1, "SessionStart": 1}
+        assert report["fixed"] is False
+
+    def test_report_only_leaves_files_unchanged(self, fleet):
+        """Test that scanning without --fix does not write"""
+        from fix_hooks_config import scan
+
+        user, root = fleet
+        settings = root / "app" / ".claude" / "settings.json"
+        original = settings.read_text(encoding="utf-8")
+        out = io.StringIO()
+
+        assert scan(root, user, fix=False, workers=4, out=out) == 1
+        assert settings.read_text(encoding="utf-8") == original
+        assert "Invocations per event: SessionStart=1 Stop=3" in out.getvalue()
+
+    def test_fix_removes_duplicates(self, fleet):
+        """Test that --fix rewrites duplicates and legacy entries"""
+        from fix_hooks_config import scan
+
+        user, root = fleet
+        scan(root, user, fix=True, workers=4, out=io.StringIO())
+
+        hooks = json.loads((root / "app" / ".claude" / "settings.json").read_text(encoding="utf-8"))["hooks"]
+        local = json.loads((root / "app" / ".claude" / "settings.local.json").read_text(encoding="utf-8"))["hooks"]
+        assert "Stop" not in hooks
+        assert hooks["SessionStart"] == [{"hooks": [{"type": "command", "command": "start.sh"}]}]
+        assert local == {}
+        assert scan(root, user, workers=4, out=io.StringIO()) == 0
+
+    def test_duplicates_within_one_entry(self, tmp_path):
+        """Test that the same command twice in one list is reported"""
+        from fix_hooks_config import scan_project
+
+        claude_dir = tmp_path / "proj" / ".claude"
+        _write(claude_dir / "settings.json", {
+            "Notification": [{"hooks": [
+                {"type": "command", "command": "notify.sh"},
+                {"type": "command", "command": "notify.sh"},
+            ]}],
+        })
+
+        report = scan_project(claude_dir, {}, "(no user settings)")
+
+        assert report["duplicates"] == 1
+        assert report["after"] == {"Notification": 1}
+
+    def test_distinct_matchers_are_not_duplicates(self, tmp_path):
+        """Test that one script under two different matchers is kept twice"""
+        from fix_hooks_config import scan_project
+
+        claude_dir = tmp_path / "proj" / ".claude"
+        hooks = {"PostToolUse": [
+            {"matcher": "Bash", **_command_hook("$CLAUDE_PROJECT_DIR/hooks/PostToolUse.sh")},
+            {"matcher": "Edit", **_command_hook("$CLAUDE_PROJECT_DIR/hooks/PostToolUse.sh")},
+        ]}
+        _write(claude_dir / "settings.json", hooks)
+
+        report = scan_project(claude_dir, {}, "(no user settings)", fix=True)
+
+        assert report["files"] == {}
+        assert report["fixed"] is False
+        assert json.loads((claude_dir / "settings.json").read_text(encoding="utf-8"))["hooks"] == hooks
+
+    def test_catch_all_matcher_covers_narrow_one(self, tmp_path):
+        """Test that a hook already registered for every tool is a duplicate"""
+        from fix_hooks_config import scan_project
+
+        claude_dir = tmp_path / "proj" / ".claude"
+        _write(claude_dir / "settings.json", {"PostToolUse": [
+            {"matcher": "Bash", **_command_hook("$CLAUDE_PROJECT_DIR/hooks/PostToolUse.sh")},
+        ]})
+        user_hooks = {"PostToolUse": [_command_hook("$HOME/.claude/hooks/wsl-toast/PostToolUse.sh")]}
+
+        report = scan_project(claude_dir, user_hooks, "user")
+
+        assert report["duplicates"] == 1
+
+    def test_invocations_are_weighted_by_matcher(self, tmp_path):
+        """Test that narrowing a catch-all matcher lowers the invocation estimate"""
+        from fix_hooks_config import count_invocations, scan_project
+
+        assert count_invocations([{"PostToolUse": [
+            {"matcher": ".*", **_command_hook("a.sh")},
+            {"matcher": "^(Bash)$", **_command_hook("b.sh")},
+        ], "Stop": [{"matcher": "^(Bash)$", **_command_hook("c.sh")}]}]) == {"PostToolUse": 1.14, "Stop": 1}
+
+        claude_dir = tmp_path / "proj" / ".claude"
+        _write(claude_dir / "settings.json", {
+            "PostToolUse": [_command_hook("$CLAUDE_PROJECT_DIR/hooks/PostToolUse.sh")],
+        })
+        report = scan_project(claude_dir, {}, "(no user settings)", tool_matcher="^(Bash|Edit)$")
+
+        assert report["before"] == {"PostToolUse": 1}
+        assert report["after"] == {"PostToolUse": 0.29}
+        assert report["narrowed"] == 1
+        assert report["legacy"] == 0
+
+    def test_narrowed_matcher_is_not_reported(self, tmp_path):
+        """Test that a PostToolUse hook with a narrow matcher has no findings"""
+        from fix_hooks_config import scan_project
+
+        claude_dir = tmp_path / "proj" / ".claude"
+        _write(claude_dir / "settings.json", {
+            "PostToolUse": [{"matcher": "^(Bash)$", **_command_hook("$CLAUDE_PROJECT_DIR/hooks/PostToolUse.sh")}],
+        })
+
+        report = scan_project(claude_dir, {}, "(no user settings)", tool_matcher="^(Bash|Edit)$")
+
+        assert report["files"] == {}
+        assert report["legacy"] == 0 and report["narrowed"] == 0
+
+    def test_fix_keeps_third_party_hook_with_same_name(self, tmp_path):
+        """Test that --fix never removes another tool's Stop.sh as a duplicate"""
+        from fix_hooks_config import scan_project
+
+        claude_dir = tmp_path / "proj" / ".claude"
+        hooks = {"Stop": [_command_hook("python3 $CLAUDE_PROJECT_DIR/.claude/hooks/lint/Stop.sh --run-tests")]}
+        _write(claude_dir / "settings.json", hooks)
+        user_hooks = {"Stop": [_command_hook("$HOME/.claude/hooks/wsl-toast/Stop.sh")]}
+
+        report = scan_project(claude_dir, user_hooks, "user", fix=True)
+
+        assert report["duplicates"] == 0
+        assert json.loads((claude_dir / "settings.json").read_text(encoding="utf-8"))["hooks"] == hooks
+
+    def test_write_settings_replaces_file_atomically(self, tmp_path, monkeypatch):
+        """Test that a failed write leaves the original settings in place"""
+        import fix_hooks_config
+
+        settings = tmp_path / "settings.json"
+        settings.write_text('{"hooks": {}}\n', encoding="utf-8")
+        settings.chmod(0o600)
+
+        def fail(*args, **kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(fix_hooks_config.json, "dump", fail)
+        with pytest.raises(OSError):
+            fix_hooks_config.write_settings(settings, {"hooks": {"Stop": []}})
+        assert settings.read_text(encoding="utf-8") == '{"hooks": {}}\n'
+        assert [p.name for p in tmp_path.iterdir()] == ["settings.json"]
+
+        monkeypatch.undo()
+        fix_hooks_config.write_settings(settings, {"hooks": {"Stop": []}})
+        assert json.loads(settings.read_text(encoding="utf-8")) == {"hooks": {"Stop": []}}
+        assert settings.stat().st_mode & 0o777 == 0o600
+
+    def test_invalid_json_is_reported(self, tmp_path):
+        """Test that unreadable settings are reported, not fatal"""
+        from fix_hooks_config import scan
+
+        claude_dir = tmp_path / "proj" / ".claude"
+        claude_dir.mkdir(parents=True)
+        (claude_dir / "settings.json").write_text("{bad", encoding="utf-8")
+        out = io.StringIO()
+
+        assert scan(tmp_path, None, workers=2, out=out) == 0
+        assert "Invalid JSON" in out.getvalue()
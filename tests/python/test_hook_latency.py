@@ -0,0 +1,63 @@
+# test_hook_latency.py
+# Python tests for the end-to-end hook benchmark and its stand-in powershell.exe
+#
+# Author: Claude Code TDD Implementation
+# Version: 1.0.0
+
+import subprocess
+
+import pytest
+
+from benchmarks import fake_powershell, forkcount
+from benchmarks.hook_latency import format_table, run
+
+
+class TestFakePowerShell:
+    """Test suite for the stand-in powershell.exe"""
+
+    def test_records_args(self, tmp_path):
+        """Test that each invocation is logged with its arguments"""
+        bin_dir = fake_powershell.install(tmp_path / "bin")
+        calls_log = tmp_path / "calls.log"
+        env = fake_powershell.environment(bin_dir, tmp_path, calls_log, startup_ms=5)
+
+        result = subprocess.run(["powershell.exe", "-File", "C:\\x.ps1", "-Title", "안녕 world"],
+                                env=env, capture_output=True, text=True, check=True)
+
+        assert '"Success":true' in result.stdout
+        calls = fake_powershell.read_calls(calls_log)
+        assert [call["args"] for call in calls] == [["-File", "C:\\x.ps1", "-Title", "안녕 world"]]
+        assert calls[0]["ts"] > 0
+        assert fake_powershell.call_count(calls_log) == 1
+
+
+class TestHookLatency:
+    """Test suite for the hook benchmark"""
+
+    def test_measures_hooks(self):
+        """Test that each hook gets wall time, forks, RSS, log bytes and PowerShell calls"""
+        if not forkcount.is_supported():
+            pytest.skip("PID counting needs /proc/loadavg")
+
+        results = run(runs=1, startup_ms=0, only=["Stop", "PostToolUse"])
+
+        assert set(results) == {"Stop", "PostToolUse"}
+        stop = results["Stop"]
+        assert stop["wall_ms"] > 0
+        assert stop["forks"] >= 2
+        assert stop["maxrss_kib"] > 0
+        assert stop["logged_bytes"] > 0
+        assert stop["powershell_calls"] == 1
+        # The failing pytest run is toasted
+        assert results["PostToolUse"]["powershell_calls"] == 1
+
+    def test_table_with_baseline(self):
+        """Test the change columns against a saved run"""
+        results = {"Stop": {"wall_ms": 90.0, "forks": 12, "maxrss_kib": 100, "logged_bytes": 10,
+                            "powershell_calls": 1}}
+        baseline = {"Stop": {"wall_ms": 100.0, "forks": 14, "maxrss_kib": 100, "logged_bytes": 10,
+                             "powershell_calls": 1}}
+        table = format_table(results, baseline)
+        assert "90.0 (-10.0)" in table
+        assert "12 (-2)" in table
+        assert "(+" not in format_table(results).splitlines()[1]
@@ -0,0 +1,136 @@
+# test_hooklog.py
+# Python tests for the rotating hook log
+#
+# Author: Claude Code TDD Implementation
+# Version: 1.0.0
+
+import gzip
+import json
+import multiprocessing
+import os
+
+from src.hooklog import HookLog, truncate_fields, validate_log_config
+
+
+def _write(log, text):
+    """Log one record and flush it"""
+    log.log(text)
+    log.flush()
+
+
+class TestHookLog:
+    """Test suite for HookLog"""
+
+    def test_records_are_buffered_until_flush(self, tmp_path, monkeypatch):
+        """Test that an invocation's records reach disk in one write"""
+        log = HookLog(tmp_path / "hooks.log")
+        log.log("one\n")
+        log.log("two\n")
+        assert not (tmp_path / "hooks.log").exists()
+
+        writes = []
+        real_write = os.write
+        monkeypatch.setattr(os, "write", lambda fd, data: writes.append(bytes(data)) or real_write(fd, data))
+        log.flush()
+
+        assert writes == [b"one\ntwo\n"]
+
+    def test_rotates_by_size_with_gzip(self, tmp_path):
+        """Test that the log rotates before passing max_bytes"""
+        log = HookLog(tmp_path / "hooks.log", max_bytes=100, backups=2)
+        for i in range(10):
+            _write(log, f"record {i:02d} " + "x" * 40 + "\n")
+
+        assert (tmp_path / "hooks.log").stat().st_size <= 100
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "hooks.log", "hooks.log.1.gz", "hooks.log.2.gz", "hooks.log.lock"
+        ]
+        assert (tmp_path / "hooks.log").read_text(encoding="utf-8").startswith("record 09")
+        newest = gzip.decompress((tmp_path / "hooks.log.1.gz").read_bytes()).decode("utf-8")
+        assert newest.startswith("record 08")
+
+    def test_rotates_by_age(self, tmp_path):
+        """Test that a log started more than max_age ago is rotated"""
+        log = HookLog(tmp_path / "hooks.log", max_age_days=1, compress=False)
+        _write(log, "old\n")
+        os.utime(tmp_path / "hooks.log.lock", (0, 0))
+
+        _write(log, "new\n")
+
+        assert (tmp_path / "hooks.log").read_text(encoding="utf-8") == "new\n"
+        assert (tmp_path / "hooks.log.1").read_text(encoding="utf-8") == "old\n"
+
+    def test_levels(self, tmp_path):
+        """Test that hook_log_level filters records"""
+        log = HookLog(tmp_path / "hooks.log", level="error")
+        log.log("info\n")
+        log.log("error\n", level="error")
+        log.log_payload("Stop", '{"a": 1}', {"a": 1})
+        log.flush()
+
+        assert (tmp_path / "hooks.log").read_text(encoding="utf-8") == "error\n"
+
+        HookLog(tmp_path / "off.log", level="off").log("x\n", level="error")
+        assert not (tmp_path / "off.log").exists()
+
+    def test_payload_fields_are_truncated(self, tmp_path):
+        """Test that payload dumps cut long strings and keep one JSON line"""
+        log = HookLog(tmp_path / "hooks.log", level="debug", field_max=10)
+        payload = {"session_id": "s1", "transcript_path": "/home/dev/" + "p" * 100}
+        log.log_payload("Stop", json.dumps(payload, indent=2), payload)
+        log.flush()
+
+        marker, body = (tmp_path / "hooks.log").read_text(encoding="utf-8").splitlines()
+        assert marker.startswith("=== Stop Hook ")
+        assert json.loads(body) == {"session_id": "s1", "transcript_path": "/home/dev/…[+100 chars]"}
+
+    def test_payload_dumps_are_debug_records(self, tmp_path):
+        """Test that payloads are only dumped at debug level, raw with field_max 0"""
+        info = HookLog(tmp_path / "info.log")
+        info.log_payload("Stop", "{}", {})
+        info.flush()
+        log = HookLog(tmp_path / "hooks.log", level="debug", field_max=0)
+        raw = '{"transcript_path": "' + "p" * 100 + '"}'
+        log.log_payload("Stop", raw, json.loads(raw))
+        log.flush()
+
+        assert raw in (tmp_path / "hooks.log").read_text(encoding="utf-8")
+        assert not (tmp_path / "info.log").exists()
+
+    def test_concurrent_writers_never_interleave(self, tmp_path):
+        """Test many processes appending and rotating at once"""
+        ctx = multiprocessing.get_context("fork")
+        with ctx.Pool(8) as pool:
+            pool.starmap(_writer, [(str(tmp_path), i) for i in range(8)])
+
+        lines = []
+        for path in tmp_path.iterdir():
+            if path.name.startswith("hooks.log") and not path.name.endswith(".lock"):
+                lines += path.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 8 * 50
+        assert all(line.endswith("|end") and len(line) == 300 for line in lines)
+
+
+def _writer(directory, worker):
+    """Concurrency worker: 50 flushes with a tiny size cap and no compression"""
+    log = HookLog(os.path.join(directory, "hooks.log"), max_bytes=4096, backups=1000, compress=False)
+    for i in range(50):
+        record = f"w{worker}-{i}|".ljust(296, "x") + "|end"
+        _write(log, record + "\n")
+
+
+class TestHelpers:
+    """Test suite for truncation and validation helpers"""
+
+    def test_truncate_fields_nested(self):
+        """Test truncation inside nested dicts and lists"""
+        value = {"a": ["x" * 5, {"b": "y" * 5}], "n": 3}
+
+        assert truncate_fields(value, 2) == {"a": ["xx…[+3 chars]", {"b": "yy…[+3 chars]"}], "n": 3}
+
+    def test_validate_log_config(self):
+        """Test validation of the hook_log_* keys"""
+        assert validate_log_config({"hook_log_level": "debug", "hook_log_backups": 0}) == []
+        assert validate_log_config({"hook_log_level": "loud"}) != []
+        assert validate_log_config({"hook_log_max_bytes": 0}) != []
+        assert validate_log_config({"hook_log_compress": "yes"}) != []
@@ -0,0 +1,496 @@
+# test_hooks.py
+# Python tests for the single-process hook dispatcher
+#
+# Author: Claude Code TDD Implementation
+# Version: 1.0.0
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+
+@pytest.fixture
+def config_dir(tmp_path):
+    """Create an empty configuration directory"""
+    config_dir = tmp_path / ".wsl-toast"
+    config_dir.mkdir()
+    return config_dir
+
+
+@pytest.fixture
+def delivered(monkeypatch):
+    """Capture notify.sh argument lists instead of running notify.sh"""
+    from src import hooks
+
+    calls = []
+    monkeypatch.setattr(hooks, "run_notify", lambda args, profile=None: calls.append(args) or 0)
+    monkeypatch.setattr(hooks, "stop_spinner", lambda: None)
+    return calls
+
+
+@pytest.fixture
+def transcript(tmp_path):
+    """Create a transcript with two assistant messages"""
+    path = tmp_path / "transcript.jsonl"
+    entries = [
+        {"message": {"role": "user", "content": [{"type": "text", "text": "Hi"}]}},
+        {"message": {"role": "assistant", "content": [{"type": "text", "text": "First."}]}},
+        {"message": {"role": "assistant", "content": [
+            {"type": "thinking", "thinking": "hmm"},
+            {"type": "text", "text": "Refactored the loader. Tests pass."},
+        ]}},
+    ]
+    path.write_text("\n".join(json.dumps(e) for e in entries) + "\n", encoding="utf-8")
+    return path
+
+
+class TestHookRegistry:
+    """Test suite for the event handler table"""
+
+    def test_handlers_registered(self):
+        """Test that every hook event has a handler"""
+        from src.hooks import HANDLERS
+
+        for event in [
+            "Stop",
+            "Notification",
+            "PermissionRequest",
+            "PostToolUse",
+            "SessionStart",
+            "SessionEnd",
+        ]:
+            assert event in HANDLERS
+
+    def test_unknown_event_exits_with_usage(self, capsys):
+        """Test that an unknown event prints usage and exits 2"""
+        from src.hooks import main
+
+        assert main(["NoSuchEvent"]) == 2
+        assert "Usage" in capsys.readouterr().err
+
+
+class TestHookHandlers:
+    """Test suite for individual event handlers"""
+
+    def test_stop_uses_last_assistant_message(self, config_dir, delivered, transcript):
+        """Test that Stop toasts the first sentence of the last assistant message"""
+        from src.hooks import run_hook
+
+        payload = json.dumps({"session_id": "s1", "transcript_path": str(transcript)})
+        notification = run_hook("Stop", payload, str(config_dir))
+
+        assert notification["message"] == "Refactored the loader."
+        assert notification["type"] == "Success"
+        assert delivered[0][delivered[0].index("--session") + 1] == "s1"
+
+    def test_stop_logs_payload(self, config_dir, delivered):
+        """Test that Stop records the payload in hooks.log at debug level"""
+        from src.config_loader import clear_config_cache
+        from src.hooks import run_hook
+
+        (config_dir / "config.json").write_text('{"hook_log_level": "debug"}', encoding="utf-8")
+        clear_config_cache()
+
+        run_hook("Stop", '{"session_id": "s1"}', str(config_dir))
+
+        log = (config_dir / "logs" / "hooks.log").read_text(encoding="utf-8")
+        assert "=== Stop Hook" in log
+        assert '{"session_id": "s1"}' in log
+
+    def test_stop_writes_event_record(self, config_dir, delivered):
+        """Test that each invocation appends one structured record to events.jsonl"""
+        from src.hooks import run_hook
+
+        run_hook("Stop", '{"session_id": "s1"}', str(config_dir), stages={"read": 0.002})
+
+        lines = (config_dir / "logs" / "events.jsonl").read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 1
+        record = json.loads(lines[0])
+        assert record["event"] == "Stop"
+        assert record["session"] == "s1"
+        assert record["decision"] == "delivered"
+        assert record["type"] == "Success"
+        assert record["sample_rate"] == 1.0
+        assert set(record["stages_ms"]) == {"read", "context", "handler", "deliver"}
+        assert record["total_ms"] >= record["stages_ms"]["read"]
+        assert not (config_dir / "logs" / "hooks.log").exists()
+
+    def test_filtered_tool_is_recorded(self, config_dir, delivered):
+        """Test that a tool outside the matcher is recorded as filtered"""
+        from src.config_loader import clear_config_cache
+        from src.hooks import run_hook
+
+        (config_dir / "config.json").write_text(
+            '{"event_log_sample_rates": {"PostToolUse": 1.0}}', encoding="utf-8"
+        )
+        clear_config_cache()
+
+        assert run_hook("PostToolUse", '{"tool_name": "Read"}', str(config_dir)) is None
+
+        record = json.loads((config_dir / "logs" / "events.jsonl").read_text(encoding="utf-8"))
+        assert record["decision"] == "filtered"
+        assert record["tool"] == "Read"
+
+    def test_profile_breakdown_record(self, config_dir, tmp_path, monkeypatch):
+        """Test that WSL_TOAST_PROFILE=1 joins hook, notify.sh and PowerShell stages in one record"""
+        from src import hooks
+
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        fake = bin_dir / "powershell.exe"
+        fake.write_text(
+            "#!/usr/bin/env bash\n"
+            "echo '{\"Success\":true,\"DisplayMethod\":\"BurntToast\","
+            "\"Timing\":{\"TraceId\":\"t1\",\"StagesMs\":{\"startup\":180.0,\"import\":90.5,\"show\":12.0},"
+            "\"TotalMs\":110.0}}'\n",
+            encoding="utf-8",
+        )
+        fake.chmod(0o755)
+        monkeypatch.setenv("PATH", f"{bin_dir}:{os.environ['PATH']}")
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setenv("USER", "tester")
+        monkeypatch.setenv("WSL_TOAST_PROFILE", "1")
+        monkeypatch.setenv("WSL_TOAST_TRACE_ID", "t1")
+        monkeypatch.setenv("WSL_TOAST_TRACE", "1")
+        monkeypatch.delenv("MOCK_MODE", raising=False)
+        monkeypatch.setattr(hooks, "stop_spinner", lambda: None)
+
+        hooks.run_hook("PostToolUse", '{"tool_name": "Bash", "tool_response": {"is_error": true}}', str(config_dir))
+
+        record = json.loads((config_dir / "logs" / "events.jsonl").read_text(encoding="utf-8"))
+        assert record["trace_id"] == "t1"
+        assert record["sample_rate"] == 1.0
+        assert {"context", "handler", "deliver"} <= set(record["stages_ms"])
+        assert {"paths", "config", "build", "find_powershell", "powershell"} <= set(record["notify"]["stages_ms"])
+        assert record["notify"]["spawn_ms"] is not None
+        assert record["powershell"] == {
+            "method": "BurntToast",
+            "stages_ms": {"startup": 180.0, "import": 90.5, "show": 12.0},
+            "total_ms": 110.0,
+        }
+
+        request = json.loads((config_dir / "logs" / "traces.jsonl").read_text(encoding="utf-8"))
+        spans = {span["name"]: span for span in request["resourceSpans"][0]["scopeSpans"][0]["spans"]}
+        assert spans["windows.display"]["parentSpanId"] == spans["transport"]["spanId"]
+
+    def test_profile_disabled_by_default(self, config_dir, monkeypatch):
+        """Test that without WSL_TOAST_PROFILE no profile is requested"""
+        from src import hooks
+
+        profiles = []
+        monkeypatch.delenv("WSL_TOAST_PROFILE", raising=False)
+        monkeypatch.setattr(hooks, "run_notify", lambda args, profile=None: profiles.append(profile) or 0)
+        monkeypatch.setattr(hooks, "stop_spinner", lambda: None)
+
+        hooks.run_hook("Stop", "{}", str(config_dir))
+
+        assert profiles == [None]
+        record = json.loads((config_dir / "logs" / "events.jsonl").read_text(encoding="utf-8"))
+        assert "trace_id" not in record
+
+    def test_hook_spans(self, config_dir, delivered, monkeypatch):
+        """Test that a traced hook writes nested hook, parse, template and transport spans"""
+        from src.hooks import run_hook
+
+        monkeypatch.setenv("WSL_TOAST_TRACE", "1")
+
+        run_hook("Stop", '{"session_id": "s1"}', str(config_dir), stages={"read": 0.001})
+
+        request = json.loads((config_dir / "logs" / "traces.jsonl").read_text(encoding="utf-8"))
+        spans = {span["name"]: span for span in request["resourceSpans"][0]["scopeSpans"][0]["spans"]}
+        assert set(spans) == {"hook", "payload.parse", "template.render", "transport"}
+        root = spans["hook"]
+        assert "parentSpanId" not in root
+        assert all(spans[name]["parentSpanId"] == root["spanId"] for name in set(spans) - {"hook"})
+        attributes = {a["key"]: a["value"] for a in root["attributes"]}
+        assert attributes["session_id"] == {"stringValue": "s1"}
+        assert attributes["event"] == {"stringValue": "Stop"}
+        assert attributes["decision"] == {"stringValue": "delivered"}
+
+    def test_session_end_syncs_event_store(self, config_dir, delivered, monkeypatch):
+        """Test that SessionEnd copies the journal into the opt-in SQLite store, detached"""
+        import sqlite3
+        import subprocess
+
+        from src import hooks
+        from src.config_loader import clear_config_cache
+
+        popen = subprocess.Popen
+        spawned = []
+        monkeypatch.setattr(subprocess, "Popen", lambda args, **kwargs: spawned.append((args, kwargs)))
+
+        hooks.run_hook("Stop", '{"session_id": "s1"}', str(config_dir))
+        assert not spawned
+        (config_dir / "config.json").write_text('{"event_store_enabled": true}', encoding="utf-8")
+        clear_config_cache()
+
+        hooks.run_hook("SessionEnd", '{"session_id": "s1"}', str(config_dir))
+
+        # The hook itself never opens the database
+        assert not (config_dir / "events.db").exists()
+        (args, kwargs), = spawned
+        assert kwargs["start_new_session"] is True
+        monkeypatch.setattr(subprocess, "Popen", popen)
+        subprocess.run(args, cwd=kwargs["cwd"], check=True, stdout=subprocess.DEVNULL)
+
+        conn = sqlite3.connect(str(config_dir / "events.db"))
+        assert conn.execute("SELECT event FROM events ORDER BY id").fetchall() == [("Stop",), ("SessionEnd",)]
+
+    def test_stop_uses_language_template(self, config_dir, delivered):
+        """Test that Stop falls back to the configured language template"""
+        from src.config_loader import clear_config_cache
+        from src.hooks import run_hook
+
+        (config_dir / "config.json").write_text('{"language": "ko"}', encoding="utf-8")
+        clear_config_cache()
+
+        notification = run_hook("Stop", "{}", str(config_dir))
+
+        ko = json.loads(
+            (PROJECT_ROOT / "templates" / "notifications" / "ko.json").read_text(encoding="utf-8")
+        )
+        assert notification["title"] == ko["stop"]["title"]
+        assert notification["message"] == ko["stop"]["message"]
+
+    def test_notification_suppresses_idle_prompt(self, config_dir, delivered):
+        """Test that idle_prompt notifications are not delivered"""
+        from src.hooks import run_hook
+
+        payload = json.dumps({"notification_type": "idle_prompt", "message": "Waiting"})
+        assert run_hook("Notification", payload, str(config_dir)) is None
+        assert delivered == []
+
+    def test_notification_message(self, config_dir, delivered):
+        """Test that Notification uses the payload message"""
+        from src.hooks import run_hook
+
+        payload = json.dumps({"message": "Claude needs your permission to use Bash"})
+        notification = run_hook("Notification", payload, str(config_dir))
+
+        assert notification["message"] == "Claude needs your permission to use Bash"
+
+    def test_permission_request_detail(self, config_dir, delivered):
+        """Test that PermissionRequest extracts the tool input as detail"""
+        from src.hooks import run_hook
+
+        payload = json.dumps({"tool_name": "Bash", "tool_input": {"command": "rm -rf build"}})
+        notification = run_hook("PermissionRequest", payload, str(config_dir))
+
+        assert notification["message"] == "rm -rf build"
+        assert notification["type"] == "Warning"
+
+    def test_post_tool_use_failure(self, config_dir, delivered):
+        """Test that PostToolUse reports failures in the background"""
+        from src.hooks import run_hook
+
+        payload = json.dumps({"tool_name": "Bash", "tool_response": {"stderr": "Error: boom"}})
+        notification = run_hook("PostToolUse", payload, str(config_dir))
+
+        assert notification["type"] == "Error"
+        assert "--background" in delivered[0]
+
+    def test_post_tool_use_skips_denied_tool(self, config_dir, delivered):
+        """Test that denied tools are ignored even with a catch-all matcher"""
+        from src.hooks import run_hook
+
+        payload = json.dumps({"tool_name": "Read", "tool_response": {"content": "ok"}})
+
+        assert run_hook("PostToolUse", payload, str(config_dir)) is None
+        assert delivered == []
+
+    def test_post_tool_use_ignores_error_text_in_input(self, config_dir, delivered):
+        """Test that only the tool response decides failure"""
+        from src.hooks import run_hook
+
+        payload = json.dumps({
+            "tool_name": "Bash",
+            "tool_input": {"command": "grep -r error logs/"},
+            "tool_response": {"stdout": "no failures", "stderr": "", "is_error": False},
+        })
+        notification = run_hook("PostToolUse", payload, str(config_dir))
+
+        assert notification["type"] == "Success"
+
+    def test_post_tool_use_interrupted(self, config_dir, delivered):
+        """Test that an interrupted Bash command is a warning, not a failure"""
+        from src.hooks import run_hook
+
+        payload = json.dumps({"tool_name": "Bash", "tool_response": {"stdout": "", "interrupted": True}})
+        notification = run_hook("PostToolUse", payload, str(config_dir))
+
+        assert notification["type"] == "Warning"
+
+    def test_post_tool_use_streams_large_payload(self, monkeypatch):
+        """Test that main() reads only declared fields from a large stdin payload"""
+        import io
+
+        from src import hooks
+
+        payload = json.dumps({
+            "tool_name": "Bash",
+            "tool_input": {"command": "cat big.log"},
+            "tool_response": {"stdout": "x" * (4 * 1024 * 1024), "is_error": True},
+        }).encode("utf-8")
+        stdin = io.TextIOWrapper(io.BufferedReader(io.BytesIO(payload)))
+        calls = []
+        monkeypatch.setattr(sys, "stdin", stdin)
+        monkeypatch.setattr(hooks, "run_hook", lambda event, raw, payload=None, stages=None: calls.append((raw, payload)))
+
+        assert hooks.main(["PostToolUse"]) == 0
+
+        assert calls == [("", {"tool_name": "Bash", "tool_response": {"is_error": True}})]
+        assert stdin.buffer.read() == b""
+
+    def test_post_tool_use_streaming_keeps_session(self, config_dir, delivered, monkeypatch):
+        """Test that a streamed PostToolUse payload keeps its session id"""
+        import io
+
+        from src import hooks
+
+        payload = json.dumps({
+            "session_id": "s7",
+            "tool_name": "Bash",
+            "tool_response": {"stderr": "Error: boom"},
+        }).encode("utf-8")
+        monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BufferedReader(io.BytesIO(payload))))
+
+        raw, fields = hooks.read_stdin("PostToolUse", {})
+        assert raw == ""
+        assert fields["session_id"] == "s7"
+        assert hooks.HookContext("PostToolUse", raw, str(config_dir), payload=fields).session_id == "s7"
+
+        hooks.run_hook("PostToolUse", raw, str(config_dir), payload=fields)
+        assert delivered[0][delivered[0].index("--session") + 1] == "s7"
+
+    def test_payload_capture_is_opt_in(self, config_dir, delivered, monkeypatch):
+        """Test that raw payloads are only captured when enabled"""
+        from src.hooks import run_hook
+
+        monkeypatch.delenv("WSL_TOAST_CAPTURE_PAYLOADS", raising=False)
+        run_hook("Stop", '{"session_id": "s1"}', str(config_dir))
+
+        assert not (config_dir / "logs" / "payloads").exists()
+
+    def test_payload_capture_uses_one_file_per_invocation(self, config_dir, delivered, monkeypatch):
+        """Test that each invocation writes its own capture file"""
+        from src.hooks import run_hook
+
+        monkeypatch.setenv("WSL_TOAST_CAPTURE_PAYLOADS", "1")
+        for i in range(3):
+            run_hook("Stop", json.dumps({"session_id": f"s{i}"}), str(config_dir))
+
+        captures = sorted((config_dir / "logs" / "payloads").iterdir())
+        assert len(captures) == 3
+        assert sorted(json.loads(p.read_text(encoding="utf-8"))["session_id"] for p in captures) == [
+            "s0", "s1", "s2"
+        ]
+        assert all(p.stat().st_mode & 0o777 == 0o600 for p in captures)
+
+    def test_session_end_clears_session(self, config_dir, delivered):
+        """Test that SessionEnd clears the session and sends an untagged toast"""
+        from src.hooks import run_hook
+
+        run_hook("SessionEnd", '{"session_id": "s9"}', str(config_dir))
+
+        assert delivered[0][:3] == ["--clear-session", "--session", "s9"]
+        assert "--session" not in delivered[1]
+
+    def test_disabled_config_skips_delivery(self, config_dir, delivered):
+        """Test that enabled=false stops delivery without forking notify.sh"""
+        from src.config_loader import clear_config_cache
+        from src.hooks import run_hook
+
+        (config_dir / "config.json").write_text('{"enabled": false}', encoding="utf-8")
+        clear_config_cache()
+
+        assert run_hook("SessionStart", "{}", str(config_dir)) is None
+        assert delivered == []
+
+    def test_invalid_payload_is_tolerated(self, config_dir, delivered):
+        """Test that malformed JSON still produces a default notification"""
+        from src.hooks import run_hook
+
+        notification = run_hook("Stop", "{not json", str(config_dir))
+
+        assert notification["title"]
+
+
+class TestHookShims:
+    """Test suite for the hooks/*.sh shims"""
+
+    def test_shim_runs_dispatcher(self, tmp_path, transcript):
+        """Test that Stop.sh delivers through the dispatcher in one python3 process"""
+        record = tmp_path / "notify_args"
+        fake_notify = tmp_path / "notify.sh"
+        fake_notify.write_text(
+            f'#!/usr/bin/env bash\nprintf "%s\\n" "$@" > "{record}"\n', encoding="utf-8"
+        )
+        fake_notify.chmod(0o755)
+
+        env = dict(os.environ, HOME=str(tmp_path), WSL_TOAST_NOTIFY_SCRIPT=str(fake_notify))
+        payload = json.dumps({"session_id": "s1", "transcript_path": str(transcript)})
+        result = subprocess.run(
+            ["bash", str(PROJECT_ROOT / "hooks" / "Stop.sh")],
+            input=payload.encode("utf-8"),
+            env=env,
+            cwd=str(tmp_path),
+            capture_output=True,
+            timeout=30,
+        )
+
+        assert result.returncode == 0
+        args = record.read_text(encoding="utf-8").splitlines()
+        assert "Refactored the loader." in args
+
+    def test_concurrent_stop_hooks(self, tmp_path):
+        """Test that concurrent Stop hooks each deliver their own session's message"""
+        records = tmp_path / "records"
+        records.mkdir()
+        fake_notify = tmp_path / "notify.sh"
+        fake_notify.write_text(
+            f'#!/usr/bin/env bash\nprintf "%s\\n" "$@" > "$(mktemp "{records}/call.XXXXXX")"\n',
+            encoding="utf-8",
+        )
+        fake_notify.chmod(0o755)
+        env = dict(
+            os.environ,
+            HOME=str(tmp_path),
+            WSL_TOAST_NOTIFY_SCRIPT=str(fake_notify),
+            WSL_TOAST_CAPTURE_PAYLOADS="1",
+        )
+
+        sessions = {}
+        for i in range(8):
+            path = tmp_path / f"transcript{i}.jsonl"
+            path.write_text(json.dumps({"message": {"role": "assistant", "content": [
+                {"type": "text", "text": f"Session {i} done."},
+            ]}}) + "\n", encoding="utf-8")
+            sessions[f"s{i}"] = json.dumps({"session_id": f"s{i}", "transcript_path": str(path)})
+
+        procs = {
+            session: subprocess.Popen(
+                ["bash", str(PROJECT_ROOT / "hooks" / "Stop.sh")],
+                stdin=subprocess.PIPE,
+                env=env,
+                cwd=str(tmp_path),
+            )
+            for session in sessions
+        }
+        for session, proc in procs.items():
+            proc.communicate(sessions[session].encode("utf-8"), timeout=60)
+            assert proc.returncode == 0
+
+        delivered = {}
+        for record in records.iterdir():
+            args = record.read_text(encoding="utf-8").splitlines()
+            delivered[args[args.index("--session") + 1]] = args[args.index("--message") + 1]
+        assert delivered == {f"s{i}": f"Session {i} done." for i in range(8)}
+
+        captures = list((tmp_path / ".wsl-toast" / "logs" / "payloads").iterdir())
+        assert sorted(c.read_text(encoding="utf-8") for c in captures) == sorted(sessions.values())
@@ -0,0 +1,217 @@
+# test_install.py
+# Python tests for setup.sh hook rendering and the install manifest
+#
+# Author: Claude Code TDD Implementation
+# Version: 1.0.0
+
+import json
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from benchmarks import forkcount
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+
+@pytest.fixture
+def home(tmp_path):
+    """Create a HOME with a Korean config and a fake wslpath on PATH"""
+    home = tmp_path / "home"
+    (home / ".wsl-toast").mkdir(parents=True)
+    (home / ".wsl-toast" / "config.json").write_text('{"language": "ko"}', encoding="utf-8")
+
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    wslpath = bin_dir / "wslpath"
+    wslpath.write_text('#!/usr/bin/env bash\necho "C:\\\\fake\\\\windows"\n', encoding="utf-8")
+    wslpath.chmod(0o755)
+    return home
+
+
+def _env(home):
+    """Environment for running setup.sh and hooks against a fake HOME"""
+    path = f"{home.parent / 'bin'}{os.pathsep}{os.environ.get('PATH', '')}"
+    return dict(os.environ, HOME=str(home), PATH=path, USER="tester", MOCK_MODE="true")
+
+
+def install_hooks(home, force=True):
+    """Run install_hook_scripts from setup.sh and return the install directory"""
+    result = subprocess.run(
+        ["bash", "-c", f'source ./setup.sh; FORCE_OVERWRITE={str(force).lower()}; install_hook_scripts'],
+        cwd=str(PROJECT_ROOT),
+        env=_env(home),
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+    return home / ".claude" / "hooks" / "wsl-toast"
+
+
+class TestRenderedHooks:
+    """Test suite for the hook scripts rendered by setup.sh"""
+
+    def test_paths_and_language_are_baked(self, home):
+        """Test that rendered hooks carry absolute paths and the configured language"""
+        target = install_hooks(home)
+        script = (target / "Stop.sh").read_text(encoding="utf-8")
+
+        assert f"cd {target}" in script
+        assert f"export WSL_TOAST_NOTIFY_SCRIPT={target}/notify.sh" in script
+        assert f"export WSL_TOAST_TEMPLATES_DIR={target}/templates" in script
+        assert "export WSL_TOAST_LANGUAGE=ko" in script
+        assert "export WSL_TOAST_PS_SCRIPT_DIR=C:\\\\fake\\\\windows" in script
+        assert script.rstrip().endswith("-m src.hooks Stop")
+        assert "\nexec /" in script
+
+    def test_session_end_is_rendered(self, home):
+        """Test that SessionEnd.sh is installed as a dispatcher hook"""
+        target = install_hooks(home)
+        script = (target / "SessionEnd.sh").read_text(encoding="utf-8")
+
+        assert f"cd {target}" in script
+        assert script.rstrip().endswith("-m src.hooks SessionEnd")
+
+    def test_spinner_hooks_are_copied(self, home):
+        """Test that non-dispatcher hooks are installed unchanged"""
+        target = install_hooks(home)
+
+        assert (target / "UserPromptSubmit.sh").read_bytes() == (
+            PROJECT_ROOT / "hooks" / "UserPromptSubmit.sh"
+        ).read_bytes()
+
+    def test_unknown_language_falls_back_to_english(self, home):
+        """Test that a language without a template file is rendered as en"""
+        (home / ".wsl-toast" / "config.json").write_text('{"language": "xx"}', encoding="utf-8")
+        target = install_hooks(home)
+
+        assert "export WSL_TOAST_LANGUAGE=en" in (target / "Stop.sh").read_text(encoding="utf-8")
+
+    def test_rendered_hook_runs(self, home):
+        """Test that a rendered hook runs the dispatcher from any directory"""
+        target = install_hooks(home)
+        result = subprocess.run(
+            ["bash", str(target / "Stop.sh")],
+            input=b"{}",
+            cwd=str(home),
+            env=_env(home),
+            capture_output=True,
+            timeout=30,
+        )
+
+        assert result.returncode == 0
+        record = json.loads((home / ".wsl-toast" / "logs" / "events.jsonl").read_text(encoding="utf-8"))
+        assert record["event"] == "Stop"
+
+    def test_rendered_hook_forks_less(self, home):
+        """Test that a rendered hook spawns fewer processes than the generic shim"""
+        if not forkcount.is_supported():
+            pytest.skip("PID counting needs /proc/loadavg")
+
+        target = install_hooks(home)
+        generic = target / "Stop.generic.sh"
+        generic.write_bytes((PROJECT_ROOT / "hooks" / "Stop.sh").read_bytes())
+
+        env = _env(home)
+        generic_forks = forkcount.count_forks(["bash", str(generic)], env=env, stdin=b"{}", runs=5)
+        rendered_forks = forkcount.count_forks(
+            ["bash", str(target / "Stop.sh")], env=env, stdin=b"{}", runs=5
+        )
+
+        assert rendered_forks < generic_forks
+
+
+class TestClaudeSettings:
+    """Test suite for the hooks setup.sh registers in Claude Code's settings.json"""
+
+    def test_session_end_is_registered(self, home):
+        """Test that the default answers register SessionEnd and keep it on re-runs"""
+        settings = home / ".claude" / "settings.json"
+        for _ in range(2):
+            result = subprocess.run(
+                ["bash", "-c", "source ./setup.sh; FORCE_OVERWRITE=true; "
+                 'CLAUDE_SETTINGS_FILE="$HOME/.claude/settings.json"; configure_claude_hooks'],
+                cwd=str(PROJECT_ROOT),
+                env=_env(home),
+                stdin=subprocess.DEVNULL,
+                capture_output=True,
+                text=True,
+                timeout=60,
+            )
+            assert result.returncode == 0, result.stderr
+
+            hooks = json.loads(settings.read_text(encoding="utf-8"))["hooks"]
+            assert [h["command"] for h in hooks["SessionEnd"][0]["hooks"]] == [
+                "$HOME/.claude/hooks/wsl-toast/SessionEnd.sh"
+            ]
+            assert "matcher" not in hooks["SessionEnd"][0]
+
+
+class TestInstallManifest:
+    """Test suite for manifest.json drift detection"""
+
+    def test_manifest_records_installed_files(self, home):
+        """Test that setup.sh records a hash for every installed file"""
+        target = install_hooks(home)
+        manifest = json.loads((target / "manifest.json").read_text(encoding="utf-8"))
+
+        assert manifest["metadata"]["language"] == "ko"
+        assert "Stop.sh" in manifest["files"]
+        assert "src/hooks.py" in manifest["files"]
+        assert not any(name.endswith(".tmp") for name in manifest["files"])
+
+    def test_check_reports_modified_files(self, home):
+        """Test that edits after installation are reported as drift"""
+        from src.manifest import check_drift, load_manifest
+
+        target = install_hooks(home)
+        with open(target / "Stop.sh", "a", encoding="utf-8") as f:
+            f.write("# local edit\n")
+        (target / "templates" / "en.json").unlink()
+
+        drift = check_drift(target, load_manifest(target))
+
+        assert drift == {"modified": ["Stop.sh"], "missing": ["templates/en.json"]}
+
+    def test_check_reports_language_change(self, home):
+        """Test that changing the configured language is reported by check"""
+        from src.manifest import main
+
+        target = install_hooks(home)
+        config_file = home / ".wsl-toast" / "config.json"
+        config_file.write_text('{"language": "ja"}', encoding="utf-8")
+
+        assert main(["check", str(target), "--config", str(config_file)]) == 1
+
+    def test_rerun_without_force_keeps_modified_files(self, home):
+        """Test that a re-run declining the prompt leaves edited hooks alone"""
+        target = install_hooks(home)
+        with open(target / "Stop.sh", "a", encoding="utf-8") as f:
+            f.write("# local edit\n")
+
+        install_hooks(home, force=False)
+
+        assert "# local edit" in (target / "Stop.sh").read_text(encoding="utf-8")
+
+    def test_remove_keeps_modified_files(self, home):
+        """Test that uninstall removes only files that still match the manifest"""
+        from src.manifest import load_manifest, remove_installed
+
+        target = install_hooks(home)
+        with open(target / "Stop.sh", "a", encoding="utf-8") as f:
+            f.write("# local edit\n")
+
+        kept = remove_installed(target, load_manifest(target))
+
+        assert kept == ["Stop.sh"]
+        assert sorted(p.name for p in target.iterdir()) == ["Stop.sh"]
+
+    def test_missing_manifest(self, tmp_path):
+        """Test that check exits 3 when nothing was installed with a manifest"""
+        from src.manifest import main
+
+        assert main(["check", str(tmp_path)]) == 3
@@ -0,0 +1,74 @@
+# test_loader_benchmarks.py
+# Python tests for the config and template loader micro-benchmarks
+#
+# Author: Claude Code TDD Implementation
+# Version: 1.0.0
+
+import json
+
+from benchmarks.loaders import (
+    DEFAULT_BASELINE, build_cases, compare, generate_templates, main, make_loader, time_case
+)
+
+
+class TestSyntheticTemplates:
+    """Test suite for the generated template set"""
+
+    def test_fallback_for_untranslated_keys(self, tmp_path):
+        """Test that other languages translate half the keys and fall back for the rest"""
+        codes = generate_templates(tmp_path, keys=10, languages=5)
+        assert codes == ["en", "l01", "l02", "l03", "l04"]
+        assert len(json.loads((tmp_path / "l01.json").read_text(encoding="utf-8"))) == 5
+
+        loader = make_loader(tmp_path, codes)
+        assert loader.get_template("key_00002", "l03")["title"] == "[l03] Title 2"
+        assert loader.get_template("key_00003", "l03")["title"] == "[en] Title 3"
+        assert loader.get_available_languages() == codes
+
+    def test_cases_run(self, tmp_path):
+        """Test that every case runs against a small set"""
+        cases = build_cases(tmp_path, keys=20, languages=3)
+        for name, func in cases.items():
+            func()
+        assert {"load_config_cold", "load_config_cached", "validate_config", "get_template_fallback",
+                "get_notification_data", "get_available_languages"} <= set(cases)
+
+    def test_time_case(self):
+        """Test the timing statistics"""
+        result = time_case(lambda: None, rounds=3)
+        assert result["calls"] >= 1
+        assert 0 <= result["min_us"] <= result["median_us"]
+
+
+class TestBaseline:
+    """Test suite for baseline comparison"""
+
+    def test_flags_regressions_beyond_threshold(self):
+        """Test that only slowdowns past the threshold are regressions"""
+        baseline = {"results": {"a": {"min_us": 10.0}, "b": {"min_us": 10.0}, "gone": {"min_us": 1.0}}}
+        results = {"a": {"min_us": 12.0}, "b": {"min_us": 13.0}, "new": {"min_us": 5.0}}
+        rows = compare(results, baseline, threshold=0.25)
+        assert [(name, bad) for name, _, _, _, bad in rows] == [("a", False), ("b", True)]
+
+    def test_checked_in_baseline_covers_cases(self, tmp_path):
+        """Test that the stored baseline has every case"""
+        baseline = json.loads(DEFAULT_BASELINE.read_text(encoding="utf-8"))
+        assert set(baseline["results"]) == set(build_cases(tmp_path, keys=4, languages=2))
+
+    def test_save_and_compare(self, tmp_path, capsys):
+        """Test that a saved run compares against itself without regressions"""
+        path = tmp_path / "baseline.json"
+        args = ["--keys", "20", "--languages", "3", "--rounds", "2", "--filter", "validate"]
+        assert main(args + ["--save", str(path)]) == 0
+        saved = json.loads(path.read_text(encoding="utf-8"))
+        saved["results"]["validate_config"]["min_us"] *= 100
+        path.write_text(json.dumps(saved), encoding="utf-8")
+        capsys.readouterr()
+
+        assert main(args + ["--compare", str(path), "--json"]) == 0
+        assert json.loads(capsys.readouterr().out)[0]["regressed"] is False
+
+        saved["results"]["validate_config"]["min_us"] /= 10000
+        path.write_text(json.dumps(saved), encoding="utf-8")
+        assert main(args + ["--compare", str(path)]) == 1
+        assert "REGRESSION" in capsys.readouterr().out
@@ -0,0 +1,120 @@
+# test_matchers.py
+# Python tests for PostToolUse matcher generation
+#
+# Author: Claude Code TDD Implementation
+# Version: 1.0.0
+
+import json
+import re
+
+import pytest
+
+
+class TestToolMatcher:
+    """Test suite for build_tool_matcher"""
+
+    def test_allowlist_matcher(self):
+        """Test that an allow-list matches exactly the listed tools"""
+        from src.matchers import build_tool_matcher, matches_tool
+
+        matcher = build_tool_matcher(["Bash", "Edit"])
+
+        assert matcher == "^(Bash|Edit)$"
+        assert matches_tool(matcher, "Bash")
+        assert not matches_tool(matcher, "BashOutput")
+        assert not matches_tool(matcher, "Read")
+
+    def test_denylist_matcher(self):
+        """Test that a deny-list excludes only the listed tools"""
+        from src.matchers import build_tool_matcher, matches_tool
+
+        matcher = build_tool_matcher(denylist=["Read", "Grep"])
+
+        assert not matches_tool(matcher, "Read")
+        assert not matches_tool(matcher, "Grep")
+        assert matches_tool(matcher, "NotebookRead")
+        assert matches_tool(matcher, "mcp__github__create_issue")
+
+    def test_allowlist_wins(self):
+        """Test that a non-empty allow-list overrides the deny-list"""
+        from src.matchers import build_tool_matcher
+
+        assert build_tool_matcher(["Write"], ["Read"]) == "^(Write)$"
+
+    def test_empty_lists_match_all(self):
+        """Test that no lists produce the catch-all matcher"""
+        from src.matchers import MATCH_ALL, build_tool_matcher
+
+        assert build_tool_matcher([], []) == MATCH_ALL
+
+    def test_invalid_names_are_dropped(self):
+        """Test that regex metacharacters cannot be injected through tool names"""
+        from src.matchers import build_tool_matcher
+
+        matcher = build_tool_matcher(["Bash", ".*", "Edit|Write", 3])
+
+        assert matcher == "^(Bash)$"
+        re.compile(matcher)
+
+    def test_default_config_matcher(self):
+        """Test that the default config skips read-only tools"""
+        from src.config_loader import get_default_config
+        from src.matchers import get_tool_matcher, matches_tool
+
+        matcher = get_tool_matcher(get_default_config())
+
+        for tool in ["Read", "Glob", "Grep"]:
+            assert not matches_tool(matcher, tool)
+        for tool in ["Bash", "Edit", "Write"]:
+            assert matches_tool(matcher, tool)
+
+
+class TestSavingsEstimate:
+    """Test suite for per-turn invocation estimates"""
+
+    def test_estimate_with_mix(self):
+        """Test counting hook launches for a given tool mix"""
+        from src.matchers import estimate_invocations
+
+        estimate = estimate_invocations("^(Bash)$", {"Read": 6, "Bash": 2})
+
+        assert estimate["total"] == 8
+        assert estimate["invoked"] == 2
+        assert estimate["saved"] == 6
+        assert estimate["saved_percent"] == pytest.approx(75.0)
+
+    def test_catch_all_saves_nothing(self):
+        """Test that the catch-all matcher launches the hook for every call"""
+        from src.matchers import MATCH_ALL, estimate_invocations
+
+        assert estimate_invocations(MATCH_ALL)["saved"] == 0
+
+    def test_cli_reports_savings(self, tmp_path, capsys):
+        """Test the command-line savings report"""
+        from src.matchers import main
+
+        config_file = tmp_path / "config.json"
+        config_file.write_text(json.dumps({"hook_tool_allowlist": ["Bash"]}), encoding="utf-8")
+
+        assert main(["--config", str(config_file), "--mix", "Read=3,Bash=1"]) == 0
+        assert "1 of 4 tool calls" in capsys.readouterr().out
+
+
+class TestFixHooksConfig:
+    """Test suite for matcher narrowing in fix_hooks_config.py"""
+
+    def test_narrows_catch_all_post_tool_use(self, tmp_path):
+        """Test that only our catch-all PostToolUse entries are narrowed"""
+        from fix_hooks_config import fix_hooks_config
+
+        settings_path = tmp_path / "settings.json"
+        settings_path.write_text(json.dumps({"hooks": {"PostToolUse": [
+            {"matcher": ".*", "hooks": [{"type": "command", "command": "$HOME/.claude/hooks/wsl-toast/PostToolUse.sh"}]},
+            {"matcher": ".*", "hooks": [{"type": "command", "command": "lint.sh"}]},
+        ]}}), encoding="utf-8")
+
+        assert fix_hooks_config(settings_path, "^(Bash)$") is True
+
+        entries = json.loads(settings_path.read_text(encoding="utf-8"))["hooks"]["PostToolUse"]
+        assert entries[0]["matcher"] == "^(Bash)$"
+        assert entries[1]["matcher"] == ".*"
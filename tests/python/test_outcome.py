@@ -0,0 +1,97 @@
+# test_outcome.py
+# Python tests for the PostToolUse outcome classifier
+#
+# Author: Claude Code TDD Implementation
+# Version: 1.0.0
+
+import io
+import json
+import re
+from pathlib import Path
+
+import pytest
+
+from src.config_loader import get_default_config
+from src.outcome import (
+    FAILURE,
+    INTERRUPTED,
+    SUCCESS,
+    classify,
+    get_rule_table,
+    payload_fields,
+    validate_rules,
+)
+from src.payload import read_fields
+
+CORPUS = json.loads(
+    (Path(__file__).parent / "fixtures" / "post_tool_use_corpus.json").read_text(encoding="utf-8")
+)
+
+
+def _classify_stream(payload, config):
+    """Classify a payload the way the hook does: stream, extract, classify"""
+    data = read_fields(io.BytesIO(json.dumps(payload).encode("utf-8")), payload_fields(config))
+    return classify(data.get("tool_name", ""), data.get("tool_response"), get_rule_table(config))
+
+
+class TestCorpus:
+    """Regression corpus of PostToolUse payloads"""
+
+    @pytest.mark.parametrize("case", CORPUS, ids=[case["name"] for case in CORPUS])
+    def test_corpus(self, case):
+        """Test that each recorded payload gets its expected outcome"""
+        assert _classify_stream(case["payload"], get_default_config()) == case["expected"]
+
+    def test_grep_misclassified_corpus(self):
+        """Test that the corpus covers payloads the old payload-wide grep got wrong"""
+        grep = re.compile(r"error|fail|exception", re.IGNORECASE)
+        wrong = [
+            case["name"] for case in CORPUS
+            if (case["expected"] == FAILURE) != bool(grep.search(json.dumps(case["payload"])))
+        ]
+
+        assert len(wrong) >= 8
+
+
+class TestRules:
+    """Test suite for rule lookup and configuration overrides"""
+
+    def test_default_rule_applies_to_unknown_tools(self):
+        """Test that '*' covers tools without their own rule"""
+        table = get_rule_table(get_default_config())
+
+        assert classify("SomeNewTool", {"isError": True}, table) == FAILURE
+        assert classify("SomeNewTool", {"interrupted": True}, table) == SUCCESS
+
+    def test_config_overrides_and_patterns(self):
+        """Test that hook_outcome_rules adds pattern rules and replaces keys"""
+        config = dict(get_default_config(), hook_outcome_rules={
+            "mcp__*": {"error_fields": ["error", "message"]},
+            "Bash": {"stderr_pattern": None},
+        })
+        table = get_rule_table(config)
+
+        assert classify("mcp__jira__create", {"message": "Quota exceeded"}, table) == FAILURE
+        assert classify("Bash", {"stderr": "error: boom"}, table) == SUCCESS
+        assert classify("Bash", {"interrupted": True}, table) == INTERRUPTED
+        assert "tool_response.message" in payload_fields(config)
+
+    def test_rule_table_is_cached(self):
+        """Test that the same rules compile once"""
+        config = dict(get_default_config(), hook_outcome_rules={"Edit": {"error_fields": ["err"]}})
+
+        assert get_rule_table(config) is get_rule_table(dict(config))
+
+    def test_invalid_rules_fall_back_to_defaults(self):
+        """Test that a broken regex in config does not break the hook"""
+        config = dict(get_default_config(), hook_outcome_rules={"Bash": {"stderr_pattern": "("}})
+
+        assert classify("Bash", {"stderr": "fatal: no"}, get_rule_table(config)) == FAILURE
+
+    def test_validate_rules(self):
+        """Test validation of hook_outcome_rules"""
+        assert validate_rules({"Bash": {"exit_code_fields": ["code"]}}) == []
+        assert validate_rules([]) != []
+        assert validate_rules({"Bash": {"exit_code_fields": "code"}}) != []
+        assert validate_rules({"Bash": {"stderr_pattern": "("}}) != []
+        assert validate_rules({"Bash": {"colour": "red"}}) != []
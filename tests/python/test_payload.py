@@ -0,0 +1,130 @@
+# test_payload.py
+# Python tests for the streaming hook payload reader
+#
+# Author: Claude Code TDD Implementation
+# Version: 1.0.0
+
+import io
+import json
+import tracemalloc
+
+import pytest
+
+from src.payload import drain, read_capped, read_fields
+
+
+def _stream(data):
+    """Wrap a payload (dict or bytes) in a binary stream"""
+    if isinstance(data, dict):
+        data = json.dumps(data).encode("utf-8")
+    return io.BytesIO(data)
+
+
+def _post_tool_use(stdout):
+    """Build a PostToolUse payload with a large tool output"""
+    return {
+        "session_id": "s1",
+        "hook_event_name": "PostToolUse",
+        "tool_name": "Bash",
+        "tool_input": {"command": "cat big.log", "description": "x"},
+        "tool_response": {"stdout": stdout, "stderr": "", "interrupted": False, "is_error": True},
+    }
+
+
+class TestReadFields:
+    """Test suite for read_fields()"""
+
+    def test_extracts_top_level_and_nested_fields(self):
+        """Test that declared fields are kept and everything else is dropped"""
+        payload = _post_tool_use("ok")
+
+        found = read_fields(_stream(payload), ["tool_name", "session_id", "tool_response.is_error"])
+
+        assert found == {"tool_name": "Bash", "session_id": "s1", "tool_response": {"is_error": True}}
+
+    def test_missing_fields_are_absent(self):
+        """Test that undeclared or absent fields do not appear"""
+        found = read_fields(_stream({"a": 1}), ["a", "notification_type", "b.c"])
+
+        assert found == {"a": 1}
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 64])
+    def test_escapes_and_unicode_across_chunks(self, chunk_size):
+        """Test strings with escapes and multi-byte text split at any byte"""
+        payload = {
+            "skip": 'x\\"}]{["' * 10,
+            "msg": 'He said "hi" \\ 한국어 😀\n',
+            "obj": {"list": [1, {"k": "}"}], "n": -1.5e3, "t": None},
+        }
+
+        found = read_fields(_stream(payload), ["msg", "obj.list", "obj.n", "obj.t"], chunk_size=chunk_size)
+
+        assert found == {"msg": payload["msg"], "obj": {"list": [1, {"k": "}"}], "n": -1500.0, "t": None}}
+
+    def test_large_values_use_constant_memory(self):
+        """Test that a 32 MiB tool output is skipped without being held in memory"""
+        data = json.dumps(_post_tool_use('line "quoted" \\ 로그\n' * 1_200_000)).encode("utf-8")
+        stream = io.BytesIO(data)
+        assert len(data) > 32 * 1024 * 1024
+
+        tracemalloc.start()
+        found = read_fields(stream, ["tool_name", "tool_response.is_error"], max_bytes=len(data))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        assert found == {"tool_name": "Bash", "tool_response": {"is_error": True}}
+        assert peak < 4 * 1024 * 1024
+
+    def test_long_strings_are_cut(self):
+        """Test that a declared string is kept only up to max_value_bytes"""
+        data = json.dumps({"message": "é" * 5000}, ensure_ascii=False).encode("utf-8")
+
+        found = read_fields(io.BytesIO(data), ["message"], max_value_bytes=101)
+
+        assert found["message"] == "é" * 50
+
+        escaped = read_fields(_stream({"message": "é" * 5000}), ["message"], max_value_bytes=101)
+        assert escaped["message"] == "é" * 16
+
+    def test_large_containers_are_dropped(self):
+        """Test that a declared object over max_value_bytes is skipped"""
+        payload = {"tool_input": {"content": "x" * 10000}, "tool_name": "Write"}
+
+        found = read_fields(_stream(payload), ["tool_input", "tool_name"], max_value_bytes=100)
+
+        assert found == {"tool_input": None, "tool_name": "Write"}
+
+    def test_byte_cap_returns_fields_seen_so_far(self):
+        """Test that reading stops at max_bytes"""
+        data = json.dumps(_post_tool_use("x" * 100000)).encode("utf-8")
+        stream = io.BytesIO(data)
+
+        found = read_fields(stream, ["tool_name", "tool_response.is_error"], max_bytes=4096)
+
+        assert found == {"tool_name": "Bash", "tool_response": {}}
+        assert stream.tell() == 4096
+
+    def test_stops_once_all_fields_are_found(self):
+        """Test that the rest of the stream is not read"""
+        data = json.dumps({"tool_name": "Edit", "tool_response": {"content": "x" * 500000}}).encode("utf-8")
+        stream = io.BytesIO(data)
+
+        assert read_fields(stream, ["tool_name"], chunk_size=1024) == {"tool_name": "Edit"}
+        assert stream.tell() == 1024
+
+    @pytest.mark.parametrize("data", [b"", b"not json", b"[1, 2]", b'{"tool_name": ', b'{"a" 1}'])
+    def test_invalid_input_is_tolerated(self, data):
+        """Test that malformed or truncated payloads never raise"""
+        assert read_fields(io.BytesIO(data), ["tool_name"]) == {}
+
+
+class TestStreamHelpers:
+    """Test suite for read_capped() and drain()"""
+
+    def test_read_capped(self):
+        """Test that whole-payload reads stop at the cap"""
+        stream = io.BytesIO(b"x" * 200000)
+
+        assert len(read_capped(stream, 150000)) == 150000
+        assert drain(stream) == 50000
+        assert stream.read() == b""
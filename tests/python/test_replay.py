@@ -0,0 +1,106 @@
+# test_replay.py
+# Python tests for replaying captured hook payloads
+#
+# Author: Claude Code TDD Implementation
+# Version: 1.0.0
+
+import gzip
+import json
+
+import pytest
+
+from benchmarks.replay import compare, load_corpus, main, parse_hooks_log, parse_stamp, replay
+
+HOOKS_LOG = """\
+=== Notification Hook Mon Oct 19 05:12:01 UTC 2026 ===
+{"session_id": "s1", "hook_event_name": "Notification", "message": "Claude needs your permission to use Bash"}
+[suppressed idle_prompt duplicate]
+=== UserPromptSubmit Hook Mon Oct 19 05:12:02 UTC 2026 ===
+512
+=== PermissionRequest Hook Mon Oct 19 05:12:04 UTC 2026 ===
+{
+  "session_id": "s1",
+  "tool_name": "Bash",
+  "tool_input": {"command": "git push"}
+}
+"""
+
+
+@pytest.fixture
+def log_dir(tmp_path):
+    """Logs with a rotated hooks.log, a live one and a payload capture"""
+    logs = tmp_path / "logs"
+    (logs / "payloads").mkdir(parents=True)
+    (logs / "hooks.log.1.gz").write_bytes(gzip.compress(HOOKS_LOG.encode("utf-8")))
+    (logs / "hooks.log").write_text(
+        '=== Notification Hook Mon Oct 19 06:00:00 UTC 2026 ===\n{"message": "Waiting for input"}\n',
+        encoding="utf-8",
+    )
+    (logs / "payloads" / "PostToolUse-20261019-055000-42-ab12cd34.json").write_text(
+        json.dumps({"session_id": "s1", "tool_name": "Bash",
+                    "tool_response": {"stdout": "", "stderr": "boom", "exit_code": 2}}),
+        encoding="utf-8",
+    )
+    return logs
+
+
+class TestCorpus:
+    """Test suite for building the payload corpus"""
+
+    def test_parse_hooks_log(self):
+        """Test JSON blocks between markers, skipping non-JSON bodies and trailing log lines"""
+        corpus = parse_hooks_log(HOOKS_LOG.splitlines(keepends=True))
+        assert [item["event"] for item in corpus] == ["Notification", "PermissionRequest"]
+        assert corpus[0]["payload"]["message"] == "Claude needs your permission to use Bash"
+        assert corpus[1]["payload"]["tool_input"] == {"command": "git push"}
+        assert corpus[1]["ts"] - corpus[0]["ts"] == 3
+
+    def test_parse_stamp(self):
+        """Test date(1) stamps with and without a zone"""
+        assert parse_stamp("Mon Oct 19 05:12:01 KST 2026") == parse_stamp("Mon Oct 19 05:12:01 2026")
+        assert parse_stamp("not a date") is None
+
+    def test_load_corpus_orders_sources(self, log_dir):
+        """Test that rotated logs, the live log and captures merge in time order"""
+        corpus = load_corpus(log_dir)
+        assert [item["event"] for item in corpus] == [
+            "Notification", "PermissionRequest", "PostToolUse", "Notification"
+        ]
+        assert [item["event"] for item in load_corpus(log_dir, "captures")] == ["PostToolUse"]
+
+
+class TestReplay:
+    """Test suite for replaying against the stand-in backend"""
+
+    def test_replay_records_notifications(self, log_dir):
+        """Test that each payload's toast is captured with its latency"""
+        results = replay(load_corpus(log_dir), speed=0)
+
+        assert [r["event"] for r in results] == ["Notification", "PermissionRequest", "PostToolUse", "Notification"]
+        assert all(r["latency_ms"] > 0 for r in results)
+        assert results[1]["notifications"][0]["message"]
+        assert results[2]["notifications"][0]["type"] == "Error"
+
+    def test_compare_reports_changes_and_regressions(self):
+        """Test notification diffs and latency regressions"""
+        baseline = [{"event": "Stop", "latency_ms": 100.0, "notifications": [{"title": "a"}]},
+                    {"event": "Stop", "latency_ms": 100.0, "notifications": [{"title": "b"}]}]
+        results = [{"event": "Stop", "latency_ms": 150.0, "notifications": [{"title": "a"}]},
+                   {"event": "Stop", "latency_ms": 150.0, "notifications": []}]
+        diff = compare(results, baseline, threshold=0.25)
+        assert [c["index"] for c in diff["changed"]] == [1]
+        assert diff["latency"]["Stop"]["regressed"] is True
+        assert diff["count_mismatch"] is False
+
+    def test_output_then_compare(self, log_dir, tmp_path, capsys):
+        """Test that a replay compared with its own saved results reports no changes"""
+        saved = tmp_path / "baseline.json"
+        args = ["--log-dir", str(log_dir), "--speed", "0", "--source", "captures"]
+        assert main(args + ["--output", str(saved)]) == 0
+        capsys.readouterr()
+        main(args + ["--compare", str(saved), "--threshold", "100", "--json"])
+        assert json.loads(capsys.readouterr().out)["changed"] == []
+
+    def test_empty_corpus(self, tmp_path):
+        """Test the exit code when nothing was captured"""
+        assert main(["--log-dir", str(tmp_path)]) == 1
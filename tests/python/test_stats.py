@@ -0,0 +1,143 @@
+# test_stats.py
+# Python tests for wsl-toast stats
+#
+# Author: Claude Code TDD Implementation
+# Version: 1.0.0
+
+import gzip
+import json
+import os
+import subprocess
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+from src.stats import LatencyHistogram, Stats, iter_records, main, parse_since
+from src.events import event_log_files
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+
+def _line(ts, event="Stop", decision="delivered", total_ms=20.0, **fields):
+    """One events.jsonl line"""
+    record = {"ts": ts, "event": event, "pid": 1, "decision": decision, "total_ms": total_ms}
+    record.update(fields)
+    return json.dumps(record) + "\n"
+
+
+@pytest.fixture
+def log_dir(tmp_path):
+    """Event log with a gzipped rotated file and a live file"""
+    logs = tmp_path / "logs"
+    logs.mkdir()
+    rotated = "".join([
+        _line(100, session="a", backend="powershell", exit=0),
+        _line(101, event="PostToolUse", decision="filtered", session="a", sample_rate=0.01),
+    ])
+    (logs / "events.jsonl.1.gz").write_bytes(gzip.compress(rotated.encode("utf-8")))
+    (logs / "events.jsonl").write_text("".join([
+        _line(200, event="Notification", decision="suppressed", reason="idle_prompt", session="b"),
+        _line(201, session="b", backend="powershell", exit=3),
+        _line(202, event="PostToolUse", decision="error", error="OSError", session="b", sample_rate=1.0),
+        "{not json\n",
+    ]), encoding="utf-8")
+    return logs
+
+
+class TestStats:
+    """Test suite for the stats aggregate"""
+
+    def _report(self, log_dir, **filters):
+        stats = Stats(**filters)
+        for record in iter_records(event_log_files(log_dir)):
+            stats.add(record)
+        return stats.report()
+
+    def test_counts_weighted_by_sample_rate(self, log_dir):
+        """Test counts across rotated and live files, undoing sampling"""
+        report = self._report(log_dir)
+
+        assert report["records"] == 5
+        assert report["events"]["PostToolUse"] == {"invocations": 101, "filtered": 100, "error": 1}
+        assert report["events"]["Stop"]["delivered"] == 2
+        assert report["backends"] == {"powershell": 2}
+        assert report["powershell_spawns"] == 2
+        assert report["suppressed"] == {"idle_prompt": 1}
+        assert report["failures"] == {"exit 3": 1, "OSError": 1}
+
+    def test_since_and_session_filters(self, log_dir):
+        """Test --since and --session"""
+        assert self._report(log_dir, since=200)["records"] == 3
+        report = self._report(log_dir, session="a")
+        assert set(report["events"]) == {"Stop", "PostToolUse"}
+
+    def test_histogram_percentiles(self):
+        """Test that percentiles land within the bucket error"""
+        hist = LatencyHistogram()
+        for ms in range(1, 1001):
+            hist.add(float(ms))
+
+        for pct, exact in ((50, 500), (95, 950), (99, 990)):
+            assert exact <= hist.percentile(pct) <= exact * 1.05
+        assert LatencyHistogram().percentile(50) is None
+
+    def test_constant_memory(self, tmp_path):
+        """Test that memory does not grow with the number of records"""
+        logs = tmp_path / "logs"
+        logs.mkdir()
+        with open(logs / "events.jsonl", "w", encoding="utf-8") as f:
+            for i in range(50000):
+                f.write(_line(i, session=f"s{i % 7}", total_ms=(i % 997) / 3))
+
+        tracemalloc.start()
+        stats = Stats()
+        for record in iter_records(event_log_files(logs)):
+            stats.add(record)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        assert stats.report()["records"] == 50000
+        assert peak < 1024 * 1024
+
+    def test_parse_since(self):
+        """Test durations, Unix times and ISO dates"""
+        assert parse_since("2h", now=10000) == 2800
+        assert parse_since("1700000000") == 1700000000
+        assert parse_since("2024-01-02") > 1700000000
+        with pytest.raises(ValueError):
+            parse_since("yesterday")
+
+
+class TestCommand:
+    """Test suite for the stats command line"""
+
+    def test_json_output(self, log_dir, capsys):
+        """Test --json"""
+        assert main(["--json", "--log-dir", str(log_dir), "--session", "b"]) == 0
+
+        report = json.loads(capsys.readouterr().out)
+        assert report["session"] == "b"
+        assert report["records"] == 3
+
+    def test_text_output(self, log_dir, capsys):
+        """Test the plain text tables"""
+        main(["--log-dir", str(log_dir)])
+
+        out = capsys.readouterr().out
+        assert "PowerShell spawns: 2" in out
+        assert "PostToolUse" in out
+
+    def test_notify_sh_stats(self, log_dir, tmp_path):
+        """Test that notify.sh (wsl-toast) dispatches the stats subcommand"""
+        home = tmp_path / "home"
+        (home / ".wsl-toast").mkdir(parents=True)
+        os.symlink(log_dir, home / ".wsl-toast" / "logs")
+
+        result = subprocess.run(
+            ["bash", str(PROJECT_ROOT / "scripts" / "notify.sh"), "stats", "--json", "--since", "150"],
+            capture_output=True, text=True, env=dict(os.environ, HOME=str(home), USER="tester"),
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert json.loads(result.stdout)["records"] == 3
@@ -250,6 +250,7 @@ class TestConfigLoaderCoverage:
             load_config,
             get_default_config,
             clear_config_cache,
+            thaw_config,
         )
 
         # Create a custom config
@@ -265,7 +266,7 @@ class TestConfigLoaderCoverage:
         config = load_config(str(tmp_path))
         defaults = get_default_config()
 
-        assert config == defaults
+        assert thaw_config(config) == defaults
 
     def test_merge_config(self):
         """Test merge_config function"""
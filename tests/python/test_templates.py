@@ -284,12 +284,12 @@ class TestConfigurationLoader:
 
     def test_load_config_returns_defaults(self, tmp_path):
         """Test that loading config returns defaults when file doesn't exist"""
-        from src.config_loader import load_config, get_default_config
+        from src.config_loader import load_config, get_default_config, thaw_config
 
         config = load_config(str(tmp_path))
         defaults = get_default_config()
 
-        assert config == defaults
+        assert thaw_config(config) == defaults
 
     def test_load_config_reads_from_file(self, mock_config_file):
         """Test loading configuration from file"""
@@ -303,7 +303,7 @@ class TestConfigurationLoader:
 
     def test_load_config_handles_invalid_json(self, tmp_path):
         """Test handling of invalid JSON in config file"""
-        from src.config_loader import load_config, get_default_config
+        from src.config_loader import load_config, get_default_config, thaw_config
 
         invalid_file = tmp_path / "config.json"
         invalid_file.write_text("{invalid json}", encoding="utf-8")
@@ -312,7 +312,7 @@ class TestConfigurationLoader:
         config = load_config(str(tmp_path))
         defaults = get_default_config()
 
-        assert config == defaults
+        assert thaw_config(config) == defaults
 
     def test_get_config_returns_default_value(self, tmp_path):
         """Test getting a config value returns default if not set"""
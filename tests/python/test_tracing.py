@@ -0,0 +1,115 @@
+# test_tracing.py
+# Python tests for OTLP/JSON trace spans
+#
+# Author: Claude Code TDD Implementation
+# Version: 1.0.0
+
+import json
+
+import pytest
+
+from src.tracing import (
+    STATUS_ERROR,
+    FileExporter,
+    InMemoryExporter,
+    Tracer,
+    export_request,
+    hook_tracer,
+    session_trace,
+    session_trace_id,
+    validate_trace_config,
+)
+
+
+class TestTracer:
+    """Test suite for Tracer and the OTLP encoding"""
+
+    def test_nested_spans(self):
+        """Test parent links, shared attributes and export on flush"""
+        exporter = InMemoryExporter()
+        tracer = Tracer(exporter, "ab" * 16, {"session_id": "s1", "event": "Stop"})
+        with tracer.span("hook") as root:
+            with tracer.span("transport", backend="mock") as child:
+                pass
+        tracer.flush()
+
+        assert [span.name for span in exporter.spans] == ["transport", "hook"]
+        assert child.parent_id == root.span_id
+        assert root.parent_id is None
+        assert child.attributes == {"session_id": "s1", "event": "Stop", "backend": "mock"}
+        assert child.start_ns >= root.start_ns and child.end_ns <= root.end_ns
+
+    def test_otlp_encoding(self):
+        """Test the OTLP/JSON field names and value types"""
+        tracer = Tracer(InMemoryExporter(), "cd" * 16)
+        span = tracer.record("payload.parse", 1000, 2000, bytes=12, ratio=0.5, ok=True, label="x")
+
+        request = export_request([span])
+        encoded = request["resourceSpans"][0]["scopeSpans"][0]["spans"][0]
+        assert request["resourceSpans"][0]["resource"]["attributes"][0] == {
+            "key": "service.name", "value": {"stringValue": "wsl-toast"}
+        }
+        assert encoded["traceId"] == "cd" * 16 and len(encoded["spanId"]) == 16
+        assert (encoded["startTimeUnixNano"], encoded["endTimeUnixNano"]) == ("1000", "2000")
+        assert encoded["attributes"] == [
+            {"key": "bytes", "value": {"intValue": "12"}},
+            {"key": "ratio", "value": {"doubleValue": 0.5}},
+            {"key": "ok", "value": {"boolValue": True}},
+            {"key": "label", "value": {"stringValue": "x"}},
+        ]
+
+    def test_exception_marks_error(self):
+        """Test that a failing block ends its span with an error status"""
+        exporter = InMemoryExporter()
+        tracer = Tracer(exporter)
+        with pytest.raises(ValueError):
+            with tracer.span("transport"):
+                raise ValueError("boom")
+        tracer.flush()
+
+        assert exporter.spans[0].to_otlp()["status"] == {"code": STATUS_ERROR, "message": "ValueError"}
+
+    def test_disabled_tracer_is_a_no_op(self):
+        """Test that a tracer without exporter records nothing"""
+        tracer = Tracer()
+        with tracer.span("hook") as span:
+            assert span is None
+        tracer.flush()
+
+        assert tracer.finished == []
+
+    def test_session_trace_id(self):
+        """Test that a session's hooks share one 32 hex digit trace id"""
+        assert session_trace_id("s1") == session_trace_id("s1") != session_trace_id("s2")
+        assert len(session_trace_id("s1")) == 32
+        assert session_trace_id("") != session_trace_id("")
+
+
+class TestTraceFile:
+    """Test suite for traces.jsonl"""
+
+    def test_file_exporter_and_session_trace(self, tmp_path):
+        """Test one line per export and collecting one session's spans"""
+        for session in ("s1", "s2", "s1"):
+            tracer = hook_tracer("Stop", session, tmp_path, {"trace_enabled": True})
+            with tracer.span("hook"):
+                pass
+            tracer.flush()
+
+        lines = (tmp_path / "traces.jsonl").read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 3
+        spans = session_trace(tmp_path, "s1")["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        assert len(spans) == 2
+        assert {span["traceId"] for span in spans} == {session_trace_id("s1")}
+
+    def test_hook_tracer_opt_in(self, tmp_path, monkeypatch):
+        """Test that tracing is off unless configured or forced by WSL_TOAST_TRACE"""
+        monkeypatch.delenv("WSL_TOAST_TRACE", raising=False)
+        assert not hook_tracer("Stop", "s1", tmp_path, {}).enabled
+        monkeypatch.setenv("WSL_TOAST_TRACE", "1")
+        assert isinstance(hook_tracer("Stop", "s1", tmp_path, {}).exporter, FileExporter)
+
+    def test_validate_trace_config(self):
+        """Test validation of trace_enabled"""
+        assert validate_trace_config({"trace_enabled": True}) == []
+        assert validate_trace_config({"trace_enabled": "yes"}) != []
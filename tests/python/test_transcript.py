@@ -0,0 +1,328 @@
+# test_transcript.py
+# Python tests for the backward transcript reader
+#
+# Author: Claude Code TDD Implementation
+# Version: 1.0.0
+
+import io
+import json
+
+
+def _assistant(text):
+    """Build an assistant transcript entry"""
+    return {"message": {"role": "assistant", "content": [{"type": "text", "text": text}]}}
+
+
+def _user(text):
+    """Build a user transcript entry"""
+    return {"message": {"role": "user", "content": [{"type": "text", "text": text}]}}
+
+
+def _write_transcript(path, entries, trailing_newline=True):
+    """Write entries as JSONL"""
+    data = "\n".join(json.dumps(e, ensure_ascii=False) for e in entries)
+    if trailing_newline:
+        data += "\n"
+    path.write_bytes(data.encode("utf-8"))
+    return path
+
+
+class TestIterLinesReverse:
+    """Test suite for iter_lines_reverse"""
+
+    def test_lines_in_reverse_order(self):
+        """Test that lines come back last to first"""
+        from src.transcript import iter_lines_reverse
+
+        f = io.BytesIO(b"one\ntwo\nthree")
+        assert list(iter_lines_reverse(f, block_size=4)) == [b"three", b"two", b"one"]
+
+    def test_trailing_newline_yields_empty_line(self):
+        """Test that a final newline produces one empty line first"""
+        from src.transcript import iter_lines_reverse
+
+        f = io.BytesIO(b"a\nb\n")
+        assert list(iter_lines_reverse(f, block_size=3)) == [b"", b"b", b"a"]
+
+    def test_multibyte_split_across_blocks(self):
+        """Test that UTF-8 characters split by block boundaries survive"""
+        from src.transcript import iter_lines_reverse
+
+        lines = ["작업이 완료되었습니다", "タスク完了", "任务完成 ✓"]
+        data = "\n".join(lines).encode("utf-8")
+        for block_size in range(1, 9):
+            result = list(iter_lines_reverse(io.BytesIO(data), block_size=block_size))
+            assert [line.decode("utf-8") for line in result] == list(reversed(lines))
+
+    def test_line_longer_than_block(self):
+        """Test that very long lines are reassembled"""
+        from src.transcript import iter_lines_reverse
+
+        long_line = b"x" * 100_000
+        f = io.BytesIO(b"head\n" + long_line + b"\ntail")
+        assert list(iter_lines_reverse(f, block_size=1024)) == [b"tail", long_line, b"head"]
+
+    def test_empty_file(self):
+        """Test that an empty file yields a single empty line"""
+        from src.transcript import iter_lines_reverse
+
+        assert list(iter_lines_reverse(io.BytesIO(b""))) == [b""]
+
+
+class TestLastAssistantMessage:
+    """Test suite for get_last_assistant_message"""
+
+    def test_returns_newest_assistant_text(self, tmp_path):
+        """Test that the newest assistant message with text wins"""
+        from src.transcript import get_last_assistant_message
+
+        path = _write_transcript(tmp_path / "t.jsonl", [
+            _assistant("Old answer."),
+            _user("Next"),
+            _assistant("New answer."),
+            {"message": {"role": "assistant", "content": [{"type": "tool_use", "name": "Bash"}]}},
+            _user("tool result"),
+        ])
+
+        assert get_last_assistant_message(str(path)) == "New answer."
+
+    def test_skips_invalid_lines(self, tmp_path):
+        """Test that truncated or invalid JSON lines are ignored"""
+        from src.transcript import get_last_assistant_message
+
+        path = tmp_path / "t.jsonl"
+        path.write_bytes(
+            json.dumps(_assistant("Valid.")).encode("utf-8")
+            + b'\n{"message": {"role": "assistant", "content": [{"type": "te'
+            + b"\n\xff\xfe\"assistant\"\n"
+        )
+
+        assert get_last_assistant_message(str(path)) == "Valid."
+
+    def test_no_trailing_newline_and_unicode(self, tmp_path):
+        """Test the last line without newline and non-ASCII text"""
+        from src.transcript import get_last_assistant_message
+
+        path = _write_transcript(
+            tmp_path / "t.jsonl", [_user("hi"), _assistant("완료했습니다.")], trailing_newline=False
+        )
+
+        assert get_last_assistant_message(str(path)) == "완료했습니다."
+
+    def test_stops_reading_at_last_message(self, tmp_path, monkeypatch):
+        """Test that older lines are never parsed once a message is found"""
+        from src import transcript
+
+        path = _write_transcript(
+            tmp_path / "t.jsonl", [_assistant(f"Answer {i}.") for i in range(1000)]
+        )
+        parsed = []
+        real_loads = json.loads
+        monkeypatch.setattr(transcript.json, "loads", lambda s: parsed.append(s) or real_loads(s))
+
+        assert transcript.get_last_assistant_message(str(path)) == "Answer 999."
+        assert len(parsed) == 1
+
+    def test_missing_file(self):
+        """Test that a missing transcript returns an empty string"""
+        from src.transcript import get_last_assistant_message
+
+        assert get_last_assistant_message("/nonexistent/transcript.jsonl") == ""
+        assert get_last_assistant_message("") == ""
+
+    def test_matches_forward_scan_on_generated_transcript(self, tmp_path):
+        """Test that the backward reader agrees with a full scan"""
+        from benchmarks.transcript_tail import forward_scan, generate_transcript
+        from src.transcript import get_last_assistant_message
+
+        path = str(tmp_path / "bench.jsonl")
+        expected = generate_transcript(path, 1)
+
+        assert get_last_assistant_message(path) == expected
+        assert forward_scan(path) == expected
+
+
+class TestTranscriptIndex:
+    """Test suite for the per-transcript sidecar offset index"""
+
+    def _count_parses(self, monkeypatch):
+        """Record every transcript line handed to json.loads"""
+        parsed = []
+        real_loads = json.loads
+
+        def counting_loads(s, **kwargs):
+            if isinstance(s, bytes):
+                parsed.append(s)
+            return real_loads(s, **kwargs)
+
+        monkeypatch.setattr(json, "loads", counting_loads)
+        return parsed
+
+    def test_index_records_offset_and_message(self, tmp_path):
+        """Test that the sidecar stores the offset, inode and message"""
+        from src.transcript import get_index_path, get_last_assistant_message
+
+        path = _write_transcript(tmp_path / "t.jsonl", [_assistant("First.")])
+        index_dir = tmp_path / "index"
+
+        assert get_last_assistant_message(str(path), index_dir) == "First."
+
+        index = json.loads(get_index_path(index_dir, str(path)).read_text(encoding="utf-8"))
+        assert index["offset"] == path.stat().st_size
+        assert index["inode"] == path.stat().st_ino
+        assert index["message"] == "First."
+
+    def test_only_appended_bytes_are_parsed(self, tmp_path, monkeypatch):
+        """Test that a second Stop parses only the new lines"""
+        from src.transcript import get_last_assistant_message
+
+        path = _write_transcript(tmp_path / "t.jsonl", [_assistant(f"Old {i}.") for i in range(50)])
+        index_dir = tmp_path / "index"
+        get_last_assistant_message(str(path), index_dir)
+
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(_user("tool output")) + "\n")
+            f.write(json.dumps(_assistant("New.")) + "\n")
+        parsed = self._count_parses(monkeypatch)
+
+        assert get_last_assistant_message(str(path), index_dir) == "New."
+        assert len(parsed) == 1
+
+    def test_message_carried_over_when_nothing_new(self, tmp_path, monkeypatch):
+        """Test that appended lines without assistant text keep the cached message"""
+        from src.transcript import get_last_assistant_message
+
+        path = _write_transcript(tmp_path / "t.jsonl", [_assistant("Cached.")])
+        index_dir = tmp_path / "index"
+        get_last_assistant_message(str(path), index_dir)
+
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(_user("no assistant here")) + "\n")
+        parsed = self._count_parses(monkeypatch)
+
+        assert get_last_assistant_message(str(path), index_dir) == "Cached."
+        assert parsed == []
+
+    def test_truncation_falls_back_to_full_scan(self, tmp_path):
+        """Test that a shorter transcript (same inode) is rescanned"""
+        from src.transcript import get_last_assistant_message
+
+        path = _write_transcript(tmp_path / "t.jsonl", [_assistant("Long answer."), _user("x" * 500)])
+        index_dir = tmp_path / "index"
+        get_last_assistant_message(str(path), index_dir)
+
+        with open(path, "r+b") as f:
+            f.truncate(0)
+            f.write((json.dumps(_assistant("Fresh.")) + "\n").encode("utf-8"))
+
+        assert get_last_assistant_message(str(path), index_dir) == "Fresh."
+
+    def test_rotation_falls_back_to_full_scan(self, tmp_path):
+        """Test that a replaced transcript (new inode) is rescanned"""
+        from src.transcript import get_last_assistant_message
+
+        path = _write_transcript(tmp_path / "t.jsonl", [_assistant("Before rotation.")])
+        index_dir = tmp_path / "index"
+        get_last_assistant_message(str(path), index_dir)
+
+        replacement = _write_transcript(
+            tmp_path / "new.jsonl", [_assistant("After rotation."), _user("y" * 200)]
+        )
+        replacement.replace(path)
+
+        assert get_last_assistant_message(str(path), index_dir) == "After rotation."
+
+    def test_rewrite_in_place_falls_back_to_full_scan(self, tmp_path):
+        """Test that rewritten bytes before the offset are detected"""
+        from src.transcript import get_last_assistant_message
+
+        path = _write_transcript(tmp_path / "t.jsonl", [_assistant("Answer A.")])
+        index_dir = tmp_path / "index"
+        get_last_assistant_message(str(path), index_dir)
+
+        with open(path, "r+b") as f:
+            f.write((json.dumps(_assistant("Answer B.")) + "\n").encode("utf-8"))
+
+        assert get_last_assistant_message(str(path), index_dir) == "Answer B."
+
+    def test_partial_last_line_is_reparsed(self, tmp_path):
+        """Test that a line still being written is picked up once complete"""
+        from src.transcript import get_index_path, get_last_assistant_message
+
+        path = _write_transcript(tmp_path / "t.jsonl", [_assistant("Done.")])
+        complete_size = path.stat().st_size
+        line = json.dumps(_assistant("Later.")).encode("utf-8")
+        with open(path, "ab") as f:
+            f.write(line[:20])
+        index_dir = tmp_path / "index"
+
+        assert get_last_assistant_message(str(path), index_dir) == "Done."
+        index = json.loads(get_index_path(index_dir, str(path)).read_text(encoding="utf-8"))
+        assert index["offset"] == complete_size
+
+        with open(path, "ab") as f:
+            f.write(line[20:] + b"\n")
+
+        assert get_last_assistant_message(str(path), index_dir) == "Later."
+
+    def test_locked_index_scans_without_waiting(self, tmp_path):
+        """Test that a busy index lock falls back to an unindexed scan"""
+        import fcntl
+
+        from src.transcript import get_index_path, get_last_assistant_message
+
+        path = _write_transcript(tmp_path / "t.jsonl", [_assistant("Unlocked.")])
+        index_dir = tmp_path / "index"
+        index_dir.mkdir()
+        index_path = get_index_path(index_dir, str(path))
+
+        with open(index_path.with_suffix(".lock"), "a") as lock:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+            assert get_last_assistant_message(str(path), index_dir) == "Unlocked."
+
+        assert not index_path.exists()
+
+    def test_concurrent_sessions(self, tmp_path):
+        """Test many processes reading and appending to transcripts at once"""
+        import multiprocessing
+
+        path = _write_transcript(tmp_path / "t.jsonl", [_assistant("Start.")])
+        index_dir = tmp_path / "index"
+
+        ctx = multiprocessing.get_context("fork")
+        with ctx.Pool(8) as pool:
+            results = pool.starmap(_append_and_read, [(str(path), str(index_dir), i) for i in range(40)])
+
+        assert all(r.startswith("Msg ") or r == "Start." for r in results)
+
+        from src.transcript import get_index_path, get_last_assistant_message
+
+        expected = get_last_assistant_message(str(path))
+        assert get_last_assistant_message(str(path), index_dir) == expected
+        json.loads(get_index_path(index_dir, str(path)).read_text(encoding="utf-8"))
+
+    def test_prune_removes_stale_sidecars(self, tmp_path):
+        """Test that sidecars of old transcripts are removed"""
+        import os
+
+        from src.transcript import prune_index_dir
+
+        stale = tmp_path / "stale.json"
+        stale.write_text("{}", encoding="utf-8")
+        (tmp_path / "stale.lock").write_text("", encoding="utf-8")
+        fresh = tmp_path / "fresh.json"
+        fresh.write_text("{}", encoding="utf-8")
+        os.utime(stale, (0, 0))
+
+        prune_index_dir(tmp_path)
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["fresh.json"]
+
+
+def _append_and_read(path, index_dir, i):
+    """Worker for the concurrency test: append one message, then read"""
+    from src.transcript import get_last_assistant_message
+
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(_assistant(f"Msg {i}.")) + "\n")
+    return get_last_assistant_message(path, index_dir)
@@ -14,6 +14,7 @@ PROJECT_ROOT="$(cd "${SCRIPT_DIR}" && pwd)"
 CONFIG_DIR="${HOME}/.wsl-toast"
 CONFIG_FILE="${CONFIG_DIR}/config.json"
 SYMLINK="${HOME}/.local/bin/wsl-toast"
+HOOKS_DIR="${HOME}/.claude/hooks/wsl-toast"
 
 # Exit codes
 EXIT_SUCCESS=0
@@ -57,6 +58,7 @@ confirm_uninstallation() {
     echo "  - Configuration directory: $CONFIG_DIR"
     echo "  - Configuration file: $CONFIG_FILE"
     echo "  - Symbolic link: $SYMLINK"
+    echo "  - Installed hooks: $HOOKS_DIR (files edited since install are kept)"
     echo
     echo "Items NOT removed (preserve your project):"
     echo "  - Project directory: $PROJECT_ROOT"
@@ -90,6 +92,38 @@ remove_symlink() {
     return 0
 }
 
+remove_hook_scripts() {
+    log_info "Removing installed hook scripts..."
+
+    if [ ! -d "$HOOKS_DIR" ]; then
+        log_info "Hook directory not found: $HOOKS_DIR"
+        return 0
+    fi
+
+    if [ ! -f "${HOOKS_DIR}/manifest.json" ] || ! command -v python3 &>/dev/null; then
+        log_warning "No install manifest in ${HOOKS_DIR}; leaving it in place"
+        log_warning "Remove it manually if it is no longer needed"
+        return 0
+    fi
+
+    # Only files that still match manifest.json are removed
+    local output kind name
+    if ! output="$(cd "$PROJECT_ROOT" && python3 -m src.manifest remove "$HOOKS_DIR")"; then
+        log_warning "Failed to read ${HOOKS_DIR}/manifest.json; leaving hooks in place"
+        return 0
+    fi
+    while read -r kind name; do
+        if [[ "$kind" == "kept" ]]; then
+            log_warning "Kept locally modified file: ${HOOKS_DIR}/${name}"
+        fi
+    done <<< "$output"
+
+    log_success "Hook scripts removed: $HOOKS_DIR"
+    log_info "Remove the wsl-toast entries from ${HOME}/.claude/settings.json if present"
+
+    return 0
+}
+
 remove_config_directory() {
     log_info "Removing configuration directory..."
 
@@ -144,6 +178,7 @@ ${GREEN}========================================${NC}
 ${BLUE}Removed:${NC}
   - Configuration directory: ${CONFIG_DIR}
   - Symbolic link: ${SYMLINK}
+  - Installed hooks: ${HOOKS_DIR}
 
 ${BLUE}Preserved:${NC}
   - Project directory: ${PROJECT_ROOT}
@@ -184,6 +219,9 @@ main() {
     # Remove symlink
     remove_symlink
 
+    # Remove installed hooks (unmodified files only)
+    remove_hook_scripts
+
     # Remove configuration directory
     remove_config_directory
 
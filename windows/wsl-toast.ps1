@@ -32,6 +32,24 @@
 .PARAMETER MockMode
     Testing mode that doesn't display actual notifications (default: false)
 
+.PARAMETER SessionId
+    Optional Claude Code session id used to tag the toast in Action Center
+
+.PARAMETER HistoryCap
+    Maximum number of wsl-toast notifications kept in Action Center (0 disables pruning)
+
+.PARAMETER PruneIntervalSec
+    Minimum number of seconds between history pruning passes (default: 60)
+
+.PARAMETER ClearSession
+    Remove every remaining toast tagged with SessionId instead of showing a toast
+
+.PARAMETER Timing
+    Add per-stage durations (Timing) to the JSON result (set by notify.sh when WSL_TOAST_PROFILE=1)
+
+.PARAMETER TraceId
+    Correlation id echoed in Timing, shared with the hook and notify.sh records
+
 .EXAMPLE
     .\wsl-toast.ps1 -Title "Test" -Message "Test message"
     Displays a basic information notification
@@ -44,19 +62,23 @@
     .\wsl-toast.ps1 -Title "테스트" -Message "한글 메시지" -Type "Success"
     Displays a success notification with Korean characters
 
+.EXAMPLE
+    .\wsl-toast.ps1 -ClearSession -SessionId "0f3c2c1e-6f0b-4b8e-9d7a-2a1d5c9e8b10"
+    Removes the toasts a finished session left in Action Center
+
 .NOTES
     Version: 1.0.0
     Author: Claude Code TDD Implementation
     Requires: PowerShell 5.1+, BurntToast module (optional, with graceful fallback)
 #>
 
-[CmdletBinding()]
+[CmdletBinding(DefaultParameterSetName='Show')]
 param(
-    [Parameter(Mandatory=$true, Position=0)]
+    [Parameter(Mandatory=$true, Position=0, ParameterSetName='Show')]
     [ValidateNotNullOrEmpty()]
     [string]$Title,
 
-    [Parameter(Mandatory=$true, Position=1)]
+    [Parameter(Mandatory=$true, Position=1, ParameterSetName='Show')]
     [ValidateNotNullOrEmpty()]
     [string]$Message,
 
@@ -78,7 +100,27 @@ param(
     [switch]$Silent,
 
     [Parameter(Mandatory=$false)]
-    [switch]$Sound
+    [switch]$Sound,
+
+    [Parameter(Mandatory=$false)]
+    [string]$SessionId,
+
+    [Parameter(Mandatory=$false)]
+    [ValidateRange(0, 1000)]
+    [int]$HistoryCap = 0,
+
+    [Parameter(Mandatory=$false)]
+    [ValidateRange(0, 86400)]
+    [int]$PruneIntervalSec = 60,
+
+    [Parameter(Mandatory=$true, ParameterSetName='ClearSession')]
+    [switch]$ClearSession,
+
+    [Parameter(Mandatory=$false)]
+    [switch]$Timing,
+
+    [Parameter(Mandatory=$false)]
+    [string]$TraceId
 )
 
 # Ensure UTF-8 output for WSL callers
@@ -90,8 +132,49 @@ $script:IsSilent = $true
 if ($Sound.IsPresent) { $script:IsSilent = $false }
 if ($Silent.IsPresent) { $script:IsSilent = $true }
 
+# Action Center history: every toast we show is tagged "wslt-<session>-<ticks>"
+# so pruning only ever touches our own notifications.
+$script:ToastTagPrefix = 'wslt'
+$script:ToastAppId = '{1AC14E77-02E7-4E5D-B744-2EB1AE5198B7}\WindowsPowerShell\v1.0\powershell.exe'
+$script:PruneStampPath = Join-Path ([System.IO.Path]::GetTempPath()) 'wsl-toast-history.stamp'
+
+# -Timing: stage durations from a monotonic Stopwatch; $null when disabled so
+# Add-TimingMark returns at once. Startup (process start to here) can only be
+# taken from wall-clock times.
+$script:Timing = $null
+if ($Timing.IsPresent) {
+    $script:TimingWatch = [System.Diagnostics.Stopwatch]::StartNew()
+    $script:TimingLastMs = 0.0
+    $script:Timing = [ordered]@{}
+    try {
+        $startup = (Get-Date) - (Get-Process -Id $PID).StartTime
+        $script:Timing['startup'] = [math]::Round($startup.TotalMilliseconds, 3)
+    }
+    catch { }
+}
+
 #region Helper Functions
 
+<#
+.SYNOPSIS
+    Records the time since the previous mark as a named stage (-Timing only)
+
+.PARAMETER Name
+    Stage name
+#>
+function Add-TimingMark {
+    [CmdletBinding()]
+    param(
+        [Parameter(Mandatory=$true)]
+        [string]$Name
+    )
+
+    if ($null -eq $script:Timing) { return }
+    $now = $script:TimingWatch.Elapsed.TotalMilliseconds
+    $script:Timing[$Name] = [math]::Round($now - $script:TimingLastMs, 3)
+    $script:TimingLastMs = $now
+}
+
 <#
 .SYNOPSIS
     Tests if the BurntToast module is available
@@ -400,6 +483,9 @@ function Get-BurntToastDuration {
 .PARAMETER AppLogo
     Optional path to app logo
 
+.PARAMETER Tag
+    Optional Action Center tag (see New-ToastTag)
+
 .OUTPUTS
     System.Management.Automation.PSObject representing the toast
 #>
@@ -420,7 +506,10 @@ function New-ToastObject {
         [string]$Duration = 'Normal',
 
         [Parameter(Mandatory=$false)]
-        [string]$AppLogo
+        [string]$AppLogo,
+
+        [Parameter(Mandatory=$false)]
+        [string]$Tag
     )
 
     $toast = [PSCustomObject]@{
@@ -429,6 +518,7 @@ function New-ToastObject {
         Type = Get-DefaultNotificationType -Type $Type
         Duration = Get-DefaultDuration -Duration $Duration
         AppLogo = $AppLogo
+        Tag = $Tag
         Timestamp = Get-Date
     }
 
@@ -503,10 +593,13 @@ function Show-ToastNotification {
             $result.Success = $true
             $result.Method = 'Mock'
             $result.Message = 'Mock mode: Notification not displayed'
+            Add-TimingMark -Name 'show'
         }
         elseif (Test-BurntToastAvailability) {
+            Add-TimingMark -Name 'module_check'
             # Import BurntToast module
             Import-Module BurntToast -ErrorAction Stop
+            Add-TimingMark -Name 'import'
 
             # Display the toast
             $cmd = Get-Command -Name New-BurntToastNotification -ErrorAction Stop
@@ -534,13 +627,20 @@ function Show-ToastNotification {
                 $btParams.Silent = $true
             }
 
+            # UniqueIdentifier becomes the toast Tag/Group, which history pruning keys on
+            if ($Toast.Tag -and ($paramNames -contains 'UniqueIdentifier')) {
+                $btParams.UniqueIdentifier = $Toast.Tag
+            }
+
             $null = New-BurntToastNotification @btParams
+            Add-TimingMark -Name 'show'
 
             $result.Success = $true
             $result.Method = 'BurntToast'
             $result.Message = 'Notification displayed using BurntToast'
         }
         else {
+            Add-TimingMark -Name 'module_check'
             # Fallback: Use Windows Forms Balloon Tip
             Add-Type -AssemblyName System.Windows.Forms
 
@@ -560,6 +660,7 @@ function Show-ToastNotification {
             $balloon.ShowBalloonTip((Get-ToastDurationMs -Duration $Toast.Duration))
             Start-Sleep -Milliseconds 100
             $balloon.Dispose()
+            Add-TimingMark -Name 'show'
 
             $result.Success = $true
             $result.Method = 'BalloonTip'
@@ -575,6 +676,326 @@ function Show-ToastNotification {
     return $result
 }
 
+<#
+.SYNOPSIS
+    Converts a session id into the key embedded in toast tags
+
+.PARAMETER SessionId
+    The Claude Code session id (may be empty)
+
+.OUTPUTS
+    System.String with at most 32 alphanumeric characters
+#>
+function Get-ToastSessionKey {
+    [CmdletBinding()]
+    [OutputType([string])]
+    param(
+        [Parameter(Mandatory=$false)]
+        [string]$SessionId
+    )
+
+    $key = ($SessionId -replace '[^A-Za-z0-9]', '')
+    if ([string]::IsNullOrEmpty($key)) {
+        return 'nosession'
+    }
+    if ($key.Length -gt 32) {
+        $key = $key.Substring(0, 32)
+    }
+    return $key
+}
+
+<#
+.SYNOPSIS
+    Builds a unique Action Center tag for a new toast
+
+.PARAMETER SessionId
+    The Claude Code session id (may be empty)
+
+.OUTPUTS
+    System.String tag of the form "wslt-<session>-<ticks>" (at most 64 characters)
+#>
+function New-ToastTag {
+    [CmdletBinding()]
+    [OutputType([string])]
+    param(
+        [Parameter(Mandatory=$false)]
+        [string]$SessionId
+    )
+
+    $key = Get-ToastSessionKey -SessionId $SessionId
+    return '{0}-{1}-{2}' -f $script:ToastTagPrefix, $key, [DateTime]::UtcNow.Ticks
+}
+
+<#
+.SYNOPSIS
+    Parses a toast tag created by New-ToastTag
+
+.PARAMETER Tag
+    The tag to parse
+
+.OUTPUTS
+    System.Management.Automation.PSObject with SessionKey and Ticks, or $null for foreign tags
+#>
+function ConvertFrom-ToastTag {
+    [CmdletBinding()]
+    [OutputType([psobject])]
+    param(
+        [Parameter(Mandatory=$false)]
+        [string]$Tag
+    )
+
+    $pattern = '^{0}-(?<key>[A-Za-z0-9]+)-(?<ticks>\d+)$' -f $script:ToastTagPrefix
+    if ($Tag -notmatch $pattern) {
+        return $null
+    }
+
+    return [PSCustomObject]@{
+        SessionKey = $Matches['key']
+        Ticks = [long]$Matches['ticks']
+    }
+}
+
+<#
+.SYNOPSIS
+    Lists wsl-toast notifications currently held in Action Center
+
+.OUTPUTS
+    System.Object[] of PSObjects with Tag, Group, SessionKey and Ticks
+#>
+function Get-ToastHistory {
+    [CmdletBinding()]
+    [OutputType([object[]])]
+    param()
+
+    $items = @()
+    try {
+        if (Get-Command -Name Get-BTHistory -ErrorAction SilentlyContinue) {
+            $items = @(Get-BTHistory -ErrorAction Stop)
+        }
+        else {
+            $null = [Windows.UI.Notifications.ToastNotificationManager, Windows.UI.Notifications, ContentType = WindowsRuntime]
+            $items = @([Windows.UI.Notifications.ToastNotificationManager]::History.GetHistory($script:ToastAppId))
+        }
+    }
+    catch {
+        Write-Verbose "Toast history unavailable: $_"
+        return @()
+    }
+
+    $entries = foreach ($item in $items) {
+        $parsed = ConvertFrom-ToastTag -Tag $item.Tag
+        if ($null -ne $parsed) {
+            [PSCustomObject]@{
+                Tag = $item.Tag
+                Group = $item.Group
+                SessionKey = $parsed.SessionKey
+                Ticks = $parsed.Ticks
+            }
+        }
+    }
+
+    return @($entries)
+}
+
+<#
+.SYNOPSIS
+    Selects the history entries that should be removed
+
+.PARAMETER Entries
+    History entries as returned by Get-ToastHistory
+
+.PARAMETER HistoryCap
+    Number of most recent toasts to keep
+
+.PARAMETER SessionId
+    When set, selects every toast of this session regardless of the cap
+
+.OUTPUTS
+    System.Object[] of entries to remove, oldest first
+#>
+function Select-ToastPruneCandidates {
+    [CmdletBinding()]
+    [OutputType([object[]])]
+    param(
+        [Parameter(Mandatory=$false)]
+        [AllowEmptyCollection()]
+        [object[]]$Entries = @(),
+
+        [Parameter(Mandatory=$false)]
+        [int]$HistoryCap = 0,
+
+        [Parameter(Mandatory=$false)]
+        [string]$SessionId
+    )
+
+    if ($SessionId) {
+        $key = Get-ToastSessionKey -SessionId $SessionId
+        return @($Entries | Where-Object { $_.SessionKey -eq $key } | Sort-Object Ticks)
+    }
+
+    if ($HistoryCap -le 0 -or $Entries.Count -le $HistoryCap) {
+        return @()
+    }
+
+    $excess = $Entries.Count - $HistoryCap
+    return @($Entries | Sort-Object Ticks | Select-Object -First $excess)
+}
+
+<#
+.SYNOPSIS
+    Tests whether enough time has passed since the last pruning pass
+
+.PARAMETER IntervalSec
+    Minimum number of seconds between passes (0 always prunes)
+
+.PARAMETER StampPath
+    File whose modification time records the last pass
+
+.OUTPUTS
+    System.Boolean indicating if a pruning pass should run
+#>
+function Test-ToastPruneDue {
+    [CmdletBinding()]
+    [OutputType([bool])]
+    param(
+        [Parameter(Mandatory=$false)]
+        [int]$IntervalSec = 60,
+
+        [Parameter(Mandatory=$false)]
+        [string]$StampPath = $script:PruneStampPath
+    )
+
+    if ($IntervalSec -le 0 -or -not (Test-Path -LiteralPath $StampPath)) {
+        return $true
+    }
+
+    $lastRun = (Get-Item -LiteralPath $StampPath).LastWriteTimeUtc
+    return (([DateTime]::UtcNow - $lastRun).TotalSeconds -ge $IntervalSec)
+}
+
+<#
+.SYNOPSIS
+    Removes one wsl-toast notification from Action Center
+
+.PARAMETER Entry
+    History entry as returned by Get-ToastHistory
+#>
+function Remove-ToastHistoryEntry {
+    [CmdletBinding()]
+    param(
+        [Parameter(Mandatory=$true)]
+        [psobject]$Entry
+    )
+
+    if (Get-Command -Name Remove-BTNotification -ErrorAction SilentlyContinue) {
+        Remove-BTNotification -Tag $Entry.Tag -Group $Entry.Group -ErrorAction Stop
+    }
+    else {
+        $null = [Windows.UI.Notifications.ToastNotificationManager, Windows.UI.Notifications, ContentType = WindowsRuntime]
+        [Windows.UI.Notifications.ToastNotificationManager]::History.Remove($Entry.Tag, $Entry.Group, $script:ToastAppId)
+    }
+}
+
+<#
+.SYNOPSIS
+    Enforces the Action Center history cap or clears a session's toasts
+
+.DESCRIPTION
+    Cap enforcement is throttled through a stamp file so it runs at most once
+    per PruneIntervalSec; clearing a session always runs. In MockMode nothing
+    is removed and the result lists what would have been pruned.
+
+.PARAMETER HistoryCap
+    Number of most recent toasts to keep (0 disables cap enforcement)
+
+.PARAMETER SessionId
+    When set, removes every toast of this session instead of enforcing the cap
+
+.PARAMETER PruneIntervalSec
+    Minimum number of seconds between cap enforcement passes
+
+.PARAMETER History
+    History entries to use instead of querying Action Center
+
+.PARAMETER MockMode
+    Report candidates without removing anything
+
+.OUTPUTS
+    System.Management.Automation.PSObject with Status, Candidates and Removed
+#>
+function Invoke-ToastHistoryPrune {
+    [CmdletBinding()]
+    [OutputType([psobject])]
+    param(
+        [Parameter(Mandatory=$false)]
+        [int]$HistoryCap = 0,
+
+        [Parameter(Mandatory=$false)]
+        [string]$SessionId,
+
+        [Parameter(Mandatory=$false)]
+        [int]$PruneIntervalSec = 60,
+
+        [Parameter(Mandatory=$false)]
+        [AllowEmptyCollection()]
+        [object[]]$History,
+
+        [Parameter(Mandatory=$false)]
+        [switch]$MockMode
+    )
+
+    $result = [PSCustomObject]@{
+        Status = $null
+        Candidates = @()
+        Removed = 0
+    }
+
+    if (-not $SessionId) {
+        if ($HistoryCap -le 0) {
+            $result.Status = 'Disabled'
+            return $result
+        }
+        if (-not (Test-ToastPruneDue -IntervalSec $PruneIntervalSec)) {
+            $result.Status = 'Throttled'
+            return $result
+        }
+    }
+
+    if (-not $PSBoundParameters.ContainsKey('History')) {
+        $History = Get-ToastHistory
+    }
+
+    $candidates = Select-ToastPruneCandidates -Entries $History -HistoryCap $HistoryCap -SessionId $SessionId
+    $result.Candidates = @($candidates | ForEach-Object { $_.Tag })
+
+    if ($MockMode) {
+        $result.Status = 'Mock'
+        return $result
+    }
+
+    foreach ($entry in $candidates) {
+        try {
+            Remove-ToastHistoryEntry -Entry $entry
+            $result.Removed++
+        }
+        catch {
+            Write-Verbose "Failed to remove toast $($entry.Tag): $_"
+        }
+    }
+
+    if (-not $SessionId) {
+        try {
+            [System.IO.File]::WriteAllText($script:PruneStampPath, [DateTime]::UtcNow.Ticks.ToString())
+        }
+        catch {
+            Write-Verbose "Failed to update prune stamp: $_"
+        }
+    }
+
+    $result.Status = 'Pruned'
+    return $result
+}
+
 #endregion
 
 #region Main Function
@@ -601,6 +1022,15 @@ function Show-ToastNotification {
 .PARAMETER MockMode
     Testing mode flag
 
+.PARAMETER SessionId
+    Optional Claude Code session id used to tag the toast
+
+.PARAMETER HistoryCap
+    Number of wsl-toast notifications kept in Action Center (0 disables pruning)
+
+.PARAMETER PruneIntervalSec
+    Minimum number of seconds between history pruning passes
+
 .OUTPUTS
     System.Management.Automation.PSObject with operation result
 #>
@@ -628,7 +1058,16 @@ function Send-WSLToast {
         [string]$AppLogo,
 
         [Parameter(Mandatory=$false)]
-        [switch]$MockMode
+        [switch]$MockMode,
+
+        [Parameter(Mandatory=$false)]
+        [string]$SessionId,
+
+        [Parameter(Mandatory=$false)]
+        [int]$HistoryCap = 0,
+
+        [Parameter(Mandatory=$false)]
+        [int]$PruneIntervalSec = 60
     )
 
     $result = [PSCustomObject]@{
@@ -640,6 +1079,7 @@ function Send-WSLToast {
         Timestamp = Get-Date
         DisplayMethod = $null
         DisplayMessage = $null
+        HistoryPrune = $null
         Error = $null
     }
 
@@ -650,7 +1090,9 @@ function Send-WSLToast {
         }
 
         # Create toast object
-        $toast = New-ToastObject -Title $Title -Message $Message -Type $Type -Duration $Duration -AppLogo $AppLogo
+        $tag = New-ToastTag -SessionId $SessionId
+        $toast = New-ToastObject -Title $Title -Message $Message -Type $Type -Duration $Duration -AppLogo $AppLogo -Tag $tag
+        Add-TimingMark -Name 'prepare'
 
         # Display the notification
         $displayResult = Show-ToastNotification -Toast $toast -MockMode:$MockMode
@@ -658,6 +1100,13 @@ function Send-WSLToast {
         $result.Success = $displayResult.Success
         $result.DisplayMethod = $displayResult.Method
         $result.DisplayMessage = $displayResult.Message
+
+        # Opportunistically enforce the history cap after a successful delivery.
+        # Balloon tips never reach Action Center history, so there is nothing to prune.
+        if ($displayResult.Success -and $displayResult.Method -ne 'BalloonTip') {
+            $result.HistoryPrune = Invoke-ToastHistoryPrune -HistoryCap $HistoryCap -PruneIntervalSec $PruneIntervalSec -MockMode:$MockMode
+            Add-TimingMark -Name 'prune'
+        }
     }
     catch {
         $result.Success = $false
@@ -667,15 +1116,85 @@ function Send-WSLToast {
     return $result
 }
 
+<#
+.SYNOPSIS
+    Removes every remaining toast of a session from Action Center
+
+.PARAMETER SessionId
+    The Claude Code session id whose toasts should be removed
+
+.PARAMETER MockMode
+    Report what would be removed without removing anything
+
+.OUTPUTS
+    System.Management.Automation.PSObject with operation result
+#>
+function Clear-WSLToastSession {
+    [CmdletBinding()]
+    [OutputType([psobject])]
+    param(
+        [Parameter(Mandatory=$false)]
+        [string]$SessionId,
+
+        [Parameter(Mandatory=$false)]
+        [switch]$MockMode
+    )
+
+    $result = [PSCustomObject]@{
+        Success = $false
+        SessionId = $SessionId
+        Timestamp = Get-Date
+        HistoryPrune = $null
+        Error = $null
+    }
+
+    if ([string]::IsNullOrWhiteSpace($SessionId)) {
+        $result.Error = 'SessionId is required to clear a session'
+        return $result
+    }
+
+    try {
+        $result.HistoryPrune = Invoke-ToastHistoryPrune -SessionId $SessionId -MockMode:$MockMode
+        $result.Success = $true
+    }
+    catch {
+        $result.Error = $_.Exception.Message
+    }
+
+    return $result
+}
+
 #endregion
 
 # Script entry point
 if ($MyInvocation.InvocationName -ne '.') {
     # Script is being executed directly
-    $result = Send-WSLToast @PSBoundParameters
+    if ($ClearSession) {
+        $result = Clear-WSLToastSession -SessionId $SessionId -MockMode:$MockMode
+    }
+    else {
+        # Sound/Silent are handled at script scope; everything else maps onto Send-WSLToast
+        $sendParams = @{}
+        foreach ($name in $PSBoundParameters.Keys) {
+            if ($name -notin @('Silent', 'Sound', 'ClearSession', 'Timing', 'TraceId')) {
+                $sendParams[$name] = $PSBoundParameters[$name]
+            }
+        }
+        $result = Send-WSLToast @sendParams
+    }
+
+    if ($null -ne $script:Timing) {
+        $timingResult = [PSCustomObject]@{
+            TraceId = $TraceId
+            StagesMs = [PSCustomObject]$script:Timing
+            TotalMs = [math]::Round($script:TimingWatch.Elapsed.TotalMilliseconds, 3)
+        }
+        $result | Add-Member -NotePropertyName Timing -NotePropertyValue $timingResult
+    }
 
-    # Output result as JSON for programmatic access
-    $result | ConvertTo-Json -Compress
+    # Output result as JSON for programmatic access (Timing nests one level deeper)
+    $depth = if ($null -ne $script:Timing) { 4 } else { 2 }
+    $result | ConvertTo-Json -Compress -Depth $depth
 
     # Exit with appropriate code
     exit $(if ($result.Success) { 0 } else { 1 })